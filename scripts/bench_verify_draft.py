@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Measure verify_draft() throughput on a batch of synthetic drafts.
+
+Usage: python scripts/bench_verify_draft.py [N_DRAFTS]
+"""
+
+import sys
+import time
+
+from contentsifter.generate.gates import verify_draft
+
+DRAFT = (
+    "Most people treat their resume like a history lesson. It isn't.\n\n"
+    "Here's what we do instead. Start with the role you want.\n"
+    "✅ Lead with outcomes\n✅ Cut the filler\n\n"
+    "Let's leverage that in order to land the interview.\n"
+) * 3
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    drafts = [f"{DRAFT}{i}" for i in range(n)]
+
+    start = time.perf_counter()
+    violations = sum(len(verify_draft(d)) for d in drafts)
+    elapsed = time.perf_counter() - start
+
+    print(f"Verified {n:,} drafts in {elapsed:.2f}s")
+    print(f"  {n / elapsed:,.0f} drafts/s, {elapsed / n * 1e6:,.0f} us/draft")
+    print(f"  {violations:,} violations found")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Process-wide cache for static files read on every generation.
+
+The AI-gate reference, each client's voice print and voice profile are
+read (and the profile parsed) by every draft, planner run and web request,
+yet change only when someone regenerates or edits them. AssetCache keeps
+their contents in memory, keyed by path and validated against the file's
+mtime and size, so a repeated generation costs one stat per asset and no
+reads. Editing or replacing a file makes the next access reload it.
+
+Memory is bounded two ways: files above ``max_file_bytes`` are read
+through without caching, and entries are evicted least-recently-used once
+their combined size passes ``max_bytes``.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable
+
+# Total bytes of file content kept across all entries
+MAX_CACHE_BYTES = 16 * 1024 * 1024
+
+# Files larger than this are never cached
+MAX_FILE_BYTES = 2 * 1024 * 1024
+
+
+class AssetCache:
+    """LRU cache of file contents (or values parsed from them) keyed by path."""
+
+    def __init__(self, max_bytes: int = MAX_CACHE_BYTES, max_file_bytes: int = MAX_FILE_BYTES):
+        self.max_bytes = max_bytes
+        self.max_file_bytes = max_file_bytes
+        # (path, parser) -> ((mtime_ns, size), value)
+        self._entries: OrderedDict[tuple, tuple[tuple[int, int], Any]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _drop(self, key: tuple):
+        token, _ = self._entries.pop(key)
+        self._bytes -= token[1]
+
+    def load(self, path: Path, parse: Callable[[str], Any] | None = None) -> Any:
+        """Return ``parse(text)`` for the file at ``path`` (the text itself if no parser).
+
+        Returns None if the file doesn't exist. Each parser gets its own
+        entry, so a file can be cached both raw and parsed.
+        """
+        key = (os.fspath(path), parse)
+        try:
+            st = os.stat(key[0])
+        except OSError:
+            with self._lock:
+                if key in self._entries:
+                    self._drop(key)
+            return None
+        token = (st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == token:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        text = Path(path).read_text()
+        value = parse(text) if parse else text
+        if token[1] > self.max_file_bytes:
+            return value
+
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (token, value)
+            self._bytes += token[1]
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+        return value
+
+    def read_text(self, path: Path) -> str | None:
+        """Contents of the file at ``path``, or None if it doesn't exist."""
+        return self.load(path)
+
+    def invalidate(self, path: Path):
+        """Forget every entry for ``path``; for writers in this process."""
+        name = os.fspath(path)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == name]:
+                self._drop(key)
+
+    def clear(self):
+        """Drop all entries and reset metrics."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+asset_cache = AssetCache()
@@ -23,7 +23,15 @@ from contentsifter.llm.client import create_client as create_llm_client
 from contentsifter.parser.metadata import parse_metadata
 from contentsifter.parser.splitter import split_all_files, split_merged_file
 from contentsifter.parser.turns import parse_speaker_turns
-from contentsifter.storage.database import Database
+from contentsifter.search.vectors import (
+    clear_expansions,
+    flush_search_stats,
+    hybrid_unified_search,
+    precompute_expansions,
+    rebuild_vectors,
+    update_vectors,
+)
+from contentsifter.storage.database import FTS_TABLES, TRIGRAM_TABLES, Database
 from contentsifter.storage.repository import Repository
 
 console = Console(force_terminal=True)
@@ -157,11 +165,8 @@ def client_info(slug):
                 console.print(f"  Extractions: {summary['total_extractions']}")
 
                 # Content items count
-                try:
-                    row = db.conn.execute("SELECT COUNT(*) as cnt FROM content_items").fetchone()
-                    console.print(f"  Content items: {row['cnt']}")
-                except Exception:
-                    pass
+                content_count = sum(repo.get_counters("content_type").values())
+                console.print(f"  Content items: {content_count}")
         else:
             console.print("\n  [dim]No database yet (run ingest to start).[/dim]")
 
@@ -219,6 +224,7 @@ def parse(ctx, input_path):
 
         new_count = 0
         skip_count = 0
+        turn_count = 0
 
         for record in records:
             if repo.call_exists(record.original_filename):
@@ -230,7 +236,10 @@ def parse(ctx, input_path):
                 record.raw_text, record.source_file, record.original_filename,
                 coach_name=client_config.name, coach_email=client_config.email,
             )
-            turns = parse_speaker_turns(record.raw_text)
+            turns = parse_speaker_turns(
+                record.raw_text,
+                coach_name=client_config.name, coach_email=client_config.email,
+            )
 
             if not turns:
                 console.print(
@@ -240,10 +249,14 @@ def parse(ctx, input_path):
 
             call_id = repo.insert_call(metadata, turns)
             new_count += 1
+            turn_count += len(turns)
 
             if new_count % 10 == 0:
                 console.print(f"  Parsed {new_count} calls...")
 
+        if db.optimize_fts_after_load("speaker_turns_fts", turn_count):
+            console.print("[dim]Optimized the speaker turn search index.[/dim]")
+
         console.print()
         console.print(f"[green]Done![/green] Parsed [bold]{new_count}[/bold] new calls.")
         if skip_count:
@@ -286,23 +299,17 @@ def status(ctx):
         console.print(table)
 
         # Content items count
-        try:
-            row = db.conn.execute("SELECT COUNT(*) as cnt FROM content_items").fetchone()
-            content_count = row["cnt"]
-            if content_count > 0:
-                console.print()
-                ci_table = Table(title="Ingested Content Items")
-                ci_table.add_column("Type", style="cyan")
-                ci_table.add_column("Count", justify="right")
-                rows = db.conn.execute(
-                    "SELECT content_type, COUNT(*) as cnt FROM content_items GROUP BY content_type ORDER BY cnt DESC"
-                ).fetchall()
-                for r in rows:
-                    ci_table.add_row(r["content_type"], str(r["cnt"]))
-                ci_table.add_row("[bold]Total[/bold]", f"[bold]{content_count}[/bold]")
-                console.print(ci_table)
-        except Exception:
-            pass
+        content_by_type = repo.get_counters("content_type")
+        content_count = sum(content_by_type.values())
+        if content_count > 0:
+            console.print()
+            ci_table = Table(title="Ingested Content Items")
+            ci_table.add_column("Type", style="cyan")
+            ci_table.add_column("Count", justify="right")
+            for content_type, cnt in content_by_type.items():
+                ci_table.add_row(content_type, str(cnt))
+            ci_table.add_row("[bold]Total[/bold]", f"[bold]{content_count}[/bold]")
+            console.print(ci_table)
 
         # Extraction counts
         if summary["total_extractions"] > 0:
@@ -452,6 +459,10 @@ def extract(ctx, call_id, limit, force):
             total_extractions += call_extractions
             console.print(f"    [green]{call_extractions} items extracted[/green]")
 
+        if db.optimize_fts_after_load("extractions_fts", total_extractions):
+            console.print("[dim]Optimized the extraction search index.[/dim]")
+        update_vectors(db, ("extractions",))
+
         console.print(
             f"\n[green]Done![/green] Extracted [bold]{total_extractions}[/bold] "
             f"items from {len(call_ids)} calls."
@@ -516,8 +527,9 @@ def sift(ctx, input_path, limit, dry_run):
 
 
 @cli.command()
+@click.option("--rebuild", is_flag=True, help="Recompute cached counters from the source tables")
 @click.pass_context
-def stats(ctx):
+def stats(ctx, rebuild):
     """Show detailed database statistics."""
     db_path = ctx.obj["db_path"]
 
@@ -528,17 +540,19 @@ def stats(ctx):
     with Database(db_path) as db:
         repo = Repository(db)
 
+        if rebuild:
+            db.rebuild_stats_counters()
+            console.print("[green]Rebuilt stats counters.[/green]")
+
         # Call type breakdown
-        rows = db.conn.execute(
-            "SELECT call_type, COUNT(*) as cnt FROM calls GROUP BY call_type ORDER BY cnt DESC"
-        ).fetchall()
+        call_types = repo.get_counters("call_type")
 
         console.print()
         table = Table(title="Calls by Type")
         table.add_column("Type", style="cyan")
         table.add_column("Count", justify="right")
-        for r in rows:
-            table.add_row(r["call_type"], str(r["cnt"]))
+        for call_type, cnt in call_types.items():
+            table.add_row(call_type, str(cnt))
         console.print(table)
 
         # Date range
@@ -551,31 +565,177 @@ def stats(ctx):
             )
 
         # Total turns
-        row = db.conn.execute(
-            "SELECT COUNT(*) as cnt, SUM(turn_count) as turns FROM calls"
-        ).fetchone()
-        console.print(f"Total calls: [bold]{row['cnt']}[/bold]")
-        console.print(f"Total speaker turns: [bold]{row['turns']}[/bold]")
+        turns = repo.get_counters("totals").get("turns", 0)
+        console.print(f"Total calls: [bold]{sum(call_types.values())}[/bold]")
+        console.print(f"Total speaker turns: [bold]{turns}[/bold]")
 
         # Tag counts
-        rows = db.conn.execute(
-            """SELECT t.name, COUNT(*) as cnt FROM tags t
-               JOIN extraction_tags et ON t.id = et.tag_id
-               GROUP BY t.name ORDER BY cnt DESC LIMIT 20"""
-        ).fetchall()
-        if rows:
+        tag_counts = list(repo.get_counters("tag").items())[:20]
+        if tag_counts:
             console.print()
             tag_table = Table(title="Top Tags")
             tag_table.add_column("Tag", style="cyan")
             tag_table.add_column("Count", justify="right")
-            for r in rows:
-                tag_table.add_row(r["name"], str(r["cnt"]))
+            for name, cnt in tag_counts:
+                tag_table.add_row(name, str(cnt))
             console.print(tag_table)
 
+        if db.has_trigram_index():
+            overhead = db.trigram_overhead()
+            console.print(
+                f"\nTrigram index: [bold]{overhead['trigram_bytes'] / 1024:,.1f} KB[/bold] "
+                f"({overhead['ratio']}x the primary search index)"
+            )
+
+
+@cli.group(name="fts")
+@click.pass_context
+def fts_group(ctx):
+    """Maintain the full-text search indexes."""
+    if not ctx.obj["db_path"].exists():
+        console.print("[yellow]No database found.[/yellow] Run 'parse' first.")
+        ctx.exit()
+
+
+def _fts_tables(table: str | None) -> tuple[str, ...]:
+    return (table,) if table else FTS_TABLES
+
+
+_fts_table_option = click.option(
+    "--table", type=click.Choice(FTS_TABLES), default=None,
+    help="Limit to one FTS table (default: all)",
+)
+
+
+@fts_group.command(name="optimize")
+@_fts_table_option
+@click.pass_context
+def fts_optimize(ctx, table):
+    """Merge index segments for faster queries."""
+    with Database(ctx.obj["db_path"]) as db:
+        for name in _fts_tables(table):
+            db.optimize_fts((name,))
+            console.print(f"  Optimized [cyan]{name}[/cyan]")
+    console.print("[green]Done![/green]")
+
+
+@fts_group.command(name="rebuild")
+@_fts_table_option
+@click.pass_context
+def fts_rebuild(ctx, table):
+    """Rebuild indexes from their content tables."""
+    with Database(ctx.obj["db_path"]) as db:
+        for name in _fts_tables(table):
+            db.rebuild_fts((name,))
+            console.print(f"  Rebuilt [cyan]{name}[/cyan]")
+    console.print("[green]Done![/green]")
+
+
+@fts_group.command(name="integrity-check")
+@_fts_table_option
+@click.pass_context
+def fts_integrity_check(ctx, table):
+    """Verify indexes match their content tables."""
+    with Database(ctx.obj["db_path"]) as db:
+        results = db.check_fts_integrity(_fts_tables(table))
+
+    failed = 0
+    for name, error in results.items():
+        if error is None:
+            console.print(f"  [green]OK[/green]   {name}")
+        else:
+            failed += 1
+            console.print(f"  [red]FAIL[/red] {name}: {error}")
+
+    if failed:
+        console.print(
+            f"\n[red]{failed} index(es) out of sync.[/red] Run 'contentsifter fts rebuild' to repair."
+        )
+        ctx.exit(1)
+
+
+@fts_group.command(name="stats")
+@_fts_table_option
+@click.pass_context
+def fts_stats(ctx, table):
+    """Show row and segment counts for each index."""
+    with Database(ctx.obj["db_path"]) as db:
+        tables = _fts_tables(table)
+        if table is None and db.has_trigram_index():
+            tables += tuple(TRIGRAM_TABLES)
+        stats = db.fts_segment_stats(tables)
+        overhead = db.trigram_overhead() if table is None else None
+
+    t = Table(title="Full-Text Indexes")
+    t.add_column("Table", style="cyan")
+    t.add_column("Rows", justify="right")
+    t.add_column("Segments", justify="right")
+    t.add_column("Pages", justify="right")
+    t.add_column("Size", justify="right")
+    for row in stats:
+        t.add_row(
+            row["table"],
+            f"{row['rows']:,}",
+            str(row["segments"]),
+            f"{row['pages']:,}",
+            f"{row['bytes'] / 1024:,.1f} KB",
+        )
+    console.print(t)
+    if overhead and overhead["trigram_bytes"]:
+        console.print(
+            f"Trigram overhead: [bold]{overhead['ratio']}x[/bold] the primary indexes it shadows"
+        )
+
+
+@fts_group.command(name="trigram")
+@click.option("--disable", is_flag=True, help="Drop the trigram indexes instead")
+@click.pass_context
+def fts_trigram(ctx, disable):
+    """Build the trigram indexes used for substring and typo-tolerant search."""
+    with Database(ctx.obj["db_path"]) as db:
+        if disable:
+            db.disable_trigram_index()
+            console.print("[green]Done![/green] Dropped the trigram indexes.")
+            return
+        db.enable_trigram_index()
+        overhead = db.trigram_overhead()
+    console.print(
+        f"[green]Done![/green] Built the trigram indexes "
+        f"([bold]{overhead['trigram_bytes'] / 1024:,.1f} KB[/bold], "
+        f"{overhead['ratio']}x the primary indexes)."
+    )
+
+
+@fts_group.command(name="vectors")
+@click.option("--rebuild", is_flag=True, help="Discard and re-create all vectors")
+@click.pass_context
+def fts_vectors(ctx, rebuild):
+    """Update the local vectors used by semantic search."""
+    with Database(ctx.obj["db_path"]) as db:
+        count = rebuild_vectors(db) if rebuild else update_vectors(db)
+    console.print(f"[green]Done![/green] Indexed [bold]{count}[/bold] items.")
+
+
+@fts_group.command(name="expansions")
+@click.option("--top", type=int, default=50, help="Logged queries to precompute")
+@click.option("--clear", is_flag=True, help="Empty the cache instead")
+@click.pass_context
+def fts_expansions(ctx, top, clear):
+    """Precompute cached query expansions for popular queries and tags."""
+    with Database(ctx.obj["db_path"]) as db:
+        if clear:
+            count = clear_expansions(db)
+            console.print(f"[green]Done![/green] Cleared [bold]{count}[/bold] cached expansions.")
+            return
+        count = precompute_expansions(db, top_n=top)
+    console.print(f"[green]Done![/green] Precomputed [bold]{count}[/bold] query expansions.")
+
 
 @cli.command()
 @click.argument("query")
-@click.option("--semantic", is_flag=True, help="Use Claude for semantic search")
+@click.option("--semantic", is_flag=True, help="Local semantic search (keyword + vector ranking)")
+@click.option("--llm-rerank", is_flag=True, help="Re-rank semantic results with Claude")
+@click.option("--all-sources", is_flag=True, help="Also search ingested content, content blocks and transcripts (with --semantic, vector-ranked)")
 @click.option("--category", "-c", multiple=True, help="Filter by category (qa, testimonial, playbook, story)")
 @click.option("--tag", "-t", multiple=True, help="Filter by tag")
 @click.option("--date-from", help="Filter from date (YYYY-MM-DD)")
@@ -583,6 +743,7 @@ def stats(ctx):
 @click.option("--call-type", help="Filter by call type")
 @click.option("--min-quality", type=int, help="Minimum quality score (1-5)")
 @click.option("--limit", type=int, default=20, help="Max results")
+@click.option("--facets", is_flag=True, help="Show match counts per category, tag, call type and year")
 @click.option(
     "--output-format",
     type=click.Choice(["table", "json", "full"]),
@@ -590,13 +751,17 @@ def stats(ctx):
     help="Output format",
 )
 @click.pass_context
-def search(ctx, query, semantic, category, tag, date_from, date_to,
-           call_type, min_quality, limit, output_format):
+def search(ctx, query, semantic, llm_rerank, all_sources, category, tag, date_from, date_to,
+           call_type, min_quality, limit, facets, output_format):
     """Search extracted content."""
     import json as json_mod
+    from contentsifter.search.facets import facet_counts
     from contentsifter.search.filters import SearchFilters
+    from contentsifter.search.fuzzy import fuzzy_search
     from contentsifter.search.keyword import keyword_search
+    from contentsifter.search.rerank import load_weights
     from contentsifter.search.semantic import semantic_search
+    from contentsifter.search.unified import unified_search
 
     db_path = ctx.obj["db_path"]
 
@@ -610,16 +775,36 @@ def search(ctx, query, semantic, category, tag, date_from, date_to,
         limit=limit,
     )
 
+    if all_sources:
+        with Database(db_path) as db:
+            if semantic:
+                results = hybrid_unified_search(db, query, filters)
+            else:
+                results = unified_search(db, query, filters)
+        _print_unified_results(query, results, output_format)
+        return
+
     with Database(db_path) as db:
-        if semantic:
-            llm = create_llm_client(ctx.obj["llm_mode"], ctx.obj["model"])
-            results = semantic_search(db, query, llm, filters)
+        if semantic or llm_rerank:
+            llm = create_llm_client(ctx.obj["llm_mode"], ctx.obj["model"]) if llm_rerank else None
+            weights = load_weights(_get_client_config(ctx).rerank_weights_path)
+            results = semantic_search(
+                db, query, llm, filters, llm_rerank=llm_rerank, weights=weights,
+            )
+            flush_search_stats(db)
         else:
             results = keyword_search(db, query, filters)
+        fuzzy = False
+        if not results:
+            results = fuzzy_search(db, query, filters)
+            fuzzy = bool(results)
+        counts = facet_counts(db, query, filters) if facets and results and not fuzzy else {}
 
     if not results:
         console.print("[yellow]No results found.[/yellow]")
         return
+    if fuzzy and output_format != "json":
+        console.print("[yellow]No exact matches.[/yellow] Showing close matches.")
 
     if output_format == "json":
         console.print(json_mod.dumps(results, indent=2))
@@ -656,18 +841,89 @@ def search(ctx, query, semantic, category, tag, date_from, date_to,
         console.print(table)
         console.print(f"\n[dim]Showing {len(results)} results. Use --output-format full for details.[/dim]")
 
+    if counts and output_format != "json":
+        console.print()
+        for name, values in counts.items():
+            if values:
+                listed = ", ".join(f"{value} ({count})" for value, count in values.items())
+                console.print(f"[bold]{name.replace('_', ' ').title()}:[/bold] {listed}")
+
+
+@cli.command(name="tune-search")
+@click.argument("labels_path", type=click.Path(exists=True))
+@click.pass_context
+def tune_search(ctx, labels_path):
+    """Fit semantic search rerank weights to a labeled query file.
+
+    LABELS_PATH is JSONL, one {"query": "...", "relevant": [extraction ids]}
+    object per line. Weights are saved next to the client's database.
+    """
+    from contentsifter.search.rerank import load_labels, load_weights, save_weights, tune_weights
+
+    client_config = _get_client_config(ctx)
+    labels = load_labels(Path(labels_path))
+    if not labels:
+        console.print("[yellow]No labeled queries found.[/yellow]")
+        return
+
+    weights_path = client_config.rerank_weights_path
+    with Database(ctx.obj["db_path"]) as db:
+        weights, mrr = tune_weights(db, labels, load_weights(weights_path))
+
+    save_weights(weights, weights_path)
+    console.print(
+        f"[green]Done![/green] Tuned on {len(labels)} queries "
+        f"(MRR [bold]{mrr:.3f}[/bold]). Saved to {weights_path}"
+    )
+
+
+def _print_unified_results(query: str, results: list[dict], output_format: str):
+    import json as json_mod
+
+    if not results:
+        console.print("[yellow]No results found.[/yellow]")
+        return
+
+    if output_format == "json":
+        console.print(json_mod.dumps(results, indent=2))
+    elif output_format == "full":
+        for r in results:
+            console.print(f"\n[bold cyan]{r['title'] or r['parent_title'] or 'Untitled'}[/bold cyan]")
+            console.print(f"[dim]{r['source']} | {r['kind']} | {r['date'] or 'no date'}[/dim]")
+            console.print(f"\n{r['text']}")
+            console.print("─" * 60)
+    else:
+        table = Table(title=f"Search (all sources): {query}")
+        table.add_column("#", style="dim", width=3)
+        table.add_column("Source", style="cyan", width=13)
+        table.add_column("Kind", width=12)
+        table.add_column("Title", style="bold")
+        table.add_column("Date", style="dim", width=10)
+        table.add_column("Score", justify="right", width=5)
+        for i, r in enumerate(results):
+            table.add_row(
+                str(i + 1),
+                r["source"],
+                r["kind"] or "",
+                (r["title"] or r["parent_title"] or "")[:50],
+                (r["date"] or "")[:10],
+                f"{r['score']:.2f}",
+            )
+        console.print(table)
+
 
 @cli.command()
 @click.option("--query", "-q", required=True, help="Search query for source material")
 @click.option(
-    "--format", "-f", "format_type",
+    "--format", "-f", "format_types",
     type=click.Choice([
         "linkedin", "newsletter", "thread", "playbook",
         "video-script", "carousel",
         "email-welcome", "email-weekly", "email-sales",
     ]),
     required=True,
-    help="Output format",
+    multiple=True,
+    help="Output format (repeat to generate several formats in parallel)",
 )
 @click.option("--topic", help="Topic/title for the generated content")
 @click.option("--category", "-c", multiple=True, help="Filter source by category")
@@ -675,17 +931,22 @@ def search(ctx, query, semantic, category, tag, date_from, date_to,
 @click.option("--limit", type=int, default=10, help="Max source items to use")
 @click.option("--save", is_flag=True, help="Save draft to content/drafts/")
 @click.pass_context
-def generate(ctx, query, format_type, topic, category, min_quality, limit, save):
+def generate(ctx, query, format_types, topic, category, min_quality, limit, save):
     """Generate content drafts from search results.
 
-    Voice print and content gates are always applied.
+    Voice print and content gates are always applied. Several formats
+    (-f linkedin -f thread ...) share the same source material and run
+    concurrently.
     """
     from datetime import datetime
 
-    from contentsifter.generate.drafts import generate_draft
+    from contentsifter.generate.drafts import generate_draft, generate_drafts_multi
+    from contentsifter.planning.voicecard import load_voice_card
     from contentsifter.planning.voiceprint import load_voice_print
+    from contentsifter.planning.voiceprofile import load_voice_profile
     from contentsifter.search.filters import SearchFilters
     from contentsifter.search.keyword import keyword_search
+    from contentsifter.storage.drafts import index_draft, sync_drafts
 
     db_path = ctx.obj["db_path"]
     client_config = _get_client_config(ctx)
@@ -695,6 +956,8 @@ def generate(ctx, query, format_type, topic, category, min_quality, limit, save)
     voice_print = load_voice_print(path=client_config.voice_print_path)
     if voice_print:
         console.print("[dim]Using voice print for tone matching.[/dim]")
+    voice_card = load_voice_card(path=client_config.voice_print_path)
+    voice_profile = load_voice_profile(client_config.voice_profile_path)
 
     filters = SearchFilters(
         categories=list(category),
@@ -709,6 +972,35 @@ def generate(ctx, query, format_type, topic, category, min_quality, limit, save)
         console.print("[yellow]No source material found for that query.[/yellow]")
         return
 
+    format_types = list(dict.fromkeys(format_types))
+    if len(format_types) > 1:
+        console.print(
+            f"Found [bold]{len(results)}[/bold] source items. "
+            f"Generating {', '.join(format_types)} drafts in parallel..."
+        )
+        console.print("[dim]Content gates enabled (AI detection + voice matching).[/dim]")
+        drafts = generate_drafts_multi(
+            results, format_types, llm, topic, voice_print=voice_print,
+            save_dir=client_config.drafts_dir if save else None,
+            voice_profile=voice_profile, voice_card=voice_card,
+        )
+        for format_type, draft in drafts.items():
+            console.print()
+            if isinstance(draft, Exception):
+                console.print(f"[red]{format_type} failed:[/red] {type(draft).__name__}: {draft}")
+                continue
+            console.print(f"[bold]Generated {format_type} Draft:[/bold]")
+            console.print("=" * 60)
+            console.print(draft)
+            console.print("=" * 60)
+        if save:
+            # File names are chosen inside generate_drafts_multi, so reconcile the folder
+            with Database(db_path) as db:
+                sync_drafts(db, client_config.drafts_dir)
+            console.print(f"\n[green]Saved to:[/green] {client_config.drafts_dir}")
+        return
+
+    format_type = format_types[0]
     console.print(f"Found [bold]{len(results)}[/bold] source items. Generating {format_type} draft...")
     console.print("[dim]Content gates enabled (AI detection + voice matching).[/dim]")
 
@@ -718,7 +1010,8 @@ def generate(ctx, query, format_type, topic, category, min_quality, limit, save)
         save_to = client_config.drafts_dir / f"{format_type}-{timestamp}.md"
 
     draft = generate_draft(results, format_type, llm, topic,
-                           voice_print=voice_print, save_to=save_to)
+                           voice_print=voice_print, save_to=save_to,
+                           voice_profile=voice_profile, voice_card=voice_card)
 
     console.print()
     console.print("[bold]Generated Draft:[/bold]")
@@ -726,9 +1019,160 @@ def generate(ctx, query, format_type, topic, category, min_quality, limit, save)
     console.print(draft)
     console.print("=" * 60)
     if save_to:
+        with Database(db_path) as db:
+            index_draft(db, save_to)
+            db.conn.commit()
         console.print(f"\n[green]Saved to:[/green] {save_to}")
 
 
+@cli.command(name="generate-batch")
+@click.argument("job_file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--workers", type=int, default=4, help="Drafts generated at once")
+@click.option(
+    "--status", "status_file", type=click.Path(dir_okay=False, path_type=Path),
+    help="Status log (default: JOB_FILE.status.jsonl)",
+)
+@click.pass_context
+def generate_batch(ctx, job_file, workers, status_file):
+    """Generate a draft for every row of a CSV or JSONL job file.
+
+    Rows have topic, format, and optional category (;-separated),
+    min_quality and limit. Drafts are saved to the client's drafts folder.
+    Finished rows are logged, so rerunning the same file skips them.
+    """
+    from contentsifter.generate.batch import read_batch_file, run_batch, status_path_for
+    from contentsifter.planning.voicecard import load_voice_card
+    from contentsifter.planning.voiceprint import load_voice_print
+    from contentsifter.planning.voiceprofile import load_voice_profile
+
+    try:
+        rows = read_batch_file(job_file)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    if not rows:
+        console.print("[yellow]No rows in job file.[/yellow]")
+        return
+
+    client_config = _get_client_config(ctx)
+    status_path = status_file or status_path_for(job_file)
+    llm = create_llm_client(ctx.obj["llm_mode"], ctx.obj["model"])
+    voice_print = load_voice_print(path=client_config.voice_print_path)
+    voice_card = load_voice_card(path=client_config.voice_print_path)
+    voice_profile = load_voice_profile(client_config.voice_profile_path)
+
+    styles = {"done": "green", "no_source": "yellow", "failed": "red"}
+
+    def report(row, record):
+        style = styles[record["status"]]
+        detail = record.get("error") or record.get("path") or "no source material"
+        console.print(
+            f"  [{style}]{record['status']:>9}[/{style}] line {row.line}: "
+            f"{row.format_type} / {row.topic} [dim]({record['seconds']:.1f}s, {detail})[/dim]"
+        )
+
+    console.print(f"Generating {len(rows)} drafts, {workers} at a time...")
+    with Database(ctx.obj["db_path"]) as db:
+        summary = run_batch(
+            db, rows, llm, client_config.drafts_dir, status_path,
+            voice_print=voice_print, voice_profile=voice_profile,
+            workers=workers, on_result=report, voice_card=voice_card,
+        )
+
+    console.print()
+    console.print(
+        f"[green]Done![/green] {summary.done} drafts in {summary.elapsed:.1f}s "
+        f"({summary.drafts_per_minute:.1f} drafts/min)"
+    )
+    if summary.skipped:
+        console.print(f"[dim]Skipped {summary.skipped} rows already done.[/dim]")
+    if summary.no_source:
+        console.print(f"[yellow]{summary.no_source} rows had no source material.[/yellow]")
+    if summary.failed:
+        console.print(f"[red]{summary.failed} rows failed; rerun to retry them.[/red]")
+    console.print(f"[dim]Status log: {status_path}[/dim]")
+
+
+@cli.command(name="audit-drafts")
+@click.argument("paths", nargs=-1, type=click.Path(exists=True, dir_okay=False))
+@click.option("--flagged", is_flag=True, help="Only list drafts that read as AI")
+@click.option(
+    "--output-format",
+    type=click.Choice(["table", "json"]),
+    default="table",
+    help="Output format",
+)
+@click.pass_context
+def audit_drafts(ctx, paths, flagged, output_format):
+    """Score saved drafts for AI writing patterns, locally.
+
+    Scores every draft in the client's drafts folder, or just PATHS.
+    """
+    import json as json_mod
+
+    from contentsifter.generate.gates import verify_draft
+    from contentsifter.generate.stylometry import AI_SCORE_THRESHOLD, score_ai_patterns
+    from contentsifter.planning.voiceprofile import load_voice_profile, voice_similarity
+    from contentsifter.web.utils import parse_draft
+
+    if paths:
+        files = [Path(p) for p in paths]
+    else:
+        drafts_dir = _get_client_config(ctx).drafts_dir
+        files = sorted(drafts_dir.glob("*.md")) if drafts_dir.exists() else []
+    if not files:
+        console.print("[yellow]No drafts found.[/yellow]")
+        return
+
+    voice_profile = load_voice_profile(_get_client_config(ctx).voice_profile_path)
+
+    rows = []
+    for path in files:
+        info = parse_draft(path)
+        result = score_ai_patterns(info["body"])
+        if flagged and not result.suspicious:
+            continue
+        row = {
+            "file": path.name,
+            "format": info["format_type"],
+            "score": result.score,
+            "violations": len(verify_draft(info["body"])),
+            "signals": result.strongest(3),
+        }
+        if voice_profile:
+            row["voice_match"] = voice_similarity(info["body"], voice_profile).score
+        rows.append(row)
+
+    if output_format == "json":
+        click.echo(json_mod.dumps(rows, indent=2))
+        return
+
+    table = Table(title="Draft AI-pattern audit")
+    table.add_column("Draft", style="cyan")
+    table.add_column("Format", style="dim")
+    table.add_column("Score", justify="right")
+    table.add_column("Violations", justify="right")
+    table.add_column("Strongest signals", style="dim")
+    if voice_profile:
+        table.add_column("Voice match", justify="right")
+    for row in rows:
+        style = "yellow" if row["score"] >= AI_SCORE_THRESHOLD else ""
+        cells = [
+            row["file"],
+            row["format"],
+            f"[{style}]{row['score']:.2f}[/{style}]" if style else f"{row['score']:.2f}",
+            str(row["violations"]),
+            ", ".join(s.replace("_", " ") for s in row["signals"]),
+        ]
+        if voice_profile:
+            cells.append(f"{row['voice_match']:.2f}")
+        table.add_row(*cells)
+    console.print(table)
+    suspicious = sum(1 for row in rows if row["score"] >= AI_SCORE_THRESHOLD)
+    console.print(
+        f"\n[dim]{len(rows)} drafts scored, {suspicious} at or above {AI_SCORE_THRESHOLD}.[/dim]"
+    )
+
+
 @cli.command(name="export")
 @click.option(
     "--output", "-o",
@@ -784,28 +1228,24 @@ def ingest(ctx, input_path, content_type, show_status):
             console.print("[yellow]No database found.[/yellow]")
             return
         with Database(db_path) as db:
-            try:
-                rows = db.conn.execute(
-                    "SELECT content_type, COUNT(*) as cnt, SUM(char_count) as chars "
-                    "FROM content_items GROUP BY content_type ORDER BY cnt DESC"
-                ).fetchall()
-                if not rows:
-                    console.print("[yellow]No content items ingested yet.[/yellow]")
-                    return
-                table = Table(title=f"Ingested Content ({client_config.name})")
-                table.add_column("Type", style="cyan")
-                table.add_column("Count", justify="right")
-                table.add_column("Total Chars", justify="right")
-                total_count = 0
-                total_chars = 0
-                for r in rows:
-                    table.add_row(r["content_type"], str(r["cnt"]), f"{r['chars']:,}")
-                    total_count += r["cnt"]
-                    total_chars += r["chars"]
-                table.add_row("[bold]Total[/bold]", f"[bold]{total_count}[/bold]", f"[bold]{total_chars:,}[/bold]")
-                console.print(table)
-            except Exception:
-                console.print("[yellow]No content items table found.[/yellow]")
+            repo = Repository(db)
+            counts = repo.get_counters("content_type")
+            chars = repo.get_counters("content_chars")
+            if not counts:
+                console.print("[yellow]No content items ingested yet.[/yellow]")
+                return
+            table = Table(title=f"Ingested Content ({client_config.name})")
+            table.add_column("Type", style="cyan")
+            table.add_column("Count", justify="right")
+            table.add_column("Total Chars", justify="right")
+            for ctype, cnt in counts.items():
+                table.add_row(ctype, str(cnt), f"{chars.get(ctype, 0):,}")
+            table.add_row(
+                "[bold]Total[/bold]",
+                f"[bold]{sum(counts.values())}[/bold]",
+                f"[bold]{sum(chars.values()):,}[/bold]",
+            )
+            console.print(table)
         return
 
     if not input_path:
@@ -824,6 +1264,9 @@ def ingest(ctx, input_path, content_type, show_status):
         items = ingest_path(
             db, input_path, content_type=content_type, author=client_config.name,
         )
+        if db.optimize_fts_after_load("content_items_fts", len(items)):
+            console.print("[dim]Optimized the content search index.[/dim]")
+        update_vectors(db, ("content_items",))
 
     console.print(f"[green]Done![/green] Ingested [bold]{len(items)}[/bold] content items.")
     for ct, count in _count_by_type(items):
@@ -1023,33 +1466,13 @@ def _content_summary(db, client_config) -> dict:
         "has_questionnaire": (client_config.content_dir / "interview-guide.md").exists(),
     }
 
-    try:
-        rows = db.conn.execute(
-            "SELECT content_type, COUNT(*) as cnt, COALESCE(SUM(char_count), 0) as chars "
-            "FROM content_items GROUP BY content_type"
-        ).fetchall()
-        for r in rows:
-            summary["content_by_type"][r["content_type"]] = r["cnt"]
-            summary["content_items"] += r["cnt"]
-            summary["total_chars"] += r["chars"]
-    except Exception:
-        pass
-
-    try:
-        rows = db.conn.execute(
-            "SELECT category, COUNT(*) as cnt FROM extractions GROUP BY category"
-        ).fetchall()
-        for r in rows:
-            summary["extractions_by_cat"][r["category"]] = r["cnt"]
-            summary["extractions"] += r["cnt"]
-    except Exception:
-        pass
-
-    try:
-        row = db.conn.execute("SELECT COUNT(*) as cnt FROM calls").fetchone()
-        summary["calls"] = row["cnt"]
-    except Exception:
-        pass
+    repo = Repository(db)
+    summary["content_by_type"] = repo.get_counters("content_type")
+    summary["content_items"] = sum(summary["content_by_type"].values())
+    summary["total_chars"] = sum(repo.get_counters("content_chars").values())
+    summary["extractions_by_cat"] = repo.get_counters("category")
+    summary["extractions"] = sum(summary["extractions_by_cat"].values())
+    summary["calls"] = sum(repo.get_counters("call_type").values())
 
     return summary
 
@@ -1299,8 +1722,9 @@ def init_templates(ctx, force):
 @cli.command(name="voice-print")
 @click.option("--force", is_flag=True, help="Regenerate even if voice-print.md exists")
 @click.option("--sample-size", type=int, default=100, help="Turns per sample bucket")
+@click.option("--seed", type=int, default=None, help="Random seed for reproducible sampling")
 @click.pass_context
-def voice_print_cmd(ctx, force, sample_size):
+def voice_print_cmd(ctx, force, sample_size, seed):
     """Analyze speaking/writing patterns and generate a voice profile."""
     from contentsifter.planning.voiceprint import (
         analyze_voice,
@@ -1348,10 +1772,124 @@ def voice_print_cmd(ctx, force, sample_size):
         result = analyze_voice(
             db, llm, sample_per_bucket=sample_size,
             coach_name=client_config.name, coach_email=client_config.email,
+            seed=seed,
         )
 
     out_path = save_voice_print(result, path=vp_path)
     console.print(f"[green]Voice print saved to:[/green] {out_path}")
+    ctx.invoke(voice_card_cmd, rebuild=True)
+    ctx.invoke(voice_profile_cmd)
+
+
+@cli.command(name="voice-card")
+@click.option("--rebuild", is_flag=True, help="Rebuild even if the card is up to date")
+@click.option("--compare", "compare_query", help="Draft from this search with the full print and with the card")
+@click.option(
+    "--format", "-f", "format_type",
+    type=click.Choice([
+        "linkedin", "newsletter", "thread", "playbook",
+        "video-script", "carousel",
+        "email-welcome", "email-weekly", "email-sales",
+    ]),
+    default="linkedin",
+    help="Format for --compare",
+)
+@click.option("--limit", type=int, default=10, help="Max source items for --compare")
+@click.pass_context
+def voice_card_cmd(ctx, rebuild, compare_query, format_type, limit):
+    """Build the short voice card used in draft prompts (no API calls).
+
+    With --compare, drafts once with each and reports prompt size and voice
+    match, so you can check the card keeps the voice.
+    """
+    from contentsifter.generate.sources import estimate_tokens
+    from contentsifter.planning.voicecard import (
+        build_voice_card,
+        compare_voice_prompts,
+        load_voice_card,
+        save_voice_card,
+        voice_card_path,
+    )
+    from contentsifter.planning.voiceprint import load_voice_print
+    from contentsifter.planning.voiceprofile import load_voice_profile
+
+    client_config = _get_client_config(ctx)
+    vp_path = client_config.voice_print_path
+    voice_print = load_voice_print(path=vp_path)
+    if voice_print is None:
+        raise click.ClickException(f"No voice print at {vp_path}. Run voice-print first.")
+
+    if rebuild:
+        save_voice_card(build_voice_card(voice_print), voice_card_path(vp_path))
+    voice_card = load_voice_card(path=vp_path)
+
+    print_tokens = estimate_tokens(voice_print)
+    card_tokens = estimate_tokens(voice_card)
+    console.print(f"[green]Voice card:[/green] {voice_card_path(vp_path)}")
+    console.print(
+        f"Full print ~{print_tokens:,} tokens, card ~{card_tokens:,} tokens "
+        f"({1 - card_tokens / print_tokens:.0%} fewer per draft prompt)"
+    )
+
+    if not compare_query:
+        return
+
+    from contentsifter.search.filters import SearchFilters
+    from contentsifter.search.keyword import keyword_search
+
+    with Database(ctx.obj["db_path"]) as db:
+        results = keyword_search(db, compare_query, SearchFilters(limit=limit))
+    if not results:
+        console.print("[yellow]No source material found for that query.[/yellow]")
+        return
+
+    llm = create_llm_client(ctx.obj["llm_mode"], ctx.obj["model"])
+    voice_profile = load_voice_profile(client_config.voice_profile_path)
+    console.print(f"Drafting {format_type} from {len(results)} source items with each...")
+    rows = compare_voice_prompts(results, format_type, llm, voice_print, voice_card, voice_profile)
+
+    table = Table(title="Voice print vs voice card (before gates)")
+    table.add_column("Prompt")
+    table.add_column("Voice tokens", justify="right")
+    table.add_column("Input tokens", justify="right")
+    table.add_column("Voice match", justify="right")
+    for row in rows:
+        match = f"{row['voice_match']:.2f}" if row["voice_match"] is not None else "-"
+        table.add_row(row["prompt"], f"{row['voice_tokens']:,}", f"{row['input_tokens']:,}", match)
+    console.print(table)
+    if voice_profile is None:
+        console.print("[dim]No voice profile; run voice-profile to score voice match.[/dim]")
+
+
+@cli.command(name="voice-profile")
+@click.pass_context
+def voice_profile_cmd(ctx):
+    """Measure the client's writing into a numeric voice profile (no API calls).
+
+    Drafts that already match the profile skip the voice gate.
+    """
+    from contentsifter.planning.voiceprofile import (
+        MIN_PROFILE_WORDS,
+        build_voice_profile,
+        save_voice_profile,
+    )
+
+    client_config = _get_client_config(ctx)
+    with Database(ctx.obj["db_path"]) as db:
+        profile = build_voice_profile(db, coach_name=client_config.name, coach_email=client_config.email)
+
+    if profile.word_count < MIN_PROFILE_WORDS:
+        console.print(
+            f"[yellow]Only {profile.word_count:,} words of source text; "
+            f"need {MIN_PROFILE_WORDS:,} for a voice profile.[/yellow]"
+        )
+        return
+
+    out_path = save_voice_profile(profile, client_config.voice_profile_path)
+    console.print(
+        f"[green]Voice profile saved to:[/green] {out_path} "
+        f"({profile.word_count:,} words from {profile.sample_count:,} samples)"
+    )
 
 
 @cli.command(name="plan-week")
@@ -1391,6 +1929,7 @@ def plan_week(ctx, week_of, topic_focus, no_llm):
             use_llm=not no_llm,
             calendar_dir=client_config.calendar_dir,
             voice_print_path=client_config.voice_print_path,
+            voice_profile_path=client_config.voice_profile_path,
         )
 
     console.print(f"[green]Calendar saved to:[/green] {output_path}")
@@ -68,6 +68,10 @@ class ClientConfig:
     def voice_print_path(self) -> Path:
         return self.content_dir / "voice-print.md"
 
+    @property
+    def voice_profile_path(self) -> Path:
+        return self.content_dir / "voice-profile.json"
+
     @property
     def drafts_dir(self) -> Path:
         return self.content_dir / "drafts"
@@ -84,6 +88,10 @@ class ClientConfig:
     def exports_dir(self) -> Path:
         return self.db_path.parent / "exports"
 
+    @property
+    def rerank_weights_path(self) -> Path:
+        return self.db_path.parent / "rerank-weights.json"
+
     def ensure_dirs(self):
         """Create all client directories if they don't exist."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
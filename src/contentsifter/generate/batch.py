@@ -0,0 +1,263 @@
+"""Bulk draft generation from a topic list, resumable across runs.
+
+The job file is CSV (with a header row) or JSONL, one draft per row:
+
+    topic,format,category,min_quality,limit
+    networking tips,linkedin,playbook,4,
+    salary negotiation,thread,,,
+
+Only ``topic`` and ``format`` are required; ``category`` may list several
+categories separated by ``;``. Source retrieval runs up front on the
+calling thread (SQLite connections stay on their own thread), then
+generation and gates run on a bounded thread pool.
+
+Every finished row is appended to a JSONL status log keyed by a hash of
+the row's fields. A rerun skips rows already marked done, so an
+interrupted or partly failed job picks up where it stopped; editing a
+row gives it a new key and it runs again.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from contentsifter.generate.drafts import generate_draft
+from contentsifter.search.filters import SearchFilters
+from contentsifter.search.keyword import keyword_search
+from contentsifter.storage.database import Database
+from contentsifter.storage.drafts import index_draft
+
+log = logging.getLogger(__name__)
+
+# Drafts generated at once
+DEFAULT_WORKERS = 4
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+@dataclass
+class BatchRow:
+    """One requested draft."""
+
+    line: int
+    topic: str
+    format_type: str
+    categories: list[str] = field(default_factory=list)
+    min_quality: int = 3
+    limit: int = 10
+
+    @property
+    def key(self) -> str:
+        """Stable id for the status log; changes if any field changes."""
+        fields = [self.topic, self.format_type, ";".join(self.categories), str(self.min_quality), str(self.limit)]
+        return hashlib.sha1("\x1f".join(fields).encode()).hexdigest()[:12]
+
+    @property
+    def filename(self) -> str:
+        slug = _SLUG_RE.sub("-", self.topic.lower()).strip("-")[:40] or "draft"
+        return f"{self.format_type}-{slug}-{self.key[:6]}.md"
+
+
+@dataclass
+class BatchSummary:
+    """Counts and timing for one run_batch() call."""
+
+    total: int = 0
+    done: int = 0
+    skipped: int = 0
+    failed: int = 0
+    no_source: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def drafts_per_minute(self) -> float:
+        return self.done * 60 / self.elapsed if self.elapsed else 0.0
+
+
+def _int_field(value, default: int, name: str, line: int) -> int:
+    if value is None or str(value).strip() == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"Line {line}: {name} must be a number, got {value!r}") from None
+
+
+def _row(record: dict, line: int) -> BatchRow:
+    topic = str(record.get("topic") or "").strip()
+    format_type = str(record.get("format") or "").strip()
+    if not topic or not format_type:
+        raise ValueError(f"Line {line}: topic and format are required")
+    categories = record.get("category") or []
+    if isinstance(categories, str):
+        categories = [c.strip() for c in categories.split(";") if c.strip()]
+    return BatchRow(
+        line=line,
+        topic=topic,
+        format_type=format_type,
+        categories=list(categories),
+        min_quality=_int_field(record.get("min_quality"), 3, "min_quality", line),
+        limit=_int_field(record.get("limit"), 10, "limit", line),
+    )
+
+
+def read_batch_file(path: Path) -> list[BatchRow]:
+    """Parse a CSV or JSONL (by extension) job file into rows.
+
+    Raises ValueError naming the line of the first malformed row.
+    """
+    text = path.read_text()
+    if path.suffix.lower() in (".jsonl", ".json"):
+        rows = []
+        for line, raw in enumerate(text.splitlines(), start=1):
+            if not raw.strip():
+                continue
+            try:
+                record = json.loads(raw)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Line {line}: {e.msg}") from None
+            rows.append(_row(record, line))
+        return rows
+
+    reader = csv.DictReader(text.splitlines())
+    # Header is line 1, so data rows start at line 2
+    return [_row(record, line) for line, record in enumerate(reader, start=2)]
+
+
+def status_path_for(job_path: Path) -> Path:
+    """Default status log location: next to the job file."""
+    return job_path.with_name(job_path.name + ".status.jsonl")
+
+
+def load_status(path: Path) -> dict[str, dict]:
+    """Latest status record per row key.
+
+    Lines that don't parse (a run killed mid-append) are logged and
+    skipped; their rows simply run again.
+    """
+    status: dict[str, dict] = {}
+    if not path.exists():
+        return status
+    for line, raw in enumerate(path.read_text().splitlines(), start=1):
+        if not raw.strip():
+            continue
+        try:
+            record = json.loads(raw)
+            status[record["key"]] = record
+        except (ValueError, KeyError, TypeError):
+            log.warning("Skipping unreadable line %d of %s", line, path)
+    return status
+
+
+def run_batch(
+    db: Database,
+    rows: list[BatchRow],
+    llm_client,
+    drafts_dir: Path,
+    status_path: Path,
+    voice_print: str | None = None,
+    voice_profile=None,
+    workers: int = DEFAULT_WORKERS,
+    on_result=None,
+    voice_card: str | None = None,
+) -> BatchSummary:
+    """Generate a draft for every row not already done, ``workers`` at a time.
+
+    ``on_result(row, record)`` is called on this thread as each row
+    finishes. Returns counts and elapsed time for the rows run here.
+    """
+    start = time.perf_counter()
+    summary = BatchSummary(total=len(rows))
+    previous = load_status(status_path)
+    status_path.parent.mkdir(parents=True, exist_ok=True)
+    # Terminate a partial last line so the next record starts on its own
+    if status_path.exists() and status_path.stat().st_size:
+        with status_path.open("rb+") as f:
+            f.seek(-1, 2)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+    def record(row: BatchRow, status: str, started: float, **extra):
+        entry = {
+            "key": row.key,
+            "line": row.line,
+            "topic": row.topic,
+            "format": row.format_type,
+            "status": status,
+            "seconds": round(time.perf_counter() - started, 2),
+            "finished_at": datetime.now().isoformat(timespec="seconds"),
+            **extra,
+        }
+        with status_path.open("a") as f:
+            f.write(json.dumps(entry) + "\n")
+        if status == "done":
+            summary.done += 1
+        elif status == "no_source":
+            summary.no_source += 1
+        else:
+            summary.failed += 1
+        if on_result:
+            on_result(row, entry)
+
+    # Retrieval on this thread, since the connection can't be shared
+    pending: list[tuple[BatchRow, list[dict]]] = []
+    seen: set[str] = set()
+    for row in rows:
+        if previous.get(row.key, {}).get("status") == "done" or row.key in seen:
+            summary.skipped += 1
+            continue
+        seen.add(row.key)
+        started = time.perf_counter()
+        filters = SearchFilters(categories=row.categories, min_quality=row.min_quality, limit=row.limit)
+        try:
+            results = keyword_search(db, row.topic, filters)
+        except Exception as e:
+            record(row, "failed", started, error=f"{type(e).__name__}: {e}")
+            continue
+        if not results:
+            record(row, "no_source", started)
+            continue
+        pending.append((row, results))
+
+    def generate(row: BatchRow, results: list[dict]) -> tuple[float, Path | None, str | None]:
+        started = time.perf_counter()
+        path = drafts_dir / row.filename
+        try:
+            generate_draft(
+                results, row.format_type, llm_client, topic=row.topic,
+                voice_print=voice_print, save_to=path, voice_profile=voice_profile,
+                voice_card=voice_card,
+            )
+        except Exception as e:
+            log.warning("Batch line %d (%s) failed: %s", row.line, row.topic, e)
+            return started, None, f"{type(e).__name__}: {e}"
+        return started, path, None
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(pending)))) as pool:
+            futures = {pool.submit(generate, row, results): row for row, results in pending}
+            for future in as_completed(futures):
+                row = futures[future]
+                started, path, error = future.result()
+                if error:
+                    record(row, "failed", started, error=error)
+                    continue
+                # Index on this thread too, so the drafts page lists it without a rescan
+                try:
+                    index_draft(db, path)
+                    db.conn.commit()
+                except (OSError, UnicodeDecodeError) as e:
+                    log.warning("Could not index draft %s: %s", path, e)
+                record(row, "done", started, path=str(path))
+
+    summary.elapsed = time.perf_counter() - start
+    return summary
@@ -3,21 +3,34 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 
 from contentsifter.generate.gates import load_ai_gate, run_content_gates
+from contentsifter.generate.sources import pack_sources, source_budget
 from contentsifter.generate.templates import TEMPLATES
 from contentsifter.llm.client import complete_with_retry
 
 log = logging.getLogger(__name__)
 
+# Formats generated at once by generate_drafts_multi()
+MAX_PARALLEL_FORMATS = 4
 
-def format_source_material(results: list[dict]) -> str:
-    """Format search results into source material for generation."""
+
+def format_source_material(results: list[dict], budget_tokens: int | None = None) -> str:
+    """Format search results into source material for generation.
+
+    With ``budget_tokens``, results are first selected and trimmed to fit
+    (see generate.sources.pack_sources).
+    """
+    if budget_tokens is not None:
+        results = pack_sources(results, budget_tokens)
     sections = []
     for r in results:
         section = f"### {r['title']} [{r['category'].upper()}]\n"
-        section += f"{r['content']}\n"
+        if r["content"]:
+            section += f"{r['content']}\n"
         if r.get("raw_quote"):
             section += f'\n> Direct quote: "{r["raw_quote"]}"\n'
         if r.get("tags"):
@@ -39,36 +52,30 @@ def _inject_voice_context(system_prompt: str, voice_print: str | None) -> str:
     return system_prompt
 
 
-def generate_draft(
-    results: list[dict],
-    format_type: str,
-    llm_client,
-    topic: str | None = None,
-    voice_print: str | None = None,
-    save_to: Path | None = None,
-) -> str:
-    """Generate a content draft from search results.
+def draft_system_prompt(format_type: str, voice_print: str | None) -> str:
+    """The format's system prompt with the voice print filled in."""
+    return _inject_voice_context(TEMPLATES[format_type]["system"], voice_print)
 
-    All drafts pass through content gates (AI detection + voice matching +
-    hard cleanup). Voice print and gates are never skipped.
 
-    Args:
-        results: Search results to use as source material
-        format_type: One of the TEMPLATES keys
-        llm_client: The LLM client to use
-        topic: Optional topic/title override
-        voice_print: Optional voice print content for tone matching
-        save_to: Optional path to save the draft as a markdown file
-    """
+def _check_format(format_type: str):
     if format_type not in TEMPLATES:
         raise ValueError(f"Unknown format: {format_type}. Choose from: {list(TEMPLATES.keys())}")
 
-    template = TEMPLATES[format_type]
-    source_material = format_source_material(results)
-    system_prompt = _inject_voice_context(template["system"], voice_print)
 
-    if not topic:
-        topic = results[0]["title"] if results else "career coaching insights"
+def _draft_from_source(
+    source_material: str,
+    format_type: str,
+    llm_client,
+    topic: str,
+    voice_print: str | None,
+    voice_profile,
+    ai_gate_doc: str,
+    save_to: Path | None,
+    voice_card: str | None = None,
+) -> str:
+    """Generate, gate and optionally save one draft from formatted source material."""
+    template = TEMPLATES[format_type]
+    system_prompt = draft_system_prompt(format_type, voice_card or voice_print)
 
     response = complete_with_retry(
         llm_client,
@@ -84,9 +91,9 @@ def generate_draft(
 
     # Always run content gates (AI detection + voice matching + hard cleanup)
     log.info("Running content gates on %s draft...", format_type)
-    ai_gate_doc = load_ai_gate()
     draft = run_content_gates(
-        draft, llm_client, voice_print=voice_print, ai_gate_doc=ai_gate_doc
+        draft, llm_client, voice_print=voice_print, ai_gate_doc=ai_gate_doc,
+        format_type=format_type, voice_profile=voice_profile, voice_card=voice_card,
     )
 
     if save_to:
@@ -94,3 +101,96 @@ def generate_draft(
         save_to.write_text(f"# {topic}\n\n*Format: {format_type}*\n\n---\n\n{draft}\n")
 
     return draft
+
+
+def generate_draft(
+    results: list[dict],
+    format_type: str,
+    llm_client,
+    topic: str | None = None,
+    voice_print: str | None = None,
+    save_to: Path | None = None,
+    voice_profile=None,
+    voice_card: str | None = None,
+) -> str:
+    """Generate a content draft from search results.
+
+    All drafts pass through content gates (AI detection + voice matching +
+    hard cleanup). The AI gate is skipped or narrowed to a targeted fix when
+    local checks find the draft already clean, and the voice gate when the
+    draft already matches ``voice_profile``; hard cleanup always runs.
+
+    Args:
+        results: Search results to use as source material
+        format_type: One of the TEMPLATES keys
+        llm_client: The LLM client to use
+        topic: Optional topic/title override
+        voice_print: Optional voice print content for tone matching
+        save_to: Optional path to save the draft as a markdown file
+        voice_profile: Optional VoiceProfile for skipping the voice gate
+        voice_card: Optional short voice card, used in place of the voice
+            print in the prompt and regular voice gate
+
+    Source material is packed into the format's token budget
+    (SOURCE_TOKEN_BUDGETS), so extra results cost nothing once it's full.
+    """
+    _check_format(format_type)
+    if not topic:
+        topic = results[0]["title"] if results else "career coaching insights"
+    return _draft_from_source(
+        format_source_material(results, source_budget(format_type)), format_type, llm_client, topic,
+        voice_print, voice_profile, load_ai_gate(), save_to, voice_card,
+    )
+
+
+def generate_drafts_multi(
+    results: list[dict],
+    formats: list[str],
+    llm_client,
+    topic: str | None = None,
+    voice_print: str | None = None,
+    save_dir: Path | None = None,
+    voice_profile=None,
+    max_workers: int = MAX_PARALLEL_FORMATS,
+    voice_card: str | None = None,
+) -> dict[str, str | Exception]:
+    """Generate one draft per format from the same source material, in parallel.
+
+    Source material is packed once per distinct format budget and the
+    AI-gate reference loaded once; both are shared across formats.
+    Each format runs generate_draft()'s full pipeline on its own thread, so
+    the whole set takes about as long as the slowest format. With
+    ``save_dir``, each draft is saved there as ``{format}-{timestamp}.md``.
+
+    Returns format -> draft, in ``formats`` order. A format whose generation
+    failed maps to the exception it raised, so one failure doesn't lose the
+    other drafts.
+    """
+    formats = list(dict.fromkeys(formats))
+    for format_type in formats:
+        _check_format(format_type)
+    if not topic:
+        topic = results[0]["title"] if results else "career coaching insights"
+
+    budgets = {format_type: source_budget(format_type) for format_type in formats}
+    materials = {budget: format_source_material(results, budget) for budget in set(budgets.values())}
+    ai_gate_doc = load_ai_gate()
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+
+    def run(format_type: str) -> str:
+        save_to = save_dir / f"{format_type}-{timestamp}.md" if save_dir else None
+        return _draft_from_source(
+            materials[budgets[format_type]], format_type, llm_client, topic,
+            voice_print, voice_profile, ai_gate_doc, save_to, voice_card,
+        )
+
+    drafts: dict[str, str | Exception] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(formats)))) as pool:
+        futures = {format_type: pool.submit(run, format_type) for format_type in formats}
+        for format_type, future in futures.items():
+            try:
+                drafts[format_type] = future.result()
+            except Exception as e:
+                log.warning("Failed to generate %s draft: %s", format_type, e)
+                drafts[format_type] = e
+    return drafts
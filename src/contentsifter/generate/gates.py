@@ -5,92 +5,44 @@ Three gates:
 2. Voice Gate: Validates and rewrites to match the voice print
 3. Hard Cleanup: Regex backstop that programmatically fixes all remaining violations
 
+The AI gate is conditional: a draft that already passes verify_draft() and
+scores low on the local AI-pattern scorer (stylometry.py) skips it, and one
+with only a few violations gets a targeted fix instead of a full rewrite
+(GATE_POLICIES, per format). The voice gate is skipped when the draft
+already matches the client's numeric voice profile
+(planning/voiceprofile.py).
+
 After gates run, verify_draft() checks for any remaining violations. If found, one
 targeted LLM retry runs with specific violation feedback. Hard cleanup is the final
-guaranteed backstop.
+guaranteed backstop and always runs.
 """
 
 from __future__ import annotations
 
 import logging
 import re
+from bisect import bisect_left
+from dataclasses import dataclass
 from pathlib import Path
 from typing import NamedTuple
 
+from contentsifter.assets import asset_cache
 from contentsifter.config import CONTENT_DIR, MODEL_LIGHT
+from contentsifter.generate.lexicon import (
+    BANNED_CHARS,
+    BANNED_PHRASES,
+    BANNED_WORD_RE,
+    WORD_CATEGORIES,
+    alternation,
+    fold,
+)
+from contentsifter.generate.stylometry import score_ai_patterns
 from contentsifter.llm.client import complete_with_retry, create_client
 
 log = logging.getLogger(__name__)
 
 AI_GATE_PATH = CONTENT_DIR / "ai-gate.md"
 
-# ---------------------------------------------------------------------------
-# Banned lists — derived from ai-gate.md Quick-Reference + Sections 2-15
-# ---------------------------------------------------------------------------
-
-BANNED_CHARS = {"—", "–"}
-
-# Words that are ALWAYS banned regardless of context.
-# Checked with word-boundary regex (\b) to avoid false positives.
-BANNED_WORDS: frozenset[str] = frozenset({
-    # Verbs (Section 3)
-    "delve", "delving", "harness", "harnessing", "leverage", "leveraging",
-    "utilize", "utilizing", "facilitate", "augment", "embark",
-    "illuminate", "underscore", "bolster", "spearhead",
-    "foster", "cultivate", "streamline", "empower", "elevate",
-    "amplify", "curate", "catalyze", "galvanize",
-    # Adjectives (Section 3)
-    "robust", "seamless", "transformative",
-    "groundbreaking", "exemplary", "invaluable", "commendable",
-    "pivotal", "paramount", "multifaceted", "holistic", "synergistic",
-    "ever-evolving", "thought-provoking",
-    "unparalleled", "revolutionary", "unprecedented",
-    # Nouns (Section 3)
-    "tapestry", "realm", "beacon", "paradigm", "synergy", "synergies",
-    "stakeholder", "nexus", "plethora", "cacophony",
-    # Additional from writing style section
-    "enlightening", "esteemed", "intricate", "elucidate",
-})
-
-# Formal connectors (Section 5) — always banned
-BANNED_CONNECTORS: frozenset[str] = frozenset({
-    "furthermore", "moreover", "additionally", "consequently",
-    "nevertheless", "nonetheless", "notwithstanding", "subsequently",
-    "accordingly", "hereby", "whereby",
-    "undoubtedly", "arguably", "notably", "remarkably",
-    "crucially", "importantly",
-})
-
-# Multi-word phrases — case-insensitive substring match
-BANNED_PHRASES: tuple[str, ...] = (
-    "it's important to note", "it's worth noting", "it's worth mentioning",
-    "it's crucial to understand", "it is essential to consider",
-    "in today's", "in the realm of", "serves as a",
-    "at the end of the day", "in conclusion", "in closing", "in summary",
-    "moving forward", "the bottom line", "navigate the", "embark on a journey",
-    "unlock the potential", "harness the power", "at the forefront",
-    "bridge the gap", "pave the way", "whether you're a seasoned",
-    "as we navigate", "in an ever-evolving", "from a broader perspective",
-    "generally speaking", "it could be argued", "needless to say",
-    "it goes without saying", "for all intents and purposes",
-    "at this point in time", "in order to", "due to the fact that",
-    "has the ability to", "delve into", "shed light", "dive deep",
-    "in a world where", "remains to be seen",
-    # Bridge phrases (Section 5)
-    "with that in mind", "on the flip side", "to put it simply",
-    "to that end", "by the same token", "in the same vein", "along those lines",
-    # Closers (Section 6)
-    "to sum up", "in essence", "all things considered", "to wrap things up",
-    "as we've seen", "final thoughts",
-    # Hedging (Section 2)
-    "perhaps you might want", "you may want to check", "one might argue",
-    "it should be noted", "bearing in mind",
-    "given the fact that", "as a matter of fact", "in light of the fact",
-    # Openers (Section 4)
-    "in the world of", "have you ever wondered",
-    "when it comes to", "at its core",
-)
-
 # Safe mechanical word replacements — ONLY where the swap is always correct.
 # Context-dependent words (landscape, dynamic, innovative, etc.) are excluded.
 SAFE_WORD_SWAPS: dict[str, str] = {
@@ -189,6 +141,57 @@ SAFE_PHRASE_SWAPS: dict[str, str] = {
     "embark on a journey": "start",
 }
 
+# ---------------------------------------------------------------------------
+# Compiled rules — built once at import, shared by every draft checked
+# ---------------------------------------------------------------------------
+
+# Decorative emoji (❌ and ✅ are allowed as list bullets)
+_EMOJI_CLASS = "[🚀💪✨🔥💡🎯🙌👏👇👆🤔💰🎉🏆🌟⭐💥🔑📌🙏❤️🤝💼📈🧠👀🎁💎🫶🤷‍♀️🤷‍♂️🤷]"
+
+
+def _find_all(pattern: re.Pattern, text: str):
+    """Yield every match of ``pattern`` in ``text``, overlapping ones included."""
+    m = pattern.search(text)
+    while m:
+        yield m
+        m = pattern.search(text, m.start() + 1)
+
+
+_CHAR_RE = re.compile("[" + re.escape("".join(sorted(BANNED_CHARS))) + "]")
+_SEMICOLON_CHAR_RE = re.compile(";")
+_ASTERISK_RE = re.compile(r"\*{1,3}\S")
+_EMOJI_RE = re.compile(_EMOJI_CLASS)
+_NEWLINE_RE = re.compile("\n")
+
+# verify_draft() reports each line's violations in this category order
+_CATEGORY_ORDER = {
+    cat: i for i, cat in enumerate(
+        ("char", "semicolon", "asterisk", "word", "connector", "phrase", "emoji")
+    )
+}
+
+# Swaps are case-insensitive: they match against lexicon.fold()ed text.
+# Phrase swaps apply longest first, each to the output of the one before
+_PHRASE_SWAP_ORDER = [
+    (phrase, re.compile(re.escape(phrase), re.IGNORECASE), SAFE_PHRASE_SWAPS[phrase])
+    for phrase in sorted(SAFE_PHRASE_SWAPS, key=len, reverse=True)
+]
+
+# Word swaps never overlap (each is a whole word and no replacement is
+# itself a swap key), so one pass gives the same result as one sub per word
+_WORD_SWAP_RE = re.compile(r"\b(?:" + alternation(SAFE_WORD_SWAPS) + r")\b")
+
+_DASH_RE = re.compile(r"\s*[—–]\s*")
+_SEMICOLON_RE = re.compile(r"\s*;\s*")
+_LOWER_AFTER_PERIOD_RE = re.compile(r"\. ([a-z])")
+_DOUBLE_PERIOD_RE = re.compile(r"\.\s*\.")
+_PERIOD_COMMA_RE = re.compile(r"\.\s*,")
+_EMPHASIS_RE = re.compile(r"\*{1,3}(.+?)\*{1,3}")
+_EMOJI_RUN_RE = re.compile(r"[^\S\n]*" + _EMOJI_CLASS + r"+[^\S\n]*")
+_MULTI_SPACE_RE = re.compile(r" {2,}")
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+_BLANK_LINE_SPACES_RE = re.compile(r"\n +\n")
+
 # ---------------------------------------------------------------------------
 # Verification
 # ---------------------------------------------------------------------------
@@ -201,54 +204,48 @@ class Violation(NamedTuple):
     line_number: int    # 1-indexed
 
 
+def _line_starts(text: str) -> list[int]:
+    return [m.start() for m in _NEWLINE_RE.finditer(text)]
+
+
 def verify_draft(text: str) -> list[Violation]:
     """Check a draft against all instant-fail criteria.
 
     Returns a list of Violation tuples. Empty list means the draft passes.
-    Pure string/regex matching — no LLM calls, very fast.
+    Pure string/regex matching — no LLM calls, very fast. Each rule is
+    reported at most once per line.
     """
-    violations: list[Violation] = []
-    lines = text.split("\n")
-
-    for i, line in enumerate(lines, start=1):
-        line_lower = line.lower()
-
-        # Banned characters
-        for ch in BANNED_CHARS:
-            if ch in line:
-                violations.append(Violation("char", ch, i))
-
-        # Semicolons
-        if ";" in line:
-            violations.append(Violation("semicolon", ";", i))
-
-        # Markdown bold/italic asterisks (not bullet point *)
-        if re.search(r"\*{1,3}\S", line):
-            violations.append(Violation("asterisk", "**", i))
-
-        # Banned words (word-boundary, case-insensitive)
-        for word in BANNED_WORDS:
-            if re.search(r"\b" + re.escape(word) + r"\b", line_lower):
-                violations.append(Violation("word", word, i))
-
-        # Banned connectors
-        for conn in BANNED_CONNECTORS:
-            if re.search(r"\b" + re.escape(conn) + r"\b", line_lower):
-                violations.append(Violation("connector", conn, i))
-
-        # Banned phrases (substring)
-        for phrase in BANNED_PHRASES:
-            if phrase.lower() in line_lower:
-                violations.append(Violation("phrase", phrase, i))
-
-        # Decorative emoji
-        if re.search(
-            r"[🚀💪✨🔥💡🎯🙌👏👇👆🤔💰🎉🏆🌟⭐💥🔑📌🙏❤️🤝💼📈🧠👀🎁💎🫶🤷‍♀️🤷‍♂️🤷]",
-            line,
-        ):
-            violations.append(Violation("emoji", "decorative emoji", i))
-
-    return violations
+    found: dict[Violation, tuple] = {}
+
+    def add(category: str, matched: str, line: int, order=0):
+        v = Violation(category, matched, line)
+        if v not in found:
+            found[v] = (line, _CATEGORY_ORDER[category], order)
+
+    breaks = _line_starts(text)
+    for m in _CHAR_RE.finditer(text):
+        add("char", m.group(), bisect_left(breaks, m.start()) + 1, m.group())
+    for m in _SEMICOLON_CHAR_RE.finditer(text):
+        add("semicolon", ";", bisect_left(breaks, m.start()) + 1)
+    for m in _ASTERISK_RE.finditer(text):
+        add("asterisk", "**", bisect_left(breaks, m.start()) + 1)
+    for m in _EMOJI_RE.finditer(text):
+        add("emoji", "decorative emoji", bisect_left(breaks, m.start()) + 1)
+
+    lower = text.lower()
+    breaks = _line_starts(lower)
+    for m in _find_all(BANNED_WORD_RE, lower):
+        word = m.group()
+        add(WORD_CATEGORIES[word], word, bisect_left(breaks, m.start()) + 1, m.start())
+    # Plain substring search beats one big alternation for the phrase list
+    for order, phrase in enumerate(BANNED_PHRASES):
+        needle = phrase.lower()
+        pos = lower.find(needle)
+        while pos != -1:
+            add("phrase", phrase, bisect_left(breaks, pos) + 1, order)
+            pos = lower.find(needle, pos + 1)
+
+    return sorted(found, key=found.__getitem__)
 
 
 def _format_violations_for_llm(violations: list[Violation]) -> str:
@@ -352,10 +349,13 @@ RULES:
 
 
 def load_ai_gate() -> str | None:
-    """Load the AI gate reference document from disk."""
-    if AI_GATE_PATH.exists():
-        return AI_GATE_PATH.read_text()
-    return None
+    """Load the AI gate reference document (cached until the file changes)."""
+    return asset_cache.read_text(AI_GATE_PATH)
+
+
+def _with_reference(system: str, heading: str, reference: str) -> str:
+    """``system`` with a reference document appended."""
+    return system + f"\n\n## {heading}\n\n{reference}"
 
 
 def run_ai_gate(draft: str, llm_client, ai_gate_doc: str | None = None) -> str:
@@ -372,7 +372,7 @@ def run_ai_gate(draft: str, llm_client, ai_gate_doc: str | None = None) -> str:
 
     response = complete_with_retry(
         llm_client,
-        system=AI_GATE_SYSTEM + f"\n\n## AI Writing Reference\n\n{ai_gate_doc}",
+        system=_with_reference(AI_GATE_SYSTEM, "AI Writing Reference", ai_gate_doc),
         user=f"Rewrite this draft to remove all AI-sounding patterns:\n\n{draft}",
         max_tokens=4096,
     )
@@ -390,7 +390,7 @@ def run_voice_gate(draft: str, llm_client, voice_print: str | None = None) -> st
 
     response = complete_with_retry(
         llm_client,
-        system=VOICE_GATE_SYSTEM + f"\n\n## Voice Print Reference\n\n{voice_print}",
+        system=_with_reference(VOICE_GATE_SYSTEM, "Voice Print Reference", voice_print),
         user=f"Rewrite this draft to match the voice print:\n\n{draft}",
         max_tokens=4096,
     )
@@ -427,6 +427,32 @@ def _retry_fix(
 # ---------------------------------------------------------------------------
 
 
+def _capitalize_after_period(m: re.Match) -> str:
+    return ". " + m.group(1).upper()
+
+
+def _swap_phrases(text: str) -> str:
+    """Apply SAFE_PHRASE_SWAPS as one case-insensitive re.sub per phrase would."""
+    folded = fold(text)
+    for phrase, pattern, replacement in _PHRASE_SWAP_ORDER:
+        if phrase in folded:
+            text = pattern.sub(replacement, text)
+            folded = fold(text)
+    return text
+
+
+def _swap_words(text: str) -> str:
+    """Apply SAFE_WORD_SWAPS in one pass over the text."""
+    parts: list[str] = []
+    last = 0
+    for m in _WORD_SWAP_RE.finditer(fold(text)):
+        parts.append(text[last:m.start()])
+        parts.append(SAFE_WORD_SWAPS[m.group()])
+        last = m.end()
+    parts.append(text[last:])
+    return "".join(parts)
+
+
 def _hard_cleanup(text: str) -> str:
     """Regex backstop: programmatically fix anything the LLM gates missed.
 
@@ -436,45 +462,143 @@ def _hard_cleanup(text: str) -> str:
     - Em/en dashes, semicolons, asterisks, decorative emoji, whitespace
     """
     # Phase 1: Phrase swaps (longest first to avoid partial matches)
-    for phrase in sorted(SAFE_PHRASE_SWAPS, key=len, reverse=True):
-        replacement = SAFE_PHRASE_SWAPS[phrase]
-        text = re.sub(re.escape(phrase), replacement, text, flags=re.IGNORECASE)
+    text = _swap_phrases(text)
 
     # Phase 2: Word swaps (word-boundary, case-insensitive)
-    for word, replacement in SAFE_WORD_SWAPS.items():
-        text = re.sub(
-            r"\b" + re.escape(word) + r"\b", replacement, text, flags=re.IGNORECASE
-        )
+    text = _swap_words(text)
 
     # Phase 3: Em/en dashes -> period + space
-    text = re.sub(r"\s*[—–]\s*", ". ", text)
-    text = re.sub(r"\. ([a-z])", lambda m: ". " + m.group(1).upper(), text)
-    text = re.sub(r"\.\s*\.", ".", text)
-    text = re.sub(r"\.\s*,", ",", text)
+    text = _DASH_RE.sub(". ", text)
+    text = _LOWER_AFTER_PERIOD_RE.sub(_capitalize_after_period, text)
+    text = _DOUBLE_PERIOD_RE.sub(".", text)
+    text = _PERIOD_COMMA_RE.sub(",", text)
 
     # Phase 4: Semicolons -> periods
-    text = re.sub(r"\s*;\s*", ". ", text)
-    text = re.sub(r"\. ([a-z])", lambda m: ". " + m.group(1).upper(), text)
-    text = re.sub(r"\.\s*\.", ".", text)
+    text = _SEMICOLON_RE.sub(". ", text)
+    text = _LOWER_AFTER_PERIOD_RE.sub(_capitalize_after_period, text)
+    text = _DOUBLE_PERIOD_RE.sub(".", text)
 
     # Phase 5: Strip markdown bold/italic asterisks
-    text = re.sub(r"\*{1,3}(.+?)\*{1,3}", r"\1", text)
+    text = _EMPHASIS_RE.sub(r"\1", text)
 
     # Phase 6: Strip decorative emoji (keep ❌ ✅ only)
-    text = re.sub(
-        r"[^\S\n]*[🚀💪✨🔥💡🎯🙌👏👇👆🤔💰🎉🏆🌟⭐💥🔑📌🙏❤️🤝💼📈🧠👀🎁💎🫶🤷‍♀️🤷‍♂️🤷]+[^\S\n]*",
-        "",
-        text,
-    )
+    text = _EMOJI_RUN_RE.sub("", text)
 
     # Phase 7: Whitespace cleanup
-    text = re.sub(r" {2,}", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    text = re.sub(r"\n +\n", "\n\n", text)
+    text = _MULTI_SPACE_RE.sub(" ", text)
+    text = _MULTI_NEWLINE_RE.sub("\n\n", text)
+    text = _BLANK_LINE_SPACES_RE.sub("\n\n", text)
 
     return text.strip()
 
 
+# ---------------------------------------------------------------------------
+# Gate policy — which LLM gates a draft actually needs
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class GatePolicy:
+    """When a format's drafts may skip or downgrade the LLM AI gate.
+
+    A draft with no violations and a local AI-pattern score (see
+    stylometry.score_ai_patterns) below ``max_ai_score`` skips the AI gate,
+    unless ``skip_when_clean`` is off. One that also has at most
+    ``max_targeted_density`` violations per 100 words gets a targeted fix
+    of just those violations instead of a full AI-gate rewrite. Anything
+    worse runs the full gate.
+
+    A draft whose voice similarity (see voiceprofile.voice_similarity) is
+    at least ``min_voice_similarity`` skips the voice gate. The voice gate
+    normally rewrites against the short voice card; one scoring below
+    ``deep_voice_similarity`` gets a deep rewrite against the full print.
+    """
+    skip_when_clean: bool = True
+    max_targeted_density: float = 1.0
+    max_ai_score: float = 0.5
+    min_voice_similarity: float = 0.7
+    deep_voice_similarity: float = 0.45
+
+
+DEFAULT_GATE_POLICY = GatePolicy()
+
+# Short formats are judged strictly: a couple of tells in a 150-word post
+# usually means the whole thing reads as AI. Long formats can carry a few.
+GATE_POLICIES: dict[str, GatePolicy] = {
+    "linkedin": GatePolicy(max_targeted_density=0.5, max_ai_score=0.4),
+    "thread": GatePolicy(max_targeted_density=0.5, max_ai_score=0.4),
+    "carousel": GatePolicy(max_targeted_density=0.5, max_ai_score=0.4),
+    "newsletter": GatePolicy(max_targeted_density=1.5),
+    "playbook": GatePolicy(max_targeted_density=1.5, max_ai_score=0.6),
+    "email-weekly": GatePolicy(max_targeted_density=1.5),
+    # Sales copy always gets the full rewrite
+    "email-sales": GatePolicy(skip_when_clean=False, max_targeted_density=0.0),
+}
+
+
+class GateDecision(NamedTuple):
+    """What the policy chose for one gate, and why."""
+    gate: str           # ai, voice, retry, cleanup
+    action: str         # run, targeted, deep, skip
+    reason: str
+
+
+def plan_ai_gate(draft: str, format_type: str | None = None) -> tuple[GateDecision, list[Violation]]:
+    """Decide how much AI-gate work ``draft`` needs from local checks alone.
+
+    Returns the decision and the violations it was based on.
+    """
+    policy = GATE_POLICIES.get(format_type, DEFAULT_GATE_POLICY)
+    violations = verify_draft(draft)
+    ai_score = score_ai_patterns(draft)
+    scored = f"AI-pattern score {ai_score.score:.2f}"
+    if ai_score.score >= policy.max_ai_score:
+        signals = ", ".join(ai_score.strongest())
+        return GateDecision("ai", "run", f"{scored} ({signals})"), violations
+    if not violations:
+        if policy.skip_when_clean:
+            return GateDecision("ai", "skip", f"no rule violations, {scored}"), violations
+        return GateDecision("ai", "run", f"{format_type} drafts always get the full gate"), violations
+
+    density = len(violations) * 100 / max(len(draft.split()), 1)
+    found = f"{len(violations)} violations ({density:.1f} per 100 words), {scored}"
+    if density <= policy.max_targeted_density:
+        return GateDecision("ai", "targeted", found), violations
+    return GateDecision("ai", "run", found), violations
+
+
+def plan_voice_gate(
+    draft: str,
+    voice_print: str | None,
+    voice_profile=None,
+    format_type: str | None = None,
+) -> GateDecision:
+    """Decide whether ``draft`` needs the voice gate.
+
+    ``voice_profile`` is a planning.voiceprofile.VoiceProfile; without one
+    every draft with a voice print runs the gate.
+    """
+    if not voice_print:
+        return GateDecision("voice", "skip", "no voice print")
+    if voice_profile is None:
+        return GateDecision("voice", "run", "voice print provided, no voice profile")
+
+    from contentsifter.planning.voiceprofile import voice_similarity
+
+    policy = GATE_POLICIES.get(format_type, DEFAULT_GATE_POLICY)
+    match = voice_similarity(draft, voice_profile)
+    scored = f"voice similarity {match.score:.2f}"
+    if match.score >= policy.min_voice_similarity:
+        return GateDecision("voice", "skip", f"{scored} already matches the profile")
+    if match.score < policy.deep_voice_similarity:
+        return GateDecision("voice", "deep", f"{scored} is far from the profile")
+    return GateDecision("voice", "run", scored)
+
+
+def _log_decision(decision: GateDecision):
+    log.info("Gate %s: %s (%s)", decision.gate, decision.action, decision.reason)
+
+
 # ---------------------------------------------------------------------------
 # Orchestrator
 # ---------------------------------------------------------------------------
@@ -493,40 +617,61 @@ def run_content_gates(
     llm_client,
     voice_print: str | None = None,
     ai_gate_doc: str | None = None,
+    format_type: str | None = None,
+    voice_profile=None,
+    voice_card: str | None = None,
 ) -> str:
     """Run content gates with verification and retry.
 
     Flow:
-    1. AI gate (Haiku) — remove AI patterns
-    2. Voice gate (Sonnet) — match client voice
-    3. Verify — check for remaining violations
-    4. If violations: one targeted LLM retry with specific feedback
-    5. Hard cleanup — guaranteed programmatic fix
-    6. Final verify — log warning if anything remains
+    1. Plan — local checks decide whether the AI gate runs in full, runs
+       as a targeted fix, or is skipped (see GATE_POLICIES)
+    2. AI gate (Haiku) — remove AI patterns
+    3. Voice gate (Sonnet) — match client voice, skipped when the draft
+       already matches ``voice_profile``. Rewrites against ``voice_card``
+       when given, or the full print for drafts far from the profile
+    4. Verify — check for remaining violations
+    5. If violations: one targeted LLM retry with specific feedback
+    6. Hard cleanup — guaranteed programmatic fix, never skipped
+    7. Final verify — log warning if anything remains
+
+    Each gate's decision is logged with its reason.
     """
     if ai_gate_doc is None:
         ai_gate_doc = load_ai_gate()
 
-    # AI gate (lightweight model)
-    log.info("Running AI gate...")
-    light_client = _create_light_client() or llm_client
-    gated = run_ai_gate(draft, light_client, ai_gate_doc=ai_gate_doc)
-
-    # Voice gate (main model)
-    if voice_print:
-        log.info("Running voice gate...")
+    light_client = None
+
+    def light():
+        nonlocal light_client
+        if light_client is None:
+            light_client = _create_light_client() or llm_client
+        return light_client
+
+    # AI gate (lightweight model), only as much as local checks say is needed
+    decision, violations = plan_ai_gate(draft, format_type)
+    _log_decision(decision)
+    gated = draft
+    if decision.action == "run":
+        gated = run_ai_gate(draft, light(), ai_gate_doc=ai_gate_doc)
+    elif decision.action == "targeted":
+        gated = _retry_fix(draft, light(), violations, ai_gate_doc=ai_gate_doc)
+
+    # Voice gate (main model), unless the draft already matches the profile
+    decision = plan_voice_gate(gated, voice_print, voice_profile, format_type)
+    _log_decision(decision)
+    if decision.action == "run":
+        gated = run_voice_gate(gated, llm_client, voice_print=voice_card or voice_print)
+    elif decision.action == "deep":
         gated = run_voice_gate(gated, llm_client, voice_print=voice_print)
 
     # Verify after both gates
     violations = verify_draft(gated)
     if violations:
-        log.info(
-            "Found %d violations after gates, running targeted retry...",
-            len(violations),
-        )
+        _log_decision(GateDecision("retry", "run", f"{len(violations)} violations after gates"))
         gated = _retry_fix(
-            gated, light_client, violations,
-            ai_gate_doc=ai_gate_doc, voice_print=voice_print,
+            gated, light(), violations,
+            ai_gate_doc=ai_gate_doc, voice_print=voice_card or voice_print,
         )
         post_retry = verify_draft(gated)
         if post_retry:
@@ -534,9 +679,11 @@ def run_content_gates(
                 "%d violations remain after retry, hard cleanup will fix...",
                 len(post_retry),
             )
+    else:
+        _log_decision(GateDecision("retry", "skip", "no violations after gates"))
 
     # Hard cleanup (guaranteed backstop)
-    log.info("Running hard cleanup...")
+    _log_decision(GateDecision("cleanup", "run", "always"))
     gated = _hard_cleanup(gated)
 
     # Final verification
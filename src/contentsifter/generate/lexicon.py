@@ -0,0 +1,101 @@
+"""Banned AI-writing lexicon shared by the content gates and the AI-pattern scorer.
+
+The lists come from ai-gate.md. gates.verify_draft() reports them as
+violations; stylometry.score_ai_patterns() counts them toward the
+lexicon_density signal.
+"""
+
+from __future__ import annotations
+
+import re
+
+# Derived from ai-gate.md Quick-Reference + Sections 2-15
+
+BANNED_CHARS = {"—", "–"}
+
+# Words that are ALWAYS banned regardless of context.
+# Checked with word-boundary regex (\b) to avoid false positives.
+BANNED_WORDS: frozenset[str] = frozenset({
+    # Verbs (Section 3)
+    "delve", "delving", "harness", "harnessing", "leverage", "leveraging",
+    "utilize", "utilizing", "facilitate", "augment", "embark",
+    "illuminate", "underscore", "bolster", "spearhead",
+    "foster", "cultivate", "streamline", "empower", "elevate",
+    "amplify", "curate", "catalyze", "galvanize",
+    # Adjectives (Section 3)
+    "robust", "seamless", "transformative",
+    "groundbreaking", "exemplary", "invaluable", "commendable",
+    "pivotal", "paramount", "multifaceted", "holistic", "synergistic",
+    "ever-evolving", "thought-provoking",
+    "unparalleled", "revolutionary", "unprecedented",
+    # Nouns (Section 3)
+    "tapestry", "realm", "beacon", "paradigm", "synergy", "synergies",
+    "stakeholder", "nexus", "plethora", "cacophony",
+    # Additional from writing style section
+    "enlightening", "esteemed", "intricate", "elucidate",
+})
+
+# Formal connectors (Section 5) — always banned
+BANNED_CONNECTORS: frozenset[str] = frozenset({
+    "furthermore", "moreover", "additionally", "consequently",
+    "nevertheless", "nonetheless", "notwithstanding", "subsequently",
+    "accordingly", "hereby", "whereby",
+    "undoubtedly", "arguably", "notably", "remarkably",
+    "crucially", "importantly",
+})
+
+# Multi-word phrases — case-insensitive substring match
+BANNED_PHRASES: tuple[str, ...] = (
+    "it's important to note", "it's worth noting", "it's worth mentioning",
+    "it's crucial to understand", "it is essential to consider",
+    "in today's", "in the realm of", "serves as a",
+    "at the end of the day", "in conclusion", "in closing", "in summary",
+    "moving forward", "the bottom line", "navigate the", "embark on a journey",
+    "unlock the potential", "harness the power", "at the forefront",
+    "bridge the gap", "pave the way", "whether you're a seasoned",
+    "as we navigate", "in an ever-evolving", "from a broader perspective",
+    "generally speaking", "it could be argued", "needless to say",
+    "it goes without saying", "for all intents and purposes",
+    "at this point in time", "in order to", "due to the fact that",
+    "has the ability to", "delve into", "shed light", "dive deep",
+    "in a world where", "remains to be seen",
+    # Bridge phrases (Section 5)
+    "with that in mind", "on the flip side", "to put it simply",
+    "to that end", "by the same token", "in the same vein", "along those lines",
+    # Closers (Section 6)
+    "to sum up", "in essence", "all things considered", "to wrap things up",
+    "as we've seen", "final thoughts",
+    # Hedging (Section 2)
+    "perhaps you might want", "you may want to check", "one might argue",
+    "it should be noted", "bearing in mind",
+    "given the fact that", "as a matter of fact", "in light of the fact",
+    # Openers (Section 4)
+    "in the world of", "have you ever wondered",
+    "when it comes to", "at its core",
+)
+
+
+def alternation(terms) -> str:
+    """Regex alternation of literal ``terms``, longest first."""
+    return "|".join(re.escape(t) for t in sorted(terms, key=lambda t: (-len(t), t)))
+
+
+# Banned word or connector -> its violation category
+WORD_CATEGORIES: dict[str, str] = {
+    **{word: "word" for word in BANNED_WORDS},
+    **{conn: "connector" for conn in BANNED_CONNECTORS},
+}
+
+# Any banned word or connector, matched against lowercased text
+BANNED_WORD_RE = re.compile(r"\b(?:" + alternation(WORD_CATEGORIES) + r")\b")
+
+# Matching is case-insensitive. Rather than IGNORECASE patterns (which
+# skip the regex engine's literal-prefix scan), patterns are matched
+# against a folded copy of the text: lower() plus the non-ASCII letters
+# IGNORECASE treats as ASCII. Folding keeps offsets, so matches map back
+# one to one.
+_CASE_FOLD = str.maketrans({"İ": "i", "ı": "i", "ſ": "s", "K": "k"})
+
+
+def fold(text: str) -> str:
+    return text.translate(_CASE_FOLD).lower()
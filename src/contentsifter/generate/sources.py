@@ -0,0 +1,133 @@
+"""Token-budgeted selection of source material for draft generation.
+
+Search returns up to ``limit`` results regardless of size, so one long
+playbook can cost more input tokens than the draft needs while a short
+Q&A takes a whole slot. pack_sources() picks what goes into the prompt:
+
+1. Value each result as relevance (its search rank) x quality_score.
+2. Drop near-duplicates of a more valuable result.
+3. Take results in value order while they fit the format's budget.
+   When the next one doesn't fit, use its raw quote alone if it has one,
+   otherwise trim its content at a sentence boundary.
+
+Tokens are estimated at CHARS_PER_TOKEN characters each, which is close
+enough for budgeting English prose.
+"""
+
+from __future__ import annotations
+
+import re
+
+from contentsifter.search.rerank import is_duplicate
+from contentsifter.search.vectors import tokenize
+
+CHARS_PER_TOKEN = 4
+
+# Source-material budget in tokens, per format. Short formats only need a
+# few good points; playbooks and newsletters can use more detail.
+SOURCE_TOKEN_BUDGETS: dict[str, int] = {
+    "linkedin": 1500,
+    "thread": 1500,
+    "carousel": 2000,
+    "video-script": 1200,
+    "email-welcome": 1200,
+    "email-weekly": 2500,
+    "email-sales": 1500,
+    "newsletter": 3000,
+    "playbook": 4000,
+}
+DEFAULT_SOURCE_BUDGET = 2500
+
+# Jaccard overlap of stemmed words above which two results are duplicates
+DUPLICATE_THRESHOLD = 0.8
+
+# Smallest trimmed piece worth including, in tokens
+MIN_TRIMMED_TOKENS = 60
+
+# Sections are joined with this separator; counted against the budget
+SEPARATOR_TOKENS = 2
+
+_SENTENCE_END_RE = re.compile(r"[.!?](?=\s)")
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def source_budget(format_type: str) -> int:
+    return SOURCE_TOKEN_BUDGETS.get(format_type, DEFAULT_SOURCE_BUDGET)
+
+
+def _value(result: dict, position: int) -> float:
+    """Relevance from search rank (1, 1/2, 1/3 ...) times quality (1-5, default 3)."""
+    return (result.get("quality_score") or 3) / (position + 1)
+
+
+def _section_tokens(result: dict) -> int:
+    """Tokens format_source_material() will spend on ``result``."""
+    text = f"{result['title']} {result['category']} {result.get('content') or ''}"
+    if result.get("raw_quote"):
+        text += f" Direct quote: {result['raw_quote']}"
+    if result.get("tags"):
+        text += " Tags: " + ", ".join(result["tags"])
+    return estimate_tokens(text) + 4
+
+
+def _trim(text: str, max_chars: int) -> str:
+    """Cut ``text`` to at most ``max_chars``, at a sentence end when there is one."""
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    ends = [m.end() for m in _SENTENCE_END_RE.finditer(cut + " ")]
+    if ends and ends[-1] > max_chars // 2:
+        return cut[:ends[-1]]
+    return cut.rsplit(" ", 1)[0] + "..."
+
+
+def _fit(result: dict, tokens: int) -> dict | None:
+    """A cut-down copy of ``result`` that fits in ``tokens``, or None."""
+    if tokens < MIN_TRIMMED_TOKENS:
+        return None
+    quote_only = {**result, "content": "", "tags": []}
+    if result.get("raw_quote") and _section_tokens(quote_only) <= tokens:
+        return quote_only
+    overhead = _section_tokens({**result, "content": "", "raw_quote": "", "tags": []})
+    room = (tokens - overhead) * CHARS_PER_TOKEN
+    if room < MIN_TRIMMED_TOKENS * CHARS_PER_TOKEN // 2:
+        return None
+    return {**result, "content": _trim(result.get("content") or "", room), "raw_quote": "", "tags": []}
+
+
+def pack_sources(results: list[dict], budget_tokens: int) -> list[dict]:
+    """Choose and trim ``results`` (in search-rank order) to fit ``budget_tokens``.
+
+    Returns the chosen results, most valuable first. Trimmed ones are
+    copies; the input dicts are never changed. The top result is always
+    included, trimmed if it alone is over budget.
+    """
+    ranked = sorted(
+        enumerate(results), key=lambda pr: (-_value(pr[1], pr[0]), pr[0])
+    )
+    packed: list[dict] = []
+    kept: list[set[str]] = []
+    remaining = budget_tokens
+    for _, result in ranked:
+        words = set(tokenize(f"{result['title']} {result.get('content') or ''}"))
+        if words and is_duplicate(words, kept, DUPLICATE_THRESHOLD):
+            continue
+        cost = _section_tokens(result) + SEPARATOR_TOKENS
+        if cost <= remaining:
+            chosen = result
+        else:
+            chosen = _fit(result, remaining - SEPARATOR_TOKENS)
+            if chosen is None and not packed:
+                chosen = {**result, "content": _trim(result.get("content") or "", budget_tokens * CHARS_PER_TOKEN)}
+            if chosen is None:
+                continue
+            cost = _section_tokens(chosen) + SEPARATOR_TOKENS
+        packed.append(chosen)
+        kept.append(words)
+        remaining -= cost
+        if remaining < MIN_TRIMMED_TOKENS:
+            break
+    return packed
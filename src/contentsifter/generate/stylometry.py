@@ -0,0 +1,170 @@
+"""Local AI-pattern scoring — a fast, offline estimate of how "AI" a draft reads.
+
+Six stylometric signals, each scaled to 0-1 (1 = strongly AI-like):
+
+- sentence_uniformity: sentence lengths that barely vary
+- lexicon_density: banned words, connectors and phrases per 100 words
+- tricolon_rate: "X, Y, and Z" lists per 100 words
+- hedging_rate: hedges ("might", "perhaps", "it seems") per 100 words
+- connector_rate: share of sentences opening with a formal transition
+- paragraph_uniformity: paragraphs of near-identical length
+
+The score is their weighted mean, over the signals the draft is long
+enough to measure. The gate policy uses it to decide which drafts need the
+LLM AI gate; `contentsifter audit-drafts` reports it for saved drafts.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from statistics import mean, pstdev
+from typing import NamedTuple
+
+from contentsifter.generate.lexicon import BANNED_CONNECTORS, BANNED_PHRASES, BANNED_WORD_RE, fold
+
+# Drafts scoring at or above this read as AI-written
+AI_SCORE_THRESHOLD = 0.5
+
+SIGNAL_WEIGHTS: dict[str, float] = {
+    "lexicon_density": 0.30,
+    "sentence_uniformity": 0.20,
+    "tricolon_rate": 0.15,
+    "connector_rate": 0.15,
+    "hedging_rate": 0.10,
+    "paragraph_uniformity": 0.10,
+}
+
+# Fewest sentences / paragraphs before their length spread means anything
+MIN_SENTENCES = 4
+MIN_PARAGRAPHS = 3
+
+HEDGES: tuple[str, ...] = (
+    "might", "perhaps", "possibly", "potentially", "arguably", "somewhat",
+    "generally", "typically", "it seems", "may be", "could be", "tend to",
+    "in many cases", "to some extent", "in some ways",
+)
+
+# Sentence openers that read as essay transitions in conversational copy
+TRANSITIONS: frozenset[str] = BANNED_CONNECTORS | frozenset({
+    "however", "therefore", "thus", "ultimately", "overall", "firstly",
+    "secondly", "lastly", "finally", "hence",
+})
+
+_WORDS_RE = re.compile(r"[A-Za-z0-9']+")
+_SENTENCE_RE = re.compile(r"[^.!?\n]+[.!?]*")
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+_TRICOLON_RE = re.compile(
+    r"\b\w+(?:[ '-]\w+){0,2}, \w+(?:[ '-]\w+){0,2},? (?:and|or) \w+", re.IGNORECASE
+)
+_HEDGE_RE = re.compile(r"\b(?:" + "|".join(re.escape(h) for h in HEDGES) + r")\b")
+_OPENER_RE = re.compile(r"\s*([a-z]+)")
+
+
+class Span(NamedTuple):
+    """A stretch of the draft that contributed to its score."""
+    start: int
+    end: int
+    kind: str           # lexicon, tricolon, hedge, connector
+    text: str
+
+
+@dataclass
+class AIScore:
+    """Result of score_ai_patterns()."""
+    score: float
+    signals: dict[str, float] = field(default_factory=dict)    # 0-1 per signal
+    features: dict[str, float] = field(default_factory=dict)   # raw measurements
+    spans: list[Span] = field(default_factory=list)
+
+    @property
+    def suspicious(self) -> bool:
+        return self.score >= AI_SCORE_THRESHOLD
+
+    def strongest(self, n: int = 2) -> list[str]:
+        """Names of the ``n`` signals pushing the score up most."""
+        ranked = sorted(self.signals, key=lambda s: -self.signals[s] * SIGNAL_WEIGHTS[s])
+        return [s for s in ranked[:n] if self.signals[s] > 0]
+
+
+def _clamp(value: float) -> float:
+    return max(0.0, min(1.0, value))
+
+
+def _variation(lengths: list[int]) -> float:
+    """Coefficient of variation (spread relative to the mean)."""
+    avg = mean(lengths)
+    return pstdev(lengths) / avg if avg else 0.0
+
+
+def score_ai_patterns(text: str) -> AIScore:
+    """Score ``text`` for AI writing patterns without any network calls."""
+    words = _WORDS_RE.findall(text)
+    per_100 = 100 / max(len(words), 1)
+    folded = fold(text)
+    spans: list[Span] = []
+    features: dict[str, float] = {}
+    signals: dict[str, float] = {}
+
+    def mark(start: int, end: int, kind: str):
+        spans.append(Span(start, end, kind, text[start:end]))
+
+    # Banned lexicon
+    hits = 0
+    for m in BANNED_WORD_RE.finditer(folded):
+        mark(m.start(), m.end(), "lexicon")
+        hits += 1
+    for phrase in BANNED_PHRASES:
+        needle = phrase.lower()
+        pos = folded.find(needle)
+        while pos != -1:
+            mark(pos, pos + len(needle), "lexicon")
+            hits += 1
+            pos = folded.find(needle, pos + len(needle))
+    features["lexicon_density"] = hits * per_100
+    signals["lexicon_density"] = _clamp(features["lexicon_density"] / 2.0)
+
+    # Tricolons
+    tricolons = list(_TRICOLON_RE.finditer(text))
+    for m in tricolons:
+        mark(m.start(), m.end(), "tricolon")
+    features["tricolon_rate"] = len(tricolons) * per_100
+    signals["tricolon_rate"] = _clamp(features["tricolon_rate"] / 1.5)
+
+    # Hedging
+    hedges = list(_HEDGE_RE.finditer(folded))
+    for m in hedges:
+        mark(m.start(), m.end(), "hedge")
+    features["hedging_rate"] = len(hedges) * per_100
+    signals["hedging_rate"] = _clamp(features["hedging_rate"] / 2.0)
+
+    # Sentences: length spread and transition openers
+    sentences = [
+        m for m in _SENTENCE_RE.finditer(text) if _WORDS_RE.search(m.group())
+    ]
+    if sentences:
+        openers = 0
+        for m in sentences:
+            opener = _OPENER_RE.match(folded, m.start())
+            if opener and opener.group(1) in TRANSITIONS:
+                mark(opener.start(1), opener.end(1), "connector")
+                openers += 1
+        features["connector_rate"] = openers / len(sentences)
+        signals["connector_rate"] = _clamp(features["connector_rate"] / 0.25)
+    if len(sentences) >= MIN_SENTENCES:
+        lengths = [len(_WORDS_RE.findall(m.group())) for m in sentences]
+        features["sentence_variation"] = _variation(lengths)
+        signals["sentence_uniformity"] = _clamp((0.6 - features["sentence_variation"]) / 0.4)
+
+    # Paragraph length spread
+    paragraphs = [p for p in _PARAGRAPH_SPLIT_RE.split(text) if _WORDS_RE.search(p)]
+    if len(paragraphs) >= MIN_PARAGRAPHS:
+        features["paragraph_variation"] = _variation(
+            [len(_WORDS_RE.findall(p)) for p in paragraphs]
+        )
+        signals["paragraph_uniformity"] = _clamp((0.5 - features["paragraph_variation"]) / 0.4)
+
+    weight = sum(SIGNAL_WEIGHTS[s] for s in signals)
+    score = sum(SIGNAL_WEIGHTS[s] * v for s, v in signals.items()) / weight if weight else 0.0
+    spans.sort()
+    return AIScore(round(score, 4), signals, features, spans)
@@ -13,6 +13,10 @@ from contentsifter.config import MODEL_DEFAULT
 
 logger = logging.getLogger(__name__)
 
+# System prompts at least this long are marked for prompt caching. Shorter
+# ones fall under the API's minimum cacheable size (about 1024 tokens).
+CACHE_MIN_SYSTEM_CHARS = 4000
+
 
 @dataclass
 class LLMResponse:
@@ -20,6 +24,7 @@ class LLMResponse:
     input_tokens: int
     output_tokens: int
     model: str
+    cache_read_tokens: int = 0
 
 
 class AnthropicAPIClient:
@@ -37,7 +42,7 @@ class AnthropicAPIClient:
         response = self.client.messages.create(
             model=self.model,
             max_tokens=max_tokens,
-            system=system,
+            system=_system_blocks(system),
             messages=[{"role": "user", "content": user}],
         )
         return LLMResponse(
@@ -45,9 +50,21 @@ class AnthropicAPIClient:
             input_tokens=response.usage.input_tokens,
             output_tokens=response.usage.output_tokens,
             model=self.model,
+            cache_read_tokens=getattr(response.usage, "cache_read_input_tokens", 0) or 0,
         )
 
 
+def _system_blocks(system: str) -> str | list[dict]:
+    """Mark long system prompts as a cacheable prefix.
+
+    The gate prompts (rules doc, voice print) are identical across every
+    draft, so repeat calls read them from the cache instead of reprocessing.
+    """
+    if len(system) < CACHE_MIN_SYSTEM_CHARS:
+        return system
+    return [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+
+
 class ClaudeCodeClient:
     """Client that uses the claude CLI for LLM calls.
 
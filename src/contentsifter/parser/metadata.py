@@ -23,6 +23,19 @@ def classify_call_type(filename: str) -> str:
     return "other"
 
 
+def matches_coach(
+    text: str,
+    coach_name: str = COACH_NAME,
+    coach_email: str = COACH_EMAIL,
+) -> bool:
+    """Check whether a name or email string identifies the coach."""
+    lower = text.lower()
+    return bool(
+        (coach_name and coach_name.lower() in lower)
+        or (coach_email and coach_email.lower() in lower)
+    )
+
+
 def parse_participants(
     raw: str,
     coach_name: str = COACH_NAME,
@@ -35,9 +48,7 @@ def parse_participants(
         if not part:
             continue
 
-        is_coach = (
-            coach_name.lower() in part.lower() or coach_email.lower() in part.lower()
-        )
+        is_coach = matches_coach(part, coach_name, coach_email)
 
         # Check if it looks like an email
         if "@" in part:
@@ -4,6 +4,8 @@ import ast
 import logging
 import re
 
+from contentsifter.config import COACH_EMAIL, COACH_NAME
+from contentsifter.parser.metadata import matches_coach
 from contentsifter.storage.models import SpeakerTurn
 
 logger = logging.getLogger(__name__)
@@ -30,11 +32,17 @@ def extract_transcript_section(raw_text: str) -> str:
     return raw_text
 
 
-def parse_speaker_turns(raw_text: str) -> list[SpeakerTurn]:
+def parse_speaker_turns(
+    raw_text: str,
+    coach_name: str = COACH_NAME,
+    coach_email: str = COACH_EMAIL,
+) -> list[SpeakerTurn]:
     """Parse speaker turn lines into structured SpeakerTurn objects.
 
     Each line is a Python dict literal like:
     {'speaker': {'display_name': 'Name', ...}, 'text': '...', 'timestamp': 'HH:MM:SS'}
+
+    Turns spoken by the coach (matched by name or email) get is_coach=True.
     """
     transcript_text = extract_transcript_section(raw_text)
     turns = []
@@ -47,14 +55,20 @@ def parse_speaker_turns(raw_text: str) -> list[SpeakerTurn]:
         try:
             data = ast.literal_eval(line)
             speaker = data["speaker"]
+            speaker_name = speaker["display_name"]
+            speaker_email = speaker.get("matched_calendar_invitee_email")
+            is_coach = matches_coach(
+                speaker_name, coach_name, coach_email
+            ) or matches_coach(speaker_email or "", coach_name, coach_email)
             turns.append(
                 SpeakerTurn(
                     turn_index=len(turns),
-                    speaker_name=speaker["display_name"],
-                    speaker_email=speaker.get("matched_calendar_invitee_email"),
+                    speaker_name=speaker_name,
+                    speaker_email=speaker_email,
                     text=data["text"],
                     timestamp=data["timestamp"],
                     timestamp_seconds=timestamp_to_seconds(data["timestamp"]),
+                    is_coach=is_coach,
                 )
             )
         except (ValueError, SyntaxError, KeyError) as e:
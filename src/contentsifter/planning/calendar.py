@@ -9,7 +9,9 @@ from pathlib import Path
 
 from contentsifter.config import CALENDAR_DIR
 from contentsifter.generate.drafts import format_source_material, generate_draft
+from contentsifter.planning.voicecard import load_voice_card
 from contentsifter.planning.voiceprint import load_voice_print
+from contentsifter.planning.voiceprofile import load_voice_profile
 from contentsifter.storage.database import Database
 
 log = logging.getLogger(__name__)
@@ -232,6 +234,7 @@ def generate_calendar(
     use_llm: bool = True,
     calendar_dir: Path = CALENDAR_DIR,
     voice_print_path: Path | None = None,
+    voice_profile_path: Path | None = None,
 ) -> tuple[str, Path]:
     """Generate a weekly content calendar.
 
@@ -249,6 +252,8 @@ def generate_calendar(
     drafts: dict[str, str] = {}
     if use_llm and llm_client:
         voice_print = load_voice_print(path=voice_print_path)
+        voice_card = load_voice_card(path=voice_print_path)
+        voice_profile = load_voice_profile(voice_profile_path) if voice_profile_path else None
 
         for day_name, (pillar, format_type, category, platform) in WEEKLY_SCHEDULE.items():
             if pillar is None or not selections.get(day_name):
@@ -264,6 +269,8 @@ def generate_calendar(
                     llm_client,
                     topic=items[0]["title"],
                     voice_print=voice_print,
+                    voice_profile=voice_profile,
+                    voice_card=voice_card,
                 )
                 drafts[day_name] = draft
             except Exception as e:
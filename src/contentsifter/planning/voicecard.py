@@ -0,0 +1,246 @@
+"""Voice card — a short extract of the voice print for per-draft prompts.
+
+A full voice print runs to thousands of tokens, and it used to be sent with
+every draft and every voice-gate rewrite. The card keeps its most useful
+lines within VOICE_CARD_CHARS:
+
+- Lines are the print's bullets, quoted examples and table rows.
+- Each is scored by its heading (Quick Reference, DO/DON'T, Signature
+  Phrases and words to avoid rank highest), plus a bonus for carrying a
+  quoted example or a directive ("never", "always", "don't" ...), minus a
+  little for position under its heading.
+- The best lines are taken until the card is full, with at most
+  MAX_ITEMS_PER_SECTION from any one section so no section crowds out
+  the rest. They are written back under their original headings, in
+  their original order.
+
+The card is derived locally (no LLM call) and saved as ``voice-card.md``
+next to the voice print. It is rebuilt whenever the voice print is newer,
+so a hand-edited card is kept until the print changes. Drafting and the
+regular voice gate use the card. The full print is still used for deep
+rewrites (see GatePolicy.deep_voice_similarity).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from pathlib import Path
+
+from contentsifter.assets import asset_cache
+from contentsifter.config import VOICE_PRINT_PATH
+from contentsifter.planning.voiceprint import load_voice_print
+
+log = logging.getLogger(__name__)
+
+VOICE_CARD_FILENAME = "voice-card.md"
+
+# Longest card, in characters (~1,000 tokens)
+VOICE_CARD_CHARS = 4000
+
+# Longest single line kept on the card
+ITEM_CHARS = 220
+
+MAX_ITEMS_PER_SECTION = 8
+
+# Weight by section or subsection heading keyword, checked in order;
+# lines under other headings get 1.0
+SECTION_WEIGHTS: tuple[tuple[str, float], ...] = (
+    ("quick reference", 3.0),
+    ("do / don", 3.0),
+    ("do/don", 3.0),
+    ("signature phrase", 2.5),
+    ("avoid", 2.5),
+    ("vocabulary", 2.0),
+    ("how to open", 2.0),
+    ("how to close", 2.0),
+    ("sentence pattern", 1.5),
+    ("story bank", 0.5),
+    ("brand element", 0.5),
+)
+
+_DIRECTIVE_RE = re.compile(r"\b(never|always|don't|do not|avoid|instead|no)\b", re.IGNORECASE)
+_QUOTED_RE = re.compile(r"[\"“][^\"”]{2,}[\"”]")
+_TABLE_RULE_RE = re.compile(r"^\|[\s:|-]+\|$")
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+
+
+def voice_card_path(voice_print_path: Path | None = None) -> Path:
+    """Where the card for a voice print lives: next to it."""
+    return (voice_print_path or VOICE_PRINT_PATH).with_name(VOICE_CARD_FILENAME)
+
+
+def _section_weight(heading: str) -> float:
+    lowered = heading.lower()
+    for keyword, weight in SECTION_WEIGHTS:
+        if keyword in lowered:
+            return weight
+    return 1.0
+
+
+def _shorten(text: str) -> str:
+    if len(text) <= ITEM_CHARS:
+        return text
+    return text[:ITEM_CHARS].rsplit(" ", 1)[0].rstrip(",;:") + "..."
+
+
+def _items(voice_print: str) -> tuple[str, list[dict]]:
+    """The print's title line and its candidate lines, in document order."""
+    title = "# Voice Card"
+    section = subsection = ""
+    position = 0
+    items: list[dict] = []
+    for raw in voice_print.splitlines():
+        line = raw.strip()
+        if line.startswith("# "):
+            title = "# " + line[2:].replace("Voice Print", "Voice Card")
+            continue
+        if line.startswith("## "):
+            section, subsection, position = line[3:], "", 0
+            continue
+        if line.startswith("###"):
+            subsection, position = line.lstrip("#").strip(), 0
+            continue
+        if line.startswith("|"):
+            if _TABLE_RULE_RE.match(line):
+                continue
+            cells = [c.strip() for c in line.strip("|").split("|")]
+            text = cells[0] + (f" — {cells[1]}" if len(cells) > 1 and cells[1] else "")
+        elif line.startswith(("- ", "* ", "> ")):
+            text = line[2:].strip()
+        else:
+            continue
+        if not section or not text:
+            continue
+        text = _shorten(_BOLD_RE.sub(r"\1", text))
+        weight = max(_section_weight(section), _section_weight(subsection))
+        score = weight * (
+            1.0
+            + (0.5 if _QUOTED_RE.search(text) else 0.0)
+            + (0.3 if _DIRECTIVE_RE.search(text) else 0.0)
+        ) - 0.05 * position
+        items.append({"section": section, "subsection": subsection, "text": text, "score": score})
+        position += 1
+    return title, items
+
+
+def _drop_table_headers(voice_print: str) -> str:
+    """Drop table header rows (the line before a |---| rule) so only data rows remain."""
+    lines = voice_print.splitlines()
+    return "\n".join(
+        line for i, line in enumerate(lines)
+        if not (i + 1 < len(lines) and _TABLE_RULE_RE.match(lines[i + 1].strip()))
+    )
+
+
+def build_voice_card(voice_print: str, max_chars: int = VOICE_CARD_CHARS) -> str:
+    """Condense ``voice_print`` into a card of at most ``max_chars`` (see module docstring)."""
+    if len(voice_print) <= max_chars:
+        return voice_print
+    title, items = _items(_drop_table_headers(voice_print))
+    if not items:
+        cut = voice_print[:max_chars]
+        return cut.rsplit("\n", 1)[0] if "\n" in cut else cut
+
+    ranked = sorted(range(len(items)), key=lambda i: -items[i]["score"])
+    chosen: set[int] = set()
+    headings: set[tuple[str, str]] = set()
+    per_section: dict[str, int] = {}
+    used = len(title) + 2
+    for i in ranked:
+        item = items[i]
+        if per_section.get(item["section"], 0) >= MAX_ITEMS_PER_SECTION:
+            continue
+        cost = len(item["text"]) + 3
+        if (item["section"], "") not in headings:
+            cost += len(item["section"]) + 5
+        if item["subsection"] and (item["section"], item["subsection"]) not in headings:
+            cost += len(item["subsection"]) + 6
+        if used + cost > max_chars:
+            continue
+        used += cost
+        chosen.add(i)
+        headings.update({(item["section"], ""), (item["section"], item["subsection"])})
+        per_section[item["section"]] = per_section.get(item["section"], 0) + 1
+
+    lines = [title]
+    section = subsection = None
+    for i, item in enumerate(items):
+        if i not in chosen:
+            continue
+        if item["section"] != section:
+            section, subsection = item["section"], None
+            lines.append(f"\n## {section}")
+        if item["subsection"] and item["subsection"] != subsection:
+            subsection = item["subsection"]
+            lines.append(f"### {subsection}")
+        lines.append(f"- {item['text']}")
+    return "\n".join(lines) + "\n"
+
+
+def save_voice_card(content: str, path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    asset_cache.invalidate(path)
+    return path
+
+
+def load_voice_card(path: Path | None = None) -> str | None:
+    """The card for the voice print at ``path``, building it if missing or stale.
+
+    Returns None when there is no voice print.
+    """
+    vp_path = path or VOICE_PRINT_PATH
+    voice_print = load_voice_print(vp_path)
+    if voice_print is None:
+        return None
+    card_path = voice_card_path(vp_path)
+    try:
+        stale = card_path.stat().st_mtime_ns < vp_path.stat().st_mtime_ns
+    except OSError:
+        stale = True
+    if stale:
+        log.info("Building voice card from %s", vp_path)
+        save_voice_card(build_voice_card(voice_print), card_path)
+    return asset_cache.read_text(card_path)
+
+
+def compare_voice_prompts(
+    results: list[dict],
+    format_type: str,
+    llm_client,
+    voice_print: str,
+    voice_card: str,
+    voice_profile=None,
+    topic: str | None = None,
+) -> list[dict]:
+    """Draft the same source once with the full voice print and once with the card.
+
+    Drafts are compared before content gates, so any difference comes from
+    the prompt alone. Returns one row per prompt with its voice-reference
+    token estimate, the input tokens the API reported, the draft, and its
+    voice_similarity score (None without a profile).
+    """
+    from contentsifter.generate.drafts import draft_system_prompt, format_source_material
+    from contentsifter.generate.sources import estimate_tokens, source_budget
+    from contentsifter.generate.templates import TEMPLATES
+    from contentsifter.llm.client import complete_with_retry
+    from contentsifter.planning.voiceprofile import voice_similarity
+
+    topic = topic or results[0]["title"]
+    user = TEMPLATES[format_type]["user"].format(
+        topic=topic, source_material=format_source_material(results, source_budget(format_type)),
+    )
+    rows = []
+    for label, reference in (("voice print", voice_print), ("voice card", voice_card)):
+        response = complete_with_retry(
+            llm_client, system=draft_system_prompt(format_type, reference), user=user, max_tokens=2048,
+        )
+        rows.append({
+            "prompt": label,
+            "voice_tokens": estimate_tokens(reference),
+            "input_tokens": response.input_tokens,
+            "draft": response.content,
+            "voice_match": voice_similarity(response.content, voice_profile).score if voice_profile else None,
+        })
+    return rows
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import logging
+import random
 from pathlib import Path
 
+from contentsifter.assets import asset_cache
 from contentsifter.config import COACH_EMAIL, COACH_NAME, VOICE_PRINT_PATH
 from contentsifter.llm.client import complete_with_retry
 from contentsifter.planning.prompts import (
@@ -23,6 +25,39 @@ log = logging.getLogger(__name__)
 MAX_CHARS_PER_BUCKET = 8000
 MAX_TOTAL_CHARS = 50000
 
+# Rows fetched per round when sampling; stays under SQLite's variable limit
+SAMPLE_FETCH_BATCH = 500
+
+
+def get_coach_speaker_ids(
+    db: Database,
+    coach_name: str = COACH_NAME,
+    coach_email: str = COACH_EMAIL,
+) -> list[int]:
+    """Resolve the coach to speaker ids.
+
+    Matches speakers flagged at parse time plus any whose name or email
+    matches the given identity. This only touches the small speakers table;
+    turn queries then filter on the indexed speaker_id.
+    """
+    clauses = ["is_coach = 1"]
+    params: list[str] = []
+    if coach_name:
+        clauses.append("name LIKE ?")
+        params.append(f"%{coach_name}%")
+    if coach_email:
+        clauses.append("email = ?")
+        params.append(coach_email)
+    rows = db.conn.execute(
+        f"SELECT id FROM speakers WHERE {' OR '.join(clauses)}", params
+    ).fetchall()
+    return [r[0] for r in rows]
+
+
+def speaker_filter(speaker_ids: list[int]) -> str:
+    """SQL fragment restricting speaker_turns to the given speaker ids."""
+    return f"speaker_id IN ({','.join('?' for _ in speaker_ids)})"
+
 
 def get_coach_turn_stats(
     db: Database,
@@ -30,13 +65,16 @@ def get_coach_turn_stats(
     coach_email: str = COACH_EMAIL,
 ) -> dict:
     """Get basic stats about the coach's speaker turns."""
+    speaker_ids = get_coach_speaker_ids(db, coach_name, coach_email)
+    if not speaker_ids:
+        return {"turn_count": 0, "total_chars": 0, "call_count": 0}
     row = db.conn.execute(
-        """SELECT COUNT(*) as turn_count,
-                  COALESCE(SUM(LENGTH(text)), 0) as total_chars,
-                  COUNT(DISTINCT call_id) as call_count
-           FROM speaker_turns
-           WHERE speaker_name LIKE ? OR speaker_email = ?""",
-        (f"%{coach_name}%", coach_email),
+        f"""SELECT COUNT(*) as turn_count,
+                   COALESCE(SUM(char_len), 0) as total_chars,
+                   COUNT(DISTINCT call_id) as call_count
+            FROM speaker_turns
+            WHERE {speaker_filter(speaker_ids)}""",
+        speaker_ids,
     ).fetchone()
     return dict(row) if row else {"turn_count": 0, "total_chars": 0, "call_count": 0}
 
@@ -54,87 +92,110 @@ def get_content_item_stats(db: Database) -> dict:
         return {"item_count": 0, "total_chars": 0}
 
 
+def _sample_rows(
+    db: Database,
+    id_sql: str,
+    id_params: list | tuple,
+    fetch_sql: str,
+    k: int,
+    rng: random.Random,
+    keep=None,
+) -> list[dict]:
+    """Draw up to k random rows without sorting the filtered set.
+
+    id_sql must return only row ids so it can be answered from an index.
+    A random subset of those ids is then fetched with fetch_sql, which must
+    select ``id`` and ``text`` and contain a single ``{ids}`` placeholder.
+    Rows failing ``keep`` are skipped and more ids are drawn until k rows
+    are collected or the candidates run out. Results follow sample order,
+    so a seeded rng gives reproducible samples.
+    """
+    ids = [r[0] for r in db.conn.execute(id_sql, id_params).fetchall()]
+    # ids[:remaining] are undrawn; each draw swaps its pick to the end of that range
+    remaining = len(ids)
+    rows: list[dict] = []
+    while remaining and len(rows) < k:
+        want = k - len(rows) if keep is None else SAMPLE_FETCH_BATCH
+        drawn = []
+        for _ in range(min(remaining, want, SAMPLE_FETCH_BATCH)):
+            j = rng.randrange(remaining)
+            remaining -= 1
+            ids[j], ids[remaining] = ids[remaining], ids[j]
+            drawn.append(ids[remaining])
+        placeholders = ",".join("?" for _ in drawn)
+        texts = {
+            r["id"]: r["text"]
+            for r in db.conn.execute(fetch_sql.format(ids=placeholders), drawn)
+        }
+        for row_id in drawn:
+            text = texts.get(row_id)
+            if text is None or (keep is not None and not keep(text)):
+                continue
+            rows.append({"text": text})
+            if len(rows) >= k:
+                break
+    return rows
+
+
+def _has_question(text: str) -> bool:
+    return "?" in text
+
+
 def get_stratified_coach_sample(
     db: Database,
     per_bucket: int = 100,
     coach_name: str = COACH_NAME,
     coach_email: str = COACH_EMAIL,
+    seed: int | None = None,
 ) -> dict[str, list[dict]]:
     """Get categorized samples of the coach's speech patterns.
 
+    Length buckets are sampled from idx_speaker_turns_speaker, and
+    openings/closings from a random set of calls, so nothing sorts or
+    windows over every coach turn. Pass a seed for a reproducible sample.
+
     Returns dict with keys: openings, closings, monologues, short, medium, questions
     """
-    coach_filter = f"%{coach_name}%"
     samples: dict[str, list[dict]] = {}
-
-    # 1. Openings — first 3 coach turns per call
-    rows = db.conn.execute(
-        """WITH ranked AS (
-             SELECT text, call_id,
-                    ROW_NUMBER() OVER (PARTITION BY call_id ORDER BY turn_index) as rn
-             FROM speaker_turns
-             WHERE speaker_name LIKE ? OR speaker_email = ?
-           )
-           SELECT text FROM ranked WHERE rn <= 3
-           ORDER BY RANDOM() LIMIT ?""",
-        (coach_filter, coach_email, per_bucket),
-    ).fetchall()
-    samples["openings"] = [dict(r) for r in rows]
-
-    # 2. Closings — last 3 coach turns per call
-    rows = db.conn.execute(
-        """WITH ranked AS (
-             SELECT text, call_id,
-                    ROW_NUMBER() OVER (PARTITION BY call_id ORDER BY turn_index DESC) as rn
-             FROM speaker_turns
-             WHERE speaker_name LIKE ? OR speaker_email = ?
-           )
-           SELECT text FROM ranked WHERE rn <= 3
-           ORDER BY RANDOM() LIMIT ?""",
-        (coach_filter, coach_email, per_bucket),
-    ).fetchall()
-    samples["closings"] = [dict(r) for r in rows]
-
-    # 3. Long monologues — turns > 500 chars
-    rows = db.conn.execute(
-        """SELECT text FROM speaker_turns
-           WHERE (speaker_name LIKE ? OR speaker_email = ?)
-             AND LENGTH(text) > 500
-           ORDER BY RANDOM() LIMIT ?""",
-        (coach_filter, coach_email, per_bucket),
-    ).fetchall()
-    samples["monologues"] = [dict(r) for r in rows]
-
-    # 4. Short turns — < 100 chars
-    rows = db.conn.execute(
-        """SELECT text FROM speaker_turns
-           WHERE (speaker_name LIKE ? OR speaker_email = ?)
-             AND LENGTH(text) < 100
-           ORDER BY RANDOM() LIMIT ?""",
-        (coach_filter, coach_email, per_bucket),
-    ).fetchall()
-    samples["short"] = [dict(r) for r in rows]
-
-    # 5. Medium turns — 100-500 chars
-    rows = db.conn.execute(
-        """SELECT text FROM speaker_turns
-           WHERE (speaker_name LIKE ? OR speaker_email = ?)
-             AND LENGTH(text) BETWEEN 100 AND 500
-           ORDER BY RANDOM() LIMIT ?""",
-        (coach_filter, coach_email, per_bucket),
-    ).fetchall()
-    samples["medium"] = [dict(r) for r in rows]
-
-    # 6. Questions — turns containing ?
-    rows = db.conn.execute(
-        """SELECT text FROM speaker_turns
-           WHERE (speaker_name LIKE ? OR speaker_email = ?)
-             AND text LIKE '%?%'
-             AND LENGTH(text) > 30
-           ORDER BY RANDOM() LIMIT ?""",
-        (coach_filter, coach_email, per_bucket),
-    ).fetchall()
-    samples["questions"] = [dict(r) for r in rows]
+    speaker_ids = get_coach_speaker_ids(db, coach_name, coach_email)
+    if not speaker_ids:
+        return samples
+    coach_filter = speaker_filter(speaker_ids)
+    rng = random.Random(seed)
+    fetch_sql = "SELECT id, text FROM speaker_turns WHERE id IN ({ids})"
+
+    # 1-2. Openings/closings — first/last 3 coach turns of randomly chosen calls
+    call_ids = [r[0] for r in db.conn.execute("SELECT id FROM calls").fetchall()]
+    call_ids = rng.sample(call_ids, min(len(call_ids), per_bucket))
+    for key, direction in (("openings", "ASC"), ("closings", "DESC")):
+        candidates: list[dict] = []
+        for call_id in call_ids:
+            rows = db.conn.execute(
+                f"""SELECT text FROM speaker_turns
+                    WHERE call_id = ? AND {coach_filter}
+                    ORDER BY turn_index {direction} LIMIT 3""",
+                (call_id, *speaker_ids),
+            ).fetchall()
+            candidates.extend(dict(r) for r in rows)
+        samples[key] = rng.sample(candidates, min(len(candidates), per_bucket))
+
+    # 3-6. Length buckets and questions, sampled by id from the speaker index
+    buckets = {
+        "monologues": ("char_len > 500", None),
+        "short": ("char_len < 100", None),
+        "medium": ("char_len BETWEEN 100 AND 500", None),
+        "questions": ("char_len > 30", _has_question),
+    }
+    for key, (length_clause, keep) in buckets.items():
+        samples[key] = _sample_rows(
+            db,
+            f"SELECT id FROM speaker_turns WHERE {coach_filter} AND {length_clause}",
+            speaker_ids,
+            fetch_sql,
+            per_bucket,
+            rng,
+            keep=keep,
+        )
 
     return samples
 
@@ -142,67 +203,39 @@ def get_stratified_coach_sample(
 def get_stratified_content_sample(
     db: Database,
     per_bucket: int = 100,
+    seed: int | None = None,
 ) -> dict[str, list[dict]]:
     """Get categorized samples from content_items for voice analysis.
 
+    Buckets are sampled by id from idx_content_items_chars rather than with
+    ORDER BY RANDOM(). Pass a seed for a reproducible sample.
+
     Returns dict with keys: short_posts, medium_posts, long_form, openings, closings, questions
     """
     samples: dict[str, list[dict]] = {}
+    rng = random.Random(seed)
+
+    # (bucket, id filter, selected text, row filter)
+    buckets = (
+        ("short", "char_count < 500", "text", None),
+        ("medium", "char_count BETWEEN 500 AND 2000", "text", None),
+        ("monologues", "char_count > 2000", "text", None),
+        ("openings", "1", "SUBSTR(text, 1, 200)", None),
+        ("closings", "char_count > 200", "SUBSTR(text, MAX(1, char_count - 200))", None),
+        ("questions", "char_count > 30", "text", _has_question),
+    )
 
     try:
-        # Short posts: < 500 chars
-        rows = db.conn.execute(
-            """SELECT text FROM content_items
-               WHERE char_count < 500
-               ORDER BY RANDOM() LIMIT ?""",
-            (per_bucket,),
-        ).fetchall()
-        samples["short"] = [dict(r) for r in rows]
-
-        # Medium posts: 500-2000 chars
-        rows = db.conn.execute(
-            """SELECT text FROM content_items
-               WHERE char_count BETWEEN 500 AND 2000
-               ORDER BY RANDOM() LIMIT ?""",
-            (per_bucket,),
-        ).fetchall()
-        samples["medium"] = [dict(r) for r in rows]
-
-        # Long form: > 2000 chars
-        rows = db.conn.execute(
-            """SELECT text FROM content_items
-               WHERE char_count > 2000
-               ORDER BY RANDOM() LIMIT ?""",
-            (per_bucket,),
-        ).fetchall()
-        samples["monologues"] = [dict(r) for r in rows]
-
-        # Openings: first 200 chars of each item
-        rows = db.conn.execute(
-            """SELECT SUBSTR(text, 1, 200) as text FROM content_items
-               ORDER BY RANDOM() LIMIT ?""",
-            (per_bucket,),
-        ).fetchall()
-        samples["openings"] = [dict(r) for r in rows]
-
-        # Closings: last 200 chars of each item
-        rows = db.conn.execute(
-            """SELECT SUBSTR(text, MAX(1, char_count - 200)) as text FROM content_items
-               WHERE char_count > 200
-               ORDER BY RANDOM() LIMIT ?""",
-            (per_bucket,),
-        ).fetchall()
-        samples["closings"] = [dict(r) for r in rows]
-
-        # Questions: items containing ?
-        rows = db.conn.execute(
-            """SELECT text FROM content_items
-               WHERE text LIKE '%?%'
-               AND char_count > 30
-               ORDER BY RANDOM() LIMIT ?""",
-            (per_bucket,),
-        ).fetchall()
-        samples["questions"] = [dict(r) for r in rows]
+        for key, where, text_expr, keep in buckets:
+            samples[key] = _sample_rows(
+                db,
+                f"SELECT id FROM content_items WHERE {where}",
+                (),
+                f"SELECT id, {text_expr} as text FROM content_items WHERE id IN ({{ids}})",
+                per_bucket,
+                rng,
+                keep=keep,
+            )
     except Exception as e:
         log.warning("Could not sample content_items: %s", e)
 
@@ -240,8 +273,12 @@ def analyze_voice(
     sample_per_bucket: int = 100,
     coach_name: str = COACH_NAME,
     coach_email: str = COACH_EMAIL,
+    seed: int | None = None,
 ) -> str:
-    """Run 3-pass voice analysis and return the final voice print markdown."""
+    """Run 3-pass voice analysis and return the final voice print markdown.
+
+    Pass a seed to draw the same source samples on every run.
+    """
     # Gather samples from available sources
     turn_stats = get_coach_turn_stats(db, coach_name, coach_email)
     content_stats = get_content_item_stats(db)
@@ -255,14 +292,15 @@ def analyze_voice(
             turn_stats["turn_count"], turn_stats["total_chars"], turn_stats["call_count"],
         )
         turn_samples = get_stratified_coach_sample(db, per_bucket=sample_per_bucket,
-                                                    coach_name=coach_name, coach_email=coach_email)
+                                                    coach_name=coach_name, coach_email=coach_email,
+                                                    seed=seed)
 
     if content_stats["item_count"] > 0:
         log.info(
             "Content item stats: %d items, %d chars",
             content_stats["item_count"], content_stats["total_chars"],
         )
-        content_samples = get_stratified_content_sample(db, per_bucket=sample_per_bucket)
+        content_samples = get_stratified_content_sample(db, per_bucket=sample_per_bucket, seed=seed)
 
     samples = _merge_samples(turn_samples, content_samples)
 
@@ -322,12 +360,10 @@ def save_voice_print(content: str, path: Path | None = None) -> Path:
     out_path = path or VOICE_PRINT_PATH
     out_path.parent.mkdir(parents=True, exist_ok=True)
     out_path.write_text(content)
+    asset_cache.invalidate(out_path)
     return out_path
 
 
 def load_voice_print(path: Path | None = None) -> str | None:
-    """Load voice print from disk, or return None if it doesn't exist."""
-    vp_path = path or VOICE_PRINT_PATH
-    if vp_path.exists():
-        return vp_path.read_text()
-    return None
+    """Load voice print (cached until the file changes), or None if it doesn't exist."""
+    return asset_cache.read_text(path or VOICE_PRINT_PATH)
@@ -0,0 +1,284 @@
+"""Numeric voice profile — a local, offline stand-in for judging voice match.
+
+The voice print is prose for the LLM. The profile is a handful of numbers
+measured over everything the client wrote (content_items) and said (coach
+speaker_turns):
+
+- function_words: relative frequency of common function words
+- ngrams: the most frequent character trigrams and their share
+- sentence_lengths / paragraph_lengths: share of sentences (paragraphs)
+  falling in each length bin, in words
+- punctuation: marks per 100 words
+
+Paragraph lengths come from content items only, since a speaker turn isn't
+a written paragraph. voice_similarity() compares a draft against the
+profile in a few milliseconds; the content gates skip the voice rewrite for
+drafts that already match (see GatePolicy.min_voice_similarity).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import re
+from collections import Counter
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+
+from contentsifter.assets import asset_cache
+from contentsifter.config import COACH_EMAIL, COACH_NAME
+from contentsifter.planning.voiceprint import get_coach_speaker_ids, speaker_filter
+from contentsifter.storage.database import Database
+
+log = logging.getLogger(__name__)
+
+# Character trigrams kept in the profile
+NGRAM_LIMIT = 300
+
+# Drafts scoring at or above this already sound like the client
+VOICE_MATCH_THRESHOLD = 0.7
+
+# Source words needed before a profile is trusted to judge drafts
+MIN_PROFILE_WORDS = 500
+
+FUNCTION_WORDS: tuple[str, ...] = (
+    "a", "about", "after", "all", "also", "an", "and", "any", "are", "as",
+    "at", "be", "because", "been", "but", "by", "can", "could", "do", "does",
+    "even", "every", "for", "from", "had", "has", "have", "he", "her", "here",
+    "how", "i", "if", "in", "into", "is", "it", "just", "like", "me", "more",
+    "most", "my", "no", "not", "now", "of", "on", "one", "only", "or", "our",
+    "out", "really", "she", "so", "some", "than", "that", "the", "their",
+    "them", "then", "there", "they", "this", "to", "up", "us", "very", "was",
+    "we", "what", "when", "which", "who", "why", "will", "with", "would",
+    "you", "your",
+)
+
+PUNCTUATION: tuple[str, ...] = (",", ";", ":", "!", "?", "—", "-", "(", "...", '"', "'")
+
+# Upper bounds (in words) of each length bin; the last bin is open-ended
+SENTENCE_BINS: tuple[int, ...] = (5, 10, 15, 20, 30)
+PARAGRAPH_BINS: tuple[int, ...] = (15, 40, 80)
+
+COMPONENT_WEIGHTS: dict[str, float] = {
+    "function_words": 0.30,
+    "ngrams": 0.25,
+    "punctuation": 0.20,
+    "sentence_lengths": 0.15,
+    "paragraph_lengths": 0.10,
+}
+
+_WORD_RE = re.compile(r"[a-z']+")
+_SENTENCE_RE = re.compile(r"[^.!?\n]+")
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+_SPACE_RE = re.compile(r"\s+")
+_FUNCTION_WORDS = frozenset(FUNCTION_WORDS)
+
+
+@dataclass
+class VoiceProfile:
+    """Per-client voice measurements (see module docstring)."""
+
+    word_count: int = 0
+    sample_count: int = 0
+    function_words: dict[str, float] = field(default_factory=dict)
+    ngrams: dict[str, float] = field(default_factory=dict)
+    sentence_lengths: list[float] = field(default_factory=list)
+    paragraph_lengths: list[float] = field(default_factory=list)
+    punctuation: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class VoiceMatch:
+    """Result of voice_similarity()."""
+
+    score: float
+    components: dict[str, float] = field(default_factory=dict)   # 0-1 per component
+
+    @property
+    def matches(self) -> bool:
+        return self.score >= VOICE_MATCH_THRESHOLD
+
+
+class _Tally:
+    """Running counts for one body of text, turned into shares at the end."""
+
+    def __init__(self):
+        self.words = 0
+        self.samples = 0
+        self.function_words: Counter = Counter()
+        self.ngrams: Counter = Counter()
+        self.sentence_bins = [0] * (len(SENTENCE_BINS) + 1)
+        self.paragraph_bins = [0] * (len(PARAGRAPH_BINS) + 1)
+        self.punctuation: Counter = Counter()
+
+    def add(self, text: str, paragraphs: bool = True):
+        lowered = text.lower()
+        words = _WORD_RE.findall(lowered)
+        if not words:
+            return
+        self.samples += 1
+        self.words += len(words)
+        self.function_words.update(w for w in words if w in _FUNCTION_WORDS)
+        flat = _SPACE_RE.sub(" ", lowered)
+        self.ngrams.update(flat[i:i + 3] for i in range(len(flat) - 2))
+        for mark in PUNCTUATION:
+            self.punctuation[mark] += text.count(mark)
+        for sentence in _SENTENCE_RE.findall(text):
+            length = len(_WORD_RE.findall(sentence.lower()))
+            if length:
+                self.sentence_bins[_bin(length, SENTENCE_BINS)] += 1
+        if paragraphs:
+            for para in _PARAGRAPH_SPLIT_RE.split(text):
+                length = len(_WORD_RE.findall(para.lower()))
+                if length:
+                    self.paragraph_bins[_bin(length, PARAGRAPH_BINS)] += 1
+
+    def profile(self, ngram_limit: int | None = None) -> VoiceProfile:
+        total_grams = sum(self.ngrams.values()) or 1
+        grams = self.ngrams.most_common(ngram_limit) if ngram_limit else self.ngrams.items()
+        per_100 = 100 / max(self.words, 1)
+        return VoiceProfile(
+            word_count=self.words,
+            sample_count=self.samples,
+            function_words={w: n / max(self.words, 1) for w, n in self.function_words.items()},
+            ngrams={g: n / total_grams for g, n in grams},
+            sentence_lengths=_shares(self.sentence_bins),
+            paragraph_lengths=_shares(self.paragraph_bins),
+            punctuation={m: n * per_100 for m, n in self.punctuation.items() if n},
+        )
+
+
+def _bin(length: int, bounds: tuple[int, ...]) -> int:
+    for i, bound in enumerate(bounds):
+        if length <= bound:
+            return i
+    return len(bounds)
+
+
+def _shares(counts: list[int]) -> list[float]:
+    total = sum(counts)
+    return [n / total for n in counts] if total else []
+
+
+def _affinity(a: dict[str, float], b: dict[str, float], keys=None) -> float:
+    """Bhattacharyya coefficient of two frequency tables, renormalized over ``keys``.
+
+    Square roots keep "the" and " th" from drowning out everything else.
+    """
+    keys = set(a) | set(b) if keys is None else keys
+    total_a = sum(a.get(k, 0.0) for k in keys)
+    total_b = sum(b.get(k, 0.0) for k in keys)
+    if not total_a or not total_b:
+        return 0.0
+    return sum(math.sqrt(a.get(k, 0.0) * b.get(k, 0.0)) for k in keys) / math.sqrt(total_a * total_b)
+
+
+def _overlap(a: list[float], b: list[float]) -> float:
+    """1 minus the total variation distance between two binned distributions."""
+    return 1 - sum(abs(x - y) for x, y in zip(a, b)) / 2
+
+
+def _rate_closeness(draft: dict[str, float], profile: dict[str, float]) -> float:
+    """Mean per-mark closeness of punctuation rates (1 = identical habits).
+
+    Rates are smoothed by one mark per 100 words, so a short draft that
+    happens to skip a rare mark isn't judged as if it never uses it.
+    """
+    marks = [m for m in PUNCTUATION if draft.get(m, 0) + profile.get(m, 0) > 0]
+    if not marks:
+        return 1.0
+    return 1 - sum(
+        abs(draft.get(m, 0) - profile.get(m, 0)) / (draft.get(m, 0) + profile.get(m, 0) + 1)
+        for m in marks
+    ) / len(marks)
+
+
+def build_voice_profile(
+    db: Database,
+    coach_name: str = COACH_NAME,
+    coach_email: str = COACH_EMAIL,
+) -> VoiceProfile:
+    """Measure every content item and coach turn into a VoiceProfile.
+
+    Streams rows rather than sampling, since the counts are cheap.
+    """
+    tally = _Tally()
+    try:
+        for (text,) in db.conn.execute("SELECT text FROM content_items"):
+            tally.add(text)
+    except Exception as e:
+        log.warning("Could not read content_items: %s", e)
+
+    speaker_ids = get_coach_speaker_ids(db, coach_name, coach_email)
+    if speaker_ids:
+        for (text,) in db.conn.execute(
+            f"SELECT text FROM speaker_turns WHERE {speaker_filter(speaker_ids)}",
+            speaker_ids,
+        ):
+            tally.add(text, paragraphs=False)
+
+    return tally.profile(NGRAM_LIMIT)
+
+
+def voice_similarity(draft: str, profile: VoiceProfile) -> VoiceMatch:
+    """Score how closely ``draft`` matches ``profile``, from 0 to 1.
+
+    Character trigrams are compared only over the profile's trigrams, and
+    paragraph lengths only when the draft has more than one paragraph.
+    """
+    tally = _Tally()
+    tally.add(draft)
+    measured = tally.profile()
+
+    components = {
+        "function_words": _affinity(measured.function_words, profile.function_words),
+        "ngrams": _affinity(measured.ngrams, profile.ngrams, profile.ngrams.keys()),
+        "punctuation": _rate_closeness(measured.punctuation, profile.punctuation),
+    }
+    if measured.sentence_lengths and profile.sentence_lengths:
+        components["sentence_lengths"] = _overlap(measured.sentence_lengths, profile.sentence_lengths)
+    if sum(tally.paragraph_bins) > 1 and profile.paragraph_lengths:
+        components["paragraph_lengths"] = _overlap(measured.paragraph_lengths, profile.paragraph_lengths)
+
+    weight = sum(COMPONENT_WEIGHTS[c] for c in components)
+    score = sum(COMPONENT_WEIGHTS[c] * v for c, v in components.items()) / weight
+    return VoiceMatch(round(score, 4), {c: round(v, 4) for c, v in components.items()})
+
+
+def save_voice_profile(profile: VoiceProfile, path: Path) -> Path:
+    """Write the profile as compact JSON (shares rounded to 6 places)."""
+    data = asdict(profile)
+    for key in ("function_words", "ngrams", "punctuation"):
+        data[key] = {k: round(v, 6) for k, v in data[key].items()}
+    for key in ("sentence_lengths", "paragraph_lengths"):
+        data[key] = [round(v, 6) for v in data[key]]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n")
+    asset_cache.invalidate(path)
+    return path
+
+
+def _parse_profile(text: str) -> VoiceProfile | None:
+    known = {f.name for f in fields(VoiceProfile)}
+    try:
+        data = json.loads(text)
+        if not isinstance(data, dict):
+            raise TypeError(f"expected an object, got {type(data).__name__}")
+        profile = VoiceProfile(**{k: v for k, v in data.items() if k in known})
+        if profile.word_count < MIN_PROFILE_WORDS:
+            return None
+    except (ValueError, TypeError) as e:
+        # Derived file: a broken one is ignored until 'voice-profile' rebuilds it
+        log.warning("Ignoring unreadable voice profile (%s); rerun 'contentsifter voice-profile'", e)
+        return None
+    return profile
+
+
+def load_voice_profile(path: Path) -> VoiceProfile | None:
+    """Load a saved profile, or None if there isn't a usable one.
+
+    The parsed profile is cached until the file changes; treat it as
+    read-only.
+    """
+    return asset_cache.load(path, _parse_profile)
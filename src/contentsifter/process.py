@@ -13,6 +13,7 @@ from pathlib import Path
 
 from contentsifter.extraction.chunker import chunk_transcript
 from contentsifter.extraction.extractor import extract_from_chunk
+from contentsifter.search.vectors import update_vectors
 from contentsifter.storage.database import Database
 from contentsifter.storage.repository import Repository
 
@@ -121,6 +122,8 @@ def process_calls(
                 results["extractions_created"] += call_count
                 print(f"  -> {call_count} items extracted")
 
+            update_vectors(db)
+
     return results
 
 
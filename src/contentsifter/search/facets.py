@@ -0,0 +1,177 @@
+"""Facet counts for search results from in-memory bitsets.
+
+For each database, every category, tag, call type and call year gets a
+bitset (a Python int with bit ``id`` set for each extraction that has the
+value). A search's match set is turned into a bitset once, and each facet
+value's count is the popcount of its intersection with that set, so
+counting every facet costs one FTS lookup plus a few hundred integer ANDs.
+
+Facets ignore their own filter: with a category filter, the category facet
+still counts hits in every other category. Category, tag and call type
+filters are applied as bitsets; date and quality filters narrow the match
+set in SQL.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from contentsifter.search.filters import SearchFilters
+from contentsifter.search.keyword import EXTRACTION_COLUMNS
+from contentsifter.search.query import compile_query
+from contentsifter.storage.database import Database
+
+FACETS = ("category", "tag", "call_type", "year")
+
+# Values returned per facet
+FACET_LIMIT = 20
+
+# SearchFilters dimensions answered from bitsets, by the facet they match
+_BITSET_DIMENSIONS = {"category": "category", "tag": "tag", "call_type": "call_type"}
+
+
+def _bitset(ids) -> int:
+    """Pack ids into an int with bit ``id`` set for each."""
+    ids = list(ids)
+    if not ids:
+        return 0
+    bits = bytearray(max(ids) // 8 + 1)
+    for i in ids:
+        bits[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(bits, "little")
+
+
+@dataclass
+class FacetIndex:
+    """Per-value extraction bitsets for one database."""
+
+    signature: tuple
+    all_ids: int = 0
+    values: dict[str, dict[str, int]] = field(default_factory=dict)
+
+
+_indexes: dict[str, FacetIndex] = {}
+
+
+def _signature(db: Database) -> tuple:
+    """Cheap change marker: per-category and per-call-type totals plus tag rows."""
+    counters = db.conn.execute(
+        """SELECT scope, key, value FROM stats_counters
+           WHERE scope IN ('category', 'call_type') ORDER BY scope, key"""
+    ).fetchall()
+    tags = db.conn.execute(
+        """SELECT (SELECT COUNT(*) FROM extraction_tags),
+                  (SELECT MAX(rowid) FROM extraction_tags),
+                  (SELECT MAX(id) FROM extractions)"""
+    ).fetchone()
+    return tuple(tuple(r) for r in counters) + tuple(tags)
+
+
+def _build(db: Database) -> FacetIndex:
+    index = FacetIndex(signature=_signature(db))
+    ids: dict[str, dict[str, list[int]]] = {facet: {} for facet in FACETS}
+
+    rows = db.conn.execute(
+        """SELECT e.id, e.category, c.call_type, SUBSTR(c.call_date, 1, 4)
+           FROM extractions e JOIN calls c ON c.id = e.call_id"""
+    ).fetchall()
+    for eid, category, call_type, year in rows:
+        ids["category"].setdefault(category, []).append(eid)
+        if call_type:
+            ids["call_type"].setdefault(call_type, []).append(eid)
+        if year:
+            ids["year"].setdefault(year, []).append(eid)
+    for eid, name in db.conn.execute(
+        "SELECT et.extraction_id, t.name FROM extraction_tags et JOIN tags t ON t.id = et.tag_id"
+    ):
+        ids["tag"].setdefault(name, []).append(eid)
+
+    index.all_ids = _bitset(r[0] for r in rows)
+    index.values = {
+        facet: {value: _bitset(members) for value, members in by_value.items()}
+        for facet, by_value in ids.items()
+    }
+    return index
+
+
+def facet_index(db: Database) -> FacetIndex:
+    """Return the bitsets for ``db``, rebuilding them if the data changed."""
+    key = str(db.db_path)
+    index = _indexes.get(key)
+    if index is None or index.signature != _signature(db):
+        index = _indexes[key] = _build(db)
+    return index
+
+
+def _match_set(db: Database, query: str, conditions: list[tuple[str, str, list]], index: FacetIndex) -> int:
+    """Bitset of extractions matching ``query`` and the SQL-side filters."""
+    if not query and not conditions:
+        return index.all_ids
+
+    clauses = [clause for _, clause, _ in conditions]
+    params = [p for _, _, values in conditions for p in values]
+    if query:
+        if clauses:
+            sql = f"""SELECT e.id FROM extractions_fts fts
+                      JOIN extractions e ON e.id = fts.rowid
+                      JOIN calls c ON c.id = e.call_id
+                      WHERE extractions_fts MATCH ? AND {' AND '.join(clauses)}"""
+        else:
+            sql = "SELECT rowid FROM extractions_fts WHERE extractions_fts MATCH ?"
+        params = [query] + params
+    else:
+        sql = f"""SELECT e.id FROM extractions e
+                  JOIN calls c ON c.id = e.call_id
+                  WHERE {' AND '.join(clauses)}"""
+    return _bitset(r[0] for r in db.conn.execute(sql, params))
+
+
+def facet_counts(
+    db: Database,
+    query: str = "",
+    filters: SearchFilters | None = None,
+) -> dict[str, dict[str, int]]:
+    """Count search (or browse) matches per category, tag, call type and year.
+
+    Takes the same ``query`` and ``filters`` as keyword_search() (an empty
+    query counts what browse_extractions() would list). Restrict the facets
+    computed with ``filters.facets``.
+
+    Returns facet name -> {value: count}, highest count first, with at most
+    FACET_LIMIT non-zero values per facet.
+    """
+    if filters is None:
+        filters = SearchFilters()
+    facets = [f for f in FACETS if f in filters.facets] if filters.facets else list(FACETS)
+
+    index = facet_index(db)
+    if query:
+        query = compile_query(query, EXTRACTION_COLUMNS)
+        if not query:
+            return {facet: {} for facet in facets}
+    conditions = filters.sql_conditions()
+    sql_side = [c for c in conditions if c[0] not in _BITSET_DIMENSIONS]
+    matches = _match_set(db, query, sql_side, index)
+
+    selected = {"category": filters.categories, "tag": filters.tags, "call_type": filters.call_types}
+    masks: dict[str, int] = {}
+    for dim, facet in _BITSET_DIMENSIONS.items():
+        if selected[dim]:
+            mask = 0
+            for value in selected[dim]:
+                mask |= index.values[facet].get(value, 0)
+            masks[facet] = mask
+
+    counts: dict[str, dict[str, int]] = {}
+    for facet in facets:
+        scope = matches
+        for other, mask in masks.items():
+            if other != facet:
+                scope &= mask
+        hits = [
+            (value, (scope & bits).bit_count())
+            for value, bits in index.values[facet].items()
+        ]
+        hits = sorted((h for h in hits if h[1]), key=lambda h: (-h[1], h[0]))
+        counts[facet] = dict(hits[:FACET_LIMIT])
+    return counts
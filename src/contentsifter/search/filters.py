@@ -15,44 +15,55 @@ class SearchFilters:
     call_types: list[str] = field(default_factory=list)
     participants: list[str] = field(default_factory=list)
     min_quality: Optional[int] = None
+    content_types: list[str] = field(default_factory=list)
+    sources: list[str] = field(default_factory=list)
+    facets: list[str] = field(default_factory=list)
     limit: int = 20
 
-    def to_sql_clauses(self) -> tuple[str, list]:
-        """Return (WHERE clause fragments, parameters) for SQL queries.
+    def sql_conditions(self) -> list[tuple[str, str, list]]:
+        """Return (dimension, SQL condition, parameters) for each active filter.
 
-        Fragments are joined with AND by the caller.
+        Dimensions are "category", "tag", "date", "call_type" and "quality";
+        facet_counts() uses them to leave a facet's own filter out of its counts.
         """
-        clauses = []
-        params = []
+        conditions = []
 
         if self.categories:
             placeholders = ",".join("?" for _ in self.categories)
-            clauses.append(f"e.category IN ({placeholders})")
-            params.extend(self.categories)
+            conditions.append(("category", f"e.category IN ({placeholders})", list(self.categories)))
 
         if self.tags:
             placeholders = ",".join("?" for _ in self.tags)
-            clauses.append(
+            conditions.append((
+                "tag",
                 f"e.id IN (SELECT et.extraction_id FROM extraction_tags et "
-                f"JOIN tags t ON et.tag_id = t.id WHERE t.name IN ({placeholders}))"
-            )
-            params.extend(self.tags)
+                f"JOIN tags t ON et.tag_id = t.id WHERE t.name IN ({placeholders}))",
+                list(self.tags),
+            ))
 
         if self.date_from:
-            clauses.append("c.call_date >= ?")
-            params.append(self.date_from)
+            conditions.append(("date", "c.call_date >= ?", [self.date_from]))
 
         if self.date_to:
-            clauses.append("c.call_date <= ?")
-            params.append(self.date_to)
+            conditions.append(("date", "c.call_date <= ?", [self.date_to]))
 
         if self.call_types:
             placeholders = ",".join("?" for _ in self.call_types)
-            clauses.append(f"c.call_type IN ({placeholders})")
-            params.extend(self.call_types)
+            conditions.append(("call_type", f"c.call_type IN ({placeholders})", list(self.call_types)))
 
         if self.min_quality is not None:
-            clauses.append("e.quality_score >= ?")
-            params.append(self.min_quality)
+            conditions.append(("quality", "e.quality_score >= ?", [self.min_quality]))
+
+        return conditions
 
+    def to_sql_clauses(self) -> tuple[str, list]:
+        """Return (WHERE clause fragments, parameters) for SQL queries.
+
+        Fragments are joined with AND by the caller.
+        """
+        clauses = []
+        params = []
+        for _, clause, values in self.sql_conditions():
+            clauses.append(clause)
+            params.extend(values)
         return " AND ".join(clauses) if clauses else "", params
@@ -0,0 +1,149 @@
+"""Typo-tolerant fallback search over the optional trigram indexes.
+
+The porter tokenizer only matches whole (stemmed) words, so partial words
+("negot"), inner substrings and misspellings ("linkdin") find nothing.
+When the trigram indexes are enabled (``contentsifter fts trigram``), this
+tier ORs the query words' trigrams together to collect candidates, then
+scores each candidate by how closely its words match the query words:
+a substring match counts fully, otherwise the trigram similarity of the
+closest word. Candidates below MIN_SIMILARITY are dropped.
+
+Callers use it only when the primary FTS search returns nothing.
+"""
+
+from __future__ import annotations
+
+from contentsifter.search.filters import SearchFilters
+from contentsifter.search.keyword import PREVIEW_CHARS, build_results
+from contentsifter.search.unified import source_clauses
+from contentsifter.search.vectors import query_words
+from contentsifter.storage.database import Database
+
+# Candidates pulled from a trigram index before rescoring
+CANDIDATE_LIMIT = 200
+
+# Mean best-word similarity a candidate needs to be returned
+MIN_SIMILARITY = 0.4
+
+
+def _trigrams(word: str) -> set[str]:
+    """Padded character trigrams, so word starts and ends carry weight."""
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _similarity(word: str, other: str, cache: dict[str, set[str]]) -> float:
+    if word in other:
+        return 1.0
+    a = cache.setdefault(word, _trigrams(word))
+    b = cache.setdefault(other, _trigrams(other))
+    return len(a & b) / len(a | b)
+
+
+def _score(words: list[str], text: str, cache: dict[str, set[str]]) -> float:
+    """Mean over query words of the best similarity to any word in ``text``."""
+    candidates = set(query_words(text))
+    if not candidates:
+        return 0.0
+    return sum(
+        max(_similarity(w, c, cache) for c in candidates) for w in words
+    ) / len(words)
+
+
+def _match_expression(words: list[str]) -> str:
+    """OR of every query-word trigram (the trigram tokenizer needs 3+ chars)."""
+    grams = sorted({w[i:i + 3] for w in words for i in range(len(w) - 2)})
+    return " OR ".join(f'"{g}"' for g in grams)
+
+
+def _rescore(rows, words: list[str], text_of, limit: int) -> list[tuple[float, object]]:
+    cache: dict[str, set[str]] = {}
+    scored = []
+    for row in rows:
+        score = _score(words, text_of(row), cache)
+        if score >= MIN_SIMILARITY:
+            scored.append((score, row))
+    scored.sort(key=lambda sr: -sr[0])
+    return scored[:limit]
+
+
+def fuzzy_search(
+    db: Database,
+    query: str,
+    filters: SearchFilters | None = None,
+    snippets: bool = False,
+) -> list[dict]:
+    """Typo-tolerant extraction search; returns keyword_search()-style results.
+
+    Each result also has ``relevance_score``, its 0..1 similarity, but no
+    ``cursor``: fuzzy results are a single page. Returns [] if the trigram
+    index isn't enabled.
+    """
+    if filters is None:
+        filters = SearchFilters()
+    words = list(dict.fromkeys(query_words(query)))
+    expression = _match_expression(words)
+    if not expression or not db.has_trigram_index():
+        return []
+
+    filter_clause, filter_params = filters.to_sql_clauses()
+    where = f"AND {filter_clause}" if filter_clause else ""
+    if snippets:
+        text_cols = f"""
+            CASE WHEN LENGTH(e.content) > {PREVIEW_CHARS}
+                 THEN SUBSTR(e.content, 1, {PREVIEW_CHARS}) || '...'
+                 ELSE e.content END AS snippet,"""
+    else:
+        text_cols = """
+            e.raw_quote,"""
+
+    rows = db.conn.execute(
+        f"""SELECT e.id, e.category, e.title, e.content AS full_text,{text_cols}
+                   e.content, e.speaker, e.quality_score,
+                   c.title AS call_title, c.call_date, c.call_type
+            FROM extractions_trigram tg
+            JOIN extractions e ON e.id = tg.rowid
+            JOIN calls c ON c.id = e.call_id
+            WHERE extractions_trigram MATCH ? {where}
+            ORDER BY rank
+            LIMIT ?""",
+        [expression] + filter_params + [CANDIDATE_LIMIT],
+    ).fetchall()
+
+    scored = _rescore(rows, words, lambda r: f"{r['title']} {r['full_text']}", filters.limit)
+    # Rescored results have no keyset order, so they carry no page cursor
+    results = build_results(db, [row for _, row in scored])
+    for result, (score, _) in zip(results, scored):
+        result["relevance_score"] = round(score, 4)
+    return results
+
+
+def fuzzy_content_items(
+    db: Database,
+    query: str,
+    filters: SearchFilters | None = None,
+) -> list[dict]:
+    """Typo-tolerant content item search; returns unified_search()-style results."""
+    if filters is None:
+        filters = SearchFilters()
+    words = list(dict.fromkeys(query_words(query)))
+    expression = _match_expression(words)
+    clauses = source_clauses(filters, "content_item")
+    if not expression or clauses is None or not db.has_trigram_index():
+        return []
+    where, where_params = clauses
+
+    rows = db.conn.execute(
+        f"""SELECT 'content_item' AS source, ci.id, COALESCE(ci.title, '') AS title,
+                   ci.text, ci.content_type AS kind, ci.date, NULL AS quality_score,
+                   ci.author AS speaker, ci.source_file AS parent_title, NULL AS parent_id
+            FROM content_items_trigram tg
+            JOIN content_items ci ON ci.id = tg.rowid
+            WHERE content_items_trigram MATCH ?{where}
+            ORDER BY rank
+            LIMIT ?""",
+        [expression] + where_params + [CANDIDATE_LIMIT],
+    ).fetchall()
+
+    scored = _rescore(rows, words, lambda r: f"{r['title']} {r['text']}", filters.limit)
+    return [{**dict(row), "score": round(score, 4)} for score, row in scored]
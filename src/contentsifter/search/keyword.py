@@ -2,36 +2,157 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
+import json
+
 from contentsifter.search.filters import SearchFilters
+from contentsifter.search.query import compile_query
 from contentsifter.storage.database import Database
+from contentsifter.storage.repository import Repository
+
+
+# Markers FTS5 wraps around matched terms in snippets. Control characters
+# can't occur in stored text, so callers can escape the snippet first and
+# then swap these for real markup.
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_END = "\x03"
+
+# Tokens per snippet (FTS5 allows at most 64), and characters for browse previews
+SNIPPET_TOKENS = 32
+PREVIEW_CHARS = 200
+
+# Maximum rows counted when estimating a result total; beyond this the
+# total is reported as "COUNT_CAP+" instead of scanning every match.
+COUNT_CAP = 1000
+
+# extractions_fts columns that ``column:term`` queries may target
+EXTRACTION_COLUMNS = ("title", "content", "raw_quote", "context_note")
+
+
+def encode_cursor(*key) -> str:
+    """Encode a row's sort key as an opaque, URL-safe pagination cursor."""
+    raw = json.dumps(list(key)).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    """Decode a cursor from encode_cursor(). Raises ValueError if malformed."""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(key, list) or len(key) != 2:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return key
+
+
+def _get_tags(db: Database, extraction_ids: list[int]) -> dict[int, list[str]]:
+    """Fetch tag names for a page of extractions in one query."""
+    tags: dict[int, list[str]] = {eid: [] for eid in extraction_ids}
+    if not extraction_ids:
+        return tags
+    placeholders = ",".join("?" for _ in extraction_ids)
+    rows = db.conn.execute(
+        f"""SELECT et.extraction_id, t.name FROM tags t
+            JOIN extraction_tags et ON t.id = et.tag_id
+            WHERE et.extraction_id IN ({placeholders})""",
+        extraction_ids,
+    ).fetchall()
+    for r in rows:
+        tags[r["extraction_id"]].append(r["name"])
+    return tags
+
+
+def build_results(db: Database, rows, sort_key=None) -> list[dict]:
+    """Turn extraction rows into result dicts with tags.
+
+    With ``sort_key`` (row -> keyset values), each result also carries the
+    ``cursor`` that resumes after it.
+    """
+    tags = _get_tags(db, [row["id"] for row in rows])
+    results = []
+    snippets = "snippet" in rows[0].keys() if rows else False
+    for row in rows:
+        result = {
+            "id": row["id"],
+            "category": row["category"],
+            "title": row["title"],
+            "speaker": row["speaker"],
+            "quality_score": row["quality_score"],
+            "tags": tags[row["id"]],
+            "call_title": row["call_title"],
+            "call_date": row["call_date"],
+            "call_type": row["call_type"],
+        }
+        if sort_key is not None:
+            result["cursor"] = encode_cursor(*sort_key(row))
+        if snippets:
+            result["snippet"] = row["snippet"]
+        else:
+            result["content"] = row["content"]
+            result["raw_quote"] = row["raw_quote"]
+        results.append(result)
+    return results
 
 
 def keyword_search(
     db: Database,
     query: str,
     filters: SearchFilters | None = None,
+    cursor: str | None = None,
+    snippets: bool = False,
 ) -> list[dict]:
     """Full-text search using SQLite FTS5.
 
+    The query is compiled with compile_query(), so any input is safe.
     Supports:
-    - Simple queries: "linkedin profile"
+    - Simple queries: "linkedin profile" (hyphenated words are phrases)
     - Phrase matching: '"salary negotiation"'
-    - Boolean: "resume AND interview"
+    - Boolean: "resume AND interview", "resume -cover"
     - Prefix: "network*"
+    - Column: "title:salary"
+
+    Matches are ranked by bm25() with the column weights in
+    FTS_RANK_WEIGHTS (title highest).
+
+    Results are ordered by (rank, id). Pass the ``cursor`` of the last
+    result to fetch the next page; paging is keyset-based, so later pages
+    cost the same as the first.
+
+    With ``snippets=True``, results carry a query-centred ``snippet`` (matches
+    wrapped in HIGHLIGHT_START/HIGHLIGHT_END) and a highlighted ``title``
+    instead of the full ``content`` and ``raw_quote``.
     """
     if filters is None:
         filters = SearchFilters()
+    query = compile_query(query, EXTRACTION_COLUMNS)
+    if not query:
+        return []
 
     filter_clause, filter_params = filters.to_sql_clauses()
     where = f"AND {filter_clause}" if filter_clause else ""
+    cursor_params: list = []
+    if cursor:
+        where += " AND (rank, e.id) > (?, ?)"
+        cursor_params = decode_cursor(cursor)
+
+    if snippets:
+        text_cols = f"""
+            highlight(extractions_fts, 0, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}') AS title,
+            snippet(extractions_fts, -1, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}', '…', {SNIPPET_TOKENS})
+                AS snippet,"""
+    else:
+        text_cols = """
+            e.title,
+            e.content,
+            e.raw_quote,"""
 
     sql = f"""
         SELECT
             e.id,
-            e.category,
-            e.title,
-            e.content,
-            e.raw_quote,
+            e.category,{text_cols}
             e.speaker,
             e.quality_score,
             c.title as call_title,
@@ -43,62 +164,55 @@ def keyword_search(
         JOIN calls c ON c.id = e.call_id
         WHERE extractions_fts MATCH ?
         {where}
-        ORDER BY rank
+        ORDER BY rank, e.id
         LIMIT ?
     """
 
-    params = [query] + filter_params + [filters.limit]
+    params = [query] + filter_params + cursor_params + [filters.limit]
     rows = db.conn.execute(sql, params).fetchall()
-
-    results = []
-    for row in rows:
-        # Get tags for this extraction
-        tag_rows = db.conn.execute(
-            """SELECT t.name FROM tags t
-               JOIN extraction_tags et ON t.id = et.tag_id
-               WHERE et.extraction_id = ?""",
-            (row["id"],),
-        ).fetchall()
-
-        results.append({
-            "id": row["id"],
-            "category": row["category"],
-            "title": row["title"],
-            "content": row["content"],
-            "raw_quote": row["raw_quote"],
-            "speaker": row["speaker"],
-            "quality_score": row["quality_score"],
-            "tags": [t["name"] for t in tag_rows],
-            "call_title": row["call_title"],
-            "call_date": row["call_date"],
-            "call_type": row["call_type"],
-        })
-
-    return results
+    return build_results(db, rows, lambda row: (row["rank"], row["id"]))
 
 
 def browse_extractions(
     db: Database,
     filters: SearchFilters | None = None,
+    cursor: str | None = None,
+    snippets: bool = False,
 ) -> list[dict]:
     """Browse extractions without a search term.
 
     Returns results sorted by quality_score DESC, then newest first.
     Supports all SearchFilters (category, tags, date, quality, etc).
+    Pass the ``cursor`` of the last result to fetch the next page.
+    With ``snippets=True``, results carry the first PREVIEW_CHARS of content
+    as ``snippet`` instead of the full ``content`` and ``raw_quote``.
     """
     if filters is None:
         filters = SearchFilters()
 
     filter_clause, filter_params = filters.to_sql_clauses()
-    where = f"WHERE {filter_clause}" if filter_clause else ""
+    clauses = [filter_clause] if filter_clause else []
+    cursor_params: list = []
+    if cursor:
+        clauses.append("(e.quality_score, e.id) < (?, ?)")
+        cursor_params = decode_cursor(cursor)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    if snippets:
+        text_cols = f"""
+            CASE WHEN LENGTH(e.content) > {PREVIEW_CHARS}
+                 THEN SUBSTR(e.content, 1, {PREVIEW_CHARS}) || '...'
+                 ELSE e.content END AS snippet,"""
+    else:
+        text_cols = """
+            e.content,
+            e.raw_quote,"""
 
     sql = f"""
         SELECT
             e.id,
             e.category,
-            e.title,
-            e.content,
-            e.raw_quote,
+            e.title,{text_cols}
             e.speaker,
             e.quality_score,
             c.title as call_title,
@@ -111,33 +225,56 @@ def browse_extractions(
         LIMIT ?
     """
 
-    params = filter_params + [filters.limit]
+    params = filter_params + cursor_params + [filters.limit]
     rows = db.conn.execute(sql, params).fetchall()
+    return build_results(db, rows, lambda row: (row["quality_score"], row["id"]))
 
-    results = []
-    for row in rows:
-        tag_rows = db.conn.execute(
-            """SELECT t.name FROM tags t
-               JOIN extraction_tags et ON t.id = et.tag_id
-               WHERE et.extraction_id = ?""",
-            (row["id"],),
-        ).fetchall()
-
-        results.append({
-            "id": row["id"],
-            "category": row["category"],
-            "title": row["title"],
-            "content": row["content"],
-            "raw_quote": row["raw_quote"],
-            "speaker": row["speaker"],
-            "quality_score": row["quality_score"],
-            "tags": [t["name"] for t in tag_rows],
-            "call_title": row["call_title"],
-            "call_date": row["call_date"],
-            "call_type": row["call_type"],
-        })
 
-    return results
+def estimate_total(
+    db: Database,
+    query: str = "",
+    filters: SearchFilters | None = None,
+    cap: int = COUNT_CAP,
+) -> tuple[int, bool]:
+    """Estimate how many results a search or browse would return.
+
+    Returns (count, capped). Category-only browsing is answered exactly
+    from stats_counters; anything else counts at most ``cap`` + 1 matches,
+    and ``capped`` is True when there are more than ``cap``.
+    """
+    if filters is None:
+        filters = SearchFilters()
+
+    only_categories = not (
+        filters.tags or filters.date_from or filters.date_to
+        or filters.call_types or filters.min_quality is not None
+    )
+    if not query and only_categories:
+        counts = Repository(db).get_counters("category")
+        if filters.categories:
+            return sum(counts.get(cat, 0) for cat in filters.categories), False
+        return sum(counts.values()), False
+
+    filter_clause, filter_params = filters.to_sql_clauses()
+    if query:
+        query = compile_query(query, EXTRACTION_COLUMNS)
+        if not query:
+            return 0, False
+        where = f"AND {filter_clause}" if filter_clause else ""
+        inner = f"""SELECT 1 FROM extractions_fts fts
+                    JOIN extractions e ON e.id = fts.rowid
+                    JOIN calls c ON c.id = e.call_id
+                    WHERE extractions_fts MATCH ? {where} LIMIT ?"""
+        params = [query] + filter_params + [cap + 1]
+    else:
+        where = f"WHERE {filter_clause}" if filter_clause else ""
+        inner = f"""SELECT 1 FROM extractions e
+                    JOIN calls c ON c.id = e.call_id
+                    {where} LIMIT ?"""
+        params = filter_params + [cap + 1]
+
+    count = db.conn.execute(f"SELECT COUNT(*) FROM ({inner})", params).fetchone()[0]
+    return min(count, cap), count > cap
 
 
 def search_raw_turns(
@@ -146,6 +283,9 @@ def search_raw_turns(
     limit: int = 20,
 ) -> list[dict]:
     """Search raw speaker turns for a query."""
+    query = compile_query(query, ("text", "speaker_name"))
+    if not query:
+        return []
     sql = """
         SELECT
             st.id,
@@ -0,0 +1,146 @@
+"""Compile user search input into a safe FTS5 MATCH expression.
+
+Input is tokenized rather than passed to MATCH verbatim, so punctuation,
+hyphens and unbalanced quotes can't raise syntax errors:
+
+- bare words are quoted; ``career-change`` becomes the phrase "career change"
+- "quoted phrases" stay phrases (an unclosed quote runs to the end)
+- AND, OR, NOT (upper case) and parentheses are kept where they are valid
+- ``-word`` excludes a term and ``word*`` is a prefix query
+- ``title:word`` restricts a term to a column, when the index has one
+
+Compiling already-compiled output returns it unchanged.
+"""
+
+from __future__ import annotations
+
+import re
+
+OPERATORS = ("AND", "OR", "NOT")
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<phrase>(?:(?P<col>\w+):)?"[^"]*"?\*?)
+    | (?P<paren>[()])
+    | (?P<word>[^\s()"]+)
+    """,
+    re.VERBOSE,
+)
+_TERM_RE = re.compile(r"\w+")
+_COLUMN_RE = re.compile(r"(\w+):(.*)")
+
+
+def _operand(text: str, prefix: bool, column: str | None, columns: tuple[str, ...]) -> str | None:
+    """Quote ``text``'s terms as one FTS5 phrase, or None if it has no terms."""
+    terms = _TERM_RE.findall(text)
+    if not terms:
+        return None
+    phrase = '"' + " ".join(terms) + '"' + ("*" if prefix else "")
+    if column and column in columns:
+        return f"{column}:{phrase}"
+    return phrase
+
+
+def _tokens(text: str, columns: tuple[str, ...]) -> tuple[list[str], list[str]]:
+    """Split input into (expression items, excluded operands)."""
+    items: list[str] = []
+    excluded: list[str] = []
+    for m in _TOKEN_RE.finditer(text):
+        if m.group("paren"):
+            items.append(m.group("paren"))
+            continue
+        if m.group("phrase"):
+            raw = m.group("phrase")
+            column = m.group("col")
+            if column:
+                raw = raw[len(column) + 1:]
+            operand = _operand(raw.strip('"*'), raw.endswith("*"), column, columns)
+            if operand:
+                items.append(operand)
+            continue
+
+        word = m.group("word")
+        if word in OPERATORS:
+            items.append(word)
+            continue
+        negate = word.startswith("-") and len(word) > 1
+        word = word.lstrip("-")
+        column = None
+        col_match = _COLUMN_RE.match(word)
+        if col_match:
+            column, word = col_match.groups()
+        operand = _operand(word, word.endswith("*"), column, columns)
+        if operand is None:
+            continue
+        if negate:
+            excluded.append(operand)
+        else:
+            items.append(operand)
+    return items, excluded
+
+
+def _balance(items: list[str]) -> list[str]:
+    """Drop unmatched parentheses."""
+    keep = [True] * len(items)
+    opened: list[int] = []
+    for i, item in enumerate(items):
+        if item == "(":
+            opened.append(i)
+        elif item == ")":
+            if opened:
+                opened.pop()
+            else:
+                keep[i] = False
+    for i in opened:
+        keep[i] = False
+    return [item for item, k in zip(items, keep) if k]
+
+
+def _clean(items: list[str]) -> list[str]:
+    """Drop operators without an operand on both sides, and empty groups."""
+    out: list[str] = []
+    for item in items:
+        if item in OPERATORS:
+            if out and out[-1] not in OPERATORS and out[-1] != "(":
+                out.append(item)
+        elif item == ")":
+            while out and out[-1] in OPERATORS:
+                out.pop()
+            if out and out[-1] == "(":
+                out.pop()
+            else:
+                out.append(item)
+        else:
+            out.append(item)
+    while out and out[-1] in OPERATORS:
+        out.pop()
+
+    # FTS5 only allows implicit AND between plain terms, not next to a group
+    joined: list[str] = []
+    for item in out:
+        after_operand = bool(joined) and joined[-1] not in OPERATORS and joined[-1] != "("
+        starts_operand = item not in OPERATORS and item != ")"
+        if after_operand and starts_operand and (item == "(" or joined[-1] == ")"):
+            joined.append("AND")
+        joined.append(item)
+    return joined
+
+
+def compile_query(text: str, columns: tuple[str, ...] = ()) -> str:
+    """Turn free-text search input into an FTS5 expression.
+
+    ``columns`` names the columns ``col:term`` filters may target; filters
+    on any other name search the term in every column. Returns "" when the
+    input has nothing searchable.
+    """
+    items, excluded = _tokens(text, columns)
+    items = _clean(_balance(items))
+    if not items:
+        return ""
+    expression = " ".join(items).replace("( ", "(").replace(" )", ")")
+    if excluded:
+        # FTS5's NOT is binary, so exclusions apply to the whole expression
+        if len(items) > 1:
+            expression = f"({expression})"
+        expression += "".join(f" NOT {operand}" for operand in excluded)
+    return expression
@@ -0,0 +1,241 @@
+"""Feature-based local reranker for search candidates.
+
+Scores each candidate as a weighted sum of cheap, deterministic features:
+per-column BM25 (title, content, raw_quote), quality score, overlap between
+the query and the candidate's tags, a per-category prior, recency of the
+source call, and the candidate's position from the retrieval stage.
+Near-duplicates of a higher-ranked result are dropped.
+
+Weights default to hand-tuned values and can be fitted to a small labeled
+file (one JSON object per line: ``{"query": ..., "relevant": [ids]}``)
+with tune_weights().
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict, dataclass, field, fields, replace
+from datetime import date
+from pathlib import Path
+
+from contentsifter.search.filters import SearchFilters
+from contentsifter.search.vectors import hybrid_search, query_words, tokenize
+from contentsifter.storage.database import Database
+
+logger = logging.getLogger(__name__)
+
+# Candidates retrieved per labeled query when tuning
+TUNE_POOL = 60
+
+# Multipliers tried for each weight per coordinate-ascent pass
+TUNE_STEPS = (0.0, 0.5, 2.0)
+TUNE_PASSES = 3
+
+
+@dataclass
+class RerankWeights:
+    bm25_title: float = 1.0
+    bm25_content: float = 0.6
+    bm25_quote: float = 0.4
+    quality: float = 0.3
+    tag_overlap: float = 0.8
+    recency: float = 0.2
+    retrieval: float = 1.0
+    category_priors: dict[str, float] = field(default_factory=lambda: {
+        "playbook": 0.2,
+        "qa": 0.15,
+        "story": 0.05,
+        "testimonial": 0.0,
+    })
+    recency_half_life_days: float = 365.0
+    duplicate_threshold: float = 0.8
+
+
+# Weights that tune_weights() adjusts; the rest are shape parameters
+FEATURE_WEIGHTS = (
+    "bm25_title", "bm25_content", "bm25_quote",
+    "quality", "tag_overlap", "recency", "retrieval",
+)
+
+
+def load_weights(path: Path) -> RerankWeights:
+    """Load weights from a JSON file, falling back to defaults for missing keys."""
+    if not path.exists():
+        return RerankWeights()
+    data = json.loads(path.read_text())
+    known = {f.name for f in fields(RerankWeights)}
+    return RerankWeights(**{k: v for k, v in data.items() if k in known})
+
+
+def save_weights(weights: RerankWeights, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(asdict(weights), indent=2) + "\n")
+
+
+def _bm25_columns(db: Database, query: str, ids: list[int]) -> dict[int, tuple[float, ...]]:
+    """Per-column BM25 (title, content, raw_quote) for candidates matching ``query``."""
+    words = list(dict.fromkeys(query_words(query)))
+    if not words or not ids:
+        return {}
+    placeholders = ",".join("?" for _ in ids)
+    rows = db.conn.execute(
+        f"""SELECT rowid,
+                   bm25(extractions_fts, 1.0, 0.0, 0.0, 0.0) AS title,
+                   bm25(extractions_fts, 0.0, 1.0, 0.0, 0.0) AS content,
+                   bm25(extractions_fts, 0.0, 0.0, 1.0, 0.0) AS quote
+            FROM extractions_fts
+            WHERE extractions_fts MATCH ? AND rowid IN ({placeholders})""",
+        [" OR ".join(f'"{w}"' for w in words)] + ids,
+    ).fetchall()
+    # FTS5 bm25() is negative, lower is better
+    return {r["rowid"]: (-r["title"], -r["content"], -r["quote"]) for r in rows}
+
+
+def _parse_date(value: str | None) -> date | None:
+    try:
+        return date.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def _features(db: Database, query: str, candidates: list[dict], weights: RerankWeights) -> list[dict]:
+    """Compute normalized feature values (0..1) for each candidate."""
+    bm25 = _bm25_columns(db, query, [c["id"] for c in candidates])
+    col_max = [max((v[i] for v in bm25.values()), default=0.0) or 1.0 for i in range(3)]
+
+    query_stems = set(tokenize(query))
+    dates = {c["id"]: _parse_date(c.get("call_date")) for c in candidates}
+    newest = max((d for d in dates.values() if d), default=None)
+
+    n = len(candidates)
+    features = []
+    for i, c in enumerate(candidates):
+        cols = bm25.get(c["id"], (0.0, 0.0, 0.0))
+        tag_stems = set(tokenize(" ".join(t.replace("_", " ") for t in c.get("tags", []))))
+        d = dates[c["id"]]
+        features.append({
+            "bm25_title": cols[0] / col_max[0],
+            "bm25_content": cols[1] / col_max[1],
+            "bm25_quote": cols[2] / col_max[2],
+            "quality": max(0, (c.get("quality_score") or 0) - 1) / 4,
+            "tag_overlap": len(query_stems & tag_stems) / len(query_stems) if query_stems else 0.0,
+            "recency": (
+                0.5 ** ((newest - d).days / weights.recency_half_life_days)
+                if d and newest else 0.0
+            ),
+            "retrieval": 1.0 - i / n,
+        })
+    return features
+
+
+def _score(feature: dict, category: str, weights: RerankWeights) -> float:
+    score = sum(getattr(weights, name) * feature[name] for name in FEATURE_WEIGHTS)
+    return score + weights.category_priors.get(category, 0.0)
+
+
+def is_duplicate(tokens: set[str], kept: list[set[str]], threshold: float) -> bool:
+    """Whether ``tokens`` overlaps any set in ``kept`` by Jaccard >= ``threshold``."""
+    for other in kept:
+        union = len(tokens | other)
+        if union and len(tokens & other) / union >= threshold:
+            return True
+    return False
+
+
+def rerank(
+    db: Database,
+    query: str,
+    candidates: list[dict],
+    limit: int,
+    weights: RerankWeights | None = None,
+    features: list[dict] | None = None,
+) -> list[dict]:
+    """Order ``candidates`` by weighted features and return the top ``limit``.
+
+    Each returned result gets ``relevance_score`` set to its rerank score.
+    """
+    if not candidates:
+        return []
+    if weights is None:
+        weights = RerankWeights()
+    if features is None:
+        features = _features(db, query, candidates, weights)
+
+    scored = sorted(
+        zip(candidates, features),
+        key=lambda cf: (-_score(cf[1], cf[0]["category"], weights), cf[0]["id"]),
+    )
+
+    results = []
+    kept: list[set[str]] = []
+    for c, f in scored:
+        tokens = set(tokenize(f"{c['title']} {c['content']}"))
+        if is_duplicate(tokens, kept, weights.duplicate_threshold):
+            continue
+        kept.append(tokens)
+        c["relevance_score"] = round(_score(f, c["category"], weights), 4)
+        results.append(c)
+        if len(results) >= limit:
+            break
+    return results
+
+
+# ── Tuning ───────────────────────────────────────────────────────────────
+
+
+def load_labels(path: Path) -> list[dict]:
+    """Read a labeled query file: one ``{"query", "relevant"}`` object per line."""
+    labels = []
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if line:
+            entry = json.loads(line)
+            labels.append({"query": entry["query"], "relevant": set(entry["relevant"])})
+    return labels
+
+
+def _mean_reciprocal_rank(prepared, weights: RerankWeights, limit: int) -> float:
+    total = 0.0
+    for query, candidates, features, relevant in prepared:
+        ranked = rerank(None, query, [dict(c) for c in candidates], limit, weights, features)
+        total += next(
+            (1.0 / (i + 1) for i, r in enumerate(ranked) if r["id"] in relevant), 0.0
+        )
+    return total / len(prepared) if prepared else 0.0
+
+
+def tune_weights(
+    db: Database,
+    labels: list[dict],
+    weights: RerankWeights | None = None,
+    limit: int = 20,
+) -> tuple[RerankWeights, float]:
+    """Fit feature weights to labeled queries by coordinate ascent on MRR.
+
+    Returns the best weights found and their mean reciprocal rank.
+    """
+    if weights is None:
+        weights = RerankWeights()
+
+    prepared = []
+    for label in labels:
+        candidates = hybrid_search(db, label["query"], SearchFilters(limit=TUNE_POOL))
+        features = _features(db, label["query"], candidates, weights)
+        prepared.append((label["query"], candidates, features, label["relevant"]))
+
+    best = _mean_reciprocal_rank(prepared, weights, limit)
+    for _ in range(TUNE_PASSES):
+        improved = False
+        for name in FEATURE_WEIGHTS:
+            current = getattr(weights, name)
+            for step in TUNE_STEPS:
+                value = round(current * step, 4) if current else step
+                trial = replace(weights, **{name: value})
+                mrr = _mean_reciprocal_rank(prepared, trial, limit)
+                if mrr > best:
+                    best, weights, improved = mrr, trial, True
+        if not improved:
+            break
+        logger.debug("Rerank tuning pass: MRR %.4f", best)
+    return weights, best
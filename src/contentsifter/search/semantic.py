@@ -1,43 +1,21 @@
-"""Claude-powered semantic search for ContentSifter."""
+"""Semantic search for ContentSifter: local retrieval and re-ranking, optional Claude re-rank."""
 
 from __future__ import annotations
 
 import json
 import logging
 import re
+from dataclasses import replace
 
 from contentsifter.config import MODEL_LIGHT
 from contentsifter.llm.client import complete_with_retry, create_client
 from contentsifter.search.filters import SearchFilters
-from contentsifter.search.keyword import keyword_search
+from contentsifter.search.rerank import RerankWeights, rerank
+from contentsifter.search.vectors import hybrid_search, record_search
 from contentsifter.storage.database import Database
 
 logger = logging.getLogger(__name__)
 
-QUERY_EXPANSION_SYSTEM = """\
-You are a search query expert. Given a natural language question about career coaching content,
-generate an FTS5 search query that will find relevant results.
-
-The content database contains career coaching extractions in these categories:
-- Q&As (questions and answers about job search)
-- Testimonials (success stories, wins)
-- Playbooks (step-by-step advice, frameworks)
-- Stories (anecdotes, examples)
-
-Common topics: linkedin, networking, resume, interviews, salary negotiation,
-mindset, confidence, personal branding, career transition, job search strategy,
-follow up, company research, recruiter, informational interviews.
-
-Return ONLY a JSON object with:
-- "fts_query": an FTS5 query string (use OR for synonyms, quotes for phrases)
-- "keywords": list of key terms to search for
-
-Example: For "what should I do when a company ghosts me after an interview"
-{
-  "fts_query": "ghost* OR \"no response\" OR \"follow up\" OR rejection OR \"after interview\"",
-  "keywords": ["ghosting", "follow up", "no response", "rejection", "interview"]
-}"""
-
 RERANK_SYSTEM = """\
 You are ranking search results for relevance to a user's query about career coaching content.
 
@@ -50,52 +28,44 @@ Only include results with score >= 0.3."""
 def semantic_search(
     db: Database,
     query: str,
-    llm_client,
+    llm_client=None,
     filters: SearchFilters | None = None,
+    llm_rerank: bool = False,
+    weights: RerankWeights | None = None,
 ) -> list[dict]:
-    """Two-stage semantic search:
-    1. Expand query into FTS5 terms using Claude
-    2. Retrieve candidates via FTS5
-    3. Re-rank candidates using Claude
-
-    Uses a lightweight model (Haiku) since these are mechanical scoring tasks.
+    """Three-stage semantic search:
+    1. Expand the query locally (pseudo-relevance feedback from top FTS hits,
+       cached per normalized query and filters)
+    2. Retrieve candidates by FTS5 rank fused with TF-IDF vector similarity
+    3. Re-rank candidates with the local feature reranker, or with Claude
+       when ``llm_rerank`` is set
+
+    The LLM stage uses a lightweight model (Haiku) since it is a mechanical
+    scoring task. Nothing is written to ``db``; call flush_search_stats()
+    afterwards to persist the search log and new expansions.
     """
     if filters is None:
         filters = SearchFilters()
+    record_search(db, query)
+
+    # Retrieve more than needed for re-ranking
+    candidates = hybrid_search(db, query, replace(filters, limit=min(filters.limit * 3, 60)))
+    if not candidates:
+        return []
+
+    if not llm_rerank:
+        return rerank(db, query, candidates, filters.limit, weights)
 
-    # Use lightweight model for search tasks (query expansion + re-ranking)
     try:
         light_client = create_client(mode="auto", model=MODEL_LIGHT)
     except Exception:
         light_client = llm_client
 
-    # Stage 1: Query expansion
-    expansion_response = complete_with_retry(
-        light_client,
-        system=QUERY_EXPANSION_SYSTEM,
-        user=f"User query: {query}",
-        max_tokens=512,
-    )
+    return _llm_rerank(light_client, query, candidates, filters.limit)
 
-    try:
-        text = expansion_response.content.strip()
-        text = re.sub(r"^```(?:json)?\s*\n?", "", text)
-        text = re.sub(r"\n?```\s*$", "", text)
-        expansion = json.loads(text)
-        fts_query = expansion.get("fts_query", query)
-    except (json.JSONDecodeError, KeyError):
-        fts_query = query
-
-    # Stage 2: Retrieve candidates (get more than needed for re-ranking)
-    original_limit = filters.limit
-    filters.limit = min(original_limit * 3, 60)
-    candidates = keyword_search(db, fts_query, filters)
-    filters.limit = original_limit
-
-    if not candidates:
-        return []
 
-    # Stage 3: Re-rank with Claude
+def _llm_rerank(llm_client, query: str, candidates: list[dict], limit: int) -> list[dict]:
+    """Re-rank candidates with Claude, falling back to their given order."""
     candidate_summaries = []
     for c in candidates:
         candidate_summaries.append({
@@ -106,7 +76,7 @@ def semantic_search(
         })
 
     rerank_response = complete_with_retry(
-        light_client,
+        llm_client,
         system=RERANK_SYSTEM,
         user=f"Query: {query}\n\nResults:\n{json.dumps(candidate_summaries, indent=2)}",
         max_tokens=2048,
@@ -119,12 +89,12 @@ def semantic_search(
         rankings = json.loads(text)
     except (json.JSONDecodeError, KeyError):
         # If re-ranking fails, return candidates as-is
-        return candidates[:original_limit]
+        return candidates[:limit]
 
     # Build ranked results
     candidate_map = {c["id"]: c for c in candidates}
     ranked_results = []
-    for r in rankings[:original_limit]:
+    for r in rankings[:limit]:
         cid = r.get("id")
         if cid in candidate_map:
             result = candidate_map[cid]
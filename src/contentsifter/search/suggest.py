@@ -0,0 +1,142 @@
+"""Typeahead suggestions from the FTS vocabularies.
+
+Terms and document frequencies come from the fts5vocab views over the
+extraction and content item indexes. Those hold porter stems ("compani",
+"network"), so each stem is shown as the most common surface word that
+produces it in titles and tag names.
+
+The merged term list lives in memory per database, sorted for bisect
+lookup. It is rebuilt when the extraction or content item counts change,
+or explicitly with refresh_suggestions() after an ingest.
+"""
+
+from __future__ import annotations
+
+import heapq
+import re
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+
+from contentsifter.search.vectors import STOPWORDS
+from contentsifter.storage.database import Database
+
+VOCAB_TABLES = ("extractions_vocab", "content_items_vocab")
+
+# Completions returned per request
+SUGGESTION_LIMIT = 8
+
+# Shortest prefix completed; matches the FTS prefix index sizes
+MIN_PREFIX_LEN = 2
+
+_WORD_RE = re.compile(r"[a-z][a-z0-9']*")
+
+# Surface-form sources: short fields that contain the words people type
+_SURFACE_SQL = (
+    "SELECT title FROM extractions",
+    "SELECT title FROM content_items WHERE title IS NOT NULL",
+    "SELECT REPLACE(name, '_', ' ') FROM tags",
+)
+
+
+@dataclass
+class TermIndex:
+    """Sorted display words with their document frequencies."""
+
+    signature: tuple
+    words: list[str]
+    dfs: list[int]
+
+    def complete(self, prefix: str, limit: int = SUGGESTION_LIMIT) -> list[tuple[str, int]]:
+        """Words starting with ``prefix``, most frequent first."""
+        lo = bisect_left(self.words, prefix)
+        hi = bisect_left(self.words, prefix + "\uffff", lo)
+        best = heapq.nsmallest(
+            limit, range(lo, hi), key=lambda i: (-self.dfs[i], self.words[i])
+        )
+        return [(self.words[i], self.dfs[i]) for i in best]
+
+
+_indexes: dict[str, TermIndex] = {}
+
+
+def _signature(db: Database) -> tuple:
+    """Cheap change marker: extraction and content item totals."""
+    rows = db.conn.execute(
+        """SELECT scope, SUM(value) FROM stats_counters
+           WHERE scope IN ('category', 'content_type')
+           GROUP BY scope ORDER BY scope"""
+    ).fetchall()
+    return tuple((r[0], r[1]) for r in rows)
+
+
+def _stem_for(word: str, terms: dict[str, int]) -> str | None:
+    """Map a surface word to the vocabulary stem it was indexed as."""
+    if word in terms:
+        return word
+    for end in range(len(word) - 1, MIN_PREFIX_LEN - 1, -1):
+        head = word[:end]
+        # Porter turns a trailing y into i ("company" -> "compani")
+        if word[end] == "y" and head + "i" in terms:
+            return head + "i"
+        if head in terms:
+            return head
+    return None
+
+
+def _build(db: Database) -> TermIndex:
+    signature = _signature(db)
+
+    terms: dict[str, int] = {}
+    for table in VOCAB_TABLES:
+        for term, doc in db.conn.execute(f"SELECT term, doc FROM {table}"):
+            if len(term) >= MIN_PREFIX_LEN and not term.isdigit() and term not in STOPWORDS:
+                terms[term] = terms.get(term, 0) + doc
+
+    surface: dict[str, Counter] = {}
+    for sql in _SURFACE_SQL:
+        for (text,) in db.conn.execute(sql):
+            for word in _WORD_RE.findall((text or "").lower()):
+                stem = _stem_for(word.strip("'"), terms)
+                if stem is not None:
+                    surface.setdefault(stem, Counter())[word.strip("'")] += 1
+
+    display: dict[str, int] = {}
+    for term, df in terms.items():
+        word = surface[term].most_common(1)[0][0] if term in surface else term
+        display[word] = max(display.get(word, 0), df)
+
+    words = sorted(display)
+    return TermIndex(signature, words, [display[w] for w in words])
+
+
+def refresh_suggestions(db: Database) -> TermIndex:
+    """Rebuild the in-memory term list for ``db``."""
+    index = _build(db)
+    _indexes[str(db.db_path)] = index
+    return index
+
+
+def suggestion_index(db: Database) -> TermIndex:
+    """Return the term list for ``db``, rebuilding it if the data changed."""
+    index = _indexes.get(str(db.db_path))
+    if index is None or index.signature != _signature(db):
+        index = refresh_suggestions(db)
+    return index
+
+
+def suggest(db: Database, text: str, limit: int = SUGGESTION_LIMIT) -> list[dict]:
+    """Complete the last word of ``text`` from the indexed vocabulary.
+
+    Each suggestion has ``term`` (the completed word), ``query`` (``text``
+    with its last word completed) and ``df`` (documents containing it).
+    """
+    head, _, prefix = text.lower().rpartition(" ")
+    prefix = prefix.strip()
+    if len(prefix) < MIN_PREFIX_LEN:
+        return []
+    base = text[: len(head)].rstrip()
+    return [
+        {"term": word, "query": f"{base} {word}".strip(), "df": df}
+        for word, df in suggestion_index(db).complete(prefix, limit)
+    ]
@@ -0,0 +1,201 @@
+"""Unified search across every FTS5 index in ContentSifter.
+
+One statement queries extractions, ingested content items, content blocks
+and raw speaker turns. BM25 scores are normalized per source (the best hit
+in each source scores 1.0, scaled by a source weight), merged, and
+de-duplicated so each underlying document appears once.
+
+Filters that don't apply to a source exclude it: a category filter drops
+content items and turns, a content-type filter keeps only content items.
+"""
+
+from __future__ import annotations
+
+from contentsifter.search.filters import SearchFilters
+from contentsifter.search.query import compile_query
+from contentsifter.storage.database import Database
+
+SOURCES = ("extraction", "content_item", "content_block", "turn")
+
+# Relative weight of each source's best hit when merging
+SOURCE_WEIGHTS = {
+    "extraction": 1.0,
+    "content_block": 0.9,
+    "content_item": 0.8,
+    "turn": 0.6,
+}
+
+# Per-source SELECT over its FTS table; every branch yields the same columns
+_SOURCE_SQL = {
+    "extraction": """
+        SELECT 'extraction' AS source, e.id, e.title, e.content AS text,
+               e.category AS kind, c.call_date AS date, e.quality_score,
+               e.speaker, c.title AS parent_title, NULL AS parent_id, rank AS score
+        FROM extractions_fts fts
+        JOIN extractions e ON e.id = fts.rowid
+        JOIN calls c ON c.id = e.call_id
+        WHERE extractions_fts MATCH ?""",
+    "content_item": """
+        SELECT 'content_item' AS source, ci.id, COALESCE(ci.title, '') AS title,
+               ci.text, ci.content_type AS kind, ci.date, NULL AS quality_score,
+               ci.author AS speaker, ci.source_file AS parent_title, NULL AS parent_id,
+               rank AS score
+        FROM content_items_fts fts
+        JOIN content_items ci ON ci.id = fts.rowid
+        WHERE content_items_fts MATCH ?""",
+    "content_block": """
+        SELECT 'content_block' AS source, b.id, b.title, b.full_text AS text,
+               b.category AS kind, c.call_date AS date, b.quality_score,
+               b.speaker, c.title AS parent_title, b.content_item_id AS parent_id,
+               rank AS score
+        FROM content_blocks_fts fts
+        JOIN content_blocks b ON b.id = fts.rowid
+        LEFT JOIN calls c ON c.id = b.call_id
+        WHERE content_blocks_fts MATCH ?""",
+    "turn": """
+        SELECT 'turn' AS source, st.id, c.title AS title, st.text,
+               c.call_type AS kind, c.call_date AS date, NULL AS quality_score,
+               st.speaker_name AS speaker, c.title AS parent_title, st.call_id AS parent_id,
+               rank AS score
+        FROM speaker_turns_fts fts
+        JOIN speaker_turns st ON st.id = fts.rowid
+        JOIN calls c ON c.id = st.call_id
+        WHERE speaker_turns_fts MATCH ?""",
+}
+
+# Column each filter maps to per source; None means the filter excludes it
+_FILTER_COLUMNS = {
+    "extraction": {
+        "category": "e.category", "quality": "e.quality_score",
+        "date": "c.call_date", "call_type": "c.call_type", "content_type": None,
+        "tags": "e.id IN (SELECT et.extraction_id FROM extraction_tags et "
+                "JOIN tags t ON et.tag_id = t.id WHERE t.name IN ({}))",
+    },
+    "content_item": {
+        "category": None, "quality": None, "date": "ci.date",
+        "call_type": None, "content_type": "ci.content_type", "tags": None,
+    },
+    "content_block": {
+        "category": "b.category", "quality": "b.quality_score",
+        "date": "c.call_date", "call_type": "c.call_type", "content_type": None,
+        "tags": "b.id IN (SELECT bt.content_block_id FROM content_block_tags bt "
+                "JOIN tags t ON bt.tag_id = t.id WHERE t.name IN ({}))",
+    },
+    "turn": {
+        "category": None, "quality": None, "date": "c.call_date",
+        "call_type": "c.call_type", "content_type": None, "tags": None,
+    },
+}
+
+
+def source_clauses(filters: SearchFilters, source: str) -> tuple[str, list] | None:
+    """Return (AND-prefixed clause, params) for ``source``, or None to skip it."""
+    cols = _FILTER_COLUMNS[source]
+    clauses: list[str] = []
+    params: list = []
+
+    def add_in(key: str, values: list):
+        if not values:
+            return True
+        if cols[key] is None:
+            return False
+        placeholders = ",".join("?" for _ in values)
+        if "{}" in cols[key]:
+            clauses.append(cols[key].format(placeholders))
+        else:
+            clauses.append(f"{cols[key]} IN ({placeholders})")
+        params.extend(values)
+        return True
+
+    if not (
+        add_in("category", filters.categories)
+        and add_in("content_type", filters.content_types)
+        and add_in("call_type", filters.call_types)
+        and add_in("tags", filters.tags)
+    ):
+        return None
+
+    if filters.date_from:
+        clauses.append(f"{cols['date']} >= ?")
+        params.append(filters.date_from)
+    if filters.date_to:
+        clauses.append(f"{cols['date']} <= ?")
+        params.append(filters.date_to)
+    if filters.min_quality is not None:
+        if cols["quality"] is None:
+            return None
+        clauses.append(f"{cols['quality']} >= ?")
+        params.append(filters.min_quality)
+
+    return "".join(f" AND {c}" for c in clauses), params
+
+
+def _dedupe_key(row) -> tuple:
+    """Identity of the underlying document a result came from."""
+    if row["source"] == "content_block" and row["parent_id"] is not None:
+        return ("content_item", row["parent_id"])
+    if row["source"] == "turn":
+        return ("call", row["parent_id"])
+    return (row["source"], row["id"])
+
+
+def unified_search(
+    db: Database,
+    query: str,
+    filters: SearchFilters | None = None,
+) -> list[dict]:
+    """Search every FTS index in one statement and merge the results.
+
+    Each result has ``source`` (one of SOURCES), ``id``, ``title``, ``text``,
+    ``kind`` (category, content type or call type), ``date``,
+    ``quality_score``, ``speaker``, ``parent_title`` and a normalized
+    ``score`` in 0..1. Set ``filters.sources`` to search a subset.
+    """
+    if filters is None:
+        filters = SearchFilters()
+    query = compile_query(query)
+    if not query:
+        return []
+
+    branches, params = [], []
+    for source in filters.sources or SOURCES:
+        clauses = source_clauses(filters, source)
+        if clauses is None:
+            continue
+        where, where_params = clauses
+        branches.append(
+            f"SELECT * FROM ({_SOURCE_SQL[source]}{where} ORDER BY rank LIMIT ?)"
+        )
+        params += [query] + where_params + [filters.limit]
+
+    if not branches:
+        return []
+
+    rows = db.conn.execute("\nUNION ALL\n".join(branches), params).fetchall()
+
+    # bm25() is negative, lower is better; scale each source by its best hit
+    best: dict[str, float] = {}
+    for row in rows:
+        best[row["source"]] = min(best.get(row["source"], 0.0), row["score"])
+
+    results = []
+    for row in rows:
+        result = dict(row)
+        top = best[row["source"]]
+        result["score"] = round(
+            SOURCE_WEIGHTS[row["source"]] * (row["score"] / top if top else 1.0), 4
+        )
+        results.append(result)
+    results.sort(key=lambda r: (-r["score"], SOURCES.index(r["source"]), r["id"]))
+
+    seen: set[tuple] = set()
+    merged = []
+    for result in results:
+        key = _dedupe_key(result)
+        if key in seen:
+            continue
+        seen.add(key)
+        merged.append(result)
+        if len(merged) >= filters.limit:
+            break
+    return merged
@@ -0,0 +1,598 @@
+"""Local TF-IDF vectors and hybrid (FTS5 + vector) retrieval for ContentSifter.
+
+Each extraction, content item and content block is stored as a sparse,
+L2-normalized term-frequency vector: parallel uint32 term-id and float32
+weight blobs in ``search_vectors``, with a hash of the indexed text to
+detect edits. Document frequencies live in ``search_terms`` so IDF is
+always computed against the current corpus. Vectors are built by
+update_vectors() after extraction and ingest and by ``fts vectors``;
+searching never writes them.
+
+Queries never scan the vector table. FTS5 supplies the candidates, the
+top hits feed pseudo-relevance feedback (a local stand-in for LLM query
+expansion), and candidates are scored by sparse dot product and fused
+with their FTS rank. Expansion terms are cached per normalized query and
+filter set in ``query_expansions`` so repeated searches skip the feedback
+step.
+
+hybrid_search() ranks extractions, the results semantic_search() and its
+rerankers work with. Content items and blocks are reached through
+hybrid_unified_search(), which fuses unified_search() hits from every
+source with the same vectors (``search --semantic --all-sources``).
+
+Searching only reads the database. New expansions, cache hits and the
+search log are queued in memory and written in one transaction by
+flush_search_stats(), which the CLI calls after a search.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+import threading
+from array import array
+from dataclasses import replace
+
+from contentsifter.search.filters import SearchFilters
+from contentsifter.search.keyword import keyword_search
+from contentsifter.search.unified import unified_search
+from contentsifter.storage.database import Database
+
+# source name -> (table, SQL expression for the indexed text)
+VECTOR_SOURCES = {
+    "extractions": (
+        "extractions",
+        "title || ' ' || content || ' ' || COALESCE(raw_quote, '')",
+    ),
+    "content_items": (
+        "content_items",
+        "COALESCE(title, '') || ' ' || text",
+    ),
+    "content_blocks": (
+        "content_blocks",
+        "title || ' ' || full_text || ' ' || COALESCE(summary, '')",
+    ),
+}
+
+# unified_search() source -> VECTOR_SOURCES name; speaker turns have no vectors
+UNIFIED_VECTOR_SOURCES = {
+    "extraction": "extractions",
+    "content_item": "content_items",
+    "content_block": "content_blocks",
+}
+
+# FTS candidates fetched per retrieval pass
+CANDIDATE_LIMIT = 100
+
+# Pseudo-relevance feedback: expand with terms from the top FTS hits
+FEEDBACK_DOCS = 5
+FEEDBACK_TERMS = 5
+FEEDBACK_WEIGHT = 0.5
+# Terms in more than this share of documents are too common to expand with
+FEEDBACK_MAX_DF = 0.05
+
+# Expansion cache: entries are recomputed after the TTL (the corpus drifts)
+# and the least recently used are evicted beyond the size cap.
+LOCAL_EXPANDER = "local-prf"
+EXPANSION_TTL_DAYS = 30
+EXPANSION_CACHE_SIZE = 2000
+
+# Reciprocal rank fusion constant
+RRF_K = 60
+
+INDEX_BATCH = 500
+
+# db path -> {"expansions": {(key, model): terms}, "hits": {(key, model): n},
+#             "searches": {key: (query, n)}}, waiting for flush_search_stats()
+_pending: dict[str, dict] = {}
+_pending_lock = threading.Lock()
+
+STOPWORDS = frozenset("""
+a about after again all also am an and any are as at be because been before
+being but by can could did do does doing don down for from get got had has
+have having he her here hers him his how i if in into is it its just like me
+more most my no not now of off on once only or other our out over own really
+so some such than that the their them then there these they this those to too
+up us very was we were what when where which while who whom why will with
+would you your yours yeah okay um uh
+""".split())
+
+_WORD_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+
+def _stem(word: str) -> str:
+    """Strip common English inflections so 'interviews' matches 'interview'."""
+    if word.endswith("'s"):
+        word = word[:-2]
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 5 and word.endswith("ing"):
+        return word[:-3]
+    if len(word) > 4 and word.endswith("ed"):
+        return word[:-2]
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def query_words(text: str) -> list[str]:
+    """Lowercase content words of ``text``, unstemmed, in order of appearance."""
+    return [
+        w for w in _WORD_RE.findall(text.lower())
+        if len(w) > 1 and w not in STOPWORDS
+    ]
+
+
+def tokenize(text: str) -> list[str]:
+    """Stemmed content words used as vector terms."""
+    return [_stem(w) for w in query_words(text)]
+
+
+def term_weights(tokens: list[str]) -> dict[str, float]:
+    """Sublinear TF weights, L2-normalized."""
+    counts: dict[str, int] = {}
+    for t in tokens:
+        counts[t] = counts.get(t, 0) + 1
+    weights = {t: 1.0 + math.log(c) for t, c in counts.items()}
+    norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+    return {t: w / norm for t, w in weights.items()}
+
+
+def text_hash(text: str | None) -> int:
+    """Signed 64-bit hash of indexed text, stored to detect edits."""
+    digest = hashlib.blake2b((text or "").encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def _decode(terms: bytes, weights: bytes) -> tuple[array, array]:
+    ids = array("I")
+    ids.frombytes(terms)
+    ws = array("f")
+    ws.frombytes(weights)
+    return ids, ws
+
+
+# ── Indexing ─────────────────────────────────────────────────────────────
+
+
+def _load_term_ids(db: Database, terms) -> dict[str, int]:
+    """Return ids for ``terms``, creating rows for unseen ones."""
+    terms = list(terms)
+    ids: dict[str, int] = {}
+    for i in range(0, len(terms), INDEX_BATCH):
+        batch = terms[i:i + INDEX_BATCH]
+        db.conn.executemany(
+            "INSERT OR IGNORE INTO search_terms (term) VALUES (?)",
+            [(t,) for t in batch],
+        )
+        placeholders = ",".join("?" for _ in batch)
+        for row in db.conn.execute(
+            f"SELECT id, term FROM search_terms WHERE term IN ({placeholders})", batch
+        ):
+            ids[row["term"]] = row["id"]
+    return ids
+
+
+def _adjust_df(db: Database, deltas: dict[int, int]):
+    db.conn.executemany(
+        "UPDATE search_terms SET df = df + ? WHERE id = ?",
+        [(d, tid) for tid, d in deltas.items() if d],
+    )
+
+
+def _sync_source(db: Database, source: str, ids: list[int] | None = None) -> int:
+    """Bring stored vectors for ``source`` in line with its table.
+
+    With ``ids``, only those rows are checked. Returns the number of rows
+    (re)indexed.
+    """
+    table, expr = VECTOR_SOURCES[source]
+    db.conn.create_function("text_hash", 1, text_hash, deterministic=True)
+    id_list = ""
+    params: list = [source]
+    if ids is not None:
+        if not ids:
+            return 0
+        id_list = ",".join("?" for _ in ids)
+        params += ids
+
+    # Vectors whose row was deleted or whose text changed
+    stale = db.conn.execute(
+        f"""SELECT v.item_id, v.terms FROM search_vectors v
+            LEFT JOIN {table} t ON t.id = v.item_id
+            WHERE v.source = ? {f"AND v.item_id IN ({id_list})" if ids else ""}
+              AND (t.id IS NULL OR v.text_hash != text_hash({expr}))""",
+        params,
+    ).fetchall()
+
+    deltas: dict[int, int] = {}
+    for row in stale:
+        old_ids = array("I")
+        old_ids.frombytes(row["terms"])
+        for tid in old_ids:
+            deltas[tid] = deltas.get(tid, 0) - 1
+    db.conn.executemany(
+        "DELETE FROM search_vectors WHERE source = ? AND item_id = ?",
+        [(source, row["item_id"]) for row in stale],
+    )
+
+    rows = db.conn.execute(
+        f"""SELECT t.id, {expr} AS body FROM {table} t
+            WHERE NOT EXISTS (
+              SELECT 1 FROM search_vectors v WHERE v.source = ? AND v.item_id = t.id
+            ) {f"AND t.id IN ({id_list})" if ids else ""}""",
+        params,
+    ).fetchall()
+
+    for i in range(0, len(rows), INDEX_BATCH):
+        batch = [(r["id"], r["body"] or "") for r in rows[i:i + INDEX_BATCH]]
+        vectors = [(item_id, text_hash(body), term_weights(tokenize(body))) for item_id, body in batch]
+        term_ids = _load_term_ids(db, {t for _, _, vec in vectors for t in vec})
+        inserts = []
+        for item_id, body_hash, vec in vectors:
+            tids = array("I", (term_ids[t] for t in vec))
+            for tid in tids:
+                deltas[tid] = deltas.get(tid, 0) + 1
+            inserts.append((
+                source, item_id, body_hash,
+                tids.tobytes(), array("f", vec.values()).tobytes(),
+            ))
+        db.conn.executemany(
+            """INSERT INTO search_vectors (source, item_id, text_hash, terms, weights)
+               VALUES (?, ?, ?, ?, ?)""",
+            inserts,
+        )
+
+    _adjust_df(db, deltas)
+    return len(rows)
+
+
+def update_vectors(db: Database, sources=tuple(VECTOR_SOURCES)) -> int:
+    """Index new or changed rows and drop vectors for deleted ones.
+
+    Returns the number of rows (re)indexed.
+    """
+    count = sum(_sync_source(db, source) for source in sources)
+    db.conn.commit()
+    return count
+
+
+def rebuild_vectors(db: Database) -> int:
+    """Discard all vectors and term statistics and re-index everything."""
+    db.conn.execute("DELETE FROM search_vectors")
+    db.conn.execute("DELETE FROM search_terms")
+    return update_vectors(db)
+
+
+# ── Retrieval ────────────────────────────────────────────────────────────
+
+
+def _fts_query(words) -> str:
+    return " OR ".join(f'"{w}"' for w in words)
+
+
+def hybrid_search(
+    db: Database,
+    query: str,
+    filters: SearchFilters | None = None,
+) -> list[dict]:
+    """Rank extractions by FTS5 rank fused with TF-IDF vector similarity.
+
+    Returns up to ``filters.limit`` keyword_search-shaped results, each with
+    a ``relevance_score``. Candidates without a stored vector (extracted
+    since the last update_vectors()) rank on their FTS position alone.
+    """
+    if filters is None:
+        filters = SearchFilters()
+    words = list(dict.fromkeys(query_words(query)))
+    if not words:
+        return []
+
+    pool = replace(filters, limit=CANDIDATE_LIMIT)
+    candidates = keyword_search(db, _fts_query(words), pool)
+    if not candidates:
+        return []
+
+    qvec, idf, n_docs = _query_vector(db, words)
+    vectors = _load_vectors(db, [c["id"] for c in candidates])
+
+    key = expansion_key(query, filters)
+    expansion = get_cached_expansion(db, key)
+    if expansion is None:
+        expansion = _feedback_terms(db, candidates[:FEEDBACK_DOCS], vectors, qvec, idf, n_docs)
+        with _pending_lock:
+            queued = _pending_for(db)["expansions"]
+            queued[(key, LOCAL_EXPANDER)] = expansion
+            if len(queued) > EXPANSION_CACHE_SIZE:
+                del queued[next(iter(queued))]
+
+    if expansion:
+        placeholders = ",".join("?" for _ in expansion)
+        for r in db.conn.execute(
+            f"SELECT id, df FROM search_terms WHERE term IN ({placeholders})", expansion
+        ):
+            qvec.setdefault(r["id"], FEEDBACK_WEIGHT * idf(r["df"]))
+
+        seen = {c["id"] for c in candidates}
+        extra = [
+            c for c in keyword_search(db, _fts_query(expansion), pool)
+            if c["id"] not in seen
+        ]
+        if extra:
+            vectors.update(_load_vectors(db, [c["id"] for c in extra]))
+            candidates += extra
+
+    _fuse(candidates, [_similarity(qvec, vectors.get(c["id"])) for c in candidates])
+    return candidates[:filters.limit]
+
+
+def hybrid_unified_search(
+    db: Database,
+    query: str,
+    filters: SearchFilters | None = None,
+) -> list[dict]:
+    """Rank unified_search() hits from every source by FTS score fused with vector similarity.
+
+    Returns up to ``filters.limit`` unified_search()-shaped results, each
+    with a ``relevance_score``. Speaker turns have no vectors and rank on
+    their FTS position alone. There is no query expansion on this path.
+    """
+    if filters is None:
+        filters = SearchFilters()
+    words = list(dict.fromkeys(query_words(query)))
+    if not words:
+        return []
+
+    candidates = unified_search(db, _fts_query(words), replace(filters, limit=CANDIDATE_LIMIT))
+    if not candidates:
+        return []
+
+    qvec, _, _ = _query_vector(db, words)
+    vectors: dict[tuple[str, int], tuple[array, array]] = {}
+    for source, vector_source in UNIFIED_VECTOR_SOURCES.items():
+        ids = [c["id"] for c in candidates if c["source"] == source]
+        for item_id, vec in _load_vectors(db, ids, vector_source).items():
+            vectors[(source, item_id)] = vec
+
+    _fuse(candidates, [_similarity(qvec, vectors.get((c["source"], c["id"]))) for c in candidates])
+    return candidates[:filters.limit]
+
+
+def _query_vector(db: Database, words: list[str]):
+    """Return (term id -> IDF weight for the query's stems, idf function, corpus size)."""
+    n_docs = db.conn.execute(
+        "SELECT value FROM stats_counters WHERE scope = 'totals' AND key = 'vectors'"
+    ).fetchone()
+    n_docs = n_docs["value"] if n_docs else 0
+
+    def idf(df: int) -> float:
+        return math.log((n_docs + 1) / (df + 1)) + 1.0
+
+    stems = list(dict.fromkeys(_stem(w) for w in words))
+    placeholders = ",".join("?" for _ in stems)
+    qvec = {
+        row["id"]: idf(row["df"])
+        for row in db.conn.execute(
+            f"SELECT id, df FROM search_terms WHERE term IN ({placeholders})", stems
+        )
+    }
+    return qvec, idf, n_docs
+
+
+def _similarity(qvec: dict[int, float], vector: tuple[array, array] | None) -> float:
+    tids, ws = vector or ((), ())
+    return sum(qvec[tid] * w for tid, w in zip(tids, ws) if tid in qvec)
+
+
+def _fuse(candidates: list[dict], sims: list[float]):
+    """Score candidates (in FTS order) by reciprocal rank fusion with ``sims``, best first."""
+    by_vector = sorted(range(len(candidates)), key=lambda i: -sims[i])
+    vector_rank = {i: rank for rank, i in enumerate(by_vector)}
+    for fts_rank, c in enumerate(candidates):
+        c["relevance_score"] = round(
+            1.0 / (RRF_K + fts_rank + 1) + 1.0 / (RRF_K + vector_rank[fts_rank] + 1), 6
+        )
+    candidates.sort(key=lambda c: -c["relevance_score"])
+
+
+def _feedback_terms(db: Database, top: list[dict], vectors, qvec, idf, n_docs: int) -> list[str]:
+    """Pick expansion terms that weigh heavily in the top FTS hits."""
+    feedback: dict[int, float] = {}
+    for c in top:
+        tids, ws = vectors.get(c["id"], ((), ()))
+        for tid, w in zip(tids, ws):
+            if tid not in qvec:
+                feedback[tid] = feedback.get(tid, 0.0) + w
+    shortlist = sorted(feedback, key=feedback.get, reverse=True)[:FEEDBACK_TERMS * 10]
+    if not shortlist:
+        return []
+    placeholders = ",".join("?" for _ in shortlist)
+    rows = db.conn.execute(
+        f"SELECT id, term, df FROM search_terms WHERE id IN ({placeholders})", shortlist
+    ).fetchall()
+    rows.sort(key=lambda r: feedback[r["id"]] * idf(r["df"]), reverse=True)
+    return [
+        r["term"] for r in rows if 1 < r["df"] <= n_docs * FEEDBACK_MAX_DF
+    ][:FEEDBACK_TERMS]
+
+
+def _load_vectors(
+    db: Database, item_ids: list[int], source: str = "extractions",
+) -> dict[int, tuple[array, array]]:
+    if not item_ids:
+        return {}
+    placeholders = ",".join("?" for _ in item_ids)
+    rows = db.conn.execute(
+        f"""SELECT item_id, terms, weights FROM search_vectors
+            WHERE source = ? AND item_id IN ({placeholders})""",
+        [source, *item_ids],
+    ).fetchall()
+    return {r["item_id"]: _decode(r["terms"], r["weights"]) for r in rows}
+
+
+# ── Expansion cache ──────────────────────────────────────────────────────
+
+
+def normalize_query(query: str) -> str:
+    """Cache key for a query: its sorted, de-duplicated stemmed terms."""
+    return " ".join(sorted(set(tokenize(query))))
+
+
+def expansion_key(query: str, filters: SearchFilters | None = None) -> str:
+    """Cache key for an expansion: the normalized query plus its active filters.
+
+    Feedback comes from the filtered top hits, so each filter set gets its
+    own entry.
+    """
+    key = normalize_query(query)
+    clause, params = (filters or SearchFilters()).to_sql_clauses()
+    if not clause:
+        return key
+    signature = hashlib.blake2b(json.dumps([clause, params]).encode(), digest_size=6).hexdigest()
+    return f"{key} #{signature}"
+
+
+def _pending_for(db: Database) -> dict:
+    return _pending.setdefault(
+        str(db.db_path), {"expansions": {}, "hits": {}, "searches": {}}
+    )
+
+
+def get_cached_expansion(
+    db: Database,
+    key: str,
+    model: str = LOCAL_EXPANDER,
+    ttl_days: float = EXPANSION_TTL_DAYS,
+) -> list[str] | None:
+    """Return cached expansion terms for ``key``, or None on a miss or expiry.
+
+    Read-only: the hit is counted in memory until flush_search_stats().
+    """
+    with _pending_lock:
+        pending = _pending_for(db)
+        if (key, model) in pending["expansions"]:
+            return pending["expansions"][(key, model)]
+    row = db.conn.execute(
+        """SELECT terms_json FROM query_expansions
+           WHERE query_key = ? AND model = ? AND created_at >= datetime('now', ?)""",
+        (key, model, f"-{ttl_days} days"),
+    ).fetchone()
+    if row is None:
+        return None
+    with _pending_lock:
+        hits = _pending_for(db)["hits"]
+        hits[(key, model)] = hits.get((key, model), 0) + 1
+    return json.loads(row["terms_json"])
+
+
+def store_expansion(
+    db: Database,
+    key: str,
+    terms: list[str],
+    model: str = LOCAL_EXPANDER,
+    max_entries: int = EXPANSION_CACHE_SIZE,
+):
+    """Cache expansion terms for ``key`` and evict least recently used entries."""
+    _insert_expansions(db, [(key, model, terms)])
+    _evict_expansions(db, max_entries)
+
+
+def _insert_expansions(db: Database, entries):
+    db.conn.executemany(
+        """INSERT INTO query_expansions (query_key, model, terms_json)
+           VALUES (?, ?, ?)
+           ON CONFLICT(query_key, model) DO UPDATE SET
+             terms_json = excluded.terms_json,
+             created_at = datetime('now'),
+             last_used_at = datetime('now')""",
+        [(key, model, json.dumps(terms)) for key, model, terms in entries],
+    )
+
+
+def _evict_expansions(db: Database, max_entries: int = EXPANSION_CACHE_SIZE):
+    db.conn.execute(
+        """DELETE FROM query_expansions WHERE rowid IN (
+             SELECT rowid FROM query_expansions
+             ORDER BY last_used_at DESC, rowid DESC LIMIT -1 OFFSET ?
+           )""",
+        (max_entries,),
+    )
+
+
+def clear_expansions(db: Database) -> int:
+    count = db.conn.execute("DELETE FROM query_expansions").rowcount
+    db.conn.commit()
+    return count
+
+
+def record_search(db: Database, query: str):
+    """Count a user search so precompute_expansions() can warm popular queries.
+
+    Queued in memory; written by flush_search_stats().
+    """
+    key = normalize_query(query)
+    if not key:
+        return
+    with _pending_lock:
+        searches = _pending_for(db)["searches"]
+        searches[key] = (query, searches.get(key, (query, 0))[1] + 1)
+
+
+def flush_search_stats(db: Database):
+    """Write queued expansions, cache hits and search counts in one transaction."""
+    with _pending_lock:
+        pending = _pending.pop(str(db.db_path), None)
+    if not pending or not any(pending.values()):
+        return
+    if pending["expansions"]:
+        _insert_expansions(
+            db, [(key, model, terms) for (key, model), terms in pending["expansions"].items()]
+        )
+        _evict_expansions(db)
+    db.conn.executemany(
+        """UPDATE query_expansions SET last_used_at = datetime('now'), hits = hits + ?
+           WHERE query_key = ? AND model = ?""",
+        [(n, key, model) for (key, model), n in pending["hits"].items()],
+    )
+    db.conn.executemany(
+        """INSERT INTO search_log (query_key, query, count) VALUES (?, ?, ?)
+           ON CONFLICT(query_key) DO UPDATE SET
+             query = excluded.query,
+             count = count + excluded.count,
+             last_searched_at = datetime('now')""",
+        [(key, query, n) for key, (query, n) in pending["searches"].items()],
+    )
+    db.conn.commit()
+
+
+def precompute_expansions(db: Database, top_n: int = 50) -> int:
+    """Warm the expansion cache for the most frequent logged queries and every tag.
+
+    Returns the number of queries expanded.
+    """
+    from contentsifter.extraction.categories import TAGS
+
+    queries = [
+        row["query"] for row in db.conn.execute(
+            "SELECT query FROM search_log ORDER BY count DESC, last_searched_at DESC LIMIT ?",
+            (top_n,),
+        )
+    ]
+    queries += [tag.replace("_", " ") for tag in TAGS]
+
+    flush_search_stats(db)
+    expanded = 0
+    for query in dict.fromkeys(queries):
+        key = normalize_query(query)
+        if not key:
+            continue
+        db.conn.execute(
+            "DELETE FROM query_expansions WHERE query_key = ? AND model = ?",
+            (key, LOCAL_EXPANDER),
+        )
+        hybrid_search(db, query)
+        expanded += 1
+    flush_search_stats(db)
+    return expanded
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import re
 import sqlite3
 from pathlib import Path
 
-SCHEMA_VERSION = 3
+SCHEMA_VERSION = 9
 
 SCHEMA_SQL = """
 -- Individual coaching calls parsed from merged markdown files
@@ -35,6 +36,15 @@ CREATE TABLE IF NOT EXISTS participants (
     UNIQUE(call_id, display_name, email)
 );
 
+-- Distinct speaker identities, resolved once at parse time
+CREATE TABLE IF NOT EXISTS speakers (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    name      TEXT NOT NULL,
+    email     TEXT NOT NULL DEFAULT '',
+    is_coach  INTEGER DEFAULT 0,
+    UNIQUE(name, email)
+);
+
 -- Individual speaker turns
 CREATE TABLE IF NOT EXISTS speaker_turns (
     id                INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -45,6 +55,8 @@ CREATE TABLE IF NOT EXISTS speaker_turns (
     text              TEXT NOT NULL,
     timestamp         TEXT NOT NULL,
     timestamp_seconds INTEGER,
+    speaker_id        INTEGER REFERENCES speakers(id),
+    char_len          INTEGER,
     UNIQUE(call_id, turn_index)
 );
 
@@ -102,6 +114,7 @@ CREATE VIRTUAL TABLE IF NOT EXISTS extractions_fts USING fts5(
     context_note,
     content=extractions,
     content_rowid=id,
+    prefix='2 3',
     tokenize='porter unicode61'
 );
 
@@ -137,6 +150,18 @@ CREATE TRIGGER IF NOT EXISTS speaker_turns_ai AFTER INSERT ON speaker_turns BEGI
     VALUES (new.id, new.text, new.speaker_name);
 END;
 
+CREATE TRIGGER IF NOT EXISTS speaker_turns_ad AFTER DELETE ON speaker_turns BEGIN
+    INSERT INTO speaker_turns_fts(speaker_turns_fts, rowid, text, speaker_name)
+    VALUES ('delete', old.id, old.text, old.speaker_name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS speaker_turns_au AFTER UPDATE OF text, speaker_name ON speaker_turns BEGIN
+    INSERT INTO speaker_turns_fts(speaker_turns_fts, rowid, text, speaker_name)
+    VALUES ('delete', old.id, old.text, old.speaker_name);
+    INSERT INTO speaker_turns_fts(rowid, text, speaker_name)
+    VALUES (new.id, new.text, new.speaker_name);
+END;
+
 -- Processing state tracking
 CREATE TABLE IF NOT EXISTS processing_log (
     id             INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -170,6 +195,7 @@ CREATE VIRTUAL TABLE IF NOT EXISTS content_items_fts USING fts5(
     text,
     content=content_items,
     content_rowid=id,
+    prefix='2 3',
     tokenize='porter unicode61'
 );
 
@@ -190,6 +216,10 @@ CREATE TRIGGER IF NOT EXISTS content_items_au AFTER UPDATE ON content_items BEGI
     VALUES (new.id, new.title, new.text);
 END;
 
+-- Term and document-frequency views over the FTS indexes (typeahead)
+CREATE VIRTUAL TABLE IF NOT EXISTS extractions_vocab USING fts5vocab(extractions_fts, 'row');
+CREATE VIRTUAL TABLE IF NOT EXISTS content_items_vocab USING fts5vocab(content_items_fts, 'row');
+
 -- Schema version tracking
 CREATE TABLE IF NOT EXISTS schema_version (
     version INTEGER NOT NULL
@@ -198,12 +228,15 @@ CREATE TABLE IF NOT EXISTS schema_version (
 -- Indexes
 CREATE INDEX IF NOT EXISTS idx_content_items_type ON content_items(content_type);
 CREATE INDEX IF NOT EXISTS idx_content_items_extracted ON content_items(is_extracted);
+CREATE INDEX IF NOT EXISTS idx_content_items_chars ON content_items(char_count);
 CREATE INDEX IF NOT EXISTS idx_calls_date ON calls(call_date);
 CREATE INDEX IF NOT EXISTS idx_calls_type ON calls(call_type);
 CREATE INDEX IF NOT EXISTS idx_speaker_turns_call ON speaker_turns(call_id);
+CREATE INDEX IF NOT EXISTS idx_speakers_coach ON speakers(is_coach);
 CREATE INDEX IF NOT EXISTS idx_topic_chunks_call ON topic_chunks(call_id);
 CREATE INDEX IF NOT EXISTS idx_extractions_call ON extractions(call_id);
 CREATE INDEX IF NOT EXISTS idx_extractions_category ON extractions(category);
+CREATE INDEX IF NOT EXISTS idx_extractions_quality ON extractions(quality_score);
 CREATE INDEX IF NOT EXISTS idx_extractions_chunk ON extractions(chunk_id);
 CREATE INDEX IF NOT EXISTS idx_extraction_tags_tag ON extraction_tags(tag_id);
 CREATE INDEX IF NOT EXISTS idx_participants_call ON participants(call_id);
@@ -290,8 +323,327 @@ CREATE INDEX IF NOT EXISTS idx_content_blocks_call ON content_blocks(call_id);
 CREATE INDEX IF NOT EXISTS idx_content_blocks_chunk ON content_blocks(chunk_id);
 CREATE INDEX IF NOT EXISTS idx_content_blocks_quality ON content_blocks(quality_score);
 CREATE INDEX IF NOT EXISTS idx_content_block_tags_tag ON content_block_tags(tag_id);
+
+-- Materialized counters for dashboards and status pages.
+-- scope is one of: content_type, content_chars, category, stage, tag, call_type, totals
+CREATE TABLE IF NOT EXISTS stats_counters (
+    scope  TEXT NOT NULL,
+    key    TEXT NOT NULL,
+    value  INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (scope, key)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS content_items_stats_ai AFTER INSERT ON content_items BEGIN
+    INSERT INTO stats_counters (scope, key, value) VALUES ('content_type', new.content_type, 1)
+    ON CONFLICT(scope, key) DO UPDATE SET value = value + excluded.value;
+    INSERT INTO stats_counters (scope, key, value)
+    VALUES ('content_chars', new.content_type, COALESCE(new.char_count, 0))
+    ON CONFLICT(scope, key) DO UPDATE SET value = value + excluded.value;
+END;
+
+CREATE TRIGGER IF NOT EXISTS content_items_stats_ad AFTER DELETE ON content_items BEGIN
+    UPDATE stats_counters SET value = value - 1
+    WHERE scope = 'content_type' AND key = old.content_type;
+    UPDATE stats_counters SET value = value - COALESCE(old.char_count, 0)
+    WHERE scope = 'content_chars' AND key = old.content_type;
+END;
+
+CREATE TRIGGER IF NOT EXISTS content_items_stats_au
+AFTER UPDATE OF content_type, char_count ON content_items BEGIN
+    UPDATE stats_counters SET value = value - 1
+    WHERE scope = 'content_type' AND key = old.content_type;
+    UPDATE stats_counters SET value = value - COALESCE(old.char_count, 0)
+    WHERE scope = 'content_chars' AND key = old.content_type;
+    INSERT INTO stats_counters (scope, key, value) VALUES ('content_type', new.content_type, 1)
+    ON CONFLICT(scope, key) DO UPDATE SET value = value + excluded.value;
+    INSERT INTO stats_counters (scope, key, value)
+    VALUES ('content_chars', new.content_type, COALESCE(new.char_count, 0))
+    ON CONFLICT(scope, key) DO UPDATE SET value = value + excluded.value;
+END;
+
+CREATE TRIGGER IF NOT EXISTS extractions_stats_ai AFTER INSERT ON extractions BEGIN
+    INSERT INTO stats_counters (scope, key, value) VALUES ('category', new.category, 1)
+    ON CONFLICT(scope, key) DO UPDATE SET value = value + excluded.value;
+END;
+
+CREATE TRIGGER IF NOT EXISTS extractions_stats_ad AFTER DELETE ON extractions BEGIN
+    UPDATE stats_counters SET value = value - 1
+    WHERE scope = 'category' AND key = old.category;
+END;
+
+CREATE TRIGGER IF NOT EXISTS extractions_stats_au AFTER UPDATE OF category ON extractions BEGIN
+    UPDATE stats_counters SET value = value - 1
+    WHERE scope = 'category' AND key = old.category;
+    INSERT INTO stats_counters (scope, key, value) VALUES ('category', new.category, 1)
+    ON CONFLICT(scope, key) DO UPDATE SET value = value + excluded.value;
+END;
+
+CREATE TRIGGER IF NOT EXISTS extraction_tags_stats_ai AFTER INSERT ON extraction_tags BEGIN
+    INSERT INTO stats_counters (scope, key, value)
+    SELECT 'tag', name, 1 FROM tags WHERE id = new.tag_id
+    ON CONFLICT(scope, key) DO UPDATE SET value = value + excluded.value;
+END;
+
+CREATE TRIGGER IF NOT EXISTS extraction_tags_stats_ad AFTER DELETE ON extraction_tags BEGIN
+    UPDATE stats_counters SET value = value - 1
+    WHERE scope = 'tag' AND key = (SELECT name FROM tags WHERE id = old.tag_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS calls_stats_ai AFTER INSERT ON calls BEGIN
+    INSERT INTO stats_counters (scope, key, value) VALUES ('call_type', new.call_type, 1)
+    ON CONFLICT(scope, key) DO UPDATE SET value = value + excluded.value;
+    INSERT INTO stats_counters (scope, key, value)
+    VALUES ('totals', 'turns', COALESCE(new.turn_count, 0))
+    ON CONFLICT(scope, key) DO UPDATE SET value = value + excluded.value;
+END;
+
+CREATE TRIGGER IF NOT EXISTS calls_stats_ad AFTER DELETE ON calls BEGIN
+    UPDATE stats_counters SET value = value - 1
+    WHERE scope = 'call_type' AND key = old.call_type;
+    UPDATE stats_counters SET value = value - COALESCE(old.turn_count, 0)
+    WHERE scope = 'totals' AND key = 'turns';
+END;
+
+CREATE TRIGGER IF NOT EXISTS calls_stats_au AFTER UPDATE OF call_type, turn_count ON calls BEGIN
+    UPDATE stats_counters SET value = value - 1
+    WHERE scope = 'call_type' AND key = old.call_type;
+    UPDATE stats_counters SET value = value - COALESCE(old.turn_count, 0)
+    WHERE scope = 'totals' AND key = 'turns';
+    INSERT INTO stats_counters (scope, key, value) VALUES ('call_type', new.call_type, 1)
+    ON CONFLICT(scope, key) DO UPDATE SET value = value + excluded.value;
+    INSERT INTO stats_counters (scope, key, value)
+    VALUES ('totals', 'turns', COALESCE(new.turn_count, 0))
+    ON CONFLICT(scope, key) DO UPDATE SET value = value + excluded.value;
+END;
+
+-- Only completed stages are counted. processing_log is written with an upsert
+-- (not INSERT OR REPLACE) so these update triggers see every status change.
+CREATE TRIGGER IF NOT EXISTS processing_log_stats_ai AFTER INSERT ON processing_log
+WHEN new.status = 'completed' BEGIN
+    INSERT INTO stats_counters (scope, key, value) VALUES ('stage', new.stage, 1)
+    ON CONFLICT(scope, key) DO UPDATE SET value = value + excluded.value;
+END;
+
+CREATE TRIGGER IF NOT EXISTS processing_log_stats_ad AFTER DELETE ON processing_log
+WHEN old.status = 'completed' BEGIN
+    UPDATE stats_counters SET value = value - 1
+    WHERE scope = 'stage' AND key = old.stage;
+END;
+
+CREATE TRIGGER IF NOT EXISTS processing_log_stats_au AFTER UPDATE OF stage, status ON processing_log BEGIN
+    UPDATE stats_counters SET value = value - 1
+    WHERE scope = 'stage' AND key = old.stage AND old.status = 'completed';
+    INSERT INTO stats_counters (scope, key, value)
+    SELECT 'stage', new.stage, 1 WHERE new.status = 'completed'
+    ON CONFLICT(scope, key) DO UPDATE SET value = value + excluded.value;
+END;
+
+-- Local search vectors (see search/vectors.py). Each row is a sparse,
+-- L2-normalized TF vector: parallel uint32 term ids and float32 weights.
+CREATE TABLE IF NOT EXISTS search_terms (
+    id    INTEGER PRIMARY KEY,
+    term  TEXT NOT NULL UNIQUE,
+    df    INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS search_vectors (
+    source    TEXT NOT NULL,
+    item_id   INTEGER NOT NULL,
+    text_hash INTEGER NOT NULL,
+    terms     BLOB NOT NULL,
+    weights   BLOB NOT NULL,
+    PRIMARY KEY (source, item_id)
+) WITHOUT ROWID;
+
+-- Cached query expansions keyed by normalized query and expander model
+CREATE TABLE IF NOT EXISTS query_expansions (
+    query_key     TEXT NOT NULL,
+    model         TEXT NOT NULL,
+    terms_json    TEXT NOT NULL,
+    hits          INTEGER NOT NULL DEFAULT 0,
+    created_at    TEXT DEFAULT (datetime('now')),
+    last_used_at  TEXT DEFAULT (datetime('now')),
+    PRIMARY KEY (query_key, model)
+);
+CREATE INDEX IF NOT EXISTS idx_query_expansions_used ON query_expansions(last_used_at);
+
+-- Semantic searches run, used to precompute expansions for popular queries
+CREATE TABLE IF NOT EXISTS search_log (
+    query_key         TEXT PRIMARY KEY,
+    query             TEXT NOT NULL,
+    count             INTEGER NOT NULL DEFAULT 1,
+    last_searched_at  TEXT DEFAULT (datetime('now'))
+);
+
+-- Saved draft files (see storage/drafts.py), reconciled with the drafts
+-- directory by mtime and size
+CREATE TABLE IF NOT EXISTS drafts (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    filename     TEXT NOT NULL UNIQUE,
+    title        TEXT NOT NULL,
+    format_type  TEXT NOT NULL DEFAULT '',
+    draft_date   TEXT NOT NULL DEFAULT '',
+    body         TEXT NOT NULL,
+    snippet      TEXT NOT NULL DEFAULT '',
+    mtime_ns     INTEGER NOT NULL,
+    size         INTEGER NOT NULL,
+    indexed_at   TEXT DEFAULT (datetime('now'))
+);
+CREATE INDEX IF NOT EXISTS idx_drafts_format ON drafts(format_type);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS drafts_fts USING fts5(
+    title,
+    body,
+    content=drafts,
+    content_rowid=id,
+    tokenize='porter unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS drafts_ai AFTER INSERT ON drafts BEGIN
+    INSERT INTO drafts_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+END;
+
+CREATE TRIGGER IF NOT EXISTS drafts_ad AFTER DELETE ON drafts BEGIN
+    INSERT INTO drafts_fts(drafts_fts, rowid, title, body)
+    VALUES ('delete', old.id, old.title, old.body);
+END;
+
+CREATE TRIGGER IF NOT EXISTS drafts_au AFTER UPDATE OF title, body ON drafts BEGIN
+    INSERT INTO drafts_fts(drafts_fts, rowid, title, body)
+    VALUES ('delete', old.id, old.title, old.body);
+    INSERT INTO drafts_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+END;
+
+CREATE TRIGGER IF NOT EXISTS search_vectors_stats_ai AFTER INSERT ON search_vectors BEGIN
+    INSERT INTO stats_counters (scope, key, value) VALUES ('totals', 'vectors', 1)
+    ON CONFLICT(scope, key) DO UPDATE SET value = value + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS search_vectors_stats_ad AFTER DELETE ON search_vectors BEGIN
+    UPDATE stats_counters SET value = value - 1
+    WHERE scope = 'totals' AND key = 'vectors';
+END;
+"""
+
+# Indexes on columns that older databases only gain through _migrate().
+# Created after migrations run so they never reference a missing column.
+MIGRATED_INDEXES_SQL = """
+CREATE INDEX IF NOT EXISTS idx_speaker_turns_speaker ON speaker_turns(speaker_id, char_len);
 """
 
+# Recompute every counter from the source tables (used for backfill and repair)
+STATS_REBUILD_SQL = (
+    "DELETE FROM stats_counters",
+    """INSERT INTO stats_counters (scope, key, value)
+       SELECT 'content_type', content_type, COUNT(*) FROM content_items GROUP BY content_type""",
+    """INSERT INTO stats_counters (scope, key, value)
+       SELECT 'content_chars', content_type, COALESCE(SUM(char_count), 0)
+       FROM content_items GROUP BY content_type""",
+    """INSERT INTO stats_counters (scope, key, value)
+       SELECT 'category', category, COUNT(*) FROM extractions GROUP BY category""",
+    """INSERT INTO stats_counters (scope, key, value)
+       SELECT 'tag', t.name, COUNT(*) FROM extraction_tags et
+       JOIN tags t ON t.id = et.tag_id GROUP BY t.name""",
+    """INSERT INTO stats_counters (scope, key, value)
+       SELECT 'call_type', call_type, COUNT(*) FROM calls GROUP BY call_type""",
+    """INSERT INTO stats_counters (scope, key, value)
+       SELECT 'totals', 'turns', COALESCE(SUM(turn_count), 0) FROM calls""",
+    """INSERT INTO stats_counters (scope, key, value)
+       SELECT 'totals', 'vectors', COUNT(*) FROM search_vectors""",
+    """INSERT INTO stats_counters (scope, key, value)
+       SELECT 'stage', stage, COUNT(*) FROM processing_log
+       WHERE status = 'completed' GROUP BY stage""",
+)
+
+
+# Every external-content FTS5 index, keyed by the virtual table name
+FTS_TABLES = (
+    "extractions_fts",
+    "speaker_turns_fts",
+    "content_items_fts",
+    "content_blocks_fts",
+    "drafts_fts",
+)
+
+# Loads of at least this many rows merge their FTS index down to one segment
+BULK_OPTIMIZE_ROWS = 1000
+
+# FTS tables built with prefix indexes (for "ne*"-style typeahead queries)
+PREFIX_FTS_TABLES = ("extractions_fts", "content_items_fts")
+
+# bm25() column weights behind each FTS table's rank, in column order;
+# titles count most, then body text, then quotes and notes
+FTS_RANK_WEIGHTS = {
+    "extractions_fts": (10.0, 4.0, 2.0, 1.0),       # title, content, raw_quote, context_note
+    "content_items_fts": (5.0, 1.0),                # title, text
+    "content_blocks_fts": (10.0, 4.0, 2.0, 2.0),    # title, full_text, summary, raw_quote
+    "drafts_fts": (5.0, 1.0),                       # title, body
+}
+
+# Optional trigram indexes for substring and typo-tolerant matching. Not
+# part of SCHEMA_SQL: enable_trigram_index() creates them on request.
+TRIGRAM_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS extractions_trigram USING fts5(
+    title,
+    content,
+    content=extractions,
+    content_rowid=id,
+    tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS extractions_trigram_ai AFTER INSERT ON extractions BEGIN
+    INSERT INTO extractions_trigram(rowid, title, content)
+    VALUES (new.id, new.title, new.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS extractions_trigram_ad AFTER DELETE ON extractions BEGIN
+    INSERT INTO extractions_trigram(extractions_trigram, rowid, title, content)
+    VALUES ('delete', old.id, old.title, old.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS extractions_trigram_au AFTER UPDATE OF title, content ON extractions BEGIN
+    INSERT INTO extractions_trigram(extractions_trigram, rowid, title, content)
+    VALUES ('delete', old.id, old.title, old.content);
+    INSERT INTO extractions_trigram(rowid, title, content)
+    VALUES (new.id, new.title, new.content);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS content_items_trigram USING fts5(
+    title,
+    text,
+    content=content_items,
+    content_rowid=id,
+    tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS content_items_trigram_ai AFTER INSERT ON content_items BEGIN
+    INSERT INTO content_items_trigram(rowid, title, text)
+    VALUES (new.id, new.title, new.text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS content_items_trigram_ad AFTER DELETE ON content_items BEGIN
+    INSERT INTO content_items_trigram(content_items_trigram, rowid, title, text)
+    VALUES ('delete', old.id, old.title, old.text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS content_items_trigram_au AFTER UPDATE OF title, text ON content_items BEGIN
+    INSERT INTO content_items_trigram(content_items_trigram, rowid, title, text)
+    VALUES ('delete', old.id, old.title, old.text);
+    INSERT INTO content_items_trigram(rowid, title, text)
+    VALUES (new.id, new.title, new.text);
+END;
+"""
+
+# Trigram index -> the primary FTS index it shadows (for overhead reporting)
+TRIGRAM_TABLES = {
+    "extractions_trigram": "extractions_fts",
+    "content_items_trigram": "content_items_fts",
+}
+
+_TRIGRAM_TRIGGERS = tuple(
+    f"{table}_{suffix}" for table in TRIGRAM_TABLES for suffix in ("ai", "ad", "au")
+)
+
 
 class Database:
     """SQLite database connection manager."""
@@ -318,15 +670,201 @@ class Database:
             "SELECT version FROM schema_version LIMIT 1"
         ).fetchone()
         if row is None:
+            self._migrate(0)
             self.conn.execute(
                 "INSERT INTO schema_version (version) VALUES (?)",
                 (SCHEMA_VERSION,),
             )
         elif row["version"] < SCHEMA_VERSION:
+            self._migrate(row["version"])
             self.conn.execute(
                 "UPDATE schema_version SET version = ?",
                 (SCHEMA_VERSION,),
             )
+        self.conn.executescript(MIGRATED_INDEXES_SQL)
+        self.conn.commit()
+
+    def _has_column(self, table: str, column: str) -> bool:
+        rows = self.conn.execute(f"PRAGMA table_info({table})").fetchall()
+        return any(r["name"] == column for r in rows)
+
+    def _migrate(self, from_version: int):
+        """Upgrade data in an existing database written by an older schema."""
+        if from_version < 4:
+            # stats_counters was added in v4 — backfill it from existing rows
+            self.rebuild_stats_counters()
+
+        if from_version < 5:
+            # v5 resolves speaker identity into the speakers table and
+            # precomputes turn length, so coach sampling can use an index
+            # instead of LIKE '%name%' scans over every turn.
+            if not self._has_column("speaker_turns", "speaker_id"):
+                self.conn.execute(
+                    "ALTER TABLE speaker_turns ADD COLUMN speaker_id INTEGER REFERENCES speakers(id)"
+                )
+            if not self._has_column("speaker_turns", "char_len"):
+                self.conn.execute("ALTER TABLE speaker_turns ADD COLUMN char_len INTEGER")
+            self.conn.execute(
+                """INSERT OR IGNORE INTO speakers (name, email)
+                   SELECT DISTINCT speaker_name, COALESCE(speaker_email, '')
+                   FROM speaker_turns"""
+            )
+            # Coach flags were already decided per call by parse_participants
+            self.conn.execute(
+                """UPDATE speakers SET is_coach = 1
+                   WHERE EXISTS (
+                     SELECT 1 FROM participants p
+                     WHERE p.is_coach = 1
+                       AND (p.display_name = speakers.name
+                            OR (speakers.email != '' AND p.email = speakers.email))
+                   )"""
+            )
+            self.conn.execute(
+                """UPDATE speaker_turns SET
+                     speaker_id = (
+                       SELECT s.id FROM speakers s
+                       WHERE s.name = speaker_turns.speaker_name
+                         AND s.email = COALESCE(speaker_turns.speaker_email, '')
+                     ),
+                     char_len = LENGTH(text)
+                   WHERE speaker_id IS NULL"""
+            )
+
+        if from_version < 6:
+            # Before v6 speaker_turns had no delete/update triggers, so the
+            # turn index may still hold rows for deleted turns.
+            self.rebuild_fts(("speaker_turns_fts",))
+
+        if from_version < 7:
+            # v7 adds prefix indexes; FTS5 options are fixed at creation, so
+            # older tables are dropped, re-created and re-indexed.
+            for table in PREFIX_FTS_TABLES:
+                self._recreate_fts(table)
+
+        if from_version < 8:
+            self.set_fts_rank_weights()
+        elif from_version < 9:
+            # v9 adds the drafts index, filled by the drafts page rescan (sync_drafts)
+            self.set_fts_rank_weights({"drafts_fts": FTS_RANK_WEIGHTS["drafts_fts"]})
+
+    def _recreate_fts(self, table: str):
+        """Re-create an FTS table from SCHEMA_SQL if its definition has changed."""
+        ddl = re.search(
+            rf"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5\(.*?\);",
+            SCHEMA_SQL, re.S,
+        ).group(0)
+        current = self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = ?", (table,)
+        ).fetchone()
+        if current and "prefix=" in current["sql"]:
+            return
+        self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+        self.conn.execute(ddl)
+        self.rebuild_fts((table,))
+
+    def set_fts_rank_weights(self, weights: dict[str, tuple[float, ...]] = FTS_RANK_WEIGHTS):
+        """Store bm25() column weights as each FTS table's default rank."""
+        for table, columns in weights.items():
+            args = ", ".join(str(w) for w in columns)
+            self.conn.execute(
+                f"INSERT INTO {table}({table}, rank) VALUES ('rank', 'bm25({args})')"
+            )
+        self.conn.commit()
+
+    def optimize_fts(self, tables: tuple[str, ...] = FTS_TABLES):
+        """Merge each FTS index's segments into a single b-tree."""
+        for table in tables:
+            self.conn.execute(f"INSERT INTO {table}({table}) VALUES ('optimize')")
+        self.conn.commit()
+
+    def optimize_fts_after_load(self, table: str, rows_loaded: int) -> bool:
+        """Optimize ``table`` if a bulk load added enough rows to fragment it."""
+        if rows_loaded < BULK_OPTIMIZE_ROWS:
+            return False
+        self.optimize_fts((table,))
+        return True
+
+    def rebuild_fts(self, tables: tuple[str, ...] = FTS_TABLES):
+        """Discard and re-create each FTS index from its content table."""
+        for table in tables:
+            self.conn.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+        self.conn.commit()
+
+    def check_fts_integrity(self, tables: tuple[str, ...] = FTS_TABLES) -> dict[str, str | None]:
+        """Verify each FTS index against its content table.
+
+        Returns a mapping of table name to an error message, or None if the
+        index is consistent.
+        """
+        results: dict[str, str | None] = {}
+        for table in tables:
+            try:
+                self.conn.execute(
+                    f"INSERT INTO {table}({table}, rank) VALUES ('integrity-check', 1)"
+                )
+                results[table] = None
+            except sqlite3.DatabaseError as e:
+                results[table] = str(e)
+        return results
+
+    def fts_segment_stats(self, tables: tuple[str, ...] = FTS_TABLES) -> list[dict]:
+        """Return indexed row, segment, page and byte counts for each FTS table."""
+        stats = []
+        for table in tables:
+            # COUNT(*) on an external-content table counts the content rows;
+            # the docsize shadow table has one row per indexed document.
+            rows = self.conn.execute(f"SELECT COUNT(*) FROM {table}_docsize").fetchone()[0]
+            segments = self.conn.execute(
+                f"SELECT COUNT(DISTINCT segid) FROM {table}_idx"
+            ).fetchone()[0]
+            pages, size = self.conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(LENGTH(block)), 0) FROM {table}_data"
+            ).fetchone()
+            stats.append({
+                "table": table,
+                "rows": rows,
+                "segments": segments,
+                "pages": pages,
+                "bytes": size,
+            })
+        return stats
+
+    def has_trigram_index(self) -> bool:
+        """Whether enable_trigram_index() has been run on this database."""
+        row = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'extractions_trigram'"
+        ).fetchone()
+        return row is not None
+
+    def enable_trigram_index(self):
+        """Create the optional trigram indexes and fill them from their content tables."""
+        self.conn.executescript(TRIGRAM_SQL)
+        self.rebuild_fts(tuple(TRIGRAM_TABLES))
+
+    def disable_trigram_index(self):
+        """Drop the trigram indexes and the triggers that maintain them."""
+        for trigger in _TRIGRAM_TRIGGERS:
+            self.conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        for table in TRIGRAM_TABLES:
+            self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+        self.conn.commit()
+
+    def trigram_overhead(self) -> dict:
+        """Bytes used by the trigram indexes versus the primary indexes they shadow."""
+        if not self.has_trigram_index():
+            return {"trigram_bytes": 0, "primary_bytes": 0, "ratio": 0.0}
+        trigram = sum(s["bytes"] for s in self.fts_segment_stats(tuple(TRIGRAM_TABLES)))
+        primary = sum(s["bytes"] for s in self.fts_segment_stats(tuple(TRIGRAM_TABLES.values())))
+        return {
+            "trigram_bytes": trigram,
+            "primary_bytes": primary,
+            "ratio": round(trigram / primary, 2) if primary else 0.0,
+        }
+
+    def rebuild_stats_counters(self):
+        """Recompute the stats_counters table from the source tables."""
+        for sql in STATS_REBUILD_SQL:
+            self.conn.execute(sql)
         self.conn.commit()
 
     def close(self):
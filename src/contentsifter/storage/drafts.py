@@ -0,0 +1,190 @@
+"""Index of saved draft files in the client database.
+
+Drafts are markdown files in the client's drafts directory; the ``drafts``
+table mirrors their metadata and body, with an FTS index over title and
+body, so listing, counting and searching never touch the files.
+
+Writers keep the index current: the app on save and delete
+(save_draft_file, delete_draft_file), and ``generate --save`` and
+generate-batch as each draft is written. Reads never touch the folder.
+Files changed by hand are picked up by sync_drafts(), run from the drafts
+page's rescan action; it stats every file and re-reads only those whose
+mtime or size changed.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+
+from contentsifter.search.query import compile_query
+from contentsifter.storage.database import Database
+
+# Listing columns (of ``drafts d``): everything but the body
+LIST_COLUMNS = "d.filename, d.title, d.format_type, d.draft_date AS date, d.snippet, d.mtime_ns"
+
+SNIPPET_CHARS = 200
+
+_FORMAT_RE = re.compile(r"\*Format:\s*(.+?)(?:\s*\|.*)?\*")
+_ISO_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+_COMPACT_DATE_RE = re.compile(r"(\d{4})(\d{2})(\d{2})")
+
+
+def parse_draft_text(filename: str, text: str) -> dict:
+    """Split a saved draft into title, format, date, body and snippet."""
+    lines = text.split("\n")
+    stem = Path(filename).stem
+
+    title = stem
+    if lines and lines[0].startswith("# "):
+        title = lines[0][2:].strip()
+
+    format_type = ""
+    for line in lines[1:6]:
+        m = _FORMAT_RE.match(line)
+        if m:
+            format_type = m.group(1).strip()
+            break
+
+    # Body is everything after the --- separator
+    separator_idx = next(
+        (i for i, line in enumerate(lines) if line.strip() == "---" and i > 0), None
+    )
+    if separator_idx is not None:
+        body = "\n".join(lines[separator_idx + 1:]).strip()
+    else:
+        body = "\n".join(lines[2:]).strip()
+
+    date_str = ""
+    m = _ISO_DATE_RE.match(stem)
+    if m:
+        date_str = m.group(1)
+    else:
+        m = _COMPACT_DATE_RE.search(stem)
+        if m:
+            date_str = f"{m.group(1)}-{m.group(2)}-{m.group(3)}"
+
+    return {
+        "filename": filename,
+        "title": title,
+        "format_type": format_type,
+        "date": date_str,
+        "body": body,
+        "snippet": body[:SNIPPET_CHARS].replace("\n", " ").strip(),
+    }
+
+
+def _row(info: dict) -> dict:
+    info["mtime"] = info.pop("mtime_ns") / 1e9
+    return info
+
+
+def index_draft(db: Database, path: Path, st: os.stat_result | None = None) -> dict:
+    """Read ``path`` and insert or refresh its row. Does not commit."""
+    st = st or path.stat()
+    info = parse_draft_text(path.name, path.read_text())
+    db.conn.execute(
+        """INSERT INTO drafts
+               (filename, title, format_type, draft_date, body, snippet, mtime_ns, size)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+           ON CONFLICT(filename) DO UPDATE SET
+               title = excluded.title, format_type = excluded.format_type,
+               draft_date = excluded.draft_date, body = excluded.body,
+               snippet = excluded.snippet, mtime_ns = excluded.mtime_ns,
+               size = excluded.size, indexed_at = datetime('now')""",
+        (info["filename"], info["title"], info["format_type"], info["date"],
+         info["body"], info["snippet"], st.st_mtime_ns, st.st_size),
+    )
+    info["mtime"] = st.st_mtime_ns / 1e9
+    return info
+
+
+def sync_drafts(db: Database, drafts_dir: Path, force: bool = False) -> dict[str, int]:
+    """Reconcile the drafts table with the ``*.md`` files in ``drafts_dir``.
+
+    New and changed files (by mtime or size) are read and indexed; rows
+    for missing files are removed. ``force`` re-reads every file. Returns
+    counts of added, updated and removed drafts.
+    """
+    counts = {"added": 0, "updated": 0, "removed": 0}
+    files: dict[str, os.DirEntry] = {}
+    if drafts_dir.is_dir():
+        with os.scandir(drafts_dir) as entries:
+            files = {e.name: e for e in entries if e.name.endswith(".md") and e.is_file()}
+
+    indexed = {
+        r["filename"]: (r["mtime_ns"], r["size"])
+        for r in db.conn.execute("SELECT filename, mtime_ns, size FROM drafts")
+    }
+    for name in indexed.keys() - files.keys():
+        db.conn.execute("DELETE FROM drafts WHERE filename = ?", (name,))
+        counts["removed"] += 1
+    for name, entry in files.items():
+        st = entry.stat()
+        known = indexed.get(name)
+        if not force and known == (st.st_mtime_ns, st.st_size):
+            continue
+        try:
+            index_draft(db, Path(entry.path), st)
+        except (OSError, UnicodeDecodeError):
+            continue
+        counts["updated" if known else "added"] += 1
+    db.conn.commit()
+    return counts
+
+
+def list_drafts(db: Database, limit: int | None = None, offset: int = 0) -> list[dict]:
+    """Drafts newest filename first (dated filenames sort by date), without bodies."""
+    rows = db.conn.execute(
+        f"SELECT {LIST_COLUMNS} FROM drafts d ORDER BY d.filename DESC LIMIT ? OFFSET ?",
+        (-1 if limit is None else limit, offset),
+    ).fetchall()
+    return [_row(dict(r)) for r in rows]
+
+
+def count_drafts(db: Database) -> int:
+    return db.conn.execute("SELECT COUNT(*) FROM drafts").fetchone()[0]
+
+
+def search_drafts(db: Database, query: str, limit: int = 50) -> list[dict]:
+    """Drafts matching ``query`` (title weighted over body), best first."""
+    expression = compile_query(query, ("title", "body"))
+    if not expression:
+        return []
+    rows = db.conn.execute(
+        f"""SELECT {LIST_COLUMNS}
+            FROM drafts_fts JOIN drafts d ON d.id = drafts_fts.rowid
+            WHERE drafts_fts MATCH ? ORDER BY rank LIMIT ?""",
+        (expression, limit),
+    ).fetchall()
+    return [_row(dict(r)) for r in rows]
+
+
+def get_draft(db: Database, filename: str) -> dict | None:
+    """One draft with its body, or None if it isn't indexed."""
+    row = db.conn.execute(
+        f"SELECT {LIST_COLUMNS}, d.body FROM drafts d WHERE d.filename = ?", (filename,)
+    ).fetchone()
+    return _row(dict(row)) if row else None
+
+
+def save_draft_file(db: Database, drafts_dir: Path, filename: str, text: str) -> Path:
+    """Write a draft file and index it."""
+    drafts_dir.mkdir(parents=True, exist_ok=True)
+    path = drafts_dir / filename
+    path.write_text(text)
+    index_draft(db, path)
+    db.conn.commit()
+    return path
+
+
+def delete_draft_file(db: Database, drafts_dir: Path, filename: str) -> bool:
+    """Delete a draft file and its row. Returns whether a file was removed."""
+    path = drafts_dir / filename
+    removed = path.is_file()
+    if removed:
+        path.unlink()
+    db.conn.execute("DELETE FROM drafts WHERE filename = ?", (filename,))
+    db.conn.commit()
+    return removed
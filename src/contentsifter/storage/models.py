@@ -12,6 +12,7 @@ class SpeakerTurn:
     text: str
     timestamp: str
     timestamp_seconds: int
+    is_coach: bool = False
 
 
 @dataclass
@@ -67,13 +67,28 @@ class Repository:
                 (call_id, p.display_name, p.email, int(p.is_coach)),
             )
 
+        # Resolve each distinct speaker once, flagging the coach either from
+        # the parsed turn or from a coach participant in the call header
+        coach_names = {p.display_name for p in metadata.participants if p.is_coach and p.display_name}
+        coach_emails = {p.email for p in metadata.participants if p.is_coach and p.email}
+        speaker_ids: dict[tuple[str, str], int] = {}
+        for turn in turns:
+            key = (turn.speaker_name, turn.speaker_email or "")
+            if key not in speaker_ids:
+                is_coach = (
+                    turn.is_coach
+                    or turn.speaker_name in coach_names
+                    or (turn.speaker_email or "") in coach_emails
+                )
+                speaker_ids[key] = self.get_or_create_speaker(*key, is_coach=is_coach)
+
         # Insert speaker turns
         for turn in turns:
             self.db.conn.execute(
                 """INSERT INTO speaker_turns
                    (call_id, turn_index, speaker_name, speaker_email,
-                    text, timestamp, timestamp_seconds)
-                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                    text, timestamp, timestamp_seconds, speaker_id, char_len)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                 (
                     call_id,
                     turn.turn_index,
@@ -82,14 +97,18 @@ class Repository:
                     turn.text,
                     turn.timestamp,
                     turn.timestamp_seconds,
+                    speaker_ids[(turn.speaker_name, turn.speaker_email or "")],
+                    len(turn.text),
                 ),
             )
 
         # Mark as parsed
         self.db.conn.execute(
-            """INSERT OR REPLACE INTO processing_log
+            """INSERT INTO processing_log
                (call_id, stage, status, completed_at)
-               VALUES (?, 'parsed', 'completed', ?)""",
+               VALUES (?, 'parsed', 'completed', ?)
+               ON CONFLICT(call_id, stage) DO UPDATE SET
+                 status = excluded.status, completed_at = excluded.completed_at""",
             (call_id, datetime.now().isoformat()),
         )
 
@@ -106,6 +125,27 @@ class Repository:
         ).fetchall()
         return [dict(r) for r in rows]
 
+    # ── Speakers ───────────────────────────────────────────────────
+
+    def get_or_create_speaker(
+        self, name: str, email: str = "", is_coach: bool = False
+    ) -> int:
+        """Return the speaker id for a name/email pair, creating it if needed.
+
+        A speaker once flagged as the coach stays flagged.
+        """
+        self.db.conn.execute(
+            """INSERT INTO speakers (name, email, is_coach) VALUES (?, ?, ?)
+               ON CONFLICT(name, email) DO UPDATE SET
+                 is_coach = MAX(is_coach, excluded.is_coach)""",
+            (name, email, int(is_coach)),
+        )
+        row = self.db.conn.execute(
+            "SELECT id FROM speakers WHERE name = ? AND email = ?",
+            (name, email),
+        ).fetchone()
+        return row[0]
+
     # ── Topic Chunks ───────────────────────────────────────────────
 
     def insert_topic_chunks(
@@ -136,9 +176,11 @@ class Repository:
 
         # Mark as chunked
         self.db.conn.execute(
-            """INSERT OR REPLACE INTO processing_log
+            """INSERT INTO processing_log
                (call_id, stage, status, completed_at)
-               VALUES (?, 'chunked', 'completed', ?)""",
+               VALUES (?, 'chunked', 'completed', ?)
+               ON CONFLICT(call_id, stage) DO UPDATE SET
+                 status = excluded.status, completed_at = excluded.completed_at""",
             (call_id, datetime.now().isoformat()),
         )
 
@@ -196,9 +238,11 @@ class Repository:
     def mark_extracted(self, call_id: int):
         """Mark a call as fully extracted."""
         self.db.conn.execute(
-            """INSERT OR REPLACE INTO processing_log
+            """INSERT INTO processing_log
                (call_id, stage, status, completed_at)
-               VALUES (?, 'extracted', 'completed', ?)""",
+               VALUES (?, 'extracted', 'completed', ?)
+               ON CONFLICT(call_id, stage) DO UPDATE SET
+                 status = excluded.status, completed_at = excluded.completed_at""",
             (call_id, datetime.now().isoformat()),
         )
         self.db.conn.commit()
@@ -229,26 +273,34 @@ class Repository:
 
     def get_progress_summary(self) -> dict:
         """Get counts per stage and status."""
-        total = self.get_call_count()
-        summary = {"total_calls": total, "stages": {}}
-
-        for stage in ["parsed", "chunked", "extracted"]:
-            row = self.db.conn.execute(
-                """SELECT COUNT(*) FROM processing_log
-                   WHERE stage = ? AND status = 'completed'""",
-                (stage,),
-            ).fetchone()
-            summary["stages"][stage] = row[0]
+        stages = self.get_counters("stage")
+        summary = {
+            "total_calls": sum(self.get_counters("call_type").values()),
+            "stages": {stage: stages.get(stage, 0) for stage in ["parsed", "chunked", "extracted"]},
+        }
 
         # Extraction counts by category
-        rows = self.db.conn.execute(
-            """SELECT category, COUNT(*) FROM extractions GROUP BY category"""
-        ).fetchall()
-        summary["extractions"] = {r[0]: r[1] for r in rows}
+        summary["extractions"] = self.get_counters("category")
         summary["total_extractions"] = sum(summary["extractions"].values())
 
         return summary
 
+    # ── Stats Counters ─────────────────────────────────────────────
+
+    def get_counters(self, scope: str) -> dict[str, int]:
+        """Read materialized counters for a scope (e.g. 'category', 'stage').
+
+        Counters are maintained by triggers, so this never scans the
+        source tables. Keys whose count has dropped to zero are omitted.
+        """
+        rows = self.db.conn.execute(
+            """SELECT key, value FROM stats_counters
+               WHERE scope = ? AND value > 0
+               ORDER BY value DESC, key""",
+            (scope,),
+        ).fetchall()
+        return {r["key"]: r["value"] for r in rows}
+
     # ── Speaker Turns ──────────────────────────────────────────────
 
     def get_turns_for_call(self, call_id: int) -> list[dict]:
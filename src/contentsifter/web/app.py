@@ -20,9 +20,13 @@ def _setup_template_globals():
     from contentsifter.config import list_clients
 
     def draft_count(client) -> int:
-        """Count saved draft files for a client."""
-        if client and hasattr(client, "drafts_dir") and client.drafts_dir.exists():
-            return len(list(client.drafts_dir.glob("*.md")))
+        """Count saved drafts for a client, from the draft index."""
+        from contentsifter.storage.drafts import count_drafts
+        from contentsifter.web.deps import get_db
+
+        if client and hasattr(client, "db_path") and client.db_path.exists():
+            with get_db(client) as db:
+                return count_drafts(db)
         return 0
 
     templates.env.globals["list_all_clients"] = list_clients
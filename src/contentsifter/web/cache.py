@@ -0,0 +1,112 @@
+"""In-process LRU cache for web search results.
+
+Entries are stored per client and validated against a generation token:
+the database file's identity plus SQLite's ``PRAGMA data_version``, read
+from a watcher connection that never writes. data_version changes whenever
+any other connection commits, so a web upload or a CLI extract running in
+another process makes older entries stale without explicit invalidation.
+Cached values are built only from the database, so no other invalidation
+is needed.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable
+
+# Maximum cached result sets across all clients
+CACHE_SIZE = 256
+
+
+class SearchCache:
+    """LRU cache of search payloads keyed by (client slug, request key)."""
+
+    def __init__(self, max_entries: int = CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[tuple, Any]] = OrderedDict()
+        self._watchers: dict[str, tuple[tuple, sqlite3.Connection]] = {}
+        self._lock = threading.Lock()
+        # slug -> {"hits", "misses", "evictions"}
+        self._metrics: dict[str, dict[str, int]] = {}
+
+    def _count(self, slug: str, metric: str):
+        counts = self._metrics.setdefault(slug, {"hits": 0, "misses": 0, "evictions": 0})
+        counts[metric] += 1
+
+    def _token(self, db_path: Path) -> tuple | None:
+        """Current generation token for a client's database, or None if absent."""
+        try:
+            st = db_path.stat()
+        except OSError:
+            return None
+        identity = (st.st_dev, st.st_ino)
+        path = str(db_path)
+        watcher = self._watchers.get(path)
+        if watcher is None or watcher[0] != identity:
+            # First use, or the file was replaced: data_version is per-file
+            if watcher is not None:
+                watcher[1].close()
+            watcher = (identity, sqlite3.connect(path, check_same_thread=False))
+            self._watchers[path] = watcher
+        version = watcher[1].execute("PRAGMA data_version").fetchone()[0]
+        return (path, identity, version)
+
+    def get_or_compute(self, slug: str, db_path: Path, key: tuple, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, or compute and store it.
+
+        The token is read before computing, so a write that lands while
+        ``compute`` runs leaves the stored entry already stale.
+        """
+        cache_key = (slug, *key)
+        with self._lock:
+            token = self._token(db_path)
+            entry = self._entries.get(cache_key)
+            if token is not None and entry is not None and entry[0] == token:
+                self._entries.move_to_end(cache_key)
+                self._count(slug, "hits")
+                return entry[1]
+            self._count(slug, "misses")
+
+        value = compute()
+        if token is None:
+            return value
+
+        with self._lock:
+            self._entries[cache_key] = (token, value)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                (evicted_slug, *_), _ = self._entries.popitem(last=False)
+                self._count(evicted_slug, "evictions")
+        return value
+
+    def clear(self):
+        """Drop all entries, close watcher connections and reset metrics."""
+        with self._lock:
+            self._entries.clear()
+            for _, conn in self._watchers.values():
+                conn.close()
+            self._watchers.clear()
+            self._metrics.clear()
+
+    def stats(self, slug: str | None = None) -> dict:
+        """Entry count and hit-rate metrics for one client, or for all clients."""
+        with self._lock:
+            slugs = [slug] if slug is not None else list(self._metrics)
+            totals = {"hits": 0, "misses": 0, "evictions": 0}
+            for s in slugs:
+                for metric, n in self._metrics.get(s, {}).items():
+                    totals[metric] += n
+            entries = sum(1 for key in self._entries if slug is None or key[0] == slug)
+        lookups = totals["hits"] + totals["misses"]
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            **totals,
+            "hit_rate": round(totals["hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+
+search_cache = SearchCache()
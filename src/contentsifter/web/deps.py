@@ -57,32 +57,12 @@ def content_summary(db: Database, client: ClientConfig) -> dict:
         "has_questionnaire": (client.content_dir / "interview-guide.md").exists(),
     }
 
-    try:
-        rows = db.conn.execute(
-            "SELECT content_type, COUNT(*) as cnt, COALESCE(SUM(char_count), 0) as chars "
-            "FROM content_items GROUP BY content_type"
-        ).fetchall()
-        for r in rows:
-            summary["content_by_type"][r["content_type"]] = r["cnt"]
-            summary["content_items"] += r["cnt"]
-            summary["total_chars"] += r["chars"]
-    except Exception:
-        pass
-
-    try:
-        rows = db.conn.execute(
-            "SELECT category, COUNT(*) as cnt FROM extractions GROUP BY category"
-        ).fetchall()
-        for r in rows:
-            summary["extractions_by_cat"][r["category"]] = r["cnt"]
-            summary["extractions"] += r["cnt"]
-    except Exception:
-        pass
-
-    try:
-        row = db.conn.execute("SELECT COUNT(*) as cnt FROM calls").fetchone()
-        summary["calls"] = row["cnt"]
-    except Exception:
-        pass
+    repo = Repository(db)
+    summary["content_by_type"] = repo.get_counters("content_type")
+    summary["content_items"] = sum(summary["content_by_type"].values())
+    summary["total_chars"] = sum(repo.get_counters("content_chars").values())
+    summary["extractions_by_cat"] = repo.get_counters("category")
+    summary["extractions"] = sum(summary["extractions_by_cat"].values())
+    summary["calls"] = sum(repo.get_counters("call_type").values())
 
     return summary
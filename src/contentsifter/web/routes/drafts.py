@@ -4,32 +4,73 @@ from __future__ import annotations
 
 import html as html_mod
 
-from fastapi import APIRouter, Form, Request
+from fastapi import APIRouter, Query, Request
 from fastapi.responses import HTMLResponse
 
 from contentsifter.config import load_client
+from contentsifter.storage.drafts import (
+    delete_draft_file,
+    get_draft,
+    list_drafts,
+    search_drafts,
+    sync_drafts,
+)
 from contentsifter.web.app import templates
-from contentsifter.web.utils import parse_draft
+from contentsifter.web.deps import get_db
 
 router = APIRouter()
 
 
 @router.get("/{slug}/drafts")
-async def drafts_page(request: Request, slug: str):
-    """Saved drafts browsing page."""
+async def drafts_page(request: Request, slug: str, q: str = Query("")):
+    """Saved drafts browsing page, optionally filtered by a full-text query."""
     client = load_client(slug)
-    drafts_dir = client.drafts_dir
 
-    drafts = []
-    if drafts_dir.exists():
-        for p in sorted(drafts_dir.glob("*.md"), reverse=True):
-            drafts.append(parse_draft(p))
+    with get_db(client) as db:
+        drafts = search_drafts(db, q) if q.strip() else list_drafts(db)
 
     return templates.TemplateResponse("pages/drafts.html", {
         "request": request,
         "current_client": client,
         "active_page": "drafts",
         "drafts": drafts,
+        "q": q,
+    })
+
+
+@router.get("/{slug}/drafts/search")
+async def drafts_search(request: Request, slug: str, q: str = Query("")):
+    """Drafts list fragment for the search box."""
+    client = load_client(slug)
+
+    with get_db(client) as db:
+        drafts = search_drafts(db, q) if q.strip() else list_drafts(db)
+
+    return templates.TemplateResponse("pages/_drafts_list.html", {
+        "request": request,
+        "current_client": client,
+        "drafts": drafts,
+        "q": q,
+    })
+
+
+@router.post("/{slug}/drafts/refresh")
+async def refresh_drafts(request: Request, slug: str):
+    """Re-index the drafts folder, picking up files written outside the app."""
+    client = load_client(slug)
+
+    with get_db(client) as db:
+        counts = sync_drafts(db, client.drafts_dir)
+        drafts = list_drafts(db)
+
+    return templates.TemplateResponse("pages/_drafts_list.html", {
+        "request": request,
+        "current_client": client,
+        "drafts": drafts,
+        "flash_message": (
+            f"Drafts folder rescanned: {counts['added']} added, "
+            f"{counts['updated']} updated, {counts['removed']} removed."
+        ),
     })
 
 
@@ -37,12 +78,13 @@ async def drafts_page(request: Request, slug: str):
 async def draft_detail(request: Request, slug: str, filename: str):
     """Return full draft content as an HTML fragment (for expand-in-place)."""
     client = load_client(slug)
-    path = client.drafts_dir / filename
 
-    if not path.exists() or not path.is_file():
+    with get_db(client) as db:
+        info = get_draft(db, filename)
+
+    if info is None:
         return HTMLResponse('<p class="text-sm text-zinc-400">Draft not found.</p>')
 
-    info = parse_draft(path)
     return HTMLResponse(
         f'<div class="mt-4 pt-4 border-t border-zinc-100">'
         f'<div class="text-sm text-zinc-700 whitespace-pre-wrap leading-relaxed">'
@@ -55,10 +97,9 @@ async def draft_detail(request: Request, slug: str, filename: str):
 async def delete_draft(request: Request, slug: str, filename: str):
     """Delete a saved draft."""
     client = load_client(slug)
-    path = client.drafts_dir / filename
 
-    if path.exists() and path.is_file():
-        path.unlink()
+    with get_db(client) as db:
+        delete_draft_file(db, client.drafts_dir, filename)
 
     return HTMLResponse("")
 
@@ -70,18 +111,10 @@ async def batch_delete_drafts(request: Request, slug: str):
     form = await request.form()
     filenames = form.getlist("filenames")
 
-    deleted = 0
-    for filename in filenames:
-        path = client.drafts_dir / filename
-        if path.exists() and path.is_file():
-            path.unlink()
-            deleted += 1
-
-    # Return updated drafts list
-    drafts = []
-    if client.drafts_dir.exists():
-        for p in sorted(client.drafts_dir.glob("*.md"), reverse=True):
-            drafts.append(parse_draft(p))
+    with get_db(client) as db:
+        deleted = sum(delete_draft_file(db, client.drafts_dir, f) for f in filenames)
+        # Return updated drafts list
+        drafts = list_drafts(db)
 
     return templates.TemplateResponse("pages/_drafts_list.html", {
         "request": request,
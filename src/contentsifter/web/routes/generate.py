@@ -12,9 +12,13 @@ from fastapi.responses import HTMLResponse
 import os
 
 from contentsifter.config import load_client
+from contentsifter.generate.stylometry import score_ai_patterns
+from contentsifter.planning.voicecard import load_voice_card
 from contentsifter.planning.voiceprint import load_voice_print
+from contentsifter.planning.voiceprofile import load_voice_profile, voice_similarity
 from contentsifter.search.filters import SearchFilters
 from contentsifter.search.keyword import keyword_search
+from contentsifter.storage.drafts import save_draft_file
 from contentsifter.web.app import templates
 from contentsifter.web.deps import get_api_key, get_db, has_api_key
 
@@ -34,6 +38,11 @@ FORMAT_OPTIONS = [
     ("email-sales", "Sales Email"),
 ]
 
+# Multi-format options; each generates its formats in parallel
+FORMAT_BUNDLES = [
+    ("linkedin,thread,carousel,newsletter", "Social set (LinkedIn, thread, carousel, newsletter)"),
+]
+
 
 @router.get("/{slug}/generate")
 async def generate_page(request: Request, slug: str):
@@ -46,6 +55,7 @@ async def generate_page(request: Request, slug: str):
         "current_client": client,
         "active_page": "generate",
         "format_options": FORMAT_OPTIONS,
+        "format_bundles": FORMAT_BUNDLES,
         "has_api_key": has_api_key(client),
         "has_voice_print": has_voice_print,
     })
@@ -56,11 +66,14 @@ async def generate_draft_endpoint(
     request: Request,
     slug: str,
     topic: str = Form(...),
-    format_type: str = Form("linkedin"),
+    format_type: list[str] = Form(["linkedin"]),
     category: str = Form(""),
     limit: int = Form(10),
 ):
-    """Generate a content draft. Always uses voice print and content gates."""
+    """Generate a content draft. Always uses voice print and content gates.
+
+    Several format_type values generate one draft each, in parallel.
+    """
     client = load_client(slug)
 
     key = get_api_key(client)
@@ -90,51 +103,7 @@ async def generate_draft_endpoint(
             f"</div>"
         )
 
-    # Always load voice print when available
-    voice_print = load_voice_print(client.voice_print_path)
-
-    try:
-        from contentsifter.generate.drafts import generate_draft
-        from contentsifter.llm.client import create_client as create_llm_client
-
-        # Set client-specific key for LLM
-        old_key = os.environ.get("ANTHROPIC_API_KEY")
-        os.environ["ANTHROPIC_API_KEY"] = key
-        try:
-            llm = create_llm_client(mode="api")
-            draft = generate_draft(
-                results=results,
-                format_type=format_type,
-                llm_client=llm,
-                topic=topic,
-                voice_print=voice_print,
-            )
-        finally:
-            if old_key is not None:
-                os.environ["ANTHROPIC_API_KEY"] = old_key
-            elif "ANTHROPIC_API_KEY" in os.environ:
-                del os.environ["ANTHROPIC_API_KEY"]
-
-        # Find the display name for the format
-        format_label = dict(FORMAT_OPTIONS).get(format_type, format_type)
-
-        return templates.TemplateResponse("pages/_draft_result.html", {
-            "request": request,
-            "current_client": client,
-            "draft": draft,
-            "topic": topic,
-            "format_type": format_type,
-            "format_label": format_label,
-            "source_count": len(results),
-        })
-
-    except Exception as e:
-        log.exception("Draft generation failed")
-        return HTMLResponse(
-            f'<div class="rounded-lg px-4 py-3 text-sm bg-rose-50 text-rose-800 border border-rose-200">'
-            f"Generation failed: {type(e).__name__}: {e}"
-            f"</div>"
-        )
+    return _generate_drafts(request, client, key, results, _parse_formats(format_type), topic)
 
 
 @router.post("/{slug}/generate/from-extraction/{extraction_id}")
@@ -142,9 +111,9 @@ async def generate_from_extraction(
     request: Request,
     slug: str,
     extraction_id: int,
-    format_type: str = Form("linkedin"),
+    format_type: list[str] = Form(["linkedin"]),
 ):
-    """Generate a content draft from a single extraction."""
+    """Generate content drafts from a single extraction."""
     client = load_client(slug)
 
     key = get_api_key(client)
@@ -186,49 +155,83 @@ async def generate_from_extraction(
     }]
     topic = row["title"]
 
+    return _generate_drafts(request, client, key, results, _parse_formats(format_type), topic)
+
+
+def _parse_formats(values: list[str]) -> list[str]:
+    """Form format values -> unique formats; a value may list several ("linkedin,thread")."""
+    return list(dict.fromkeys(f.strip() for v in values for f in v.split(",") if f.strip()))
+
+
+def _generate_drafts(request: Request, client, key: str, results: list[dict], formats: list[str], topic: str):
+    """Generate a draft per format (in parallel for several) and render the result cards."""
+    # Always load voice print when available
     voice_print = load_voice_print(client.voice_print_path)
+    voice_card = load_voice_card(client.voice_print_path)
+    voice_profile = load_voice_profile(client.voice_profile_path)
 
     try:
-        from contentsifter.generate.drafts import generate_draft
+        from contentsifter.generate.drafts import generate_draft, generate_drafts_multi
         from contentsifter.llm.client import create_client as create_llm_client
 
+        # Set client-specific key for LLM
         old_key = os.environ.get("ANTHROPIC_API_KEY")
         os.environ["ANTHROPIC_API_KEY"] = key
         try:
             llm = create_llm_client(mode="api")
-            draft = generate_draft(
-                results=results,
-                format_type=format_type,
-                llm_client=llm,
-                topic=topic,
-                voice_print=voice_print,
-            )
+            if len(formats) == 1:
+                drafts = {formats[0]: generate_draft(
+                    results=results,
+                    format_type=formats[0],
+                    llm_client=llm,
+                    topic=topic,
+                    voice_print=voice_print,
+                    voice_profile=voice_profile,
+                    voice_card=voice_card,
+                )}
+            else:
+                drafts = generate_drafts_multi(
+                    results=results,
+                    formats=formats,
+                    llm_client=llm,
+                    topic=topic,
+                    voice_print=voice_print,
+                    voice_profile=voice_profile,
+                    voice_card=voice_card,
+                )
         finally:
             if old_key is not None:
                 os.environ["ANTHROPIC_API_KEY"] = old_key
             elif "ANTHROPIC_API_KEY" in os.environ:
                 del os.environ["ANTHROPIC_API_KEY"]
-
-        format_label = dict(FORMAT_OPTIONS).get(format_type, format_type)
-
-        return templates.TemplateResponse("pages/_draft_result.html", {
-            "request": request,
-            "current_client": client,
-            "draft": draft,
-            "topic": topic,
-            "format_type": format_type,
-            "format_label": format_label,
-            "source_count": 1,
-        })
-
     except Exception as e:
-        log.exception("Draft generation from extraction %d failed", extraction_id)
+        log.exception("Draft generation failed")
         return HTMLResponse(
             f'<div class="rounded-lg px-4 py-3 text-sm bg-rose-50 text-rose-800 border border-rose-200">'
             f"Generation failed: {type(e).__name__}: {e}"
             f"</div>"
         )
 
+    labels = dict(FORMAT_OPTIONS)
+    cards = []
+    for format_type, draft in drafts.items():
+        card = {"format_type": format_type, "format_label": labels.get(format_type, format_type)}
+        if isinstance(draft, Exception):
+            card["error"] = f"{type(draft).__name__}: {draft}"
+        else:
+            card["draft"] = draft
+            card["ai_score"] = score_ai_patterns(draft)
+            card["voice_match"] = voice_similarity(draft, voice_profile) if voice_profile else None
+        cards.append(card)
+
+    return templates.TemplateResponse("pages/_draft_results.html", {
+        "request": request,
+        "current_client": client,
+        "cards": cards,
+        "topic": topic,
+        "source_count": len(results),
+    })
+
 
 @router.post("/{slug}/generate/save")
 async def save_draft(
@@ -240,13 +243,14 @@ async def save_draft(
 ):
     """Save a generated draft to disk."""
     client = load_client(slug)
-    client.drafts_dir.mkdir(parents=True, exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     filename = f"{format_type}-{timestamp}.md"
-    path = client.drafts_dir / filename
-
-    path.write_text(f"# {topic}\n\n*Format: {format_type}*\n\n---\n\n{content}\n")
+    with get_db(client) as db:
+        save_draft_file(
+            db, client.drafts_dir, filename,
+            f"# {topic}\n\n*Format: {format_type}*\n\n---\n\n{content}\n",
+        )
 
     return HTMLResponse(
         f'<div class="rounded-lg px-4 py-3 text-sm bg-emerald-50 text-emerald-800 border border-emerald-200 mt-3 flex items-center gap-2" data-flash>'
@@ -11,6 +11,7 @@ from fastapi.responses import HTMLResponse
 from contentsifter.config import load_client
 from contentsifter.ingest.autoformat import auto_format_content, needs_formatting
 from contentsifter.ingest.reader import CLI_TYPE_MAP, ingest_path
+from contentsifter.search.suggest import refresh_suggestions
 from contentsifter.web.app import templates
 from contentsifter.web.deps import get_db
 
@@ -88,6 +89,8 @@ async def upload_file(
     try:
         with get_db(client) as db:
             items = ingest_path(db, tmp_path, content_type=content_type, author=client.name)
+            if items:
+                refresh_suggestions(db)
     finally:
         tmp_path.unlink(missing_ok=True)
 
@@ -13,10 +13,12 @@ from fastapi.responses import HTMLResponse, Response
 
 from contentsifter.config import load_client
 from contentsifter.planning.calendar import WEEKLY_SCHEDULE, select_content_for_day
+from contentsifter.planning.voicecard import load_voice_card
 from contentsifter.planning.voiceprint import load_voice_print
+from contentsifter.planning.voiceprofile import load_voice_profile
+from contentsifter.storage.drafts import get_draft, list_drafts
 from contentsifter.web.app import templates
 from contentsifter.web.deps import get_api_key, get_db, has_api_key
-from contentsifter.web.utils import parse_draft
 
 log = logging.getLogger(__name__)
 
@@ -82,13 +84,10 @@ async def planner_page(request: Request, slug: str, week: str = Query(None)):
         for row in rows:
             slots[row["day_name"]] = dict(row)
 
-    has_plan = len(slots) > 0
+        # Available drafts, from the draft index
+        drafts = list_drafts(db)
 
-    # Load available drafts
-    drafts = []
-    if client.drafts_dir.exists():
-        for p in sorted(client.drafts_dir.glob("*.md"), reverse=True):
-            drafts.append(parse_draft(p))
+    has_plan = len(slots) > 0
 
     return templates.TemplateResponse("pages/planner.html", {
         "request": request,
@@ -234,6 +233,8 @@ async def generate_for_slot(
 
     # Generate draft with voice print and gates
     voice_print = load_voice_print(client.voice_print_path)
+    voice_card = load_voice_card(client.voice_print_path)
+    voice_profile = load_voice_profile(client.voice_profile_path)
     topic = sources[0]["title"]
     extraction_ids = [s["id"] for s in sources]
 
@@ -251,6 +252,8 @@ async def generate_for_slot(
                 llm_client=llm,
                 topic=topic,
                 voice_print=voice_print,
+                voice_profile=voice_profile,
+                voice_card=voice_card,
             )
         finally:
             if old_key is not None:
@@ -290,14 +293,12 @@ async def assign_draft_to_slot(
 ):
     """Assign a saved draft file to a calendar slot."""
     client = load_client(slug)
-    path = client.drafts_dir / filename
-
-    if not path.exists():
-        return HTMLResponse('<div class="text-sm text-rose-600">Draft file not found.</div>')
-
-    info = parse_draft(path)
 
     with get_db(client) as db:
+        info = get_draft(db, filename)
+        if info is None:
+            return HTMLResponse('<div class="text-sm text-rose-600">Draft file not found.</div>')
+
         db.conn.execute(
             """UPDATE calendar_plans
                SET title = ?, content = ?, status = 'draft',
@@ -368,10 +369,8 @@ async def available_drafts(request: Request, slug: str):
     """Return the list of saved drafts as draggable cards."""
     client = load_client(slug)
 
-    drafts = []
-    if client.drafts_dir.exists():
-        for p in sorted(client.drafts_dir.glob("*.md"), reverse=True):
-            drafts.append(parse_draft(p))
+    with get_db(client) as db:
+        drafts = list_drafts(db)
 
     return templates.TemplateResponse("pages/_planner_drafts_drawer.html", {
         "request": request,
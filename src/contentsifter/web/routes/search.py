@@ -8,15 +8,22 @@ from fastapi import APIRouter, Query, Request
 from fastapi.responses import HTMLResponse
 
 from contentsifter.config import load_client
+from contentsifter.search.facets import facet_counts
 from contentsifter.search.filters import SearchFilters
-from contentsifter.search.keyword import browse_extractions, keyword_search
+from contentsifter.search.fuzzy import fuzzy_content_items, fuzzy_search
+from contentsifter.search.keyword import browse_extractions, estimate_total, keyword_search
+from contentsifter.search.suggest import suggest
+from contentsifter.search.unified import unified_search
 from contentsifter.web.app import templates
-from contentsifter.web.deps import get_db, has_api_key
-from contentsifter.web.routes.generate import FORMAT_OPTIONS  # used in search_detail
-from contentsifter.web.utils import simple_md_to_html
+from contentsifter.web.cache import search_cache
+from contentsifter.web.deps import get_db, get_repo, has_api_key
+from contentsifter.web.routes.generate import FORMAT_BUNDLES, FORMAT_OPTIONS  # used in search_detail
+from contentsifter.web.utils import highlight_to_html, simple_md_to_html
 
 router = APIRouter()
 
+# Results per page on the search/browse screen
+PAGE_SIZE = 20
 
 CATEGORY_LABELS = {
     "qa": "Q&A",
@@ -25,6 +32,26 @@ CATEGORY_LABELS = {
     "testimonial": "Testimonial",
 }
 
+# Sources searched when no extraction matches a query
+OTHER_SOURCES = ["content_item", "content_block", "turn"]
+
+SOURCE_LABELS = {
+    "extraction": "extraction",
+    "content_item": "post",
+    "content_block": "block",
+    "turn": "transcript",
+}
+
+FACET_LABELS = {
+    "category": "Category",
+    "call_type": "Call type",
+    "year": "Year",
+    "tag": "Tags",
+}
+
+# Facet values shown in the results header
+FACET_VALUES_SHOWN = 5
+
 CATEGORY_PLURALS = {
     "qa": "Q&As",
     "playbook": "playbooks",
@@ -39,16 +66,8 @@ async def search_page(request: Request, slug: str):
     client = load_client(slug)
 
     # Get category counts for tabs
-    cat_counts = {}
     with get_db(client) as db:
-        try:
-            rows = db.conn.execute(
-                "SELECT category, COUNT(*) as cnt FROM extractions GROUP BY category"
-            ).fetchall()
-            for r in rows:
-                cat_counts[r["category"]] = r["cnt"]
-        except Exception:
-            pass
+        cat_counts = get_repo(db).get_counters("category")
 
     return templates.TemplateResponse("pages/search.html", {
         "request": request,
@@ -65,11 +84,17 @@ async def search_results(
     slug: str,
     q: str = Query(""),
     category: str = Query(""),
+    cursor: str = Query(""),
 ):
-    """Return search results as HTML fragment (htmx)."""
+    """Return search results as HTML fragment (htmx).
+
+    With a ``cursor``, returns only the next page of cards (plus a new
+    "Load more" button) to replace the previous button in place.
+    """
     client = load_client(slug)
+    q = q.strip()
 
-    has_query = bool(q.strip())
+    has_query = bool(q)
     has_category = bool(category)
 
     if not has_query and not has_category:
@@ -77,21 +102,25 @@ async def search_results(
             '<p class="text-sm text-zinc-400 py-4">Type to search or select a category to browse.</p>'
         )
 
-    filters = SearchFilters()
-    if has_category:
-        filters.categories = [category]
-
-    with get_db(client) as db:
-        try:
-            if has_query:
-                results = keyword_search(db, q, filters)
-            else:
-                # Browse mode: no search term, filter by category
-                results = browse_extractions(db, filters)
-        except Exception:
-            results = []
+    payload = search_cache.get_or_compute(
+        slug, client.db_path, ("results", q, category, cursor),
+        lambda: _search_payload(client, q, category, cursor),
+    )
+    results = payload["results"]
+    next_cursor = payload["next_cursor"]
+    total, total_capped = payload["total"], payload["total_capped"]
+
+    if payload["other"]:
+        return templates.TemplateResponse("pages/_search_unified_results.html", {
+            "request": request,
+            "results": payload["other"],
+            "query": q,
+            "source_labels": SOURCE_LABELS,
+        })
 
     if not results:
+        if cursor:
+            return HTMLResponse("")
         label = CATEGORY_LABELS.get(category, category) if has_category else ""
         if has_query:
             msg = f'No results for &ldquo;{html_mod.escape(q)}&rdquo;'
@@ -101,14 +130,13 @@ async def search_results(
             msg = f"No {label} extractions found" if label else "No extractions found"
         return HTMLResponse(f'<p class="text-sm text-zinc-400 py-4">{msg}</p>')
 
-    # Build display-ready results with snippet
+    # Highlighted title/snippet markup (browse results have no highlights)
     display_results = []
     for r in results:
-        content = r.get("content", "")
-        snippet = content[:200] + "..." if len(content) > 200 else content
         display_results.append({
             **r,
-            "snippet": snippet,
+            "title_html": highlight_to_html(r["title"]),
+            "snippet_html": highlight_to_html(r["snippet"]),
         })
 
     # Header context
@@ -116,17 +144,89 @@ async def search_results(
     category_label = CATEGORY_LABELS.get(category, "") if has_category else ""
     category_plural = CATEGORY_PLURALS.get(category, "extractions") if has_category else "extractions"
 
-    return templates.TemplateResponse("pages/_search_results.html", {
+    template = "pages/_search_result_cards.html" if cursor else "pages/_search_results.html"
+    return templates.TemplateResponse(template, {
         "request": request,
         "results": display_results,
         "query": q,
+        "category": category,
         "slug": slug,
         "mode": mode,
         "category_label": category_label,
         "category_plural": category_plural,
+        "total": total,
+        "total_capped": total_capped,
+        "next_cursor": next_cursor,
+        "facets": payload["facets"],
+        "fuzzy": payload["fuzzy"],
+        "facet_labels": FACET_LABELS,
+        "cat_labels": CATEGORY_LABELS,
     })
 
 
+def _search_payload(client, q: str, category: str, cursor: str) -> dict:
+    """Run the queries behind one search/browse page (cached by search_results)."""
+    # Fetch one extra row to learn whether another page exists
+    filters = SearchFilters(limit=PAGE_SIZE + 1)
+    if category:
+        filters.categories = [category]
+
+    total, total_capped, facets, fuzzy = 0, False, {}, False
+    with get_db(client) as db:
+        try:
+            # Cards only need a preview; the detail endpoint loads full text
+            if q:
+                results = keyword_search(db, q, filters, cursor=cursor or None, snippets=True)
+            else:
+                # Browse mode: no search term, filter by category
+                results = browse_extractions(db, filters, cursor=cursor or None, snippets=True)
+            if results and not cursor:
+                total, total_capped = estimate_total(db, q, filters)
+        except Exception:
+            results = []
+
+        if results and not cursor:
+            try:
+                facets = {
+                    name: dict(list(values.items())[:FACET_VALUES_SHOWN])
+                    for name, values in facet_counts(db, q, filters).items()
+                }
+            except Exception:
+                facets = {}
+
+        if not results and q and not cursor:
+            # No whole-word match; try substrings and near-misspellings
+            filters.limit = PAGE_SIZE
+            results = fuzzy_search(db, q, filters, snippets=True)
+            fuzzy = bool(results)
+            total = len(results)
+
+        other = []
+        if not results and q and not category and not cursor:
+            # Nothing extracted matches; fall back to ingested content and transcripts
+            try:
+                other = unified_search(
+                    db, q, SearchFilters(sources=OTHER_SOURCES, limit=PAGE_SIZE),
+                )
+            except Exception:
+                other = []
+            if not other:
+                other = fuzzy_content_items(db, q, SearchFilters(limit=PAGE_SIZE))
+            for r in other:
+                text = r["text"] or ""
+                r["snippet"] = text[:200] + "..." if len(text) > 200 else text
+
+    return {
+        "results": results[:PAGE_SIZE],
+        "next_cursor": results[PAGE_SIZE - 1]["cursor"] if len(results) > PAGE_SIZE else None,
+        "total": total,
+        "total_capped": total_capped,
+        "facets": facets,
+        "fuzzy": fuzzy,
+        "other": other,
+    }
+
+
 @router.get("/{slug}/search/detail/{extraction_id}")
 async def search_detail(request: Request, slug: str, extraction_id: int):
     """Return full extraction detail as HTML fragment (htmx expand-in-place)."""
@@ -223,7 +323,7 @@ async def search_detail(request: Request, slug: str, extraction_id: int):
     # Generate bar (per-card)
     if has_api_key(client):
         options_html = "".join(
-            f'<option value="{v}">{l}</option>' for v, l in FORMAT_OPTIONS
+            f'<option value="{v}">{l}</option>' for v, l in FORMAT_OPTIONS + FORMAT_BUNDLES
         )
         eid = extraction_id
         sections.append(f"""
@@ -263,7 +363,37 @@ async def search_suggestions(request: Request, slug: str):
     """Return popular tags as clickable suggestion chips."""
     client = load_client(slug)
 
-    popular_tags: list[dict] = []
+    popular_tags = search_cache.get_or_compute(
+        slug, client.db_path, ("suggestions",), lambda: _popular_tags(client),
+    )
+
+    if not popular_tags:
+        return HTMLResponse("")
+
+    return templates.TemplateResponse("pages/_search_suggestions.html", {
+        "request": request,
+        "tags": popular_tags,
+    })
+
+
+@router.get("/{slug}/search/typeahead")
+async def search_typeahead(slug: str, q: str = Query("")):
+    """Return <option> completions for the search box's datalist."""
+    client = load_client(slug)
+
+    with get_db(client) as db:
+        try:
+            suggestions = suggest(db, q)
+        except Exception:
+            suggestions = []
+
+    return HTMLResponse("".join(
+        f'<option value="{html_mod.escape(s["query"])}"></option>' for s in suggestions
+    ))
+
+
+def _popular_tags(client, limit: int = 15) -> list[dict]:
+    """Most-used extraction tags with their counts."""
     with get_db(client) as db:
         try:
             rows = db.conn.execute(
@@ -271,16 +401,15 @@ async def search_suggestions(request: Request, slug: str):
                    JOIN extraction_tags et ON t.id = et.tag_id
                    GROUP BY t.id
                    ORDER BY cnt DESC
-                   LIMIT 15"""
+                   LIMIT ?""",
+                (limit,),
             ).fetchall()
-            popular_tags = [{"name": r["name"], "count": r["cnt"]} for r in rows]
         except Exception:
-            pass
+            return []
+    return [{"name": r["name"], "count": r["cnt"]} for r in rows]
 
-    if not popular_tags:
-        return HTMLResponse("")
 
-    return templates.TemplateResponse("pages/_search_suggestions.html", {
-        "request": request,
-        "tags": popular_tags,
-    })
+@router.get("/{slug}/search/cache-stats")
+async def search_cache_stats(slug: str):
+    """Hit-rate metrics for this client's entries in the in-process search cache."""
+    return search_cache.stats(slug)
@@ -10,6 +10,7 @@ from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
 
 from contentsifter.config import load_client
+from contentsifter.planning.voicecard import load_voice_card
 from contentsifter.planning.voiceprint import (
     analyze_voice,
     get_coach_turn_stats,
@@ -17,6 +18,11 @@ from contentsifter.planning.voiceprint import (
     load_voice_print,
     save_voice_print,
 )
+from contentsifter.planning.voiceprofile import (
+    MIN_PROFILE_WORDS,
+    build_voice_profile,
+    save_voice_profile,
+)
 from contentsifter.web.app import templates
 from contentsifter.web.deps import get_api_key, get_db, has_api_key
 from contentsifter.web.utils import simple_md_to_html
@@ -93,6 +99,14 @@ async def generate_voice_print(request: Request, slug: str):
                 del os.environ["ANTHROPIC_API_KEY"]
 
         save_voice_print(content, client.voice_print_path)
+        # Builds the short voice card used in draft prompts
+        load_voice_card(client.voice_print_path)
+
+        # The numeric profile is cheap, so refresh it alongside the print
+        with get_db(client) as db:
+            profile = build_voice_profile(db, client.name, client.email)
+        if profile.word_count >= MIN_PROFILE_WORDS:
+            save_voice_profile(profile, client.voice_profile_path)
 
         return HTMLResponse(f"""
         <div class="rounded-lg px-4 py-3 text-sm bg-emerald-50 text-emerald-800 border border-emerald-200 mb-4" data-flash>
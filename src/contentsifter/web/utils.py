@@ -6,6 +6,18 @@ import html as html_mod
 import re
 from pathlib import Path
 
+from markupsafe import Markup
+
+
+def highlight_to_html(text: str | None) -> Markup:
+    """Escape an FTS5 snippet and turn its highlight markers into <mark> tags."""
+    from contentsifter.search.keyword import HIGHLIGHT_END, HIGHLIGHT_START
+
+    escaped = html_mod.escape(text or "")
+    return Markup(
+        escaped.replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_END, "</mark>")
+    )
+
 
 def simple_md_to_html(md: str) -> str:
     """Minimal markdown to HTML for preview. Not a full parser.
@@ -183,52 +195,8 @@ def _inline_format(text: str) -> str:
 
 def parse_draft(path: Path) -> dict:
     """Parse a saved draft markdown file into metadata + content."""
-    text = path.read_text()
-    lines = text.split("\n")
-
-    title = path.stem
-    format_type = ""
-    body = text
-
-    # Extract title from first H1
-    if lines and lines[0].startswith("# "):
-        title = lines[0][2:].strip()
-
-    # Extract format from *Format: ...* line
-    for line in lines[1:6]:
-        m = re.match(r"\*Format:\s*(.+?)(?:\s*\|.*)?\*", line)
-        if m:
-            format_type = m.group(1).strip()
-            break
-
-    # Body is everything after the --- separator
-    separator_idx = None
-    for i, line in enumerate(lines):
-        if line.strip() == "---" and i > 0:
-            separator_idx = i
-            break
-    if separator_idx is not None:
-        body = "\n".join(lines[separator_idx + 1 :]).strip()
-    else:
-        body = "\n".join(lines[2:]).strip()
-
-    # Try to extract date from filename
-    date_str = ""
-    fname = path.stem
-    m = re.match(r"(\d{4}-\d{2}-\d{2})", fname)
-    if m:
-        date_str = m.group(1)
-    else:
-        m = re.search(r"(\d{4})(\d{2})(\d{2})", fname)
-        if m:
-            date_str = f"{m.group(1)}-{m.group(2)}-{m.group(3)}"
-
-    return {
-        "filename": path.name,
-        "title": title,
-        "format_type": format_type,
-        "date": date_str,
-        "body": body,
-        "snippet": body[:200].replace("\n", " ").strip(),
-        "mtime": path.stat().st_mtime,
-    }
+    from contentsifter.storage.drafts import parse_draft_text
+
+    info = parse_draft_text(path.name, path.read_text())
+    info["mtime"] = path.stat().st_mtime
+    return info
@@ -0,0 +1,110 @@
+"""Tests for contentsifter.assets."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from contentsifter.assets import AssetCache, asset_cache
+from contentsifter.planning.voiceprint import load_voice_print, save_voice_print
+from contentsifter.planning.voiceprofile import VoiceProfile, load_voice_profile, save_voice_profile
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Count Path.read_text calls."""
+    count = {"n": 0}
+    original = Path.read_text
+
+    def counting(self, *args, **kwargs):
+        count["n"] += 1
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting)
+    return count
+
+
+def _touch(path: Path, text: str):
+    """Rewrite ``path`` with a different mtime even on coarse clocks."""
+    path.write_text(text)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestAssetCache:
+    def test_second_read_hits_cache(self, tmp_path, reads):
+        cache = AssetCache()
+        path = tmp_path / "ai-gate.md"
+        path.write_text("rules")
+        assert cache.read_text(path) == "rules"
+        assert cache.read_text(path) == "rules"
+        assert reads["n"] == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_changed_file_reloads(self, tmp_path):
+        cache = AssetCache()
+        path = tmp_path / "voice-print.md"
+        path.write_text("old")
+        cache.read_text(path)
+        _touch(path, "new voice")
+        assert cache.read_text(path) == "new voice"
+
+    def test_missing_file(self, tmp_path):
+        cache = AssetCache()
+        path = tmp_path / "gone.md"
+        assert cache.read_text(path) is None
+        path.write_text("x")
+        cache.read_text(path)
+        path.unlink()
+        assert cache.read_text(path) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_parsed_values_cached_separately(self, tmp_path, reads):
+        cache = AssetCache()
+        path = tmp_path / "data.json"
+        path.write_text('{"a": 1}')
+        assert cache.load(path, json.loads) == {"a": 1}
+        assert cache.load(path, json.loads) is cache.load(path, json.loads)
+        assert cache.read_text(path) == '{"a": 1}'
+        assert reads["n"] == 2
+
+    def test_memory_bounds(self, tmp_path):
+        cache = AssetCache(max_bytes=25, max_file_bytes=15)
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / name
+            path.write_text(name * 10)
+            paths.append(path)
+            cache.read_text(path)
+        big = tmp_path / "big"
+        big.write_text("x" * 20)
+        assert cache.read_text(big) == "x" * 20
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["bytes"] <= 25
+        assert stats["evictions"] == 1
+
+
+class TestCachedLoaders:
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        asset_cache.clear()
+        yield
+        asset_cache.clear()
+
+    def test_voice_print_save_refreshes(self, tmp_path, reads):
+        path = save_voice_print("First voice.", tmp_path / "voice-print.md")
+        assert load_voice_print(path) == "First voice."
+        assert load_voice_print(path) == "First voice."
+        save_voice_print("Other voice.", path)
+        assert load_voice_print(path) == "Other voice."
+        assert reads["n"] == 2
+
+    def test_voice_profile_parsed_once(self, tmp_path, reads):
+        path = save_voice_profile(VoiceProfile(word_count=900), tmp_path / "voice-profile.json")
+        first = load_voice_profile(path)
+        assert load_voice_profile(path) is first
+        assert reads["n"] == 1
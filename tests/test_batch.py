@@ -0,0 +1,164 @@
+"""Tests for contentsifter.generate.batch."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from contentsifter.generate.batch import (
+    BatchRow,
+    load_status,
+    read_batch_file,
+    run_batch,
+    status_path_for,
+)
+from contentsifter.storage.drafts import get_draft
+
+
+@pytest.fixture
+def fake_generate(monkeypatch):
+    """Replace generate_draft with one that saves a stub and records calls."""
+    calls: list[dict] = []
+    lock = threading.Lock()
+    running = {"now": 0, "peak": 0}
+
+    def fake(results, format_type, llm_client, topic=None, voice_print=None, save_to=None, voice_profile=None,
+             voice_card=None):
+        with lock:
+            calls.append({"topic": topic, "format": format_type, "sources": len(results)})
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+        time.sleep(0.05)
+        with lock:
+            running["now"] -= 1
+        if topic == "explode":
+            raise RuntimeError("API down")
+        save_to.parent.mkdir(parents=True, exist_ok=True)
+        save_to.write_text(f"# {topic}\n\n*Format: {format_type}*\n\n---\n\nDraft.\n")
+        return "Draft."
+
+    monkeypatch.setattr("contentsifter.generate.batch.generate_draft", fake)
+    return calls, running
+
+
+class TestReadBatchFile:
+    def test_csv(self, tmp_path):
+        path = tmp_path / "jobs.csv"
+        path.write_text(
+            "topic,format,category,min_quality,limit\n"
+            "linkedin headline,linkedin,qa;playbook,4,\n"
+            "networking,thread,,,\n"
+        )
+        rows = read_batch_file(path)
+        assert rows[0] == BatchRow(2, "linkedin headline", "linkedin", ["qa", "playbook"], 4, 10)
+        assert rows[1].categories == []
+        assert rows[1].min_quality == 3
+
+    def test_jsonl(self, tmp_path):
+        path = tmp_path / "jobs.jsonl"
+        path.write_text(
+            '{"topic": "linkedin", "format": "thread", "category": ["qa"]}\n'
+            "\n"
+            '{"topic": "headline", "format": "linkedin", "min_quality": 5}\n'
+        )
+        rows = read_batch_file(path)
+        assert [(r.line, r.categories, r.min_quality) for r in rows] == [(1, ["qa"], 3), (3, [], 5)]
+
+    def test_missing_field_names_line(self, tmp_path):
+        path = tmp_path / "jobs.csv"
+        path.write_text("topic,format\nok,linkedin\n,thread\n")
+        with pytest.raises(ValueError, match="Line 3"):
+            read_batch_file(path)
+
+    def test_bad_number(self, tmp_path):
+        path = tmp_path / "jobs.jsonl"
+        path.write_text('{"topic": "x", "format": "linkedin", "min_quality": "high"}\n')
+        with pytest.raises(ValueError, match="min_quality must be a number"):
+            read_batch_file(path)
+
+    def test_key_changes_with_fields(self):
+        row = BatchRow(2, "Networking", "linkedin")
+        assert row.key == BatchRow(9, "Networking", "linkedin").key
+        assert row.key != BatchRow(2, "Networking", "thread").key
+        assert row.filename.startswith("linkedin-networking-")
+
+
+class TestRunBatch:
+    def _rows(self):
+        return [
+            BatchRow(1, "linkedin", "linkedin"),
+            BatchRow(2, "headline", "thread", ["playbook"]),
+            BatchRow(3, "salary negotiation", "linkedin"),
+            BatchRow(4, "explode", "carousel"),
+        ]
+
+    def test_records_each_outcome(self, populated_db, fake_generate, tmp_path):
+        db, _ = populated_db
+        calls, _ = fake_generate
+        status_path = tmp_path / "jobs.csv.status.jsonl"
+        rows = self._rows()
+        # "explode" needs source material to reach generation
+        db.conn.execute("UPDATE extractions SET content = content || ' explode' WHERE category = 'qa'")
+        db.conn.commit()
+
+        summary = run_batch(db, rows, object(), tmp_path / "drafts", status_path)
+
+        assert (summary.total, summary.done, summary.no_source, summary.failed) == (4, 2, 1, 1)
+        status = {r["line"]: r for r in load_status(status_path).values()}
+        assert status[1]["status"] == "done"
+        assert status[3]["status"] == "no_source"
+        assert status[4]["error"] == "RuntimeError: API down"
+        assert (tmp_path / "drafts" / rows[0].filename).exists()
+        assert get_draft(db, rows[0].filename) is not None
+        assert {c["topic"]: c["sources"] for c in calls}["headline"] == 1
+
+    def test_rerun_skips_done_rows(self, populated_db, fake_generate, tmp_path):
+        db, _ = populated_db
+        calls, _ = fake_generate
+        status_path = tmp_path / "status.jsonl"
+        rows = self._rows()[:2]
+        run_batch(db, rows, object(), tmp_path / "drafts", status_path)
+        calls.clear()
+
+        summary = run_batch(db, rows + [BatchRow(5, "headline", "linkedin")], object(), tmp_path / "drafts", status_path)
+        assert summary.skipped == 2
+        assert summary.done == 1
+        assert [c["topic"] for c in calls] == ["headline"]
+
+    def test_resumes_after_partial_status_line(self, populated_db, fake_generate, tmp_path):
+        db, _ = populated_db
+        calls, _ = fake_generate
+        status_path = tmp_path / "status.jsonl"
+        rows = self._rows()[:2]
+        run_batch(db, rows, object(), tmp_path / "drafts", status_path)
+        with status_path.open("a") as f:
+            f.write('{"key": "abc", "sta')
+        calls.clear()
+
+        assert set(load_status(status_path)) == {r.key for r in rows}
+        summary = run_batch(db, rows + [BatchRow(5, "headline", "linkedin")], object(), tmp_path / "drafts", status_path)
+        assert summary.skipped == 2
+        assert [c["topic"] for c in calls] == ["headline"]
+        assert len(load_status(status_path)) == 3
+
+    def test_duplicate_rows_run_once(self, populated_db, fake_generate, tmp_path):
+        db, _ = populated_db
+        calls, _ = fake_generate
+        rows = [BatchRow(1, "linkedin", "linkedin"), BatchRow(2, "linkedin", "linkedin")]
+        summary = run_batch(db, rows, object(), tmp_path / "drafts", tmp_path / "status.jsonl")
+        assert len(calls) == 1
+        assert summary.skipped == 1
+
+    def test_concurrency_is_bounded(self, populated_db, fake_generate, tmp_path):
+        db, _ = populated_db
+        _, running = fake_generate
+        rows = [BatchRow(i, "linkedin", "linkedin", limit=i) for i in range(1, 9)]
+        summary = run_batch(db, rows, object(), tmp_path / "drafts", tmp_path / "status.jsonl", workers=3)
+        assert summary.done == 8
+        assert 1 < running["peak"] <= 3
+        assert summary.drafts_per_minute > 0
+
+    def test_default_status_path(self, tmp_path):
+        assert status_path_for(tmp_path / "jobs.csv") == tmp_path / "jobs.csv.status.jsonl"
@@ -113,6 +113,85 @@ class TestStatusCommand:
         assert "Processing Progress" in result.output or "Status" in result.output
 
 
+class TestStatsCommand:
+    def test_stats_rebuild(self, runner, cli_env):
+        tmp_path = cli_env
+        db_path = Path(tmp_path / "data" / "contentsifter.db")
+        with Database(db_path) as db:
+            pass
+        result = runner.invoke(cli, ["stats", "--rebuild"])
+        assert result.exit_code == 0
+        assert "Rebuilt stats counters" in result.output
+
+
+class TestFtsCommands:
+    def test_fts_no_db(self, runner, cli_env):
+        result = runner.invoke(cli, ["fts", "stats"])
+        assert result.exit_code == 0
+        assert "No database found" in result.output
+
+    def test_fts_stats_and_optimize(self, runner, cli_env):
+        db_path = Path(cli_env / "data" / "contentsifter.db")
+        with Database(db_path) as db:
+            pass
+        result = runner.invoke(cli, ["fts", "stats"])
+        assert result.exit_code == 0
+        assert "speaker_turns_fts" in result.output
+
+        result = runner.invoke(cli, ["fts", "optimize", "--table", "extractions_fts"])
+        assert result.exit_code == 0
+        assert "extractions_fts" in result.output
+        assert "content_items_fts" not in result.output
+
+    def test_fts_integrity_check_failure_exits_nonzero(self, runner, cli_env):
+        db_path = Path(cli_env / "data" / "contentsifter.db")
+        with Database(db_path) as db:
+            db.conn.execute(
+                "INSERT INTO content_items_fts(rowid, title, text) VALUES (99, 'ghost', 'ghost')"
+            )
+            db.conn.commit()
+
+        result = runner.invoke(cli, ["fts", "integrity-check"])
+        assert result.exit_code == 1
+        assert "FAIL" in result.output
+
+        assert runner.invoke(cli, ["fts", "rebuild"]).exit_code == 0
+        result = runner.invoke(cli, ["fts", "integrity-check"])
+        assert result.exit_code == 0
+        assert "FAIL" not in result.output
+
+
+    def test_fts_trigram_enable_and_disable(self, runner, cli_env):
+        db_path = Path(cli_env / "data" / "contentsifter.db")
+        with Database(db_path) as db:
+            pass
+        result = runner.invoke(cli, ["fts", "trigram"])
+        assert result.exit_code == 0
+        assert "Built the trigram indexes" in result.output
+
+        result = runner.invoke(cli, ["fts", "stats"])
+        assert "extractions_trigram" in result.output
+        assert "Trigram overhead" in result.output
+
+        result = runner.invoke(cli, ["fts", "trigram", "--disable"])
+        assert result.exit_code == 0
+        with Database(db_path) as db:
+            assert not db.has_trigram_index()
+
+
+class TestTuneSearchCommand:
+    def test_tune_search_saves_weights(self, runner, cli_env):
+        db_path = Path(cli_env / "data" / "contentsifter.db")
+        with Database(db_path) as db:
+            pass
+        labels = cli_env / "labels.jsonl"
+        labels.write_text(json.dumps({"query": "salary", "relevant": [1]}) + "\n")
+        result = runner.invoke(cli, ["tune-search", str(labels)])
+        assert result.exit_code == 0
+        assert "Tuned on" in result.output
+        assert (db_path.parent / "rerank-weights.json").exists()
+
+
 class TestIngestCommand:
     def test_ingest_status_only_no_db(self, runner, cli_env):
         result = runner.invoke(cli, ["ingest", "--status-only"])
@@ -240,6 +319,130 @@ class TestSearchCommand:
         assert result.exit_code == 0
         assert "No results" in result.output or "results" in result.output.lower()
 
+    def test_search_all_sources(self, runner, cli_env):
+        db_path = Path(cli_env / "data" / "contentsifter.db")
+        with Database(db_path) as db:
+            db.conn.execute(
+                "INSERT INTO content_items (content_type, title, text, char_count) "
+                "VALUES ('blog', 'Salary post', 'Negotiate your salary.', 22)"
+            )
+            db.conn.commit()
+        result = runner.invoke(cli, ["search", "salary", "--all-sources"])
+        assert result.exit_code == 0
+        assert "Salary post" in result.output
+        assert "content_item" in result.output
+
+        result = runner.invoke(cli, ["search", "salary", "--all-sources", "--semantic", "--output-format", "json"])
+        assert result.exit_code == 0
+        assert "relevance_score" in result.output
+        assert "Salary post" in result.output
+
+    def test_search_facets(self, runner, cli_env):
+        db_path = Path(cli_env / "data" / "contentsifter.db")
+        with Database(db_path) as db:
+            db.conn.execute(
+                "INSERT INTO calls (id, source_file, original_filename, title, call_date, call_type) "
+                "VALUES (1, 'a.md', 'a.md', 'Call', '2024-03-15', 'group_qa')"
+            )
+            db.conn.execute(
+                "INSERT INTO extractions (call_id, category, title, content, quality_score) "
+                "VALUES (1, 'qa', 'Salary talk', 'Negotiate your salary.', 4)"
+            )
+            db.conn.commit()
+        result = runner.invoke(cli, ["search", "salary", "--facets"])
+        assert result.exit_code == 0
+        assert "Category:" in result.output
+        assert "Year:" in result.output
+        assert "2024" in result.output
+
+    def test_search_falls_back_to_close_matches(self, runner, cli_env):
+        db_path = Path(cli_env / "data" / "contentsifter.db")
+        with Database(db_path) as db:
+            db.conn.execute(
+                "INSERT INTO calls (id, source_file, original_filename, title, call_date, call_type) "
+                "VALUES (1, 'a.md', 'a.md', 'Call', '2024-03-15', 'group_qa')"
+            )
+            db.conn.execute(
+                "INSERT INTO extractions (call_id, category, title, content, quality_score) "
+                "VALUES (1, 'qa', 'Salary talk', 'Negotiate your salary.', 4)"
+            )
+            db.conn.commit()
+            db.enable_trigram_index()
+        result = runner.invoke(cli, ["search", "salery"])
+        assert result.exit_code == 0
+        assert "close matches" in result.output
+        assert "Salary talk" in result.output
+
+
+class TestAuditDraftsCommand:
+    def _write_draft(self, cli_env, name, body):
+        drafts = cli_env / "content" / "drafts"
+        drafts.mkdir(parents=True, exist_ok=True)
+        (drafts / name).write_text(f"# Topic\n\n*Format: linkedin*\n\n---\n\n{body}\n")
+
+    def test_audit_scores_saved_drafts(self, runner, cli_env):
+        self._write_draft(cli_env, "linkedin-1.md", "Furthermore, leverage robust synergies. Moreover, it's pivotal.")
+        self._write_draft(cli_env, "linkedin-2.md", "Sent 60 applications. Zero calls. Then we fixed the top third.")
+        result = runner.invoke(cli, ["audit-drafts", "--output-format", "json"])
+        assert result.exit_code == 0
+        rows = {r["file"]: r for r in json.loads(result.output)}
+        assert rows["linkedin-1.md"]["score"] >= 0.5
+        assert rows["linkedin-1.md"]["violations"] > 0
+        assert rows["linkedin-2.md"]["score"] < 0.5
+        assert rows["linkedin-2.md"]["format"] == "linkedin"
+
+    def test_audit_flagged_only(self, runner, cli_env):
+        self._write_draft(cli_env, "linkedin-1.md", "Furthermore, leverage robust synergies. Moreover, it's pivotal.")
+        self._write_draft(cli_env, "linkedin-2.md", "Sent 60 applications. Zero calls. Then we fixed the top third.")
+        result = runner.invoke(cli, ["audit-drafts", "--flagged"])
+        assert result.exit_code == 0
+        assert "linkedin-1.md" in result.output
+        assert "linkedin-2.md" not in result.output
+
+    def test_audit_no_drafts(self, runner, cli_env):
+        result = runner.invoke(cli, ["audit-drafts"])
+        assert result.exit_code == 0
+        assert "No drafts found" in result.output
+
+
+class TestVoiceProfileCommand:
+    def test_too_little_text(self, runner, cli_env):
+        with Database(cli_env / "data" / "contentsifter.db"):
+            pass
+        result = runner.invoke(cli, ["voice-profile"])
+        assert result.exit_code == 0
+        assert "for a voice profile" in result.output
+        assert not (cli_env / "content" / "voice-profile.json").exists()
+
+    def test_saves_profile(self, runner, cli_env):
+        with Database(cli_env / "data" / "contentsifter.db") as db:
+            for _ in range(60):
+                db.conn.execute(
+                    "INSERT INTO content_items (content_type, text, char_count) VALUES ('linkedin', ?, 50)",
+                    ("Sent 60 applications. Zero calls. Then we fixed the top third.",),
+                )
+            db.conn.commit()
+        result = runner.invoke(cli, ["voice-profile"])
+        assert result.exit_code == 0
+        assert "Voice profile saved" in result.output
+        assert (cli_env / "content" / "voice-profile.json").exists()
+
+
+class TestVoiceCardCommand:
+    def test_needs_voice_print(self, runner, cli_env):
+        result = runner.invoke(cli, ["voice-card"])
+        assert result.exit_code != 0
+        assert "No voice print" in result.output
+
+    def test_builds_card(self, runner, cli_env):
+        rules = "\n".join(f"- Rule {i}: keep it short and never hedge." for i in range(200))
+        (cli_env / "content").mkdir(parents=True, exist_ok=True)
+        (cli_env / "content" / "voice-print.md").write_text(f"# Voice Print: Test\n\n## Quick Reference\n\n{rules}\n")
+        result = runner.invoke(cli, ["voice-card"])
+        assert result.exit_code == 0
+        assert "fewer per draft prompt" in result.output
+        assert (cli_env / "content" / "voice-card.md").exists()
+
 
 class TestExportCommand:
     def test_export_no_db(self, runner, cli_env):
@@ -247,3 +450,45 @@ class TestExportCommand:
         result = runner.invoke(cli, ["export"])
         assert result.exit_code == 0
         assert "Exported" in result.output or "0" in result.output
+
+
+class TestGenerateBatchCommand:
+    def test_runs_and_resumes(self, runner, cli_env, monkeypatch):
+        with Database(cli_env / "data" / "contentsifter.db") as db:
+            db.conn.execute(
+                "INSERT INTO calls (id, source_file, original_filename, title, call_date, call_type) "
+                "VALUES (1, 'a.md', 'a.md', 'Call', '2024-01-01', 'coaching')"
+            )
+            db.conn.execute(
+                "INSERT INTO extractions (call_id, category, title, content, quality_score) "
+                "VALUES (1, 'playbook', 'Headline formula', 'Lead with the outcome.', 5)"
+            )
+            db.conn.commit()
+        job = cli_env / "jobs.csv"
+        job.write_text("topic,format\nheadline,linkedin\nsalary,thread\n")
+
+        def fake(results, format_type, llm_client, topic=None, voice_print=None, save_to=None, voice_profile=None,
+                 voice_card=None):
+            save_to.parent.mkdir(parents=True, exist_ok=True)
+            save_to.write_text("Draft.")
+            return "Draft."
+
+        monkeypatch.setattr("contentsifter.cli.create_llm_client", lambda *args: object())
+        monkeypatch.setattr("contentsifter.generate.batch.generate_draft", fake)
+
+        result = runner.invoke(cli, ["generate-batch", str(job)])
+        assert result.exit_code == 0, result.output
+        assert "drafts/min" in result.output
+        assert "rows had no source material" in result.output
+        assert len(list((cli_env / "content" / "drafts").glob("linkedin-headline-*.md"))) == 1
+
+        result = runner.invoke(cli, ["generate-batch", str(job)])
+        assert "rows already done" in result.output
+        assert len(list((cli_env / "content" / "drafts").glob("*.md"))) == 1
+
+    def test_bad_job_file(self, runner, cli_env):
+        job = cli_env / "jobs.csv"
+        job.write_text("topic,format\n,linkedin\n")
+        result = runner.invoke(cli, ["generate-batch", str(job)])
+        assert result.exit_code != 0
+        assert "Line 2" in result.output
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from contentsifter.storage.database import Database
+from contentsifter.storage.database import TRIGRAM_TABLES, Database
 
 
 class TestDatabase:
@@ -74,3 +74,210 @@ class TestDatabase:
                 "SELECT name FROM sqlite_master WHERE type='table' AND name = 'content_items_fts'"
             ).fetchall()
             assert len(tables) == 1
+
+    def test_stats_counters_follow_inserts_and_deletes(self, tmp_path):
+        db_path = tmp_path / "test.db"
+        with Database(db_path) as db:
+            db.conn.execute(
+                "INSERT INTO content_items (content_type, text, char_count) VALUES ('blog', 'abc', 3)"
+            )
+            db.conn.execute(
+                "INSERT INTO content_items (content_type, text, char_count) VALUES ('blog', 'hello', 5)"
+            )
+            db.conn.execute("DELETE FROM content_items WHERE char_count = 3")
+            rows = db.conn.execute(
+                "SELECT scope, value FROM stats_counters WHERE key = 'blog'"
+            ).fetchall()
+            counters = {r["scope"]: r["value"] for r in rows}
+            assert counters == {"content_type": 1, "content_chars": 5}
+
+    def test_rebuild_stats_counters(self, tmp_path):
+        db_path = tmp_path / "test.db"
+        with Database(db_path) as db:
+            db.conn.execute(
+                "INSERT INTO content_items (content_type, text, char_count) VALUES ('email', 'hi', 2)"
+            )
+            db.conn.execute("UPDATE stats_counters SET value = 99")
+            db.rebuild_stats_counters()
+            row = db.conn.execute(
+                "SELECT value FROM stats_counters WHERE scope = 'content_type' AND key = 'email'"
+            ).fetchone()
+            assert row["value"] == 1
+
+    def test_migration_backfills_stats_counters(self, tmp_path):
+        db_path = tmp_path / "test.db"
+        with Database(db_path) as db:
+            db.conn.execute(
+                "INSERT INTO content_items (content_type, text, char_count) VALUES ('blog', 'abc', 3)"
+            )
+            # Simulate a v3 database that predates the counters table
+            db.conn.execute("DELETE FROM stats_counters")
+            db.conn.execute("UPDATE schema_version SET version = 3")
+            db.conn.commit()
+
+        with Database(db_path) as db:
+            row = db.conn.execute(
+                "SELECT value FROM stats_counters WHERE scope = 'content_type' AND key = 'blog'"
+            ).fetchone()
+            assert row["value"] == 1
+
+    def test_migration_resolves_speakers(self, tmp_path):
+        db_path = tmp_path / "test.db"
+        with Database(db_path) as db:
+            db.conn.execute(
+                """INSERT INTO calls (source_file, original_filename, title, call_date, call_type)
+                   VALUES ('m.md', 'c.md', 'Call', '2024-01-01', 'coaching')"""
+            )
+            db.conn.execute(
+                """INSERT INTO participants (call_id, display_name, is_coach)
+                   VALUES (1, 'Coach', 1)"""
+            )
+            db.conn.execute(
+                """INSERT INTO speaker_turns (call_id, turn_index, speaker_name, text, timestamp)
+                   VALUES (1, 0, 'Coach', 'Hello there', '00:00:01')"""
+            )
+            # Simulate a v4 database written before speaker resolution existed
+            db.conn.execute("DELETE FROM speakers")
+            db.conn.execute("UPDATE speaker_turns SET speaker_id = NULL, char_len = NULL")
+            db.conn.execute("UPDATE schema_version SET version = 4")
+            db.conn.commit()
+
+        with Database(db_path) as db:
+            row = db.conn.execute(
+                """SELECT st.char_len, s.is_coach FROM speaker_turns st
+                   JOIN speakers s ON s.id = st.speaker_id"""
+            ).fetchone()
+            assert row["char_len"] == len("Hello there")
+            assert row["is_coach"] == 1
+
+
+class TestFtsMaintenance:
+    def _turn_hits(self, db, term):
+        return db.conn.execute(
+            "SELECT COUNT(*) FROM speaker_turns_fts WHERE speaker_turns_fts MATCH ?",
+            (term,),
+        ).fetchone()[0]
+
+    def test_turn_delete_and_update_sync_index(self, populated_db):
+        db, call_id = populated_db
+        assert self._turn_hits(db, "linkedin") > 0
+
+        db.conn.execute(
+            "UPDATE speaker_turns SET text = 'rewritten' WHERE call_id = ? AND turn_index = 0",
+            (call_id,),
+        )
+        assert self._turn_hits(db, "rewritten") == 1
+
+        db.conn.execute("DELETE FROM speaker_turns WHERE call_id = ?", (call_id,))
+        assert self._turn_hits(db, "linkedin") == 0
+        assert self._turn_hits(db, "rewritten") == 0
+        assert all(err is None for err in db.check_fts_integrity().values())
+
+    def test_integrity_check_detects_stale_rows(self, populated_db):
+        db, call_id = populated_db
+        db.conn.execute("DROP TRIGGER speaker_turns_ad")
+        db.conn.execute("DELETE FROM speaker_turns WHERE call_id = ?", (call_id,))
+
+        results = db.check_fts_integrity()
+        assert results["speaker_turns_fts"] is not None
+        assert results["extractions_fts"] is None
+
+        db.rebuild_fts(("speaker_turns_fts",))
+        assert db.check_fts_integrity(("speaker_turns_fts",)) == {"speaker_turns_fts": None}
+
+    def test_optimize_merges_segments(self, tmp_path):
+        with Database(tmp_path / "test.db") as db:
+            for i in range(5):
+                db.conn.execute(
+                    "INSERT INTO content_items (content_type, title, text, char_count) "
+                    "VALUES ('blog', ?, 'Body text', 9)",
+                    (f"Post {i}",),
+                )
+                db.conn.commit()
+
+            def segments():
+                stats = db.fts_segment_stats(("content_items_fts",))[0]
+                assert stats["rows"] == 5
+                return stats["segments"]
+
+            assert segments() > 1
+            db.optimize_fts()
+            assert segments() == 1
+
+    def test_segment_stats_count_indexed_rows(self, tmp_db):
+        tmp_db.conn.execute(
+            "INSERT INTO content_items (id, content_type, title, text, char_count) "
+            "VALUES (1, 'blog', 'Post', 'Body text', 9)"
+        )
+        # Drop the document from the index but keep the content row
+        tmp_db.conn.execute(
+            "INSERT INTO content_items_fts (content_items_fts, rowid, title, text) "
+            "VALUES ('delete', 1, 'Post', 'Body text')"
+        )
+        tmp_db.conn.commit()
+        assert tmp_db.fts_segment_stats(("content_items_fts",))[0]["rows"] == 0
+
+    def test_optimize_after_load_threshold(self, tmp_db):
+        assert tmp_db.optimize_fts_after_load("extractions_fts", 10) is False
+        assert tmp_db.optimize_fts_after_load("extractions_fts", 5000) is True
+
+    def test_migration_rebuilds_turn_index(self, populated_db):
+        db, call_id = populated_db
+        db.conn.execute("DROP TRIGGER speaker_turns_ad")
+        db.conn.execute("DELETE FROM speaker_turns WHERE call_id = ?", (call_id,))
+        db.conn.execute("UPDATE schema_version SET version = 5")
+        db.conn.commit()
+        db.initialize()
+
+        assert self._turn_hits(db, "linkedin") == 0
+        assert db.check_fts_integrity(("speaker_turns_fts",)) == {"speaker_turns_fts": None}
+
+    def test_migration_adds_prefix_indexes(self, populated_db):
+        db, _ = populated_db
+        db.conn.execute("DROP TABLE extractions_fts")
+        db.conn.execute(
+            """CREATE VIRTUAL TABLE extractions_fts USING fts5(
+                title, content, raw_quote, context_note,
+                content=extractions, content_rowid=id, tokenize='porter unicode61')"""
+        )
+        db.conn.execute("UPDATE schema_version SET version = 6")
+        db.conn.commit()
+        db.initialize()
+
+        sql = db.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'extractions_fts'"
+        ).fetchone()["sql"]
+        assert "prefix='2 3'" in sql
+        hits = db.conn.execute(
+            "SELECT COUNT(*) FROM extractions_fts WHERE extractions_fts MATCH 'li*'"
+        ).fetchone()[0]
+        assert hits > 0
+        assert db.check_fts_integrity(("extractions_fts",)) == {"extractions_fts": None}
+
+    def test_trigram_index_enable_and_disable(self, populated_db):
+        db, _ = populated_db
+        assert not db.has_trigram_index()
+        assert db.trigram_overhead()["trigram_bytes"] == 0
+
+        db.enable_trigram_index()
+        assert db.has_trigram_index()
+        hits = db.conn.execute(
+            "SELECT COUNT(*) FROM extractions_trigram WHERE extractions_trigram MATCH 'nkedi'"
+        ).fetchone()[0]
+        assert hits == 2
+        assert all(err is None for err in db.check_fts_integrity(tuple(TRIGRAM_TABLES)).values())
+        overhead = db.trigram_overhead()
+        assert overhead["trigram_bytes"] > 0
+        assert overhead["ratio"] > 0
+
+        db.disable_trigram_index()
+        assert not db.has_trigram_index()
+        # Writes still work once the triggers are gone
+        db.conn.execute("DELETE FROM extractions")
+        db.conn.commit()
+
+    def test_rank_uses_column_weights(self, tmp_db):
+        config = dict(
+            tuple(r) for r in tmp_db.conn.execute("SELECT k, v FROM extractions_fts_config")
+        )
+        assert config["rank"] == "bm25(10.0, 4.0, 2.0, 1.0)"
@@ -0,0 +1,149 @@
+"""Tests for contentsifter.storage.drafts."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from contentsifter.storage.drafts import (
+    count_drafts,
+    delete_draft_file,
+    get_draft,
+    list_drafts,
+    parse_draft_text,
+    save_draft_file,
+    search_drafts,
+    sync_drafts,
+)
+
+
+def _write(drafts_dir: Path, filename: str, title: str, body: str, fmt: str = "linkedin") -> Path:
+    path = drafts_dir / filename
+    path.write_text(f"# {title}\n\n*Format: {fmt}*\n\n---\n\n{body}\n")
+    return path
+
+
+@pytest.fixture
+def drafts_dir(tmp_path):
+    path = tmp_path / "drafts"
+    path.mkdir()
+    return path
+
+
+class TestParseDraftText:
+    def test_header_and_body(self):
+        info = parse_draft_text(
+            "linkedin-20260222-120000.md",
+            "# Pricing Lessons\n\n*Format: linkedin | Voice match: 0.82*\n\n---\n\nCharge more.\n",
+        )
+        assert info["title"] == "Pricing Lessons"
+        assert info["format_type"] == "linkedin"
+        assert info["date"] == "2026-02-22"
+        assert info["body"] == "Charge more."
+
+    def test_plain_file_falls_back_to_stem(self):
+        info = parse_draft_text("2026-03-01-notes.md", "just some text")
+        assert info["title"] == "2026-03-01-notes"
+        assert info["format_type"] == ""
+        assert info["date"] == "2026-03-01"
+
+
+class TestSyncDrafts:
+    def test_add_update_remove(self, tmp_db, drafts_dir):
+        first = _write(drafts_dir, "linkedin-20260222-120000.md", "Pricing", "Charge more.")
+        _write(drafts_dir, "thread-20260221-100000.md", "Hiring", "Hire slowly.", "thread")
+        assert sync_drafts(tmp_db, drafts_dir) == {"added": 2, "updated": 0, "removed": 0}
+        assert count_drafts(tmp_db) == 2
+
+        # Nothing changed
+        assert sync_drafts(tmp_db, drafts_dir) == {"added": 0, "updated": 0, "removed": 0}
+
+        first.write_text("# Pricing Again\n\n*Format: linkedin*\n\n---\n\nCharge much more.\n")
+        (drafts_dir / "thread-20260221-100000.md").unlink()
+        counts = sync_drafts(tmp_db, drafts_dir)
+        assert counts == {"added": 0, "updated": 1, "removed": 1}
+        assert [d["title"] for d in list_drafts(tmp_db)] == ["Pricing Again"]
+
+    def test_list_newest_first_without_body(self, tmp_db, drafts_dir):
+        _write(drafts_dir, "linkedin-20260220-090000.md", "Older", "a")
+        _write(drafts_dir, "linkedin-20260222-090000.md", "Newer", "b")
+        sync_drafts(tmp_db, drafts_dir)
+        rows = list_drafts(tmp_db)
+        assert [r["title"] for r in rows] == ["Newer", "Older"]
+        assert "body" not in rows[0]
+        assert rows[0]["mtime"] > 0
+        assert [r["title"] for r in list_drafts(tmp_db, limit=1, offset=1)] == ["Older"]
+
+    def test_unchanged_files_not_reread(self, tmp_db, drafts_dir, monkeypatch):
+        _write(drafts_dir, "linkedin-20260222-120000.md", "Pricing", "Charge more.")
+        sync_drafts(tmp_db, drafts_dir)
+
+        def no_read(*args, **kwargs):
+            raise AssertionError("unchanged draft was re-read")
+
+        monkeypatch.setattr(Path, "read_text", no_read)
+        assert sync_drafts(tmp_db, drafts_dir) == {"added": 0, "updated": 0, "removed": 0}
+
+    def test_in_place_rewrite_is_picked_up(self, tmp_db, drafts_dir):
+        path = _write(drafts_dir, "linkedin-20260222-120000.md", "Post", "old body")
+        sync_drafts(tmp_db, drafts_dir)
+        with open(path, "r+") as f:
+            f.seek(0)
+            f.write("# Post\n\n*Format: linkedin*\n\n---\n\nnew body, longer\n")
+        assert sync_drafts(tmp_db, drafts_dir)["updated"] == 1
+        assert get_draft(tmp_db, path.name)["body"] == "new body, longer"
+
+    def test_force_rereads_everything(self, tmp_db, drafts_dir):
+        _write(drafts_dir, "linkedin-20260222-120000.md", "Pricing", "Charge more.")
+        sync_drafts(tmp_db, drafts_dir)
+        assert sync_drafts(tmp_db, drafts_dir, force=True)["updated"] == 1
+
+    def test_missing_directory_clears_index(self, tmp_db, drafts_dir):
+        _write(drafts_dir, "linkedin-20260222-120000.md", "Pricing", "Charge more.")
+        sync_drafts(tmp_db, drafts_dir)
+        assert sync_drafts(tmp_db, drafts_dir.parent / "missing")["removed"] == 1
+        assert count_drafts(tmp_db) == 0
+
+
+class TestSearchDrafts:
+    def test_matches_title_and_body(self, tmp_db, drafts_dir):
+        _write(drafts_dir, "linkedin-20260222-120000.md", "Pricing Lessons", "Charge more for coaching.")
+        _write(drafts_dir, "thread-20260221-100000.md", "Hiring", "Your pricing page matters.", "thread")
+        _write(drafts_dir, "newsletter-20260220-100000.md", "Weekly", "Nothing relevant.", "newsletter")
+        sync_drafts(tmp_db, drafts_dir)
+
+        rows = search_drafts(tmp_db, "pricing")
+        assert [r["title"] for r in rows] == ["Pricing Lessons", "Hiring"]
+        assert search_drafts(tmp_db, "coach*")[0]["title"] == "Pricing Lessons"
+        assert search_drafts(tmp_db, "") == []
+
+    def test_index_follows_updates(self, tmp_db, drafts_dir):
+        path = _write(drafts_dir, "linkedin-20260222-120000.md", "Post", "About pricing.")
+        sync_drafts(tmp_db, drafts_dir)
+        path.write_text("# Post\n\n*Format: linkedin*\n\n---\n\nAbout hiring now.\n")
+        sync_drafts(tmp_db, drafts_dir)
+        assert search_drafts(tmp_db, "pricing") == []
+        assert len(search_drafts(tmp_db, "hiring")) == 1
+        assert tmp_db.check_fts_integrity(("drafts_fts",)) == {"drafts_fts": None}
+
+
+class TestSaveAndDelete:
+    def test_save_indexes_immediately(self, tmp_db, tmp_path):
+        drafts_dir = tmp_path / "new-drafts"
+        save_draft_file(
+            tmp_db, drafts_dir, "linkedin-20260222-120000.md",
+            "# Saved\n\n*Format: linkedin*\n\n---\n\nFresh body.\n",
+        )
+        assert (drafts_dir / "linkedin-20260222-120000.md").exists()
+        draft = get_draft(tmp_db, "linkedin-20260222-120000.md")
+        assert draft["title"] == "Saved"
+        assert draft["body"] == "Fresh body."
+
+    def test_delete_removes_file_and_row(self, tmp_db, drafts_dir):
+        path = _write(drafts_dir, "linkedin-20260222-120000.md", "Gone", "Bye.")
+        sync_drafts(tmp_db, drafts_dir)
+        assert delete_draft_file(tmp_db, drafts_dir, path.name) is True
+        assert not path.exists()
+        assert get_draft(tmp_db, path.name) is None
+        assert delete_draft_file(tmp_db, drafts_dir, path.name) is False
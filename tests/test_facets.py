@@ -0,0 +1,61 @@
+"""Tests for contentsifter.search.facets."""
+
+from __future__ import annotations
+
+from contentsifter.search.facets import facet_counts, facet_index
+from contentsifter.search.filters import SearchFilters
+
+
+class TestFacetCounts:
+    def test_counts_every_facet(self, populated_db):
+        db, _ = populated_db
+        counts = facet_counts(db, "linkedin")
+        assert counts["category"] == {"playbook": 1, "qa": 1}
+        assert counts["tag"] == {"linkedin": 2, "personal_branding": 1, "resume": 1}
+        assert counts["call_type"] == {"group_qa": 2}
+        assert counts["year"] == {"2024": 2}
+
+    def test_matches_only(self, populated_db):
+        db, _ = populated_db
+        counts = facet_counts(db, "formula")
+        assert counts["category"] == {"playbook": 1}
+        assert counts["tag"] == {"linkedin": 1, "resume": 1}
+
+    def test_facet_ignores_its_own_filter(self, populated_db):
+        db, _ = populated_db
+        counts = facet_counts(db, "linkedin", SearchFilters(categories=["qa"]))
+        # Other categories still counted, but other facets respect the filter
+        assert counts["category"] == {"playbook": 1, "qa": 1}
+        assert counts["tag"] == {"linkedin": 1, "personal_branding": 1}
+
+    def test_tag_filter_narrows_other_facets(self, populated_db):
+        db, _ = populated_db
+        counts = facet_counts(db, "", SearchFilters(tags=["resume"]))
+        assert counts["category"] == {"playbook": 1}
+        assert counts["tag"]["linkedin"] == 2
+
+    def test_sql_side_filters(self, populated_db):
+        db, _ = populated_db
+        counts = facet_counts(db, "linkedin", SearchFilters(min_quality=5))
+        assert counts["category"] == {"playbook": 1}
+        counts = facet_counts(db, "linkedin", SearchFilters(date_from="2025-01-01"))
+        assert all(not values for values in counts.values())
+
+    def test_requested_facets_only(self, populated_db):
+        db, _ = populated_db
+        counts = facet_counts(db, "linkedin", SearchFilters(facets=["year", "category"]))
+        assert list(counts) == ["category", "year"]
+
+    def test_index_rebuilt_after_changes(self, populated_db):
+        db, call_id = populated_db
+        index = facet_index(db)
+        assert facet_index(db) is index
+
+        db.conn.execute(
+            "INSERT INTO extractions (call_id, category, title, content, quality_score) "
+            "VALUES (?, 'story', 'LinkedIn win', 'Landed a job via LinkedIn.', 3)",
+            (call_id,),
+        )
+        db.conn.commit()
+        assert facet_counts(db, "linkedin")["category"]["story"] == 1
+        assert facet_index(db) is not index
@@ -0,0 +1,76 @@
+"""Tests for contentsifter.search.fuzzy."""
+
+from __future__ import annotations
+
+import pytest
+
+from contentsifter.search.filters import SearchFilters
+from contentsifter.search.fuzzy import fuzzy_content_items, fuzzy_search
+from contentsifter.search.keyword import keyword_search
+
+
+@pytest.fixture
+def trigram_db(populated_db):
+    """Populated database with the trigram indexes enabled."""
+    db, _ = populated_db
+    db.enable_trigram_index()
+    return db
+
+
+class TestFuzzySearch:
+    def test_requires_trigram_index(self, populated_db):
+        db, _ = populated_db
+        assert fuzzy_search(db, "linkdin") == []
+
+    def test_matches_misspelling(self, trigram_db):
+        assert keyword_search(trigram_db, "linkdin") == []
+        results = fuzzy_search(trigram_db, "linkdin")
+        assert len(results) == 2
+        assert all(0 < r["relevance_score"] < 1 for r in results)
+        assert "linkedin" in results[0]["tags"]
+        assert all("cursor" not in r for r in results)
+
+    def test_matches_substring(self, trigram_db):
+        # "eadlin" is inside "headline" but isn't a word porter would index
+        results = fuzzy_search(trigram_db, "eadlin")
+        assert results
+        assert results[0]["relevance_score"] == 1.0
+
+    def test_unrelated_query_returns_nothing(self, trigram_db):
+        assert fuzzy_search(trigram_db, "salary negotiation") == []
+
+    def test_short_words_return_nothing(self, trigram_db):
+        assert fuzzy_search(trigram_db, "li") == []
+
+    def test_respects_filters(self, trigram_db):
+        results = fuzzy_search(trigram_db, "linkdin", SearchFilters(categories=["playbook"]))
+        assert [r["title"] for r in results] == ["LinkedIn headline formula"]
+
+    def test_snippets(self, trigram_db):
+        results = fuzzy_search(trigram_db, "headlne", snippets=True)
+        assert results
+        assert "snippet" in results[0]
+        assert "content" not in results[0]
+
+    def test_index_follows_writes(self, trigram_db):
+        trigram_db.conn.execute(
+            "UPDATE extractions SET title = 'Negotiating an offer' WHERE title = 'LinkedIn headline formula'"
+        )
+        trigram_db.conn.commit()
+        assert [r["title"] for r in fuzzy_search(trigram_db, "negotiatng")] == ["Negotiating an offer"]
+
+
+class TestFuzzyContentItems:
+    def test_matches_misspelled_item(self, trigram_db):
+        trigram_db.conn.execute(
+            """INSERT INTO content_items (content_type, title, text, char_count)
+               VALUES ('linkedin', 'Portfolio tips', 'Show your portfolio early.', 26)"""
+        )
+        trigram_db.conn.commit()
+        results = fuzzy_content_items(trigram_db, "portfollio")
+        assert [r["title"] for r in results] == ["Portfolio tips"]
+        assert results[0]["source"] == "content_item"
+
+    def test_source_filter_excludes_items(self, trigram_db):
+        filters = SearchFilters(categories=["qa"])
+        assert fuzzy_content_items(trigram_db, "linkdin", filters) == []
@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+import time
 from unittest.mock import MagicMock
 
 import pytest
 
-from contentsifter.generate.drafts import format_source_material, _inject_voice_context
+from contentsifter.generate.drafts import format_source_material, _inject_voice_context, generate_drafts_multi
 from contentsifter.generate.gates import (
+    AI_GATE_SYSTEM,
+    RETRY_SYSTEM,
+    VOICE_GATE_SYSTEM,
     _hard_cleanup,
     verify_draft,
     _format_violations_for_llm,
+    plan_ai_gate,
+    plan_voice_gate,
     run_content_gates,
 )
+from contentsifter.generate.sources import SOURCE_TOKEN_BUDGETS, estimate_tokens, pack_sources
 from contentsifter.generate.templates import TEMPLATES
 
 
@@ -77,6 +84,56 @@ class TestFormatSourceMaterial:
         assert format_source_material([]) == ""
 
 
+class TestPackSources:
+    LONG = "Rewrite the headline around outcomes. " * 60
+
+    def _result(self, title, content, quality=3, quote=None):
+        return {"title": title, "category": "qa", "content": content, "raw_quote": quote,
+                "tags": [], "quality_score": quality}
+
+    def test_everything_fits(self):
+        results = [self._result("A", "One."), self._result("B", "Two.")]
+        assert pack_sources(results, 1500) == results
+
+    def test_quality_outweighs_small_rank_gap(self):
+        results = [self._result("Low", self.LONG, quality=1), self._result("High", self.LONG, quality=5)]
+        packed = pack_sources(results, 400)
+        assert packed[0]["title"] == "High"
+
+    def test_near_duplicates_dropped(self):
+        results = [
+            self._result("Headline tips", "Lead with the outcome you deliver for clients."),
+            self._result("Headline tips", "Lead with the outcome you deliver for clients!"),
+            self._result("Salary", "Ask for the range before the first interview."),
+        ]
+        assert [r["title"] for r in pack_sources(results, 1500)] == ["Headline tips", "Salary"]
+
+    def test_prefers_quote_when_tight(self):
+        results = [
+            self._result("First", self.LONG),
+            self._result("Second", self.LONG, quote="Nobody reads objectives."),
+        ]
+        packed = pack_sources(results, 700)
+        assert packed[1]["content"] == ""
+        assert packed[1]["raw_quote"] == "Nobody reads objectives."
+        assert "Nobody reads objectives." in format_source_material(results, 700)
+
+    def test_trims_at_sentence_and_respects_budget(self):
+        results = [self._result("First", self.LONG), self._result("Second", "Different topic. " * 200)]
+        output = format_source_material(results, 800)
+        assert estimate_tokens(output) <= 800
+        assert output.rstrip().endswith(".")
+        assert results[1]["content"] == "Different topic. " * 200
+
+    def test_top_result_always_included(self):
+        packed = pack_sources([self._result("Only", self.LONG * 5)], 300)
+        assert len(packed) == 1
+        assert len(packed[0]["content"]) <= 300 * 4
+
+    def test_every_format_has_a_budget(self):
+        assert set(SOURCE_TOKEN_BUDGETS) == set(TEMPLATES)
+
+
 class TestInjectVoiceContext:
     def test_with_placeholder(self):
         system = "Write content.{voice_context}"
@@ -203,6 +260,15 @@ class TestHardCleanup:
         fixable = [v for v in violations if v.category in ("char", "semicolon", "asterisk", "emoji")]
         assert fixable == [], f"Hard cleanup missed: {fixable}"
 
+    def test_swaps_cascade_like_sequential_subs(self):
+        """A phrase swap can form a shorter phrase, which is then swapped too."""
+        assert _hard_cleanup("In the realm of order to win") == "to win"
+
+    def test_swaps_match_unicode_case_variants(self):
+        """IGNORECASE treats 'ſ' as 's', so 'ſhed light' is still swapped."""
+        assert _hard_cleanup("We ſhed light on it.") == "We show it."
+        assert _hard_cleanup("UTİLİZE it.") == "use it."
+
 
 class TestVerifyDraft:
     def test_clean_draft_passes(self):
@@ -276,6 +342,28 @@ class TestVerifyDraft:
         dash_viols = [v for v in violations if v.category == "char"]
         assert dash_viols[0].line_number == 2
 
+    def test_overlapping_phrases_both_reported(self):
+        violations = verify_draft("As we navigate the market")
+        matched = {v.matched for v in violations}
+        assert {"as we navigate", "navigate the"} <= matched
+
+    def test_one_violation_per_rule_per_line(self):
+        violations = verify_draft("utilize, utilize; utilize\nutilize")
+        assert [(v.category, v.line_number) for v in violations] == [
+            ("semicolon", 1), ("word", 1), ("word", 2),
+        ]
+
+    def test_repeated_draft_verifies_and_cleans(self):
+        # Throughput is measured by scripts/bench_verify_draft.py
+        draft = (
+            "Most people treat their resume like a history lesson. It isn't.\n\n"
+            "Here's what we do instead. Start with the role you want.\n"
+            "✅ Lead with outcomes\n✅ Cut the filler\n\n"
+            "Let's leverage that in order to land the interview.\n"
+        ) * 3
+        assert len(verify_draft(draft)) == 6
+        assert "in order to" not in _hard_cleanup(draft)
+
 
 class TestFormatViolations:
     def test_formats_violations(self):
@@ -324,7 +412,7 @@ class TestRunContentGatesRetry:
         monkeypatch.setattr("contentsifter.generate.gates._create_light_client", lambda: None)
 
         result = run_content_gates(
-            "Some draft.",
+            "Some draft — you should utilize it.",
             llm_client=MagicMock(),
             voice_print="Match this voice.",
             ai_gate_doc="AI gate rules.",
@@ -358,7 +446,7 @@ class TestRunContentGatesRetry:
         monkeypatch.setattr("contentsifter.generate.gates._create_light_client", lambda: None)
 
         result = run_content_gates(
-            "Some draft.",
+            "Some draft — you should utilize it.",
             llm_client=MagicMock(),
             voice_print="Voice print.",
             ai_gate_doc="AI gate rules.",
@@ -391,3 +479,176 @@ class TestRunContentGatesRetry:
         assert "furthermore" not in result.lower()
         assert "robust" not in result.lower()
         assert "seamless" not in result.lower()
+
+
+class TestGatePolicy:
+    def _count_calls(self, monkeypatch, content="Clean output with no violations."):
+        from contentsifter.llm.client import LLMResponse
+        systems: list[str] = []
+
+        def mock_complete(client, system, user, max_tokens):
+            systems.append(system)
+            return LLMResponse(content=content, input_tokens=100, output_tokens=100, model="test")
+
+        monkeypatch.setattr("contentsifter.generate.gates.complete_with_retry", mock_complete)
+        monkeypatch.setattr("contentsifter.generate.gates._create_light_client", lambda: None)
+        return systems
+
+    def test_clean_draft_skips_ai_gate(self, monkeypatch):
+        systems = self._count_calls(monkeypatch)
+        run_content_gates(
+            "A clean draft.", llm_client=MagicMock(),
+            voice_print="Voice print.", ai_gate_doc="AI gate rules.",
+        )
+        # Voice gate only
+        assert len(systems) == 1
+        assert systems[0].startswith(VOICE_GATE_SYSTEM)
+
+    def test_clean_draft_without_voice_print_makes_no_calls(self, monkeypatch):
+        systems = self._count_calls(monkeypatch)
+        result = run_content_gates("A clean draft.", llm_client=MagicMock(), ai_gate_doc="AI gate rules.")
+        assert systems == []
+        assert result == "A clean draft."
+
+    def test_sparse_violations_get_targeted_fix(self, monkeypatch):
+        systems = self._count_calls(monkeypatch)
+        draft = "We talked through the plan for next quarter and it looks solid. " * 12 + "Utilize it."
+        run_content_gates(draft, llm_client=MagicMock(), ai_gate_doc="AI gate rules.")
+        assert len(systems) == 1
+        assert systems[0].startswith(RETRY_SYSTEM)
+
+    def test_dense_violations_run_full_gate(self, monkeypatch):
+        systems = self._count_calls(monkeypatch)
+        run_content_gates("Utilize this robust — seamless plan.", llm_client=MagicMock(), ai_gate_doc="AI gate rules.")
+        assert systems[0].startswith(AI_GATE_SYSTEM)
+
+    def test_plan_thresholds_are_per_format(self):
+        draft = "We talked through the plan for next quarter and it looks solid. " * 12 + "Utilize it."
+        decision, violations = plan_ai_gate(draft, "newsletter")
+        assert decision.action == "targeted"
+        assert [v.matched for v in violations] == ["utilize"]
+        assert plan_ai_gate(draft, "linkedin")[0].action == "run"
+        assert plan_ai_gate("A clean draft.", "email-sales")[0].action == "run"
+
+    def test_hard_cleanup_still_runs_when_gates_skipped(self, monkeypatch):
+        self._count_calls(monkeypatch)
+        result = run_content_gates("A clean   draft.", llm_client=MagicMock(), ai_gate_doc="AI gate rules.")
+        assert result == "A clean draft."
+
+    def test_decisions_are_logged(self, monkeypatch, caplog):
+        self._count_calls(monkeypatch)
+        with caplog.at_level("INFO", logger="contentsifter.generate.gates"):
+            run_content_gates("A clean draft.", llm_client=MagicMock(), ai_gate_doc="AI gate rules.")
+        assert "Gate ai: skip (no rule violations, AI-pattern score 0.00)" in caplog.text
+        assert "Gate voice: skip (no voice print)" in caplog.text
+
+    def _stub_similarity(self, monkeypatch, score):
+        from contentsifter.planning.voiceprofile import VoiceMatch
+        monkeypatch.setattr(
+            "contentsifter.planning.voiceprofile.voice_similarity",
+            lambda draft, profile: VoiceMatch(score),
+        )
+
+    def test_matching_voice_skips_voice_gate(self, monkeypatch):
+        systems = self._count_calls(monkeypatch)
+        self._stub_similarity(monkeypatch, 0.9)
+        run_content_gates(
+            "A clean draft.", llm_client=MagicMock(), voice_print="Voice print.",
+            ai_gate_doc="AI gate rules.", voice_profile=object(),
+        )
+        assert systems == []
+
+    def test_plan_voice_gate(self, monkeypatch):
+        self._stub_similarity(monkeypatch, 0.5)
+        decision = plan_voice_gate("A draft.", "Voice print.", object())
+        assert decision.action == "run"
+        assert decision.reason == "voice similarity 0.50"
+        assert plan_voice_gate("A draft.", "Voice print.").action == "run"
+        assert plan_voice_gate("A draft.", None, object()).action == "skip"
+
+    def test_plan_voice_gate_deep(self, monkeypatch):
+        self._stub_similarity(monkeypatch, 0.3)
+        assert plan_voice_gate("A draft.", "Voice print.", object()).action == "deep"
+
+    @pytest.mark.parametrize("score, expected", [(0.6, "Voice card."), (0.3, "Full voice print.")])
+    def test_voice_gate_uses_card_unless_deep(self, monkeypatch, score, expected):
+        systems = self._count_calls(monkeypatch)
+        self._stub_similarity(monkeypatch, score)
+        run_content_gates(
+            "A clean draft.", llm_client=MagicMock(), voice_print="Full voice print.",
+            ai_gate_doc="AI gate rules.", voice_profile=object(), voice_card="Voice card.",
+        )
+        voice_systems = [s for s in systems if s.startswith(VOICE_GATE_SYSTEM)]
+        assert len(voice_systems) == 1
+        assert voice_systems[0].endswith(expected)
+
+
+class TestGenerateDraftsMulti:
+    RESULTS = [{"title": "Headline formula", "category": "playbook", "content": "Lead with the outcome."}]
+
+    def _mock_pipeline(self, monkeypatch, delay=0.0, fail=()):
+        from contentsifter.llm.client import LLMResponse
+        calls: list[str] = []
+
+        def mock_complete(client, system, user, max_tokens):
+            calls.append(user)
+            time.sleep(delay)
+            for format_type in fail:
+                if system == TEMPLATES[format_type]["system"].format(voice_context=""):
+                    raise RuntimeError("API down")
+            return LLMResponse(content=f"Draft for: {system[:20]}", input_tokens=1, output_tokens=1, model="test")
+
+        formatted: list[int] = []
+
+        def mock_format(results, budget_tokens=None):
+            formatted.append(len(results))
+            return "SOURCE"
+
+        monkeypatch.setattr("contentsifter.generate.drafts.complete_with_retry", mock_complete)
+        monkeypatch.setattr("contentsifter.generate.drafts.format_source_material", mock_format)
+        monkeypatch.setattr("contentsifter.generate.drafts.load_ai_gate", lambda: "AI gate rules.")
+        monkeypatch.setattr("contentsifter.generate.drafts.run_content_gates", lambda draft, *a, **kw: draft)
+        return calls, formatted
+
+    def test_formats_run_in_parallel(self, monkeypatch):
+        self._mock_pipeline(monkeypatch, delay=0.2)
+        start = time.perf_counter()
+        drafts = generate_drafts_multi(self.RESULTS, ["linkedin", "thread", "carousel", "newsletter"], MagicMock())
+        assert time.perf_counter() - start < 0.6
+        assert list(drafts) == ["linkedin", "thread", "carousel", "newsletter"]
+
+    def test_source_material_is_formatted_once(self, monkeypatch):
+        calls, formatted = self._mock_pipeline(monkeypatch)
+        generate_drafts_multi(self.RESULTS, ["linkedin", "thread", "linkedin"], MagicMock())
+        assert formatted == [1]
+        assert len(calls) == 2
+        assert all("SOURCE" in user for user in calls)
+
+    def test_failure_is_isolated(self, monkeypatch):
+        self._mock_pipeline(monkeypatch, fail=("thread",))
+        drafts = generate_drafts_multi(self.RESULTS, ["linkedin", "thread"], MagicMock())
+        assert isinstance(drafts["thread"], RuntimeError)
+        assert isinstance(drafts["linkedin"], str)
+
+    def test_unknown_format_fails_before_any_call(self, monkeypatch):
+        calls, _ = self._mock_pipeline(monkeypatch)
+        with pytest.raises(ValueError, match="Unknown format"):
+            generate_drafts_multi(self.RESULTS, ["linkedin", "tiktok"], MagicMock())
+        assert calls == []
+
+    def test_saves_each_format(self, monkeypatch, tmp_path):
+        self._mock_pipeline(monkeypatch)
+        generate_drafts_multi(self.RESULTS, ["linkedin", "thread"], MagicMock(), save_dir=tmp_path)
+        saved = sorted(p.name.split("-")[0] for p in tmp_path.glob("*.md"))
+        assert saved == ["linkedin", "thread"]
+        assert "*Format: thread*" in next(tmp_path.glob("thread-*.md")).read_text()
+
+
+class TestPromptCaching:
+    def test_long_system_prompt_is_cacheable(self):
+        from contentsifter.llm.client import CACHE_MIN_SYSTEM_CHARS, _system_blocks
+
+        assert _system_blocks("short") == "short"
+        blocks = _system_blocks("x" * CACHE_MIN_SYSTEM_CHARS)
+        assert blocks[0]["cache_control"] == {"type": "ephemeral"}
+        assert blocks[0]["text"] == "x" * CACHE_MIN_SYSTEM_CHARS
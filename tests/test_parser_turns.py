@@ -118,3 +118,16 @@ Another random line
             text += f"\n{{'speaker': {{'display_name': 'S{i}', 'matched_calendar_invitee_email': None}}, 'text': 'Turn {i}', 'timestamp': '00:0{i}:00'}}"
         turns = parse_speaker_turns(text)
         assert [t.turn_index for t in turns] == [0, 1, 2, 3, 4]
+
+    def test_coach_turns_flagged(self):
+        text = """\
+## Transcript
+
+{'speaker': {'display_name': 'Coach Carol', 'matched_calendar_invitee_email': None}, 'text': 'Welcome!', 'timestamp': '00:00:05'}
+{'speaker': {'display_name': 'Dan', 'matched_calendar_invitee_email': 'carol@example.com'}, 'text': 'Hi!', 'timestamp': '00:00:08'}
+{'speaker': {'display_name': 'Bob', 'matched_calendar_invitee_email': None}, 'text': 'Hello.', 'timestamp': '00:00:10'}
+"""
+        turns = parse_speaker_turns(
+            text, coach_name="Coach Carol", coach_email="carol@example.com"
+        )
+        assert [t.is_coach for t in turns] == [True, True, False]
@@ -0,0 +1,86 @@
+"""Tests for contentsifter.search.query."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from contentsifter.search.query import compile_query
+
+COLUMNS = ("title", "content")
+
+
+@pytest.fixture
+def fts():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE VIRTUAL TABLE f USING fts5(title, content, tokenize='porter unicode61')")
+    conn.execute("INSERT INTO f VALUES ('Career change tips', 'How to switch careers')")
+    yield conn
+    conn.close()
+
+
+def _hits(conn, expression):
+    return conn.execute("SELECT COUNT(*) FROM f WHERE f MATCH ?", (expression,)).fetchone()[0]
+
+
+class TestCompileQuery:
+    def test_words_are_quoted(self):
+        assert compile_query("linkedin profile") == '"linkedin" "profile"'
+
+    def test_hyphenated_word_becomes_phrase(self, fts):
+        assert compile_query("career-change") == '"career change"'
+        assert _hits(fts, compile_query("career-change")) == 1
+
+    def test_unbalanced_quote_closed(self):
+        assert compile_query('"salary negotiation') == '"salary negotiation"'
+
+    def test_operators_kept(self):
+        assert compile_query("resume OR cv") == '"resume" OR "cv"'
+        assert compile_query("resume NOT cover") == '"resume" NOT "cover"'
+
+    def test_dangling_operators_dropped(self):
+        assert compile_query("OR resume AND") == '"resume"'
+        assert compile_query("NOT resume") == '"resume"'
+
+    def test_lowercase_operators_are_words(self):
+        assert compile_query("pros and cons") == '"pros" "and" "cons"'
+
+    def test_exclusions(self):
+        assert compile_query("career -tips") == '"career" NOT "tips"'
+        assert compile_query("career switch -tips") == '("career" "switch") NOT "tips"'
+        assert compile_query("-tips") == ""
+
+    def test_prefix(self):
+        assert compile_query("netw*") == '"netw"*'
+
+    def test_columns(self):
+        assert compile_query("title:career", COLUMNS) == 'title:"career"'
+        assert compile_query('title:"career change"', COLUMNS) == 'title:"career change"'
+        # Unknown columns search everywhere
+        assert compile_query("author:career", COLUMNS) == '"career"'
+
+    def test_groups(self, fts):
+        expression = compile_query("(career OR foo) (switch", COLUMNS)
+        assert expression == '("career" OR "foo") AND "switch"'
+        assert _hits(fts, expression) == 1
+        expression = compile_query("(career OR foo) (switch)", COLUMNS)
+        assert expression == '("career" OR "foo") AND ("switch")'
+        assert _hits(fts, expression) == 1
+
+    def test_nothing_searchable(self):
+        assert compile_query("") == ""
+        assert compile_query('" () -') == ""
+
+    def test_idempotent(self):
+        for text in ("career-change", "a OR (b c) -d", 'title:"x y"* z'):
+            once = compile_query(text, COLUMNS)
+            assert compile_query(once, COLUMNS) == once
+
+    @pytest.mark.parametrize("text", [
+        'C++ & C#', '"', "a) b", "((x", "it's", "AND OR NOT", "title:", "***", "-", "x:y:z",
+    ])
+    def test_never_raises_in_fts(self, fts, text):
+        expression = compile_query(text, COLUMNS)
+        if expression:
+            _hits(fts, expression)
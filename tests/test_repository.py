@@ -64,6 +64,35 @@ class TestCallOperations:
         assert turns[0]["turn_index"] == 0
 
 
+class TestSpeakers:
+    def test_insert_call_resolves_speakers(self, repo, sample_metadata, sample_turns):
+        call_id = repo.insert_call(sample_metadata, sample_turns)
+        rows = repo.db.conn.execute(
+            """SELECT st.char_len, st.text, s.name, s.is_coach
+               FROM speaker_turns st JOIN speakers s ON s.id = st.speaker_id
+               WHERE st.call_id = ? ORDER BY st.turn_index""",
+            (call_id,),
+        ).fetchall()
+        assert len(rows) == 3
+        assert all(r["char_len"] == len(r["text"]) for r in rows)
+        # Coach flag comes from the coach participant in the call header
+        assert [r["is_coach"] for r in rows] == [1, 0, 1]
+
+    def test_speakers_are_deduplicated(self, repo, sample_metadata, sample_turns):
+        repo.insert_call(sample_metadata, sample_turns)
+        count = repo.db.conn.execute("SELECT COUNT(*) FROM speakers").fetchone()[0]
+        assert count == 2
+
+    def test_coach_flag_is_sticky(self, repo):
+        first = repo.get_or_create_speaker("Izzy", "izzy@example.com", is_coach=True)
+        second = repo.get_or_create_speaker("Izzy", "izzy@example.com", is_coach=False)
+        assert first == second
+        row = repo.db.conn.execute(
+            "SELECT is_coach FROM speakers WHERE id = ?", (first,)
+        ).fetchone()
+        assert row["is_coach"] == 1
+
+
 class TestTopicChunks:
     def test_insert_and_retrieve(self, repo, sample_metadata, sample_turns, sample_chunks):
         call_id = repo.insert_call(sample_metadata, sample_turns)
@@ -145,6 +174,30 @@ class TestProcessingProgress:
         assert "playbook" in summary["extractions"]
 
 
+class TestStatsCounters:
+    def test_counters_track_populated_db(self, populated_db):
+        db, call_id = populated_db
+        repo = Repository(db)
+        assert repo.get_counters("call_type") == {"group_qa": 1}
+        assert repo.get_counters("category") == {"playbook": 1, "qa": 1}
+        assert repo.get_counters("tag")["linkedin"] == 2
+        assert repo.get_counters("totals") == {"turns": 3}
+
+    def test_rerunning_stage_does_not_double_count(self, repo, sample_metadata, sample_turns):
+        call_id = repo.insert_call(sample_metadata, sample_turns)
+        repo.mark_extracted(call_id)
+        repo.mark_extracted(call_id)
+        assert repo.get_counters("stage") == {"extracted": 1, "parsed": 1}
+
+    def test_counters_match_rebuild(self, populated_db):
+        db, call_id = populated_db
+        repo = Repository(db)
+        before = {scope: repo.get_counters(scope) for scope in ("category", "stage", "tag")}
+        db.rebuild_stats_counters()
+        after = {scope: repo.get_counters(scope) for scope in ("category", "stage", "tag")}
+        assert before == after
+
+
 class TestSpeakerTurns:
     def test_get_turns_for_call(self, repo, sample_metadata, sample_turns):
         call_id = repo.insert_call(sample_metadata, sample_turns)
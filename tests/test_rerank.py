@@ -0,0 +1,104 @@
+"""Tests for contentsifter.search.rerank."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from contentsifter.search.filters import SearchFilters
+from contentsifter.search.rerank import (
+    RerankWeights,
+    load_labels,
+    load_weights,
+    rerank,
+    save_weights,
+    tune_weights,
+)
+from contentsifter.search.vectors import hybrid_search
+from contentsifter.storage.models import Extraction
+from contentsifter.storage.repository import Repository
+
+
+@pytest.fixture
+def rerank_db(populated_db):
+    """Populated database plus near-duplicate and low-quality salary items."""
+    db, call_id = populated_db
+    Repository(db).insert_extractions(call_id, None, [
+        Extraction(
+            category="story", title="Salary story", quality_score=1,
+            content="She asked for more salary and got it.", tags=["salary"],
+        ),
+        Extraction(
+            category="playbook", title="Salary negotiation steps", quality_score=5,
+            content="Anchor high, then pause.", tags=["salary_negotiation"],
+        ),
+        Extraction(
+            category="playbook", title="Salary negotiation steps", quality_score=4,
+            content="Anchor high, then pause.",
+        ),
+    ])
+    return db
+
+
+def _candidates(db, query):
+    return hybrid_search(db, query, SearchFilters(limit=60))
+
+
+class TestRerank:
+    def test_quality_and_tags_outrank_story(self, rerank_db):
+        results = rerank(rerank_db, "salary negotiation", _candidates(rerank_db, "salary negotiation"), 10)
+        assert results[0]["title"] == "Salary negotiation steps"
+        assert results[0]["quality_score"] == 5
+        assert all("relevance_score" in r for r in results)
+
+    def test_duplicates_suppressed(self, rerank_db):
+        results = rerank(rerank_db, "salary negotiation", _candidates(rerank_db, "salary negotiation"), 10)
+        titles = [r["title"] for r in results]
+        assert titles.count("Salary negotiation steps") == 1
+
+    def test_duplicates_kept_when_threshold_disabled(self, rerank_db):
+        weights = RerankWeights(duplicate_threshold=1.1)
+        results = rerank(
+            rerank_db, "salary negotiation", _candidates(rerank_db, "salary negotiation"), 10, weights,
+        )
+        assert [r["title"] for r in results].count("Salary negotiation steps") == 2
+
+    def test_limit_and_empty(self, rerank_db):
+        assert len(rerank(rerank_db, "salary", _candidates(rerank_db, "salary"), 1)) == 1
+        assert rerank(rerank_db, "salary", [], 5) == []
+
+    def test_category_prior(self, rerank_db):
+        weights = RerankWeights(
+            bm25_title=0, bm25_content=0, bm25_quote=0, quality=0,
+            tag_overlap=0, recency=0, retrieval=0,
+            category_priors={"story": 1.0},
+        )
+        results = rerank(rerank_db, "salary", _candidates(rerank_db, "salary"), 10, weights)
+        assert results[0]["category"] == "story"
+
+
+class TestWeights:
+    def test_round_trip_and_unknown_keys(self, tmp_path):
+        path = tmp_path / "weights.json"
+        assert load_weights(path) == RerankWeights()
+
+        save_weights(RerankWeights(quality=2.5), path)
+        data = json.loads(path.read_text())
+        data["obsolete"] = 1
+        path.write_text(json.dumps(data))
+        assert load_weights(path).quality == 2.5
+
+    def test_tune_weights(self, rerank_db, tmp_path):
+        story_id = rerank_db.conn.execute(
+            "SELECT id FROM extractions WHERE title = 'Salary story'"
+        ).fetchone()["id"]
+        labels_path = tmp_path / "labels.jsonl"
+        labels_path.write_text(json.dumps({"query": "salary", "relevant": [story_id]}) + "\n\n")
+        labels = load_labels(labels_path)
+        assert labels == [{"query": "salary", "relevant": {story_id}}]
+
+        weights, mrr = tune_weights(rerank_db, labels)
+        assert mrr == 1.0
+        results = rerank(rerank_db, "salary", _candidates(rerank_db, "salary"), 5, weights)
+        assert results[0]["id"] == story_id
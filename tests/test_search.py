@@ -2,8 +2,19 @@
 
 from __future__ import annotations
 
+import pytest
+
 from contentsifter.search.filters import SearchFilters
-from contentsifter.search.keyword import keyword_search, search_raw_turns
+from contentsifter.search.keyword import (
+    HIGHLIGHT_END,
+    HIGHLIGHT_START,
+    browse_extractions,
+    decode_cursor,
+    estimate_total,
+    keyword_search,
+    search_raw_turns,
+)
+from contentsifter.storage.models import Extraction
 from contentsifter.storage.repository import Repository
 
 
@@ -93,6 +104,114 @@ class TestKeywordSearch:
         results = keyword_search(db, "linkedin", filters)
         assert len(results) <= 1
 
+    def test_malformed_input_does_not_raise(self, populated_db):
+        db, _ = populated_db
+        for query in ('"linkedin', "linkedin AND", "(linkedin", "C++ & linkedin!"):
+            assert isinstance(keyword_search(db, query), list)
+        assert keyword_search(db, '"linkedin')
+        assert keyword_search(db, '" -') == []
+
+    def test_hyphenated_query_is_phrase(self, populated_db):
+        db, _ = populated_db
+        results = keyword_search(db, "headline-formula")
+        assert [r["title"] for r in results] == ["LinkedIn headline formula"]
+
+    def test_column_query(self, populated_db):
+        db, _ = populated_db
+        results = keyword_search(db, "title:formula")
+        assert [r["title"] for r in results] == ["LinkedIn headline formula"]
+        assert keyword_search(db, "title:remove") == []
+
+    def test_title_matches_rank_first(self, populated_db):
+        db, call_id = populated_db
+        Repository(db).insert_extractions(call_id, None, [
+            Extraction(category="qa", title="Unrelated heading",
+                       content="Salary bands vary, so research the company first."),
+            Extraction(category="qa", title="Salary negotiation",
+                       content="Ask for a range and hold your number."),
+        ] + [
+            Extraction(category="qa", title=f"Filler {i}", content="Nothing relevant here.")
+            for i in range(5)
+        ])
+        results = keyword_search(db, "salary")
+        assert results[0]["title"] == "Salary negotiation"
+
+
+@pytest.fixture
+def many_extractions(populated_db):
+    """Populated database with 25 extra linkedin playbooks of mixed quality."""
+    db, call_id = populated_db
+    repo = Repository(db)
+    repo.insert_extractions(call_id, None, [
+        Extraction(
+            category="playbook",
+            title=f"LinkedIn tip {i}",
+            content=f"LinkedIn advice number {i}.",
+            quality_score=i % 5,
+        )
+        for i in range(25)
+    ])
+    return db
+
+
+class TestSnippets:
+    def test_keyword_snippets_replace_full_text(self, populated_db):
+        db, _ = populated_db
+        results = keyword_search(db, "headline", snippets=True)
+        assert results
+        for r in results:
+            assert "content" not in r and "raw_quote" not in r
+            assert f"{HIGHLIGHT_START}headline{HIGHLIGHT_END}" in r["snippet"].lower()
+
+    def test_keyword_title_highlighted(self, populated_db):
+        db, _ = populated_db
+        results = keyword_search(db, "formula", snippets=True)
+        assert results[0]["title"] == f"LinkedIn headline {HIGHLIGHT_START}formula{HIGHLIGHT_END}"
+
+    def test_browse_preview(self, many_extractions):
+        results = browse_extractions(many_extractions, SearchFilters(limit=5), snippets=True)
+        assert all("content" not in r and r["snippet"] for r in results)
+
+
+class TestPagination:
+    def _all_pages(self, fetch):
+        seen, cursor = [], None
+        while True:
+            page = fetch(cursor)
+            if not page:
+                return seen
+            seen.extend(r["id"] for r in page)
+            cursor = page[-1]["cursor"]
+
+    def test_keyword_pages_cover_all_results_once(self, many_extractions):
+        db = many_extractions
+        filters = SearchFilters(limit=100)
+        everything = [r["id"] for r in keyword_search(db, "linkedin", filters)]
+        filters.limit = 4
+        paged = self._all_pages(lambda c: keyword_search(db, "linkedin", filters, cursor=c))
+        assert paged == everything
+        assert len(paged) == 27
+
+    def test_browse_pages_cover_all_results_once(self, many_extractions):
+        db = many_extractions
+        filters = SearchFilters(limit=100)
+        everything = [r["id"] for r in browse_extractions(db, filters)]
+        filters.limit = 7
+        paged = self._all_pages(lambda c: browse_extractions(db, filters, cursor=c))
+        assert paged == everything
+
+    def test_invalid_cursor(self):
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor!")
+
+    def test_estimate_total_exact_for_category_browse(self, many_extractions):
+        total, capped = estimate_total(many_extractions, "", SearchFilters(categories=["playbook"]))
+        assert (total, capped) == (26, False)
+
+    def test_estimate_total_is_capped(self, many_extractions):
+        total, capped = estimate_total(many_extractions, "linkedin", cap=10)
+        assert (total, capped) == (10, True)
+
 
 class TestSearchRawTurns:
     def test_search_turns(self, populated_db):
@@ -0,0 +1,67 @@
+"""Tests for contentsifter.generate.stylometry."""
+
+from __future__ import annotations
+
+from contentsifter.generate.stylometry import AI_SCORE_THRESHOLD, score_ai_patterns
+
+AI_DRAFT = """In today's fast-paced job market, networking is more important than ever. Furthermore, it allows you to build trust, gain insight, and unlock new opportunities.
+
+Additionally, a strong LinkedIn profile can help you stand out from the crowd. It showcases your skills, experience, and achievements in a compelling way.
+
+Ultimately, success depends on consistency and authenticity. It might seem daunting at first, but it is generally worth the effort."""
+
+HUMAN_DRAFT = """Most people treat their resume like a history lesson. It isn't.
+
+Here's what we do instead. Start with the role you want. Then work backwards from the posting and cut anything that doesn't earn its spot.
+
+I had a client last week who'd applied to 60 jobs. Zero callbacks. We rewrote the top third of her resume. Two interviews in five days!
+
+Try it this week and tell me how it goes."""
+
+
+class TestScoreAIPatterns:
+    def test_ai_draft_scores_high(self):
+        result = score_ai_patterns(AI_DRAFT)
+        assert result.score >= AI_SCORE_THRESHOLD
+        assert result.suspicious
+        assert result.signals["lexicon_density"] > 0
+        assert result.signals["tricolon_rate"] > 0
+
+    def test_human_draft_scores_low(self):
+        result = score_ai_patterns(HUMAN_DRAFT)
+        assert result.score < AI_SCORE_THRESHOLD
+        assert not result.suspicious
+
+    def test_empty_and_short_text(self):
+        assert score_ai_patterns("").score == 0.0
+        result = score_ai_patterns("A clean draft.")
+        assert result.score == 0.0
+        # Too short for length-spread signals
+        assert "sentence_uniformity" not in result.signals
+        assert "paragraph_uniformity" not in result.signals
+
+    def test_spans_point_at_offending_text(self):
+        result = score_ai_patterns(AI_DRAFT)
+        kinds = {span.kind for span in result.spans}
+        assert {"lexicon", "tricolon", "hedge", "connector"} <= kinds
+        for span in result.spans:
+            assert AI_DRAFT[span.start:span.end] == span.text
+        lexicon = [s.text.lower() for s in result.spans if s.kind == "lexicon"]
+        assert "furthermore" in lexicon
+        assert "in today's" in lexicon
+
+    def test_uniform_sentences_raise_score(self):
+        uniform = " ".join(["We met the team and talked about the plan."] * 6)
+        varied = (
+            "We met the team. Then we talked for an hour about the plan, the budget "
+            "and whether the launch date still made sense. Nobody knew. So we picked one."
+        )
+        assert score_ai_patterns(uniform).signals["sentence_uniformity"] == 1.0
+        assert score_ai_patterns(varied).signals["sentence_uniformity"] == 0.0
+
+    def test_strongest_signals(self):
+        result = score_ai_patterns(AI_DRAFT)
+        strongest = result.strongest(2)
+        assert len(strongest) == 2
+        assert strongest[0] == "lexicon_density"
+        assert score_ai_patterns("A clean draft.").strongest() == []
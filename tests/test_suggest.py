@@ -0,0 +1,60 @@
+"""Tests for contentsifter.search.suggest."""
+
+from __future__ import annotations
+
+import time
+
+from contentsifter.search.suggest import refresh_suggestions, suggest, suggestion_index
+
+
+class TestSuggest:
+    def test_completes_from_vocabulary(self, populated_db):
+        db, _ = populated_db
+        terms = [s["term"] for s in suggest(db, "lin")]
+        assert terms[0] == "linkedin"
+        assert all(t.startswith("lin") for t in terms)
+
+    def test_stems_shown_as_surface_words(self, populated_db):
+        db, _ = populated_db
+        terms = [s["term"] for s in suggest(db, "pro")]
+        # Indexed as the porter stem "profil"
+        assert "profile" in terms
+        assert "profil" not in terms
+
+    def test_completes_last_word_only(self, populated_db):
+        db, _ = populated_db
+        suggestions = suggest(db, "improve head")
+        assert suggestions[0]["query"] == "improve headline"
+        assert suggestions[0]["df"] == 2
+
+    def test_short_prefix_returns_nothing(self, populated_db):
+        db, _ = populated_db
+        assert suggest(db, "l") == []
+        assert suggest(db, "linkedin ") == []
+
+    def test_ranked_by_document_frequency(self, populated_db):
+        db, _ = populated_db
+        ranked = suggest(db, "he")
+        assert [s["df"] for s in ranked] == sorted((s["df"] for s in ranked), reverse=True)
+
+    def test_rebuilds_when_content_changes(self, populated_db):
+        db, _ = populated_db
+        index = suggestion_index(db)
+        assert suggestion_index(db) is index
+        assert suggest(db, "zeb") == []
+
+        db.conn.execute(
+            "INSERT INTO content_items (content_type, title, text, char_count) "
+            "VALUES ('blog', 'Zebra stripes', 'On zebras.', 10)"
+        )
+        db.conn.commit()
+        assert suggestion_index(db) is not index
+        assert suggest(db, "zeb")[0]["term"] == "zebra"
+
+    def test_lookup_is_fast(self, populated_db):
+        db, _ = populated_db
+        refresh_suggestions(db)
+        start = time.perf_counter()
+        for _ in range(100):
+            suggest(db, "li")
+        assert (time.perf_counter() - start) / 100 < 0.01
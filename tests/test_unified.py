@@ -0,0 +1,70 @@
+"""Tests for contentsifter.search.unified."""
+
+from __future__ import annotations
+
+import pytest
+
+from contentsifter.search.filters import SearchFilters
+from contentsifter.search.unified import unified_search
+
+
+@pytest.fixture
+def unified_db(populated_db):
+    """Populated database plus a LinkedIn post and a content block derived from it."""
+    db, call_id = populated_db
+    cur = db.conn.execute(
+        """INSERT INTO content_items (content_type, title, text, date, char_count)
+           VALUES ('linkedin', 'My LinkedIn tip', 'Rewrite your LinkedIn headline today.', '2024-05-01', 38)"""
+    )
+    item_id = cur.lastrowid
+    db.conn.execute(
+        """INSERT INTO content_blocks (source_type, content_item_id, category, title, full_text, quality_score)
+           VALUES ('content_item', ?, 'playbook', 'LinkedIn headline tip', 'Rewrite your LinkedIn headline.', 4)""",
+        (item_id,),
+    )
+    db.conn.commit()
+    return db
+
+
+def _sources(results):
+    return [r["source"] for r in results]
+
+
+class TestUnifiedSearch:
+    def test_searches_every_source(self, unified_db):
+        results = unified_search(unified_db, "linkedin")
+        assert {"extraction", "turn"} <= set(_sources(results))
+        assert {"content_item", "content_block"} & set(_sources(results))
+        assert all(0 < r["score"] <= 1 for r in results)
+        assert results[0]["source"] == "extraction"
+        assert results[0]["score"] == 1.0
+
+    def test_dedupes_block_with_its_content_item(self, unified_db):
+        sources = _sources(unified_search(unified_db, "linkedin"))
+        assert sources.count("content_item") + sources.count("content_block") == 1
+        results = unified_search(unified_db, "linkedin", SearchFilters(sources=["content_block"]))
+        assert _sources(results) == ["content_block"]
+
+    def test_one_turn_per_call(self, unified_db):
+        results = unified_search(unified_db, "linkedin OR headline", SearchFilters(sources=["turn"]))
+        assert len(results) == 1
+
+    def test_category_filter_excludes_untyped_sources(self, unified_db):
+        results = unified_search(unified_db, "linkedin", SearchFilters(categories=["playbook"]))
+        assert {(r["source"], r["kind"]) for r in results} <= {
+            ("extraction", "playbook"), ("content_block", "playbook"),
+        }
+        assert results
+
+    def test_content_type_and_date_filters(self, unified_db):
+        results = unified_search(unified_db, "linkedin", SearchFilters(content_types=["linkedin"]))
+        assert _sources(results) == ["content_item"]
+        results = unified_search(unified_db, "linkedin", SearchFilters(date_from="2024-04-01"))
+        assert _sources(results) == ["content_item"]
+
+    def test_limit(self, unified_db):
+        assert len(unified_search(unified_db, "linkedin", SearchFilters(limit=2))) == 2
+
+    def test_no_matching_sources(self, unified_db):
+        filters = SearchFilters(categories=["qa"], content_types=["blog"])
+        assert unified_search(unified_db, "linkedin", filters) == []
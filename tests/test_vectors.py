@@ -0,0 +1,225 @@
+"""Tests for contentsifter.search.vectors (local hybrid retrieval)."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from contentsifter.search.filters import SearchFilters
+from contentsifter.search.semantic import semantic_search
+from contentsifter.search.vectors import (
+    expansion_key,
+    flush_search_stats,
+    get_cached_expansion,
+    hybrid_search,
+    hybrid_unified_search,
+    normalize_query,
+    precompute_expansions,
+    rebuild_vectors,
+    record_search,
+    store_expansion,
+    tokenize,
+    update_vectors,
+)
+from contentsifter.storage.models import Extraction
+from contentsifter.storage.repository import Repository
+
+
+def _df(db, term):
+    row = db.conn.execute("SELECT df FROM search_terms WHERE term = ?", (term,)).fetchone()
+    return row["df"] if row else 0
+
+
+def _vector_count(db):
+    return Repository(db).get_counters("totals").get("vectors", 0)
+
+
+class TestTokenize:
+    def test_stems_and_drops_stopwords(self):
+        assert tokenize("How do I follow up after interviews?") == ["follow", "interview"]
+
+    def test_light_stemming(self):
+        assert tokenize("companies ghosted networking") == ["company", "ghost", "network"]
+
+
+class TestUpdateVectors:
+    def test_indexes_all_extractions_once(self, populated_db):
+        db, _ = populated_db
+        assert update_vectors(db) == 2
+        assert _vector_count(db) == 2
+        assert _df(db, "linkedin") == 2
+        assert _df(db, "headline") == 2
+        assert update_vectors(db) == 0
+
+    def test_changed_and_deleted_rows(self, populated_db):
+        db, _ = populated_db
+        update_vectors(db)
+        db.conn.execute(
+            "UPDATE extractions SET content = 'Salary negotiation script.' "
+            "WHERE title = 'LinkedIn headline formula'"
+        )
+        assert update_vectors(db) == 1
+        assert _df(db, "salary") == 1
+        assert _df(db, "step") == 0
+
+        # Same length, different words
+        db.conn.execute(
+            "UPDATE extractions SET content = 'Salary negotiation scrupt.' "
+            "WHERE title = 'LinkedIn headline formula'"
+        )
+        assert update_vectors(db) == 1
+        assert _df(db, "scrupt") == 1
+        assert _df(db, "script") == 0
+
+        db.conn.execute("DELETE FROM extractions WHERE title = 'LinkedIn headline formula'")
+        assert update_vectors(db) == 0
+        assert _vector_count(db) == 1
+        assert _df(db, "salary") == 0
+        assert _df(db, "linkedin") == 1
+
+    def test_indexes_content_items(self, populated_db):
+        db, _ = populated_db
+        db.conn.execute(
+            "INSERT INTO content_items (content_type, title, text, char_count) "
+            "VALUES ('blog', 'Salary post', 'Negotiate your salary.', 22)"
+        )
+        assert update_vectors(db) == 3
+        sources = {r[0] for r in db.conn.execute("SELECT DISTINCT source FROM search_vectors")}
+        assert sources == {"extractions", "content_items"}
+        assert _df(db, "salary") == 1
+
+    def test_rebuild(self, populated_db):
+        db, _ = populated_db
+        update_vectors(db)
+        db.conn.execute("UPDATE search_terms SET df = 99")
+        assert rebuild_vectors(db) == 2
+        assert _df(db, "linkedin") == 2
+
+
+class TestHybridSearch:
+    def test_ranks_and_scores(self, populated_db):
+        db, call_id = populated_db
+        Repository(db).insert_extractions(call_id, None, [
+            Extraction(category="story", title="Salary win", content="Negotiated a higher offer."),
+        ])
+        update_vectors(db)
+        results = hybrid_search(db, "a formula for my headline")
+        assert [r["title"] for r in results][:1] == ["LinkedIn headline formula"]
+        assert "Salary win" not in [r["title"] for r in results]
+        assert all(r["relevance_score"] > 0 for r in results)
+
+    def test_does_not_index_candidates(self, populated_db):
+        db, _ = populated_db
+        results = hybrid_search(db, "linkedin")
+        assert len(results) == 2
+        assert _vector_count(db) == 0
+
+    def test_respects_filters(self, populated_db):
+        db, _ = populated_db
+        results = hybrid_search(db, "linkedin", SearchFilters(categories=["qa"]))
+        assert [r["category"] for r in results] == ["qa"]
+
+    def test_stopword_only_query(self, populated_db):
+        db, _ = populated_db
+        assert hybrid_search(db, "how do I") == []
+
+
+class TestHybridUnifiedSearch:
+    def test_ranks_content_items_with_vectors(self, populated_db):
+        db, _ = populated_db
+        db.conn.executemany(
+            "INSERT INTO content_items (content_type, title, text, char_count) VALUES ('blog', ?, ?, 0)",
+            [
+                ("Profile tips", "Your headline matters. Headline, headline, headline formula."),
+                ("Misc", "A passing mention of a headline among many other unrelated words here."),
+            ],
+        )
+        update_vectors(db)
+        results = hybrid_unified_search(db, "headline formula")
+        sources = {r["source"] for r in results}
+        assert {"extraction", "content_item"} <= sources
+        items = [r["title"] for r in results if r["source"] == "content_item"]
+        assert items == ["Profile tips", "Misc"]
+        assert all(r["relevance_score"] > 0 for r in results)
+
+    def test_stopword_only_query(self, populated_db):
+        db, _ = populated_db
+        assert hybrid_unified_search(db, "how do I") == []
+
+
+class TestSemanticSearch:
+    def test_local_by_default(self, populated_db):
+        db, _ = populated_db
+        llm = MagicMock()
+        results = semantic_search(db, "linkedin headline", llm)
+        assert len(results) == 2
+        llm.complete.assert_not_called()
+
+
+class TestExpansionCache:
+    def _hits(self, db, key):
+        row = db.conn.execute(
+            "SELECT hits FROM query_expansions WHERE query_key = ?", (key,)
+        ).fetchone()
+        return row["hits"] if row else None
+
+    def test_normalize_query(self):
+        assert normalize_query("Negotiating salaries") == normalize_query("salary negotiating")
+        assert normalize_query("how do I") == ""
+
+    def test_search_populates_then_hits_cache(self, populated_db):
+        db, _ = populated_db
+        first = [r["id"] for r in hybrid_search(db, "headline")]
+        key = normalize_query("headline")
+        assert not db.conn.in_transaction
+        assert self._hits(db, key) is None
+        flush_search_stats(db)
+        assert self._hits(db, key) == 0
+
+        second = [r["id"] for r in hybrid_search(db, "Headlines")]
+        assert not db.conn.in_transaction
+        flush_search_stats(db)
+        assert self._hits(db, key) == 1
+        assert first == second
+
+    def test_filtered_search_keyed_separately(self, populated_db):
+        db, _ = populated_db
+        filters = SearchFilters(categories=["qa"])
+        hybrid_search(db, "headline", filters)
+        flush_search_stats(db)
+        assert self._hits(db, normalize_query("headline")) is None
+        assert self._hits(db, expansion_key("headline", filters)) == 0
+        assert expansion_key("headline", filters) != expansion_key(
+            "headline", SearchFilters(categories=["story"])
+        )
+
+    def test_ttl_expiry(self, tmp_db):
+        store_expansion(tmp_db, "salary", ["offer"])
+        assert get_cached_expansion(tmp_db, "salary") == ["offer"]
+        tmp_db.conn.execute(
+            "UPDATE query_expansions SET created_at = datetime('now', '-60 days')"
+        )
+        assert get_cached_expansion(tmp_db, "salary") is None
+        assert get_cached_expansion(tmp_db, "salary", ttl_days=90) == ["offer"]
+
+    def test_lru_eviction(self, tmp_db):
+        store_expansion(tmp_db, "a", [], max_entries=2)
+        store_expansion(tmp_db, "b", [], max_entries=2)
+        tmp_db.conn.execute(
+            "UPDATE query_expansions SET last_used_at = datetime('now', '-1 hour') WHERE query_key = 'a'"
+        )
+        store_expansion(tmp_db, "c", [], max_entries=2)
+        keys = {r[0] for r in tmp_db.conn.execute("SELECT query_key FROM query_expansions")}
+        assert keys == {"b", "c"}
+
+    def test_precompute_from_log_and_tags(self, populated_db):
+        db, _ = populated_db
+        record_search(db, "LinkedIn headline")
+        record_search(db, "linkedin headlines")
+        assert db.conn.execute("SELECT COUNT(*) FROM search_log").fetchone()[0] == 0
+        flush_search_stats(db)
+        row = db.conn.execute("SELECT count FROM search_log").fetchone()
+        assert row["count"] == 2
+
+        assert precompute_expansions(db, top_n=5) > 1
+        assert self._hits(db, normalize_query("linkedin headline")) == 0
+        assert self._hits(db, normalize_query("linkedin")) == 0
@@ -0,0 +1,112 @@
+"""Tests for contentsifter.planning.voicecard."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from contentsifter.assets import asset_cache
+from contentsifter.llm.client import LLMResponse
+from contentsifter.planning.voicecard import (
+    MAX_ITEMS_PER_SECTION,
+    build_voice_card,
+    compare_voice_prompts,
+    load_voice_card,
+    voice_card_path,
+)
+from contentsifter.planning.voiceprint import save_voice_print
+from contentsifter.planning.voiceprofile import VoiceProfile
+
+FILLER = "\n".join(f"- Story {i}: a long anecdote about a client who found a role after months." for i in range(40))
+
+VOICE_PRINT = f"""# Voice Print: Jess Smith
+
+## Quick Reference
+
+- **Tone:** Warm and direct
+- **Register:** Casual, never stiff
+
+## Signature Phrases
+
+| Phrase | When to Use | Example |
+|--------|-------------|---------|
+| "Here's the thing" | Before a reframe | After listing objections |
+
+## Personal Story Bank
+
+{FILLER}
+
+## DO / DON'T Writing Guide
+
+### DON'T
+
+- **Don't open with throat-clearing.** No "In today's job market..."
+"""
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    asset_cache.clear()
+    yield
+    asset_cache.clear()
+
+
+class TestBuildVoiceCard:
+    def test_keeps_key_rules_within_budget(self):
+        card = build_voice_card(VOICE_PRINT, max_chars=800)
+        assert len(card) <= 800
+        assert card.startswith("# Voice Card: Jess Smith")
+        assert "- Tone: Warm and direct" in card
+        assert '- "Here\'s the thing" — Before a reframe' in card
+        assert "Don't open with throat-clearing." in card
+        assert "Phrase — When to Use" not in card
+        assert card.count("Story ") <= MAX_ITEMS_PER_SECTION
+
+    def test_sections_stay_in_document_order(self):
+        card = build_voice_card(VOICE_PRINT, max_chars=800)
+        assert card.index("## Quick Reference") < card.index("## Signature Phrases") < card.index("## DO / DON'T")
+
+    def test_short_print_used_as_is(self):
+        assert build_voice_card("# Voice Print: X\n\n- Be brief.\n") == "# Voice Print: X\n\n- Be brief.\n"
+
+
+class TestLoadVoiceCard:
+    def test_built_next_to_print_and_rebuilt_when_stale(self, tmp_path):
+        vp_path = save_voice_print(VOICE_PRINT, tmp_path / "voice-print.md")
+        card = load_voice_card(vp_path)
+        assert voice_card_path(vp_path).read_text() == card
+
+        # A hand edit is kept while the print is unchanged
+        card_path = voice_card_path(vp_path)
+        card_path.write_text("# Edited card\n")
+        assert load_voice_card(vp_path) == "# Edited card\n"
+
+        save_voice_print(VOICE_PRINT.replace("Warm", "Blunt"), vp_path)
+        st = card_path.stat()
+        os.utime(vp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert "Blunt and direct" in load_voice_card(vp_path)
+
+    def test_no_voice_print(self, tmp_path):
+        assert load_voice_card(tmp_path / "voice-print.md") is None
+
+
+class TestCompareVoicePrompts:
+    def test_reports_tokens_and_match(self, monkeypatch):
+        systems = []
+
+        def mock_complete(client, system, user, max_tokens):
+            systems.append(system)
+            return LLMResponse(content="We fixed the headline. Boom.", input_tokens=len(system) // 4,
+                               output_tokens=10, model="test")
+
+        monkeypatch.setattr("contentsifter.llm.client.complete_with_retry", mock_complete)
+        results = [{"title": "Headline", "category": "qa", "content": "Lead with outcomes.", "tags": []}]
+        card = build_voice_card(VOICE_PRINT, max_chars=800)
+        rows = compare_voice_prompts(results, "linkedin", object(), VOICE_PRINT, card, VoiceProfile(word_count=900))
+
+        assert [r["prompt"] for r in rows] == ["voice print", "voice card"]
+        assert rows[1]["voice_tokens"] < rows[0]["voice_tokens"]
+        assert rows[1]["input_tokens"] < rows[0]["input_tokens"]
+        assert all(0 <= r["voice_match"] <= 1 for r in rows)
+        assert card in systems[1]
@@ -0,0 +1,91 @@
+"""Tests for contentsifter.planning.voiceprint sampling."""
+
+from __future__ import annotations
+
+import pytest
+
+from contentsifter.planning import voiceprint
+from contentsifter.planning.voiceprint import (
+    get_coach_turn_stats,
+    get_stratified_coach_sample,
+    get_stratified_content_sample,
+)
+from contentsifter.storage.models import CallMetadata, Participant, SpeakerTurn
+
+COACH = "Izzy Piyale-Sheard"
+
+
+@pytest.fixture
+def voice_db(tmp_db, repo):
+    """Database with several calls of mixed-length coach and client turns."""
+    for n in range(6):
+        metadata = CallMetadata(
+            source_file="merged.md",
+            original_filename=f"coaching-call-{n}.md",
+            fathom_id=None,
+            title=f"Call {n}",
+            call_date=f"2024-01-0{n + 1}",
+            call_type="coaching",
+            participants=[Participant(display_name=COACH, email=None, is_coach=True)],
+        )
+        turns = []
+        for i in range(12):
+            speaker = COACH if i % 2 == 0 else "Client"
+            text = f"Turn {n}-{i} " + "word " * (i * 25) + ("why?" if i % 4 == 0 else "")
+            turns.append(SpeakerTurn(i, speaker, None, text, f"00:00:{i:02d}", i))
+        repo.insert_call(metadata, turns)
+
+    for i in range(20):
+        text = f"Post {i}. " + "more text " * (i * 30) + ("Agree?" if i % 3 == 0 else "")
+        tmp_db.conn.execute(
+            "INSERT INTO content_items (content_type, text, char_count) VALUES ('linkedin', ?, ?)",
+            (text, len(text)),
+        )
+    tmp_db.conn.commit()
+    return tmp_db
+
+
+class TestCoachSample:
+    def test_stats_count_only_coach_turns(self, voice_db):
+        stats = get_coach_turn_stats(voice_db, coach_name=COACH, coach_email="")
+        assert stats["turn_count"] == 36
+        assert stats["call_count"] == 6
+
+    def test_buckets_respect_length_bounds(self, voice_db):
+        samples = get_stratified_coach_sample(voice_db, per_bucket=50, coach_name=COACH, seed=1)
+        assert samples["monologues"]
+        assert all(len(t["text"]) > 500 for t in samples["monologues"])
+        assert all(len(t["text"]) < 100 for t in samples["short"])
+        assert all("?" in t["text"] for t in samples["questions"])
+        assert all(t["text"].startswith("Turn") for t in samples["openings"])
+
+    def test_per_bucket_limit(self, voice_db):
+        samples = get_stratified_coach_sample(voice_db, per_bucket=2, coach_name=COACH, seed=1)
+        assert all(len(v) <= 2 for v in samples.values())
+
+    def test_seed_is_reproducible(self, voice_db):
+        first = get_stratified_coach_sample(voice_db, per_bucket=3, coach_name=COACH, seed=42)
+        second = get_stratified_coach_sample(voice_db, per_bucket=3, coach_name=COACH, seed=42)
+        assert first == second
+
+    def test_rare_bucket_drawn_across_rounds(self, voice_db, monkeypatch):
+        monkeypatch.setattr(voiceprint, "SAMPLE_FETCH_BATCH", 2)
+        samples = get_stratified_coach_sample(voice_db, per_bucket=50, coach_name=COACH, seed=3)
+        texts = [t["text"] for t in samples["questions"]]
+        # Every long-enough coach question (turns 4 and 8 of each call), each once
+        assert len(texts) == len(set(texts)) == 12
+
+    def test_unknown_coach_returns_empty(self, voice_db):
+        tmp_db = voice_db
+        tmp_db.conn.execute("UPDATE speakers SET is_coach = 0")
+        assert get_stratified_coach_sample(tmp_db, coach_name="Nobody", coach_email="") == {}
+
+
+class TestContentSample:
+    def test_buckets_and_seed(self, voice_db):
+        first = get_stratified_content_sample(voice_db, per_bucket=4, seed=7)
+        second = get_stratified_content_sample(voice_db, per_bucket=4, seed=7)
+        assert first == second
+        assert all(len(t["text"]) <= 200 for t in first["openings"])
+        assert all(len(t["text"]) > 2000 for t in first["monologues"])
+        assert all("?" in t["text"] for t in first["questions"])
@@ -0,0 +1,141 @@
+"""Tests for contentsifter.planning.voiceprofile."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from contentsifter.planning.voiceprofile import (
+    MIN_PROFILE_WORDS,
+    NGRAM_LIMIT,
+    VoiceProfile,
+    build_voice_profile,
+    load_voice_profile,
+    save_voice_profile,
+    voice_similarity,
+)
+from contentsifter.storage.models import CallMetadata, Participant, SpeakerTurn
+
+COACH = "Izzy Piyale-Sheard"
+
+POSTS = [
+    "I sent 60 applications last spring. Zero calls. Not one.\n\n"
+    "So we tore the resume apart. Turns out the top third said nothing about what I'd actually done.",
+    "Here's the thing nobody tells you: recruiters skim. Six seconds, maybe. "
+    "If your headline doesn't land, you're gone.\n\nFix the headline first. Then worry about the rest.",
+    "My client Jess was stuck at the same title for four years. Four! "
+    "We changed one line on her LinkedIn and she got three messages that week.",
+    "Stop apologizing in cover letters. Seriously. You don't need to explain the gap, "
+    "you need to show what you did with it.",
+    "Quick one today. Ask for the salary range up front. If they won't say, that's your answer.\n\n"
+    "You can walk away. I promise you can.",
+]
+
+CASUAL_DRAFT = (
+    "Got a message from a client yesterday. She'd applied to 40 jobs and heard nothing.\n\n"
+    "We looked at her resume together. The first line was her objective. Nobody reads "
+    "objectives! We cut it and led with the project she's proudest of.\n\n"
+    "Two calls this week. That's the whole trick."
+)
+
+FORMAL_DRAFT = (
+    "In today's competitive job market, it is essential to leverage your professional network "
+    "effectively. Furthermore, candidates should ensure that their resumes comprehensively reflect "
+    "their accomplishments, skills, and experiences. Additionally, it is important to tailor each "
+    "application to the specific requirements of the role, thereby maximizing the likelihood of "
+    "success. Ultimately, a strategic and thoughtful approach will yield significant results."
+)
+
+
+@pytest.fixture
+def profile_db(tmp_db, repo):
+    """Database with the client's posts plus coach and client call turns."""
+    for post in POSTS * 10:
+        tmp_db.conn.execute(
+            "INSERT INTO content_items (content_type, text, char_count) VALUES ('linkedin', ?, ?)",
+            (post, len(post)),
+        )
+    metadata = CallMetadata(
+        source_file="merged.md",
+        original_filename="coaching-call.md",
+        fathom_id=None,
+        title="Call",
+        call_date="2024-01-01",
+        call_type="coaching",
+        participants=[Participant(display_name=COACH, email=None, is_coach=True)],
+    )
+    turns = [
+        SpeakerTurn(0, COACH, None, "So what happened after the interview?", "00:00:00", 0),
+        SpeakerTurn(1, "Client", None, "Pursuant to the aforementioned discussion, nothing.", "00:00:05", 5),
+    ]
+    repo.insert_call(metadata, turns)
+    tmp_db.conn.commit()
+    return tmp_db
+
+
+@pytest.fixture
+def profile(profile_db):
+    return build_voice_profile(profile_db, coach_name=COACH, coach_email="")
+
+
+class TestBuildVoiceProfile:
+    def test_counts_items_and_coach_turns_only(self, profile):
+        assert profile.sample_count == len(POSTS) * 10 + 1
+        assert "aforementioned" not in "".join(profile.ngrams)
+        assert profile.word_count > MIN_PROFILE_WORDS
+
+    def test_measurements(self, profile):
+        assert len(profile.ngrams) == NGRAM_LIMIT
+        assert sum(profile.sentence_lengths) == pytest.approx(1.0)
+        assert sum(profile.paragraph_lengths) == pytest.approx(1.0)
+        assert profile.function_words["you"] > profile.function_words.get("which", 0)
+        assert profile.punctuation["'"] > profile.punctuation.get(";", 0)
+
+
+class TestVoiceSimilarity:
+    def test_own_writing_matches(self, profile):
+        assert voice_similarity("\n\n".join(POSTS), profile).score > 0.95
+
+    def test_client_style_beats_formal_style(self, profile):
+        casual = voice_similarity(CASUAL_DRAFT, profile)
+        formal = voice_similarity(FORMAL_DRAFT, profile)
+        assert casual.score > formal.score
+        assert casual.components["sentence_lengths"] > formal.components["sentence_lengths"]
+        assert not formal.matches
+
+    def test_single_paragraph_skips_paragraph_component(self, profile):
+        match = voice_similarity("One line only.", profile)
+        assert "paragraph_lengths" not in match.components
+        assert 0 <= match.score <= 1
+
+
+class TestSaveLoad:
+    def test_round_trip(self, profile, tmp_path):
+        path = save_voice_profile(profile, tmp_path / "voice-profile.json")
+        loaded = load_voice_profile(path)
+        assert loaded.word_count == profile.word_count
+        assert voice_similarity(CASUAL_DRAFT, loaded).score == pytest.approx(
+            voice_similarity(CASUAL_DRAFT, profile).score, abs=1e-3
+        )
+
+    def test_missing_file(self, tmp_path):
+        assert load_voice_profile(tmp_path / "voice-profile.json") is None
+
+    def test_too_small_profile_is_ignored(self, tmp_path):
+        path = save_voice_profile(VoiceProfile(word_count=50), tmp_path / "voice-profile.json")
+        assert load_voice_profile(path) is None
+
+    @pytest.mark.parametrize("text", ['{"word_count": 5000, "function_wo', "[1, 2]", '{"word_count": "many"}'])
+    def test_broken_file_is_ignored(self, tmp_path, text, caplog):
+        path = tmp_path / "voice-profile.json"
+        path.write_text(text)
+        assert load_voice_profile(path) is None
+        assert "voice profile" in caplog.text
+
+    def test_unknown_keys_are_ignored(self, profile, tmp_path):
+        path = save_voice_profile(profile, tmp_path / "voice-profile.json")
+        data = json.loads(path.read_text())
+        data["future_field"] = 1
+        path.write_text(json.dumps(data))
+        assert load_voice_profile(path).word_count == profile.word_count
@@ -550,10 +550,61 @@ class TestSearch:
         assert "Networking Tips" in resp.text
 
     def test_search_results_contain_snippet(self, client_with_extractions):
-        """Result cards show content snippet."""
+        """Result cards show a query-centred snippet with matches highlighted."""
         resp = client_with_extractions.get("/testweb/search/results?q=relationships")
         assert resp.status_code == 200
-        assert "Build relationships" in resp.text
+        assert "Build <mark>relationships</mark>" in resp.text
+
+    def test_search_snippet_escapes_html(self, web_env_with_extractions):
+        from contentsifter.web.app import create_app
+
+        db_path = Path(web_env_with_extractions / "data" / "contentsifter.db")
+        with Database(db_path) as db:
+            db.conn.execute(
+                "INSERT INTO extractions (call_id, category, title, content, quality_score) "
+                "VALUES (1, 'qa', 'Markup', 'Use <script>alert(1)</script> zebra tags', 3)"
+            )
+            db.conn.commit()
+
+        resp = TestClient(create_app()).get("/testweb/search/results?q=zebra")
+        assert "<script>" not in resp.text
+        assert "&lt;script&gt;" in resp.text
+        assert "<mark>zebra</mark>" in resp.text
+
+    def test_search_results_show_facets(self, client_with_extractions):
+        resp = client_with_extractions.get("/testweb/search/results?q=relationships OR verbs")
+        assert resp.status_code == 200
+        assert "Category:" in resp.text
+        assert "Playbook" in resp.text
+        assert "networking" in resp.text
+
+    def test_facet_failure_keeps_results(self, client_with_extractions, monkeypatch):
+        from contentsifter.web.cache import search_cache
+        from contentsifter.web.routes import search as search_routes
+
+        def broken(*args, **kwargs):
+            raise RuntimeError("facet index unavailable")
+
+        search_cache.clear()
+        monkeypatch.setattr(search_routes, "facet_counts", broken)
+        resp = client_with_extractions.get("/testweb/search/results?q=relationships")
+        search_cache.clear()
+        assert resp.status_code == 200
+        assert "No results" not in resp.text
+        assert "close match for" not in resp.text
+        assert "Category:" not in resp.text
+
+    def test_search_falls_back_to_close_matches(self, web_env_with_extractions):
+        from contentsifter.web.app import create_app
+
+        db_path = Path(web_env_with_extractions / "data" / "contentsifter.db")
+        with Database(db_path) as db:
+            db.enable_trigram_index()
+
+        resp = TestClient(create_app()).get("/testweb/search/results?q=netwrking")
+        assert resp.status_code == 200
+        assert "close match for" in resp.text
+        assert "Networking Tips" in resp.text
 
     def test_search_results_contain_category_badge(self, client_with_extractions):
         """Results show category badge."""
@@ -583,6 +634,88 @@ class TestSearch:
         assert "Test Call" in resp.text
 
 
+
+class TestTypeahead:
+    def test_typeahead_completes_last_word(self, client_with_extractions):
+        resp = client_with_extractions.get("/testweb/search/typeahead?q=build rel")
+        assert resp.status_code == 200
+        assert '<option value="build relationship">' in resp.text
+
+    def test_typeahead_short_prefix_empty(self, client_with_extractions):
+        resp = client_with_extractions.get("/testweb/search/typeahead?q=r")
+        assert resp.text == ""
+
+
+class TestSearchCache:
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        from contentsifter.web.cache import search_cache
+
+        search_cache.clear()
+        yield search_cache
+        search_cache.clear()
+
+    def test_repeated_query_served_from_cache(self, client_with_extractions, fresh_cache):
+        first = client_with_extractions.get("/testweb/search/results?q=relationships")
+        second = client_with_extractions.get("/testweb/search/results?q=relationships ")
+        assert first.text == second.text
+        stats = client_with_extractions.get("/testweb/search/cache-stats").json()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_browse_and_pages_cached_separately(self, client_with_extractions, fresh_cache):
+        client_with_extractions.get("/testweb/search/results?category=playbook")
+        client_with_extractions.get("/testweb/search/results?category=qa")
+        client_with_extractions.get("/testweb/search/results?category=playbook")
+        assert fresh_cache.stats()["hits"] == 1
+        assert fresh_cache.stats()["entries"] == 2
+
+    def test_write_from_another_connection_invalidates(self, web_env_with_extractions, fresh_cache):
+        from contentsifter.web.app import create_app
+
+        client = TestClient(create_app())
+        resp = client.get("/testweb/search/results?q=zebra")
+        assert "No results" in resp.text
+
+        db_path = Path(web_env_with_extractions / "data" / "contentsifter.db")
+        with Database(db_path) as db:
+            db.conn.execute(
+                "INSERT INTO extractions (call_id, category, title, content, quality_score) "
+                "VALUES (1, 'qa', 'Zebra Crossing', 'A zebra answer', 3)"
+            )
+            db.conn.commit()
+
+        resp = client.get("/testweb/search/results?q=zebra")
+        assert "Crossing" in resp.text
+        assert fresh_cache.stats()["hits"] == 0
+
+    def test_stats_scoped_to_client(self, client_with_extractions, fresh_cache):
+        client_with_extractions.get("/testweb/search/suggestions")
+        client_with_extractions.get("/testweb/search/suggestions")
+        assert client_with_extractions.get("/testweb/search/cache-stats").json()["hits"] == 1
+        other = fresh_cache.stats("otherclient")
+        assert other["entries"] == 0
+        assert other["hits"] == other["misses"] == 0
+
+    def test_lru_eviction(self, tmp_path):
+        from contentsifter.web.cache import SearchCache
+
+        db_path = tmp_path / "cache.db"
+        with Database(db_path):
+            pass
+        cache = SearchCache(max_entries=2)
+        for key in ("a", "b", "a", "c"):
+            cache.get_or_compute("slug", db_path, (key,), lambda: key.upper())
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 1
+        # "b" was least recently used and evicted; "a" survives
+        assert cache.get_or_compute("slug", db_path, ("a",), lambda: "miss") == "A"
+        assert cache.get_or_compute("slug", db_path, ("b",), lambda: "miss") == "miss"
+        cache.clear()
+
+
 class TestStatus:
     def test_status_page_loads(self, client_with_db):
         resp = client_with_db.get("/testweb/status")
@@ -958,6 +1091,51 @@ class TestBrowseAndSuggestions:
         assert "browse-tab" in resp.text
         assert "Playbook" in resp.text
 
+    def test_search_results_paginate(self, web_env_with_extractions):
+        """A full page gets a Load more button whose cursor returns the rest."""
+        from contentsifter.web.app import create_app
+        from contentsifter.web.routes.search import PAGE_SIZE
+
+        db_path = Path(web_env_with_extractions / "data" / "contentsifter.db")
+        with Database(db_path) as db:
+            for i in range(PAGE_SIZE):
+                db.conn.execute(
+                    "INSERT INTO extractions (call_id, category, title, content, quality_score) "
+                    "VALUES (1, 'playbook', ?, 'More detail.', 2)",
+                    (f"Extra playbook {i}",),
+                )
+            db.conn.commit()
+
+        client = TestClient(create_app())
+        resp = client.get("/testweb/search/results?category=playbook")
+        assert resp.status_code == 200
+        assert f"{PAGE_SIZE + 1} playbooks" in resp.text
+        assert "Load more" in resp.text
+
+        import re
+        cursor = re.search(r"cursor=([^\"&]+)", resp.text).group(1)
+        more = client.get(f"/testweb/search/results?category=playbook&cursor={cursor}")
+        assert more.status_code == 200
+        assert more.text.count("search-card") == 1
+        assert "Load more" not in more.text
+
+    def test_search_falls_back_to_other_sources(self, web_env_with_extractions):
+        from contentsifter.web.app import create_app
+
+        db_path = Path(web_env_with_extractions / "data" / "contentsifter.db")
+        with Database(db_path) as db:
+            db.conn.execute(
+                "INSERT INTO content_items (content_type, title, text, char_count) "
+                "VALUES ('newsletter', 'Portfolio issue', 'Build a portfolio site.', 23)"
+            )
+            db.conn.commit()
+
+        client = TestClient(create_app())
+        resp = client.get("/testweb/search/results?q=portfolio")
+        assert resp.status_code == 200
+        assert "Portfolio issue" in resp.text
+        assert "from your other content" in resp.text
+
     def test_browse_results_header(self, client_with_extractions):
         """Browse mode shows 'N playbooks' not 'N results for'."""
         resp = client_with_extractions.get("/testweb/search/results?category=playbook")
@@ -1037,6 +1215,7 @@ class TestDrafts:
 
         app = create_app()
         c = TestClient(app)
+        c.post("/testweb/drafts/refresh")
         resp = c.get("/testweb/drafts")
         assert resp.status_code == 200
         assert "Test Topic" in resp.text
@@ -1056,6 +1235,7 @@ class TestDrafts:
 
         app = create_app()
         c = TestClient(app)
+        c.post("/testweb/drafts/refresh")
         resp = c.get("/testweb/drafts/test-draft.md")
         assert resp.status_code == 200
         assert "Full body content here." in resp.text
@@ -1095,6 +1275,7 @@ class TestDrafts:
 
         app = create_app()
         c = TestClient(app)
+        c.post("/testweb/drafts/refresh")
         resp = c.get("/testweb/drafts")
         assert resp.status_code == 200
         assert "linkedin" in resp.text
@@ -1112,6 +1293,7 @@ class TestDrafts:
 
         app = create_app()
         c = TestClient(app)
+        c.post("/testweb/drafts/refresh")
         resp = c.get("/testweb/drafts")
         assert resp.status_code == 200
         assert "Copy" in resp.text
@@ -1129,6 +1311,7 @@ class TestDrafts:
 
         app = create_app()
         c = TestClient(app)
+        c.post("/testweb/drafts/refresh")
         resp = c.get("/testweb/drafts")
         assert resp.status_code == 200
         assert "2026-02-22" in resp.text
@@ -1146,10 +1329,67 @@ class TestDrafts:
 
         app = create_app()
         c = TestClient(app)
+        c.post("/testweb/drafts/refresh")
         resp = c.get("/testweb/drafts")
         assert resp.status_code == 200
         assert "3 saved drafts" in resp.text
 
+    def test_drafts_search(self, web_env):
+        """Search fragment lists only drafts matching the query."""
+        from contentsifter.web.app import create_app
+
+        drafts_dir = Path(web_env / "content" / "drafts")
+        drafts_dir.mkdir(parents=True, exist_ok=True)
+        (drafts_dir / "linkedin-20260222-120000.md").write_text(
+            "# Pricing Post\n\n*Format: linkedin*\n\n---\n\nCharge what you are worth.\n"
+        )
+        (drafts_dir / "thread-20260221-100000.md").write_text(
+            "# Hiring Thread\n\n*Format: thread*\n\n---\n\nHire slowly.\n"
+        )
+
+        c = TestClient(create_app())
+        c.post("/testweb/drafts/refresh")
+        resp = c.get("/testweb/drafts/search", params={"q": "worth"})
+        assert resp.status_code == 200
+        assert "Pricing Post" in resp.text
+        assert "Hiring Thread" not in resp.text
+
+        resp = c.get("/testweb/drafts/search", params={"q": "nonexistentword"})
+        assert "No drafts match" in resp.text
+
+        resp = c.get("/testweb/drafts", params={"q": "hiring"})
+        assert "Hiring Thread" in resp.text
+        assert "Pricing Post" not in resp.text
+
+    def test_hand_written_draft_needs_rescan(self, web_env):
+        """Files dropped in the folder are indexed by the rescan action, not by reads."""
+        from contentsifter.web.app import create_app
+
+        drafts_dir = Path(web_env / "content" / "drafts")
+        drafts_dir.mkdir(parents=True, exist_ok=True)
+        (drafts_dir / "linkedin-20260222-120000.md").write_text(
+            "# Dropped In\n\n*Format: linkedin*\n\n---\n\nWritten by hand.\n"
+        )
+
+        c = TestClient(create_app())
+        assert "Dropped In" not in c.get("/testweb/drafts").text
+        resp = c.post("/testweb/drafts/refresh")
+        assert resp.status_code == 200
+        assert "Dropped In" in resp.text
+        assert "1 added" in resp.text
+        assert "Dropped In" in c.get("/testweb/drafts").text
+
+    def test_saved_draft_is_searchable(self, client_with_db):
+        """Drafts saved from the generate page are indexed right away."""
+        resp = client_with_db.post("/testweb/generate/save", data={
+            "content": "A draft about onboarding rituals.",
+            "format_type": "linkedin",
+            "topic": "Onboarding",
+        })
+        assert resp.status_code == 200
+        resp = client_with_db.get("/testweb/drafts/search", params={"q": "rituals"})
+        assert "Onboarding" in resp.text
+
 
 class TestSearchGenerateIntegration:
     """Tests for per-card generation from search results."""
@@ -1180,6 +1420,58 @@ class TestSearchGenerateIntegration:
         assert resp.status_code == 200
         assert "not found" in resp.text.lower()
 
+    def test_generated_draft_shows_ai_pattern_score(self, client_with_api_key, monkeypatch):
+        monkeypatch.setattr("contentsifter.llm.client.create_client", lambda **kwargs: object())
+        monkeypatch.setattr(
+            "contentsifter.generate.drafts.generate_draft",
+            lambda **kwargs: "Furthermore, we leverage robust synergies. Moreover, it is pivotal.",
+        )
+        resp = client_with_api_key.post(
+            "/testweb/generate/from-extraction/1",
+            data={"format_type": "linkedin"},
+        )
+        assert resp.status_code == 200
+        assert "AI-pattern score 0.64" in resp.text
+        assert "text-amber-600" in resp.text
+        assert "Voice match" not in resp.text
+
+    def test_format_bundle_generates_each_format(self, client_with_api_key, monkeypatch):
+        requested = {}
+
+        def fake_multi(**kwargs):
+            requested["formats"] = kwargs["formats"]
+            return {"linkedin": "We sent it.", "thread": RuntimeError("API down")}
+
+        monkeypatch.setattr("contentsifter.llm.client.create_client", lambda **kwargs: object())
+        monkeypatch.setattr("contentsifter.generate.drafts.generate_drafts_multi", fake_multi)
+        resp = client_with_api_key.post(
+            "/testweb/generate/from-extraction/1",
+            data={"format_type": "linkedin,thread"},
+        )
+        assert resp.status_code == 200
+        assert requested["formats"] == ["linkedin", "thread"]
+        assert "We sent it." in resp.text
+        assert "Twitter/X Thread generation failed: RuntimeError: API down" in resp.text
+
+    def test_generated_draft_shows_voice_match(self, client_with_api_key, web_env, monkeypatch):
+        from contentsifter.planning.voiceprofile import VoiceProfile, save_voice_profile
+
+        save_voice_profile(
+            VoiceProfile(word_count=1000, function_words={"we": 0.05}, ngrams={" we": 0.01}),
+            web_env / "content" / "voice-profile.json",
+        )
+        monkeypatch.setattr("contentsifter.llm.client.create_client", lambda **kwargs: object())
+        monkeypatch.setattr(
+            "contentsifter.generate.drafts.generate_draft",
+            lambda **kwargs: "We sent it. We waited.",
+        )
+        resp = client_with_api_key.post(
+            "/testweb/generate/from-extraction/1",
+            data={"format_type": "linkedin"},
+        )
+        assert resp.status_code == 200
+        assert "Voice match" in resp.text
+
 
 class TestHtmxIntegration:
     """Tests that htmx requests get fragment responses vs full pages."""
@@ -1334,6 +1626,7 @@ class TestSidebar:
 
         app = create_app()
         c = TestClient(app)
+        c.post("/testweb/drafts/refresh")
         resp = c.get("/testweb")
         assert resp.status_code == 200
         assert "rounded-full" in resp.text  # badge styling